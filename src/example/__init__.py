@@ -1 +1,9 @@
 """アプリケーションのルートパッケージ"""
+
+import time
+
+IMPORT_STARTED_AT = time.perf_counter()
+"""パッケージの import を開始した時刻（time.perf_counter() の値）
+
+CLI の起動時間の計測（--startup-timing）で、import フェーズの起点とする。
+"""
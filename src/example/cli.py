@@ -13,28 +13,73 @@ uv run コマンド経由での実行を想定している。
 依存するコンポーネントを適切に組み立て、Orchestrator を実行することが責務である。
 なおエラー発生時は main 関数内の ErrorHandler が例外を補足し、エラーハンドリングを実行する。
 
+起動を速くするため、モジュールの先頭では Typer と軽量なモジュールのみを import する。
+pydantic を使う設定の読み込みや Transform 層などは、必要になったサブコマンドの中で import する。
+
 Docs:
     - docs/specs/cli/requirements.md
     - docs/specs/cli/design.md
 
 Usage:
     uv run example transform xxxx.md
+    uv run example transform docs/ "logs/**/*.log" --workers 8
+    uv run example transform docs/ --incremental
+    uv run example transform docs/ --results ndjson
+    uv run example transform huge.log --shard --workers 8
+    uv run example transform "logs/*.log.gz" --compress xz --compress-level 6
+    zcat huge.log.gz | uv run example transform - | split -l 1000000
+    uv run example transform "/mnt/nfs/**/*.log" --engine async --concurrency 256
+    uv run example transform "archive/*.txt" --bytes --encoding utf-16
+    uv run example transform windows.txt --newline preserve
+    uv run example transform "/var/log/**/*.log" --layout hashed --fan-out 256
+    uv run example --profile transform docs/
+    uv run example --startup-timing transform xxxx.md
+    uv run example serve
     uv run example --help
 """
 
+from __future__ import annotations
+
+import codecs
+import contextlib
+import functools
+import io
 import logging
+import signal
 import sys
+import time
+from collections.abc import Coroutine, Mapping
+from contextlib import redirect_stderr, redirect_stdout
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
-from typing import Annotated
+from types import FrameType
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 import typer
 
-from example.config import AppConfig, EnvVarConfig
-from example.config.env_var import LogLevel
-from example.foundation.error import ErrorHandler
-from example.foundation.log import LogConfigurator, log
-from example.transform import TransformContext, TransformOrchestratorProvider
+from example import IMPORT_STARTED_AT
+from example.config import (
+    Durability,
+    LogLevel,
+    OutputCompression,
+    ReaderBackend,
+    WriterBackend,
+)
+from example.foundation.error import ApplicationError, ErrorHandler
+from example.foundation.log import LogConfigurator, LogRotation, log
+from example.foundation.profile import StartupTimer
+
+if TYPE_CHECKING:
+    from example.config import AppConfig
+    from example.transform import FileTransformResult, TransformOrchestratorProvider
+
+_IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED_AT
+_STARTUP_TIMER = "startup_timer"
+_LOG_DIR = "log_dir"
+_STDIN = Path("-")
+_SERVING: ContextVar[bool] = ContextVar("serving", default=False)
+"""常駐サーバーが example-client からの実行要求を処理している間だけ True"""
 
 logger = logging.getLogger(__name__)
 app = typer.Typer(no_args_is_help=True)
@@ -43,22 +88,442 @@ app = typer.Typer(no_args_is_help=True)
 @app.command()
 def transform(
     ctx: typer.Context,
-    target_file: Annotated[Path, typer.Argument(help="ファイルパス")],
+    targets: Annotated[
+        list[Path],
+        typer.Argument(help="ファイルパス・ディレクトリ・globパターン（複数指定可）"),
+    ],
     tmp_dir: Annotated[
         Path | None,
         typer.Option("--tmp-dir", help="一時ディレクトリパス"),
     ] = None,
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream", help="1行ずつ逐次処理し、メモリ使用量をファイルサイズに依存させない"
+        ),
+    ] = False,
+    incremental: Annotated[
+        bool,
+        typer.Option(
+            "--incremental", help="前回から変更のないファイルの変換を省略する（マニフェストを記録）"
+        ),
+    ] = False,
+    force: Annotated[
+        bool,
+        typer.Option("--force", help="--incremental 指定時に、全ファイルを変換し直す"),
+    ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            min=1,
+            help="複数ファイル変換時・--shard 指定時の並列ワーカー数（省略時は EXAMPLE_WORKERS、未設定時は使用可能なCPU数）",
+        ),
+    ] = None,
+    engine: Annotated[
+        Literal["process", "async"],
+        typer.Option(
+            "--engine",
+            help="実行方式（process: プロセスプール、async: asyncio による並行I/O）",
+        ),
+    ] = "process",
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", min=1, help="--engine async 時に同時に処理するファイル数"),
+    ] = 64,
+    results: Annotated[
+        Literal["json", "ndjson"],
+        typer.Option(
+            "--results",
+            help="結果の出力形式（json: 終了時に1つの JSON、ndjson: ファイルごとに処理完了時に1行の JSON）",
+        ),
+    ] = "json",
+    shard: Annotated[
+        bool,
+        typer.Option(
+            "--shard",
+            help="単一の大きなファイルを行境界で分割し、--workers のワーカーで並列に変換する",
+        ),
+    ] = False,
+    shard_size: Annotated[
+        int,
+        typer.Option("--shard-size", min=1, help="--shard 時に1ワーカーが担当する範囲のバイト数"),
+    ] = 32 << 20,
+    compress: Annotated[
+        OutputCompression | None,
+        typer.Option(
+            "--compress",
+            help="出力の圧縮形式（auto: 出力ファイルの拡張子から判定、none: 圧縮しない。省略時は EXAMPLE_OUTPUT_COMPRESSION）",
+        ),
+    ] = None,
+    compress_level: Annotated[
+        int | None,
+        typer.Option(
+            "--compress-level",
+            min=1,
+            max=9,
+            help="出力の圧縮レベル（省略時は EXAMPLE_COMPRESSION_LEVEL、未設定時は圧縮形式ごとの既定値）",
+        ),
+    ] = None,
+    stdout: Annotated[
+        bool,
+        typer.Option(
+            "--stdout",
+            help="変換結果をファイルではなく標準出力へ書き込む（実行結果の JSON は標準エラー出力へ出力する）",
+        ),
+    ] = False,
+    stats: Annotated[
+        bool,
+        typer.Option(
+            "--stats",
+            help="読み込み・変換・書き込みの所要時間と処理量を計測し、実行結果の JSON に stats として含める",
+        ),
+    ] = False,
+    binary: Annotated[
+        bool,
+        typer.Option(
+            "--bytes",
+            help="ファイルをデコードせずにバイト列のまま変換する（不正なバイトを含むファイルもそのまま出力する）",
+        ),
+    ] = False,
+    encoding: Annotated[
+        str | None,
+        typer.Option(
+            "--encoding",
+            help="--bytes 時の入力の文字コード（ASCII 互換でない場合のみデコードする。省略時は utf-8）",
+        ),
+    ] = None,
+    errors: Annotated[
+        Literal["strict", "replace", "ignore", "surrogateescape", "backslashreplace"] | None,
+        typer.Option(
+            "--errors",
+            help="--bytes 時にデコード・エンコードできない文字の扱い（省略時は strict）",
+        ),
+    ] = None,
+    newline: Annotated[
+        Literal["universal", "lf", "preserve"],
+        typer.Option(
+            "--newline",
+            help="行の区切り規則（universal: \\r\\n・\\r も改行とみなす / "
+            "lf: \\n のみで区切り、行末の \\r\\n も \\n で出力する / "
+            "preserve: \\n のみで区切り、出力に入力の行末を残す）",
+        ),
+    ] = "universal",
+    layout: Annotated[
+        Literal["flat", "mirror", "hashed", "content"],
+        typer.Option(
+            "--layout",
+            help="出力ファイルの配置（flat: 出力先直下に同名で出力 / mirror: 変換元の相対パスを再現 / "
+            "hashed: 変換元のパスのハッシュで2階層に分散 / content: 変換元の内容のハッシュで2階層に分散）",
+        ),
+    ] = "flat",
+    fan_out: Annotated[
+        int,
+        typer.Option(
+            "--fan-out", min=2, help="--layout hashed / content 時の各階層のサブディレクトリ数"
+        ),
+    ] = 256,
 ) -> None:
-    """テキストファイルを読み込み、行番号を付与して出力"""
+    r"""テキストファイルを読み込み、行番号を付与して出力
+
+    単一のファイルパスを指定した場合は、そのファイルの変換結果を出力する。
+    複数のパス・ディレクトリ・globパターンを指定した場合は、集計結果とファイルごとの結果を出力する。
+    --results ndjson の場合は、指定方法にかかわらずファイルごとの結果を処理が完了した順に出力する。
+    --shard の場合は、単一のファイルを分割して並列に変換し、そのファイルの変換結果を出力する。
+    gzip・bz2・xz で圧縮された入力は伸長しながら読み込み、出力は --compress の形式で圧縮する。
+    対象に - を指定した場合は標準入力を逐次変換し、--stdout と同じく変換結果を標準出力へ書き込む。
+    --stats の場合は、単一のファイルの変換結果に段階ごとの所要時間と処理量を含める。
+    --bytes の場合は、ファイル全体をデコードせずにバイト列のまま行番号を付与する。
+    --newline lf / preserve の場合は、改行コードを変換せずに \n のみで行を区切る
+    （lf は行末の \r\n も \n で出力し、preserve は入力の行末のまま出力する）。
+    --layout が flat 以外の場合は、変換元と出力ファイルの対応を出力先の .outputs/ に記録する。
+    """
+    from example.transform import TransformBatchContext, TransformContext, TransformShardContext
+
     config = _get_config(ctx)
-    context = TransformContext(
-        target_file=target_file,
-        tmp_dir=tmp_dir if tmp_dir is not None else config.tmp_dir,
+    from_stdin = _STDIN in targets
+    to_stdout = stdout or from_stdin
+    if to_stdout and _SERVING.get():
+        # 常駐サーバーの標準入力・標準出力は example-client のものではないため、転送できない
+        raise typer.BadParameter(
+            "example-client（常駐サーバー）経由では使えません。example transform を直接実行してください",
+            param_hint="'--stdout'" if stdout else "'TARGETS'",
+        )
+    if to_stdout and (
+        not _is_single_file(targets)
+        or shard
+        or engine == "async"
+        or incremental
+        or results == "ndjson"
+        or compress in ("gzip", "bz2", "xz")
+    ):
+        raise typer.BadParameter(
+            "単一の対象のみ指定でき、--shard / --engine async / --incremental / --results ndjson / --compress とは併用できません",
+            param_hint="'--stdout'" if stdout else "'TARGETS'",
+        )
+    if stats and (
+        not _is_single_file(targets) or shard or engine == "async" or results == "ndjson"
+    ):
+        raise typer.BadParameter(
+            "単一のファイルパスのみ指定でき、--shard / --engine async / --results ndjson とは併用できません",
+            param_hint="'--stats'",
+        )
+    if binary and (from_stdin or stream or shard or engine == "async"):
+        raise typer.BadParameter(
+            "標準入力（-）は指定できず、--stream / --shard / --engine async とは併用できません",
+            param_hint="'--bytes'",
+        )
+    if layout != "flat" and (to_stdout or shard):
+        raise typer.BadParameter(
+            "標準出力（--stdout / -）・--shard とは併用できません", param_hint="'--layout'"
+        )
+    if newline != "universal" and (binary or shard):
+        raise typer.BadParameter("--bytes / --shard とは併用できません", param_hint="'--newline'")
+    if not binary and (encoding is not None or errors is not None):
+        raise typer.BadParameter(
+            "--bytes を指定した場合のみ指定できます",
+            param_hint="'--encoding'" if encoding is not None else "'--errors'",
+        )
+    if encoding is not None:
+        try:
+            codecs.lookup(encoding)
+        except LookupError as e:
+            raise typer.BadParameter(
+                f"未知の文字コードです: {encoding}", param_hint="'--encoding'"
+            ) from e
+    provider = _get_provider(
+        config.reader_backend,
+        "stdout" if to_stdout else config.writer_backend,
+        config.io_buffer_size,
+        config.read_chunk_size,
+        config.durability,
+        compress if compress is not None else config.output_compression,
+        compress_level if compress_level is not None else config.compression_level,
+    )
+    _mark_startup(ctx, "provider")
+    effective_tmp_dir = tmp_dir if tmp_dir is not None else config.tmp_dir
+    if engine == "async" and stream:
+        raise typer.BadParameter("--engine async では指定できません", param_hint="'--stream'")
+    if engine == "async" and config.memory_budget is not None:
+        raise typer.BadParameter(
+            "環境変数 EXAMPLE_MEMORY_BUDGET とは併用できません", param_hint="'--engine'"
+        )
+
+    if shard:
+        if (
+            engine == "async"
+            or stream
+            or incremental
+            or results == "ndjson"
+            or compress in ("gzip", "bz2", "xz")
+        ):
+            raise typer.BadParameter(
+                "--engine async / --stream / --incremental / --results ndjson / --compress とは併用できません",
+                param_hint="'--shard'",
+            )
+        if not _is_single_file(targets):
+            raise typer.BadParameter("単一のファイルパスを指定してください", param_hint="'--shard'")
+        shard_context = TransformShardContext(
+            target_file=targets[0],
+            tmp_dir=effective_tmp_dir,
+            current_datetime=datetime.now(),
+            workers=workers if workers is not None else config.workers,
+            shard_size=shard_size,
+        )
+        with provider.run():
+            result = provider.provide_sharded().orchestrate(shard_context)
+        print(result.to_json())
+        return
+
+    if results == "json" and _is_single_file(targets):
+        context = TransformContext(
+            target_file=targets[0],
+            tmp_dir=effective_tmp_dir,
+            current_datetime=datetime.now(),
+            # 標準入力はサイズを事前に知る方法がないため、常に逐次変換する
+            streaming=stream or from_stdin,
+            incremental=incremental,
+            force=force,
+            memory_budget=config.memory_budget,
+            cache_dir=config.cache_dir,
+            stats=stats,
+            binary=binary,
+            encoding=encoding or "utf-8",
+            errors=errors or "strict",
+            newline=newline,
+            layout=layout,
+            fan_out=fan_out,
+        )
+        with provider.run():
+            if engine == "async":
+                result = _run_async(provider.provide_async().orchestrate(context), concurrency)
+            else:
+                result = provider.provide().orchestrate(context)
+        # 標準出力へ変換結果を書き込んだ場合、実行結果は標準エラー出力へ分ける
+        print(result.to_json(), file=sys.stderr if to_stdout else sys.stdout)
+        return
+
+    batch_context = TransformBatchContext(
+        targets=tuple(targets),
+        tmp_dir=effective_tmp_dir,
         current_datetime=datetime.now(),
+        workers=workers if workers is not None else config.workers,
+        concurrency=concurrency,
+        streaming=stream,
+        incremental=incremental,
+        force=force,
+        memory_budget=config.memory_budget,
+        cache_dir=config.cache_dir,
+        binary=binary,
+        encoding=encoding or "utf-8",
+        errors=errors or "strict",
+        newline=newline,
+        layout=layout,
+        fan_out=fan_out,
+        exclude=(ctx.meta[_LOG_DIR],) if _LOG_DIR in ctx.meta else (),
+    )
+    listener = _write_ndjson if results == "ndjson" else None
+    with provider.run():
+        if engine == "async":
+            batch_result = _run_async(
+                provider.provide_async_batch().orchestrate(batch_context, listener), concurrency
+            )
+        else:
+            batch_result = provider.provide_batch().orchestrate(batch_context, listener)
+    if results == "json":
+        print(batch_result.to_json())
+    if batch_result.error_count:
+        raise ApplicationError(
+            message=f"{batch_result.error_count}件のファイル変換に失敗しました",
+            cause="one or more files failed in batch transform",
+        )
+
+
+@app.command()
+def serve(
+    socket_path: Annotated[
+        Path | None,
+        typer.Option(
+            "--socket",
+            help="待ち受ける Unix ドメインソケットのパス（省略時は一時ディレクトリ配下）",
+        ),
+    ] = None,
+) -> None:
+    """常駐サーバーとして起動し、example-client から転送された実行要求を処理する
+
+    起動済みのインタープリター・import 済みのモジュール・ロガーを使い回すため、
+    1回の実行ごとの起動コストがかからない。Ctrl-C または SIGTERM で停止する。
+    example-client 経由では、標準入力（transform -）と --stdout は使えない（エラーになる）。
+    環境変数（EXAMPLE_*）・--log-level・ログの出力先は、実行要求ごとではなくサーバー起動時のものを使う。
+    """
+    from example.client import default_socket_path
+    from example.foundation.ipc import JsonLineServer
+
+    path = socket_path if socket_path is not None else default_socket_path()
+    server = JsonLineServer(path, _handle_request)
+    signal.signal(signal.SIGTERM, _interrupt)
+    logger.info("Listening on %s", path)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopped serving on %s", path)
+
+
+def _interrupt(signum: int, frame: FrameType | None) -> None:
+    """SIGTERM を Ctrl-C と同じく KeyboardInterrupt として扱い、サーバーを停止させる"""
+    raise KeyboardInterrupt
+
+
+def _handle_request(request: dict[str, Any]) -> dict[str, Any]:
+    """example-client から転送された CLI 引数を、このプロセスで実行する
+
+    サーバーはリクエストを1件ずつ処理するため、作業ディレクトリと標準出力・標準エラー出力の
+    切り替えは他のリクエストに影響しない。
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    token = _SERVING.set(True)
+    try:
+        with contextlib.chdir(request["cwd"]), redirect_stdout(stdout), redirect_stderr(stderr):
+            exit_code = _invoke(request["args"])
+    finally:
+        _SERVING.reset(token)
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def _invoke(args: list[str]) -> int:
+    """CLI 引数で app を実行し、終了コードを返す
+
+    main() と同じく、想定外の例外は ErrorHandler で処理して終了コード 1 とする。
+    """
+    try:
+        app(args=args, prog_name="example")
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception as e:
+        ErrorHandler().handle(e)
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _write_ndjson(file: FileTransformResult) -> None:
+    """1ファイル分の結果を1行の JSON として標準出力へ書き込む
+
+    後続のプロセスが進捗を逐次読み取れるよう、1行ごとにフラッシュする。
+    """
+    sys.stdout.write(file.to_json() + "\n")
+    sys.stdout.flush()
+
+
+def _is_single_file(targets: list[Path]) -> bool:
+    """単一ファイルの変換として扱うかを判定する
+
+    ディレクトリ・globパターン・複数パスの指定は一括変換として扱う。
+    """
+    if len(targets) != 1:
+        return False
+    target = targets[0]
+    return not any(c in str(target) for c in "*?[") and not target.is_dir()
+
+
+def _run_async[T](coroutine: Coroutine[Any, Any, T], max_threads: int) -> T:
+    """コルーチンをイベントループで実行する
+
+    ファイル I/O を委譲するデフォルトスレッドプールの大きさを、同時実行数に合わせる。
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    with asyncio.Runner() as runner:
+        runner.get_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_threads))
+        return runner.run(coroutine)
+
+
+@functools.cache
+def _get_provider(
+    reader_backend: ReaderBackend,
+    writer_backend: WriterBackend | Literal["stdout"],
+    io_buffer_size: int,
+    read_chunk_size: int,
+    durability: Durability,
+    output_compression: OutputCompression,
+    compression_level: int | None,
+) -> TransformOrchestratorProvider:
+    """設定に対応する TransformOrchestratorProvider を返す
+
+    設定ごとに1つだけ生成し、serve での繰り返しの実行でも構築済みのコンポーネントを使い回す。
+    """
+    from example.transform import TransformOrchestratorProvider
+
+    return TransformOrchestratorProvider(
+        reader_backend,
+        writer_backend,
+        io_buffer_size,
+        read_chunk_size,
+        durability,
+        output_compression,
+        compression_level,
     )
-    orchestrator = TransformOrchestratorProvider().provide()
-    result = orchestrator.orchestrate(context)
-    print(result.to_json())
 
 
 @log
@@ -78,22 +543,111 @@ def main_callback(
         LogLevel | None,
         typer.Option("--log-level", help="ログレベル (CRITICAL/ERROR/WARNING/INFO/DEBUG)"),
     ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile", help="サブコマンドを cProfile で計測し、ログファイルと同じ場所に出力する"
+        ),
+    ] = False,
+    startup_timing: Annotated[
+        bool,
+        typer.Option(
+            "--startup-timing",
+            help="起動処理のフェーズ（import・設定・ロガー・Provider）ごとの所要時間を標準エラー出力に表示する",
+        ),
+    ] = False,
 ) -> None:
     """各サブコマンドの事前処理"""
+    timer = _start_startup_timer(ctx, startup_timing)
+    # pydantic の import にかかる時間は config フェーズに含める
+    from example.config import AppConfig, EnvVarConfig
+
     config = AppConfig.build(env=EnvVarConfig(), log_level=log_level)
-    _initialize_logger(config.log_level, ctx.invoked_subcommand)
+    timer.mark("config")
+    rotation = LogRotation(
+        max_bytes=config.log_max_bytes,
+        backup_count=config.log_backup_count,
+        compress=config.log_compress,
+        max_files=config.log_max_files,
+        max_age=config.log_max_age,
+    )
+    log_path = _initialize_logger(
+        config.log_level, ctx.invoked_subcommand, config.log_levels, config.log_queue_size, rotation
+    )
+    timer.mark("logger")
+    if log_path is not None:
+        # ディレクトリを指定した変換で、ログファイルを変換対象として拾わないよう記録する
+        ctx.meta[_LOG_DIR] = log_path.parent
     _setup_context(ctx, config)
+    if profile:
+        _start_profiler(ctx, log_path)
+
+
+def _start_startup_timer(ctx: typer.Context, report: bool) -> StartupTimer:
+    """起動処理の計測を開始する
+
+    CLI モジュールの import にかかった時間を import フェーズとして記録し、
+    以降のフェーズはサブコマンドから _mark_startup() で記録できるよう typer.Context に格納する。
+    report が True の場合は、サブコマンドの終了時に計測結果を標準エラー出力に表示する。
+    """
+    timer = StartupTimer()
+    timer.add("import", _IMPORT_SECONDS)
+    ctx.meta[_STARTUP_TIMER] = timer
+    if report:
+        ctx.call_on_close(lambda: print(timer.summary(), file=sys.stderr))
+    return timer
+
 
+def _mark_startup(ctx: typer.Context, phase: str) -> None:
+    """起動処理の計測に、直前の区切りから現在までのフェーズを記録する"""
+    timer: StartupTimer | None = ctx.meta.get(_STARTUP_TIMER)
+    if timer is not None:
+        timer.mark(phase)
 
-def _initialize_logger(log_level: LogLevel, app_name: str | None) -> None:
+
+def _initialize_logger(
+    log_level: LogLevel,
+    app_name: str | None,
+    log_levels: Mapping[str, LogLevel],
+    queue_size: int | None,
+    rotation: LogRotation,
+) -> Path | None:
     """ロガーの初期化
 
     本アプリケーションではプレーンテキスト形式でログを出力する。
+    ロガー名ごとのログレベル（EXAMPLE_LOG_LEVELS）があれば、そのロガーにだけ適用する。
+    キューの上限件数（EXAMPLE_LOG_QUEUE_SIZE）があれば、ログの出力をバックグラウンドスレッドで行う。
+    ログファイルのローテーションと保持期間（EXAMPLE_LOG_MAX_BYTES など）を適用する。
+    作成したログファイルのパスを返す。
     """
-    log_configurator = LogConfigurator(level=log_level, app_name=app_name)
-    log_path = log_configurator.configure_plain()
+    log_configurator = LogConfigurator(level=log_level, app_name=app_name, logger_levels=log_levels)
+    log_path = log_configurator.configure_plain(queue_size=queue_size, rotation=rotation)
     logger.info("Started %s command", app_name)
     logger.info("Log file: %s", log_path)
+    return log_path
+
+
+def _start_profiler(ctx: typer.Context, log_path: Path | None) -> None:
+    """サブコマンドのプロファイリングを開始する
+
+    サブコマンドの終了時（例外による終了を含む）に計測を終了し、
+    ログファイルと同じ場所・同じファイル名で計測データと要約を出力する。
+    """
+    if log_path is None:
+        logger.warning("Profiling skipped: no log file to place the profile next to")
+        return
+
+    from example.foundation.profile import Profiler
+
+    profiler = Profiler()
+
+    def stop() -> None:
+        report = profiler.stop(log_path.with_suffix(""))
+        logger.info("Profile stats: %s", report.stats_path)
+        logger.info("Profile summary: %s", report.summary_path)
+
+    ctx.call_on_close(stop)
+    profiler.start()
 
 
 @log
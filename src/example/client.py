@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""常駐サーバー（example serve）のクライアント
+
+CLI 引数をそのまま常駐サーバーへ転送し、サーバーでの実行結果（標準出力・標準エラー出力・終了コード）を再現する。
+標準ライブラリと example.foundation.ipc のみに依存し、Typer・pydantic などを import しないため起動が速い。
+サーバーが起動していない場合は、通常の CLI と同じ処理をこのプロセスで実行する。
+
+Docs:
+    - docs/specs/cli/requirements.md
+    - docs/specs/cli/design.md
+
+Usage:
+    uv run example serve &
+    uv run example-client transform xxxx.md
+    uv run example-client --socket /tmp/example.sock transform docs/
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from example.foundation.ipc import IpcError, JsonLineClient
+
+
+def default_socket_path() -> Path:
+    """常駐サーバーのデフォルトのソケットパスを返す
+
+    ユーザーごとに異なるパスとし、他のユーザーのサーバーへ接続しないようにする。
+    起動時間を優先し、tempfile（import が重い）ではなく TMPDIR 環境変数を直接参照する。
+    """
+    return Path(os.environ.get("TMPDIR") or "/tmp") / f"example-{os.getuid()}.sock"
+
+
+def main() -> None:
+    """メイン関数"""
+    args = sys.argv[1:]
+    socket_path = default_socket_path()
+    if len(args) >= 2 and args[0] == "--socket":
+        socket_path = Path(args[1])
+        args = args[2:]
+
+    try:
+        response = JsonLineClient(socket_path).request({"args": args, "cwd": str(Path.cwd())})
+    except IpcError as e:
+        if not isinstance(e.cause, FileNotFoundError | ConnectionRefusedError):
+            print(e.message, file=sys.stderr)
+            sys.exit(1)
+        # サーバーが起動していなければ、通常の CLI としてこのプロセスで実行する
+        from example.cli import main as cli_main
+
+        sys.argv = ["example", *args]
+        cli_main()
+        return
+
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    sys.exit(response["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,44 @@ Docs:
     - docs/specs/config/design.md
 """
 
-from example.config.app import AppConfig
-from example.config.env_var import EnvVarConfig
+import importlib
+from typing import TYPE_CHECKING
+
+from example.config.types import (
+    Durability,
+    LogLevel,
+    OutputCompression,
+    ReaderBackend,
+    WriterBackend,
+)
+
+if TYPE_CHECKING:
+    from example.config.app import AppConfig
+    from example.config.env_var import EnvVarConfig
 
 __all__ = [
     "AppConfig",
+    "Durability",
     "EnvVarConfig",
+    "LogLevel",
+    "OutputCompression",
+    "ReaderBackend",
+    "WriterBackend",
 ]
+
+_LAZY_IMPORTS = {
+    "AppConfig": "example.config.app",
+    "EnvVarConfig": "example.config.env_var",
+}
+
+
+def __getattr__(name: str) -> object:
+    """AppConfig・EnvVarConfig を初回参照時に import する（PEP 562）
+
+    pydantic・pydantic-settings の import を、設定を読み込む時点まで遅らせる。
+    LogLevel などの型のみを参照する場合（CLI のオプション定義など）は import しない。
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
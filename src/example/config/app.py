@@ -5,11 +5,21 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import timedelta
 from pathlib import Path
 
-from example.config.env_var import EnvVarConfig, LogLevel
+from example.config.env_var import EnvVarConfig
 from example.config.path import PathConfig
+from example.config.types import (
+    Durability,
+    LogLevel,
+    OutputCompression,
+    ReaderBackend,
+    WriterBackend,
+)
 
 
 @dataclass(frozen=True)
@@ -18,10 +28,28 @@ class AppConfig:
 
     EnvVarConfig（環境変数）と PathConfig（デフォルト値）を合成する。
     環境変数が設定されていればその値を優先し、未設定の場合はデフォルト値を使用する。
+    実行環境に依存する値（ワーカー数など）は、生成時に実際に使う値へ解決する。
     """
 
     log_level: LogLevel
     tmp_dir: Path
+    reader_backend: ReaderBackend = "standard"
+    writer_backend: WriterBackend = "file"
+    workers: int = 1
+    io_buffer_size: int = 1 << 20
+    read_chunk_size: int = 1 << 20
+    memory_budget: int | None = None
+    cache_dir: Path | None = None
+    durability: Durability = "none"
+    output_compression: OutputCompression = "auto"
+    compression_level: int | None = None
+    log_queue_size: int | None = None
+    log_max_bytes: int | None = None
+    log_backup_count: int = 5
+    log_compress: bool = False
+    log_max_files: int | None = None
+    log_max_age: timedelta | None = None
+    log_levels: Mapping[str, LogLevel] = field(default_factory=dict[str, LogLevel])
 
     @classmethod
     def build(cls, env: EnvVarConfig, *, log_level: LogLevel | None = None) -> AppConfig:
@@ -35,4 +63,33 @@ class AppConfig:
         tmp_dir = (
             env.tmp_dir if env.tmp_dir is not None else PathConfig.from_base_dir(Path.cwd()).tmp_dir
         )
-        return AppConfig(log_level=effective_log_level, tmp_dir=tmp_dir)
+        return AppConfig(
+            log_level=effective_log_level,
+            tmp_dir=tmp_dir,
+            reader_backend=env.reader_backend,
+            writer_backend=env.writer_backend,
+            workers=env.workers if env.workers is not None else _available_cpu_count(),
+            io_buffer_size=env.io_buffer_size,
+            read_chunk_size=env.read_chunk_size,
+            memory_budget=env.memory_budget,
+            cache_dir=env.cache_dir,
+            durability=env.durability,
+            output_compression=env.output_compression,
+            compression_level=env.compression_level,
+            log_queue_size=env.log_queue_size,
+            log_max_bytes=env.log_max_bytes,
+            log_backup_count=env.log_backup_count,
+            log_compress=env.log_compress,
+            log_max_files=env.log_max_files,
+            log_max_age=env.log_max_age,
+            log_levels=dict(env.log_levels),
+        )
+
+
+def _available_cpu_count() -> int:
+    """このプロセスが実行できる CPU 数を返す
+
+    os.process_cpu_count() は CPU アフィニティ（sched_getaffinity）で制限された CPU 数を返すため、
+    taskset やコンテナで割り当てを絞った環境でも、割り当て以上のワーカーを起動しない。
+    """
+    return os.process_cpu_count() or 1
@@ -3,12 +3,23 @@
 環境変数から設定値を読み込む。プレフィックス EXAMPLE_ を付与した環境変数を対象とする。
 """
 
+from datetime import timedelta
 from pathlib import Path
-from typing import Literal
+from typing import Annotated
 
+from pydantic import ByteSize, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]
+from example.config.types import (
+    Durability,
+    LogLevel,
+    OutputCompression,
+    ReaderBackend,
+    WriterBackend,
+)
+
+type BufferSize = Annotated[ByteSize, Field(ge=4096)]
+"""I/O の単位とするバイト数（"1MiB" のような単位付きの表記も受け付ける、4KiB 以上）"""
 
 
 class EnvVarConfig(BaseSettings):
@@ -16,6 +27,7 @@ class EnvVarConfig(BaseSettings):
 
     EXAMPLE_ プレフィックスの環境変数を自動マッピングする。
     未設定項目はデフォルト値を使用し、未知の環境変数は禁止する。
+    バイト数の項目は "64KiB" や "1GB" のような単位付きの表記も受け付ける。
     """
 
     model_config = SettingsConfigDict(
@@ -25,4 +37,21 @@ class EnvVarConfig(BaseSettings):
     )
 
     log_level: LogLevel = "INFO"
+    log_levels: dict[str, LogLevel] = Field(default_factory=dict)
+    log_queue_size: Annotated[int, Field(ge=1)] | None = None
+    log_max_bytes: Annotated[ByteSize, Field(gt=0)] | None = None
+    log_backup_count: Annotated[int, Field(ge=1)] = 5
+    log_compress: bool = False
+    log_max_files: Annotated[int, Field(ge=1)] | None = None
+    log_max_age: Annotated[timedelta, Field(gt=timedelta(0))] | None = None
     tmp_dir: Path | None = None
+    reader_backend: ReaderBackend = "standard"
+    writer_backend: WriterBackend = "file"
+    workers: Annotated[int, Field(ge=1)] | None = None
+    io_buffer_size: BufferSize = ByteSize(1 << 20)
+    read_chunk_size: BufferSize = ByteSize(1 << 20)
+    memory_budget: Annotated[ByteSize, Field(gt=0)] | None = None
+    cache_dir: Path | None = None
+    durability: Durability = "none"
+    output_compression: OutputCompression = "auto"
+    compression_level: Annotated[int, Field(ge=1, le=9)] | None = None
@@ -0,0 +1,12 @@
+"""Config層の設定値の型
+
+pydantic に依存しないため、CLI のオプション定義から軽量に参照できる。
+"""
+
+from typing import Literal
+
+LogLevel = Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"]
+ReaderBackend = Literal["standard", "mmap"]
+WriterBackend = Literal["file", "memory"]
+Durability = Literal["none", "fsync"]
+OutputCompression = Literal["auto", "none", "gzip", "bz2", "xz"]
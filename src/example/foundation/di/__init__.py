@@ -0,0 +1,12 @@
+"""依存性注入の公開API(Foundation層)。
+
+公開APIは `example.foundation.di` から import すること(`__all__` のみ互換性対象)。
+
+Docs:
+    - docs/specs/foundation/di/requirements.md
+    - docs/specs/foundation/di/design.md
+"""
+
+from example.foundation.di.container import Container, Scope
+
+__all__ = ["Container", "Scope"]
@@ -0,0 +1,101 @@
+"""ライフタイムを管理する依存性注入コンテナ"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal, cast
+
+type Scope = Literal["singleton", "run"]
+"""コンポーネントのライフタイム（singleton: コンテナごとに1つ、run: 実行単位ごとに1つ）"""
+
+
+@dataclass(frozen=True)
+class _Registration:
+    """コンポーネントの生成方法とライフタイム"""
+
+    factory: Callable[["Container"], object]
+    scope: Scope
+
+
+class Container:
+    """型をキーとして、コンポーネントの生成方法とライフタイムを管理する
+
+    使用例:
+        container = Container()
+        container.register(TextFileSystemReaderProtocol, lambda c: TextFileSystemReader())
+        container.register(TextReader, lambda c: TextReader(c.resolve(TextFileSystemReaderProtocol)))
+        reader = container.resolve(TextReader)  # 2回目以降は同じインスタンスを返す
+
+        with container.run():
+            ...  # run スコープのコンポーネントは、この範囲内で1つのインスタンスを共有する
+
+    Constraints:
+        - run スコープのコンポーネントを run() の範囲外で解決した場合は、解決のたびに生成する
+        - singleton スコープのコンポーネントは、run スコープのコンポーネントに依存してはならない
+          （最初の実行のインスタンスを保持し続けてしまうため）
+        - スレッドセーフではない（登録・解決は1つのスレッドで行う）
+    """
+
+    def __init__(self) -> None:
+        """Containerを初期化"""
+        self._registrations: dict[type, _Registration] = {}
+        self._singletons: dict[type, object] = {}
+        self._run_instances: dict[type, object] | None = None
+
+    def register[T](
+        self, key: type[T], factory: Callable[["Container"], T], scope: Scope = "singleton"
+    ) -> None:
+        """コンポーネントの生成方法を登録する
+
+        同じキーで登録し直した場合は後の登録で置き換え、生成済みのインスタンスを全て破棄する
+        （置き換えたコンポーネントに依存するインスタンスも作り直すため）。
+
+        Args:
+            key: コンポーネントを解決するキー（具象クラスまたは Protocol）
+            factory: コンテナを受け取り、コンポーネントを生成する関数
+            scope: コンポーネントのライフタイム
+        """
+        self._registrations[key] = _Registration(factory=factory, scope=scope)
+        self._singletons.clear()
+        if self._run_instances is not None:
+            self._run_instances.clear()
+
+    def resolve[T](self, key: type[T]) -> T:
+        """コンポーネントを解決する
+
+        スコープ内に生成済みのインスタンスがあればそれを返し、なければ生成して保持する。
+
+        Args:
+            key: 登録時に指定したキー
+
+        Returns:
+            コンポーネントのインスタンス
+
+        Raises:
+            LookupError: キーが登録されていない場合
+        """
+        registration = self._registrations.get(key)
+        if registration is None:
+            raise LookupError(f"component is not registered: {key.__qualname__}")
+
+        instances = self._singletons if registration.scope == "singleton" else self._run_instances
+        if instances is None:
+            return cast(T, registration.factory(self))
+        if key not in instances:
+            instances[key] = registration.factory(self)
+        return cast(T, instances[key])
+
+    @contextmanager
+    def run(self) -> Iterator[None]:
+        """Run スコープを開始し、終了時に run スコープのインスタンスを破棄する
+
+        Raises:
+            RuntimeError: run スコープが既に開始されている場合
+        """
+        if self._run_instances is not None:
+            raise RuntimeError("run scope is already active")
+        self._run_instances = {}
+        try:
+            yield
+        finally:
+            self._run_instances = None
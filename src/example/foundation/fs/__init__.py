@@ -7,11 +7,33 @@ Docs:
     - docs/specs/foundation/fs/design.md
 """
 
+from example.foundation.fs.async_text import AsyncTextFileSystemReader, AsyncTextFileSystemWriter
+from example.foundation.fs.codec import with_compression_suffix
 from example.foundation.fs.error import FileSystemError
-from example.foundation.fs.text import TextFileSystemReader, TextFileSystemWriter
+from example.foundation.fs.finder import FileSystemFinder
+from example.foundation.fs.inspector import FileSystemInspector
+from example.foundation.fs.mapped import ByteRangeFileSystemReader, MmapTextFileSystemReader
+from example.foundation.fs.memory import MemoryTextFileSystemWriter
+from example.foundation.fs.stdio import StdinTextFileSystemReader, StdoutTextFileSystemWriter
+from example.foundation.fs.text import (
+    OffsetFileSystemWriter,
+    TextFileSystemReader,
+    TextFileSystemWriter,
+)
 
 __all__ = [
+    "AsyncTextFileSystemReader",
+    "AsyncTextFileSystemWriter",
+    "ByteRangeFileSystemReader",
     "FileSystemError",
+    "FileSystemFinder",
+    "FileSystemInspector",
+    "MemoryTextFileSystemWriter",
+    "MmapTextFileSystemReader",
+    "OffsetFileSystemWriter",
+    "StdinTextFileSystemReader",
+    "StdoutTextFileSystemWriter",
     "TextFileSystemReader",
     "TextFileSystemWriter",
+    "with_compression_suffix",
 ]
@@ -0,0 +1,87 @@
+"""非同期ファイルシステム操作クラス（Adapter実装）
+
+同期版の読み取り・書き込みクラスをスレッドへ委譲し、イベントループをブロックせずに実行する。
+"""
+
+import asyncio
+from pathlib import Path
+
+from example.foundation.fs.text import TextFileSystemReader, TextFileSystemWriter
+from example.protocol.fs import (
+    AsyncTextFileSystemReaderProtocol,
+    AsyncTextFileSystemWriterProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
+
+
+class AsyncTextFileSystemReader(AsyncTextFileSystemReaderProtocol):
+    """ファイル読み取り専用クラス（非同期版）
+
+    読み込みは asyncio.to_thread でスレッドへ委譲します。
+    読み込み結果と例外は委譲先の同期版クラスと同一です。
+    """
+
+    def __init__(self, reader: TextFileSystemReaderProtocol | None = None) -> None:
+        """初期化
+
+        Args:
+            reader: 委譲先の同期版読み取りクラス（None の場合は TextFileSystemReader）
+        """
+        self.reader = reader if reader is not None else TextFileSystemReader()
+
+    async def read(self, file_path: Path, newline: str | None = None) -> str:
+        """テキストファイルの内容を読み込み、文字列で返す
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+            newline: 改行コードの扱い（委譲先の read() へそのまま渡す）
+
+        Returns:
+            ファイルの内容（改行文字を含む、フィルタリングなし）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        return await asyncio.to_thread(self.reader.read, file_path, newline)
+
+
+class AsyncTextFileSystemWriter(AsyncTextFileSystemWriterProtocol):
+    """ファイル書き込み専用クラス（非同期版）
+
+    書き込みは asyncio.to_thread でスレッドへ委譲します。
+    書き込み内容と例外は委譲先の同期版クラスと同一です。
+    """
+
+    def __init__(self, writer: TextFileSystemWriterProtocol | None = None) -> None:
+        """初期化
+
+        Args:
+            writer: 委譲先の同期版書き込みクラス（None の場合は TextFileSystemWriter）
+        """
+        self.writer = writer if writer is not None else TextFileSystemWriter()
+
+    async def write(self, text: str, file_path: Path) -> None:
+        """テキスト内容をファイルに書き込む
+
+        書き込み先のディレクトリが存在しない場合は自動的に作成します。
+
+        Args:
+            text: 書き込む文字列
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        await asyncio.to_thread(self.writer.write, text, file_path)
+
+    async def remove(self, file_path: Path) -> None:
+        """ファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            file_path: 削除するファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        await asyncio.to_thread(self.writer.remove, file_path)
@@ -0,0 +1,189 @@
+"""圧縮形式の判定と、圧縮・伸長のストリーム処理
+
+標準ライブラリの gzip・bz2・lzma（xz）を使い、ファイル全体を展開せずに逐次処理する。
+読み込み時はファイル先頭のマジックバイトで、書き込み時は書き込み先の拡張子で圧縮形式を判定する。
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import re
+import zlib
+from collections.abc import Buffer, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Literal, Protocol, TextIO
+
+type Compression = Literal["gzip", "bz2", "xz"]
+"""対応する圧縮形式"""
+
+type OutputCompression = Literal["auto", "none", "gzip", "bz2", "xz"]
+"""書き込み時の圧縮形式の指定（auto: 書き込み先の拡張子から判定、none: 圧縮しない）"""
+
+_GZIP_MAGIC = b"\x1f\x8b\x08"
+"""gzip（deflate）のファイル先頭のバイト列"""
+
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+"""xz のファイル先頭のバイト列"""
+
+_BZ2_MAGIC = re.compile(rb"BZh[1-9](?:1AY&SY|\x17rE8P\x90)")
+"""bz2 のファイル先頭のバイト列（"BZh" + ブロックサイズ + 先頭ブロック、または終端のマジック）"""
+
+_MAGIC_SIZE = 10
+"""圧縮形式の判定に読み込むファイル先頭のバイト数"""
+
+_SUFFIXES: dict[str, Compression] = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+"""圧縮形式ごとのファイルの拡張子"""
+
+
+class Compressor(Protocol):
+    """データを逐次圧縮するオブジェクト（zlib・bz2・lzma の圧縮オブジェクトに共通のインターフェース）"""
+
+    def compress(self, data: Buffer, /) -> bytes:
+        """データを圧縮し、出力できる分の圧縮済みデータを返す"""
+        ...
+
+    def flush(self) -> bytes:
+        """残りの圧縮済みデータを返し、圧縮を終える"""
+        ...
+
+
+def detect_compression(content: bytes | mmap.mmap) -> Compression | None:
+    """ファイル先頭のバイト列から圧縮形式を判定する
+
+    gzip・xz の先頭バイトは UTF-8 として不正なため、UTF-8 のテキストファイルを誤判定することはない。
+    bz2 は ASCII の範囲に収まるため、"BZh" に続くブロックのマジックまで照合する。
+
+    Args:
+        content: ファイル全体、またはファイル先頭のバイト列（6バイト以上あれば全形式を判定できる）
+
+    Returns:
+        圧縮形式（圧縮されていない場合は None）
+    """
+    head = bytes(content[:_MAGIC_SIZE])
+    if head.startswith(_GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(_XZ_MAGIC):
+        return "xz"
+    if _BZ2_MAGIC.match(head):
+        return "bz2"
+    return None
+
+
+def resolve_compression(
+    output_compression: OutputCompression, file_path: Path
+) -> Compression | None:
+    """書き込み時の圧縮形式の指定を、実際に使う圧縮形式に解決する
+
+    Args:
+        output_compression: 圧縮形式の指定
+        file_path: 書き込み先のファイルパス（auto の場合に拡張子を参照する）
+
+    Returns:
+        圧縮形式（圧縮しない場合は None）
+    """
+    if output_compression == "auto":
+        return _SUFFIXES.get(file_path.suffix.lower())
+    if output_compression == "none":
+        return None
+    return output_compression
+
+
+def with_compression_suffix(file_path: Path, output_compression: OutputCompression) -> Path:
+    """書き込み先のファイルパスの拡張子を、書き込み時の圧縮形式の指定に合わせる
+
+    - auto: そのまま返す（拡張子から圧縮形式を判定するため、常に一致する）
+    - none: 圧縮形式の拡張子（.gz / .bz2 / .xz）があれば取り除く
+    - gzip / bz2 / xz: 圧縮形式の拡張子があれば置き換え、なければ付け加える
+
+    Args:
+        file_path: 書き込み先のファイルパス
+        output_compression: 圧縮形式の指定
+
+    Returns:
+        拡張子を圧縮形式に合わせたファイルパス
+    """
+    if output_compression == "auto":
+        return file_path
+    if file_path.suffix.lower() in _SUFFIXES:
+        file_path = file_path.with_suffix("")
+    if output_compression == "none":
+        return file_path
+    suffix = next(s for s, c in _SUFFIXES.items() if c == output_compression)
+    return file_path.with_name(file_path.name + suffix)
+
+
+def new_compressor(compression: Compression, level: int | None = None) -> Compressor:
+    """圧縮形式に対応する圧縮オブジェクトを生成する
+
+    gzip は zlib の圧縮オブジェクトで gzip 形式のストリームを生成する
+    （ファイル名・更新日時をヘッダーに含めないため、同じ入力からは同じ出力が得られる）。
+
+    Args:
+        compression: 圧縮形式
+        level: 圧縮レベル（1〜9、None の場合は各形式の既定値）
+
+    Returns:
+        圧縮オブジェクト
+    """
+    if compression == "gzip":
+        gzip_level = level if level is not None else zlib.Z_DEFAULT_COMPRESSION
+        return zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    if compression == "bz2":
+        return bz2.BZ2Compressor(level if level is not None else 9)
+    return lzma.LZMACompressor(preset=level)
+
+
+@contextmanager
+def open_text(file_path: Path, newline: str | None, buffering: int = -1) -> Iterator[TextIO]:
+    """ファイルを UTF-8 のテキストとして開く（圧縮されている場合は伸長しながら読み込む）
+
+    圧縮形式はファイル先頭のマジックバイトで判定するため、拡張子に依存しない。
+
+    Args:
+        file_path: 読み込み対象のファイルパス
+        newline: 改行コードの扱い（open() の newline 引数と同じ）
+        buffering: ファイルからの読み込みバッファのバイト数（-1 の場合は既定値）
+
+    Returns:
+        テキストストリームを返すコンテキストマネージャー
+    """
+    with file_path.open("rb", buffering=buffering) as raw:
+        compression = detect_compression(raw.read(_MAGIC_SIZE))
+        raw.seek(0)
+        if compression == "gzip":
+            with gzip.open(raw, "rt", encoding="utf-8", newline=newline) as text:
+                yield text
+        elif compression == "bz2":
+            with bz2.open(raw, "rt", encoding="utf-8", newline=newline) as text:
+                yield text
+        elif compression == "xz":
+            with io.TextIOWrapper(lzma.LZMAFile(raw), encoding="utf-8", newline=newline) as text:
+                yield text
+        else:
+            with io.TextIOWrapper(raw, encoding="utf-8", newline=newline) as text:
+                yield text
+
+
+def read_bytes(file_path: Path) -> bytes:
+    """ファイルの内容をバイト列で読み込む（圧縮されている場合は伸長した内容を返す）
+
+    圧縮形式は open_text() と同じくファイル先頭のマジックバイトで判定する。
+
+    Args:
+        file_path: 読み込み対象のファイルパス
+
+    Returns:
+        ファイルの内容（伸長後、デコードしない）
+    """
+    content = file_path.read_bytes()
+    compression = detect_compression(content)
+    if compression == "gzip":
+        return gzip.decompress(content)
+    if compression == "bz2":
+        return bz2.decompress(content)
+    if compression == "xz":
+        return lzma.decompress(content)
+    return content
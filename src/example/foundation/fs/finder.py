@@ -0,0 +1,121 @@
+"""ファイル探索クラス（Adapter実装）"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from example.foundation.fs.error import FileSystemError
+from example.protocol.fs import FileSystemFinderProtocol
+
+_GLOB_CHARS = frozenset("*?[")
+"""globパターンとみなす文字"""
+
+
+class FileSystemFinder(FileSystemFinderProtocol):
+    """ファイル探索専用クラス
+
+    ファイルパス・ディレクトリ・globパターンから対象ファイルを列挙する機能のみを提供します。
+    """
+
+    def find(self, patterns: Sequence[Path], exclude: Sequence[Path] = ()) -> list[Path]:
+        """パターンに一致するファイルを列挙する
+
+        - globパターン: 一致するファイル（`**` による再帰一致に対応）
+        - ディレクトリ: 配下のファイルを再帰的に列挙（隠しディレクトリの配下は列挙しない）
+        - それ以外: 指定されたパスをそのまま返す（存在確認は読み込み時に行う）
+
+        Args:
+            patterns: ファイルパス・ディレクトリ・globパターンのシーケンス
+            exclude: 配下を列挙しないディレクトリ（出力先など。ファイルパスの直接指定には適用しない）
+
+        Returns:
+            重複を除いたファイルパスのリスト（指定順、各パターン内はパス順）
+
+        Raises:
+            FileSystemError: 探索に失敗した場合、または1件も見つからない場合
+        """
+        # dict のキー順序で、重複を除きつつ指定順を保持する
+        excluded = frozenset(path.resolve() for path in exclude)
+        found: dict[Path, None] = {}
+        for pattern in patterns:
+            for path in self._expand(pattern, excluded):
+                found.setdefault(path, None)
+
+        if not found:
+            raise FileSystemError(
+                message=f"対象ファイルが見つかりません: {', '.join(map(str, patterns))}",
+                cause="no files matched the given patterns",
+            )
+        return list(found)
+
+    def _expand(self, pattern: Path, excluded: frozenset[Path]) -> list[Path]:
+        """1つのパターンを展開する
+
+        Args:
+            pattern: ファイルパス・ディレクトリ・globパターン
+            excluded: 配下を列挙しないディレクトリ（解決済みの絶対パス）
+
+        Returns:
+            展開したファイルパスのリスト
+
+        Raises:
+            FileSystemError: 探索中にエラーが発生した場合
+        """
+        try:
+            if _GLOB_CHARS.intersection(str(pattern)):
+                return sorted(
+                    p for p in self._glob(pattern) if p.is_file() and not _is_excluded(p, excluded)
+                )
+            if pattern.is_dir():
+                return sorted(self._walk(pattern, excluded))
+        except OSError as e:
+            raise FileSystemError(
+                message=f"ファイルの探索中にエラーが発生しました: {pattern}",
+                cause=e,
+            ) from e
+        return [pattern]
+
+    def _walk(self, root: Path, excluded: frozenset[Path]) -> list[Path]:
+        """ディレクトリ配下のファイルを再帰的に列挙する
+
+        隠しディレクトリ（.manifest/ や .outputs/ など）と除外ディレクトリは、配下を探索せずに読み飛ばす。
+
+        Args:
+            root: 探索するディレクトリ
+            excluded: 配下を列挙しないディレクトリ（解決済みの絶対パス）
+
+        Returns:
+            ファイルパスのリスト
+        """
+        files: list[Path] = []
+        for dir_path, dir_names, file_names in root.walk():
+            dir_names[:] = [
+                name
+                for name in dir_names
+                if not name.startswith(".") and not _is_excluded(dir_path / name, excluded)
+            ]
+            # シンボリックリンクは file_names に含まれるため、ファイルを指すものだけを残す
+            files.extend(path for name in file_names if (path := dir_path / name).is_file())
+        return files
+
+    def _glob(self, pattern: Path) -> list[Path]:
+        """globパターンに一致するパスを列挙する
+
+        Path.glob() は相対パターンのみ受け付けるため、絶対パスはアンカーを起点に展開する。
+
+        Args:
+            pattern: globパターン
+
+        Returns:
+            一致したパスのリスト
+        """
+        if pattern.is_absolute():
+            return list(Path(pattern.anchor).glob(str(pattern.relative_to(pattern.anchor))))
+        return list(Path().glob(str(pattern)))
+
+
+def _is_excluded(path: Path, excluded: frozenset[Path]) -> bool:
+    """パスが除外ディレクトリ（またはその配下）にあるか"""
+    if not excluded:
+        return False
+    resolved = path.resolve()
+    return any(resolved.is_relative_to(directory) for directory in excluded)
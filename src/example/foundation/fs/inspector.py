@@ -0,0 +1,67 @@
+"""ファイル検査クラス（Adapter実装）"""
+
+import hashlib
+from pathlib import Path
+
+from example.foundation.fs.error import FileSystemError
+from example.protocol.fs import FileStamp, FileSystemInspectorProtocol
+
+
+class FileSystemInspector(FileSystemInspectorProtocol):
+    """ファイル検査専用クラス
+
+    ファイルのメタデータ取得と内容のハッシュ計算のみを提供します。
+    """
+
+    def stamp(self, file_path: Path) -> FileStamp | None:
+        """ファイルのサイズと最終更新日時を取得する
+
+        stat を1回だけ発行し、ファイル内容は読み込みません。
+
+        Args:
+            file_path: 対象のファイルパス
+
+        Returns:
+            ファイルのメタデータ（ファイルが存在しない場合は None）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            raise FileSystemError(
+                message=f"ファイル情報の取得中にエラーが発生しました: {file_path}",
+                cause=e,
+            ) from e
+        return FileStamp(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def digest(self, file_path: Path) -> str:
+        """ファイル内容の SHA-256 ハッシュを計算する
+
+        ファイルはバイト列のまま読み込み、全体をメモリに載せずにハッシュを計算します。
+
+        Args:
+            file_path: 対象のファイルパス
+
+        Returns:
+            16進数表記のハッシュ値
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        try:
+            with file_path.open("rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        except FileNotFoundError as e:
+            raise FileSystemError(
+                message=f"ファイルが見つかりません: {file_path}",
+                cause=e,
+            ) from e
+        except Exception as e:
+            raise FileSystemError(
+                message=f"ファイルのハッシュ計算中にエラーが発生しました: {file_path}",
+                cause=e,
+            ) from e
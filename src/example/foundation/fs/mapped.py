@@ -0,0 +1,193 @@
+"""メモリマップによるファイル読み取りクラス（Adapter実装）"""
+
+import mmap
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from example.foundation.fs.codec import detect_compression, open_text
+from example.foundation.fs.error import FileSystemError
+from example.foundation.fs.text import translate_read_error
+from example.protocol.fs import (
+    ByteRange,
+    ByteRangeFileSystemReaderProtocol,
+    TextFileSystemReaderProtocol,
+)
+
+_WINDOW_SIZE = 1 << 20
+"""read_lines() で1回にデコードする範囲の目安（バイト、既定値）"""
+
+
+class MmapTextFileSystemReader(TextFileSystemReaderProtocol):
+    r"""メモリマップによるファイル読み取り専用クラス
+
+    ファイルをメモリマップし、行境界（\n）の探索をバイト列のまま行ったうえで、
+    必要な範囲だけを UTF-8 でデコードします。
+    読み込み用バッファへのコピーを経由しないため、大きなファイルでの読み取りコストを抑えられ、
+    同じファイルを並行して読む複数プロセス間でページキャッシュを共有できます。
+
+    戻り値と例外は TextFileSystemReader と同一です。
+    圧縮されたファイルはメモリマップ上では扱えないため、TextFileSystemReader と同じく伸長しながら読み込みます。
+    読み込み中にファイルが切り詰められた場合の挙動は OS に依存するため、
+    変換中に外部から更新されないファイルを対象としてください。
+    """
+
+    def __init__(self, window_size: int = _WINDOW_SIZE) -> None:
+        """MmapTextFileSystemReaderを初期化
+
+        Args:
+            window_size: read_lines() で1回にデコードする範囲の目安（バイト）
+        """
+        self.window_size = window_size
+
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        r"""テキストファイルの内容を読み込み、文字列で返す
+
+        TextFileSystemReader.read と同様に、newline が None の場合は改行コード（\r\n, \r）を \n に変換します。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+            newline: 改行コードの扱い（None 以外の場合は変換しない）
+
+        Returns:
+            ファイルの内容（改行文字を含む、フィルタリングなし）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with translate_read_error(file_path):
+            with _map(file_path) as buffer:
+                if detect_compression(buffer) is None:
+                    text = str(buffer, encoding="utf-8")
+                    if newline is not None or buffer.find(b"\r") == -1:
+                        return text
+                    return text.replace("\r\n", "\n").replace("\r", "\n")
+            with open_text(file_path, newline=newline) as f:
+                return f.read()
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        r"""テキストファイルを改行文字（\n）単位で逐次読み込む
+
+        行境界はマップしたバイト列上で探索し、\n で終わる一定サイズの範囲ごとにデコードして行に分割します。
+        UTF-8 では \n のバイトが多バイト文字の一部に現れないため、バイト単位の分割で文字が壊れることはありません。
+        メモリ使用量は分割単位と最長行の長さに比例し、ファイルサイズには依存しません。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+
+        Returns:
+            行末の改行文字を含む行のイテレータ
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合（イテレート中に送出）
+        """
+        with translate_read_error(file_path):
+            with _map(file_path) as buffer:
+                if detect_compression(buffer) is None:
+                    start = 0
+                    size = len(buffer)
+                    while start < size:
+                        end = _find_window_end(buffer, start, size, self.window_size)
+                        lines = str(buffer[start:end], encoding="utf-8").split("\n")
+                        last = lines.pop()
+                        for line in lines:
+                            yield line + "\n"
+                        if last:
+                            yield last
+                        start = end
+                    return
+            with open_text(file_path, newline="\n") as f:
+                yield from f
+
+
+class ByteRangeFileSystemReader(ByteRangeFileSystemReaderProtocol):
+    r"""バイト範囲単位のファイル読み取り専用クラス
+
+    行境界（\n の直後）の探索はメモリマップしたバイト列上で行い、ファイル全体はデコードしません。
+    UTF-8 では \n のバイトが多バイト文字の一部に現れないため、範囲の境界で文字が壊れることはありません。
+    また \r\n の途中で分割されることもないため、各範囲を str.splitlines() で分割した行を順に連結すると、
+    ファイル全体を TextFileSystemReader.read で読み込んで分割した行と一致します。
+    """
+
+    def split(self, file_path: Path, shard_size: int) -> list[ByteRange]:
+        r"""ファイルを行境界（\n の直後）で分割したバイト範囲を返す
+
+        Args:
+            file_path: 対象のファイルパス
+            shard_size: 1範囲のバイト数の目安（行が長い場合は次の行境界まで広げる）
+
+        Returns:
+            ファイル先頭から末尾までを隙間なく覆う範囲のリスト（空ファイルの場合は空リスト）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合、またはファイルが圧縮されている場合
+        """
+        ranges: list[ByteRange] = []
+        with translate_read_error(file_path), _map(file_path) as buffer:
+            compressed = detect_compression(buffer) is not None
+            size = 0 if compressed else len(buffer)
+            start = 0
+            while start < size:
+                limit = start + max(1, shard_size)
+                if limit >= size:
+                    end = size
+                else:
+                    newline = buffer.find(b"\n", limit - 1)
+                    end = size if newline == -1 else newline + 1
+                ranges.append(ByteRange(start=start, end=end))
+                start = end
+        if compressed:
+            # 圧縮されたファイルはバイト位置と行境界が対応しないため、分割できない
+            raise FileSystemError(
+                message=f"圧縮されたファイルは分割して読み込めません: {file_path}"
+            )
+        return ranges
+
+    def read_range(self, file_path: Path, byte_range: ByteRange) -> str:
+        """バイト範囲を UTF-8 でデコードして返す
+
+        Args:
+            file_path: 対象のファイルパス
+            byte_range: 読み込む範囲（split() が返した範囲）
+
+        Returns:
+            範囲の内容（改行コードは変換しない）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with translate_read_error(file_path), file_path.open("rb") as f:
+            f.seek(byte_range.start)
+            return f.read(byte_range.end - byte_range.start).decode("utf-8")
+
+
+def _find_window_end(buffer: mmap.mmap | bytes, start: int, size: int, window_size: int) -> int:
+    r"""開始位置から分割単位程度進んだ位置にある行境界（\n の直後）を返す
+
+    分割単位の中に行境界がない場合は次の行境界まで、それもない場合はファイル末尾まで広げる。
+    """
+    limit = start + window_size
+    if limit >= size:
+        return size
+    end = buffer.rfind(b"\n", start, limit)
+    if end == -1:
+        end = buffer.find(b"\n", limit)
+    return size if end == -1 else end + 1
+
+
+@contextmanager
+def _map(file_path: Path) -> Iterator[mmap.mmap | bytes]:
+    """ファイルを読み取り専用でメモリマップする
+
+    長さ 0 のファイルはメモリマップできないため、空のバイト列を返す。
+
+    Args:
+        file_path: 対象のファイルパス
+    """
+    with file_path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
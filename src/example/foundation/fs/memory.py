@@ -0,0 +1,58 @@
+"""メモリ上のファイル書き込みクラス（Adapter実装）"""
+
+from collections.abc import Iterable
+from pathlib import Path
+
+from example.protocol.fs import BinaryFileSystemWriterProtocol, TextFileSystemWriterProtocol
+
+
+class MemoryTextFileSystemWriter(TextFileSystemWriterProtocol, BinaryFileSystemWriterProtocol):
+    """書き込まれたテキストをファイルパスごとにメモリへ保持するクラス
+
+    ファイルシステムへは書き込まない。出力を残さずに変換処理だけを実行・計測する場合や、
+    変換結果を呼び出し元で直接参照する場合に使う。
+
+    Constraints:
+        - 出力全体をメモリに保持するため、メモリに載らない大きさのファイルには使わない
+    """
+
+    def __init__(self) -> None:
+        """MemoryTextFileSystemWriterを初期化"""
+        self.files: dict[Path, str] = {}
+        self.blobs: dict[Path, bytes] = {}
+
+    def write(self, text: str, file_path: Path) -> None:
+        """テキスト内容をメモリに保持する
+
+        Args:
+            text: 書き込む文字列
+            file_path: 書き込み先のファイルパス（保持する内容のキー）
+        """
+        self.files[file_path] = text
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        """文字列チャンクを連結してメモリに保持する
+
+        Args:
+            chunks: 書き込む文字列チャンクのイテラブル
+            file_path: 書き込み先のファイルパス（保持する内容のキー）
+        """
+        self.files[file_path] = "".join(chunks)
+
+    def write_bytes(self, data: bytes, file_path: Path) -> None:
+        """バイト列をメモリに保持する（テキストとは別に blobs に保持する）
+
+        Args:
+            data: 書き込むバイト列
+            file_path: 書き込み先のファイルパス（保持する内容のキー）
+        """
+        self.blobs[file_path] = data
+
+    def remove(self, file_path: Path) -> None:
+        """保持している内容を破棄する（保持していない場合は何もしない）
+
+        Args:
+            file_path: 破棄する内容のキー
+        """
+        self.files.pop(file_path, None)
+        self.blobs.pop(file_path, None)
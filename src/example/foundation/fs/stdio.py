@@ -0,0 +1,193 @@
+"""標準入力・標準出力によるファイル読み書きクラス（Adapter実装）
+
+ファイルパスの代わりに標準入力・標準出力を使い、一時ファイルを介さずにパイプラインへ組み込めるようにする。
+"""
+
+import io
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, TextIO
+
+from example.foundation.fs.error import FileSystemError
+from example.foundation.fs.text import translate_read_error
+from example.protocol.fs import (
+    BinaryFileSystemWriterProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
+
+STDIN_PATH = Path("-")
+"""標準入力を表すファイルパス"""
+
+_BUFFER_SIZE = 1 << 20
+"""標準出力へ1回に書き込むバイト数の目安（既定値）"""
+
+
+class StdinTextFileSystemReader(TextFileSystemReaderProtocol):
+    """ファイルパスが `-` の場合は標準入力から読み込むクラス
+
+    それ以外のファイルパスは委譲先の読み込み実装で読み込みます。
+    標準入力は UTF-8 のテキストとして読み込み、戻り値と改行コードの扱いは TextFileSystemReader と同一です。
+    """
+
+    def __init__(self, delegate: TextFileSystemReaderProtocol, stdin: BinaryIO | None = None):
+        """StdinTextFileSystemReaderを初期化
+
+        Args:
+            delegate: `-` 以外のファイルパスの読み込み実装
+            stdin: 標準入力のバイナリストリーム（None の場合は読み込み時点の sys.stdin.buffer）
+        """
+        self.delegate = delegate
+        self.stdin = stdin
+
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        """テキストファイル、または標準入力の内容を読み込み、文字列で返す
+
+        Args:
+            file_path: 読み込み対象のファイルパス（`-` の場合は標準入力）
+            newline: 改行コードの扱い（TextFileSystemReader.read と同じ）
+
+        Returns:
+            ファイルの内容（改行文字を含む、フィルタリングなし）
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        if file_path != STDIN_PATH:
+            return self.delegate.read(file_path, newline)
+        with translate_read_error(file_path), self._open(newline=newline) as f:
+            return f.read()
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        r"""テキストファイル、または標準入力を改行文字（\n）単位で逐次読み込む
+
+        Args:
+            file_path: 読み込み対象のファイルパス（`-` の場合は標準入力）
+
+        Returns:
+            行末の改行文字を含む行のイテレータ
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合（イテレート中に送出）
+        """
+        if file_path != STDIN_PATH:
+            yield from self.delegate.read_lines(file_path)
+            return
+        with translate_read_error(file_path), self._open(newline="\n") as f:
+            yield from f
+
+    @contextmanager
+    def _open(self, newline: str | None) -> Iterator[TextIO]:
+        """標準入力を UTF-8 のテキストストリームとして開く
+
+        読み込み後は TextIOWrapper から切り離し、標準入力そのものは閉じない。
+
+        Args:
+            newline: 改行コードの扱い（open() の newline 引数と同じ）
+        """
+        stdin = self.stdin if self.stdin is not None else sys.stdin.buffer
+        text = io.TextIOWrapper(stdin, encoding="utf-8", newline=newline)
+        try:
+            yield text
+        finally:
+            text.detach()
+
+
+class StdoutTextFileSystemWriter(TextFileSystemWriterProtocol, BinaryFileSystemWriterProtocol):
+    """テキストを標準出力へ書き込むクラス
+
+    書き込み先のファイルパスは参照せず、書き込まれた順に UTF-8 で標準出力へ書き込みます。
+
+    Constraints:
+        - 書き込み先を置き換えないため、書き込み途中で失敗した場合は出力済みの内容が残る
+    """
+
+    def __init__(self, buffer_size: int = _BUFFER_SIZE, stdout: BinaryIO | None = None):
+        """StdoutTextFileSystemWriterを初期化
+
+        Args:
+            buffer_size: 標準出力へ1回に書き込むバイト数の目安
+            stdout: 標準出力のバイナリストリーム（None の場合は書き込み時点の sys.stdout.buffer）
+        """
+        self.buffer_size = buffer_size
+        self.stdout = stdout
+
+    def write(self, text: str, file_path: Path) -> None:
+        """テキスト内容を標準出力へ書き込む
+
+        Args:
+            text: 書き込む文字列
+            file_path: 書き込み先のファイルパス（参照しない）
+
+        Raises:
+            FileSystemError: 標準出力への書き込みに失敗した場合
+        """
+        self.write_chunks((text,), file_path)
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        """文字列チャンクを順に標準出力へ書き込む
+
+        小さなチャンクは buffer_size の 1/4 の文字数程度まで連結してからエンコード・書き込みする。
+
+        Args:
+            chunks: 書き込む文字列チャンクのイテラブル
+            file_path: 書き込み先のファイルパス（参照しない）
+
+        Raises:
+            FileSystemError: 標準出力への書き込みに失敗した場合（チャンク生成元の FileSystemError はそのまま伝播する）
+        """
+        # 1文字は UTF-8 で最大4バイトのため、エンコード後に buffer_size を大きく超えない文字数で区切る
+        encode_size = max(1, self.buffer_size // 4)
+        pending: list[str] = []
+        pending_length = 0
+        try:
+            # print() などで書き込まれたテキストを先に出力し、出力順を保つ
+            sys.stdout.flush()
+            stdout = self.stdout if self.stdout is not None else sys.stdout.buffer
+            for chunk in chunks:
+                pending.append(chunk)
+                pending_length += len(chunk)
+                if pending_length >= encode_size:
+                    stdout.write("".join(pending).encode("utf-8"))
+                    pending = []
+                    pending_length = 0
+            stdout.write("".join(pending).encode("utf-8"))
+            stdout.flush()
+        except FileSystemError:
+            raise
+        except Exception as e:
+            raise FileSystemError(
+                message="標準出力への書き込み中にエラーが発生しました",
+                cause=e,
+            ) from e
+
+    def write_bytes(self, data: bytes, file_path: Path) -> None:
+        """バイト列をそのまま標準出力へ書き込む
+
+        Args:
+            data: 書き込むバイト列
+            file_path: 書き込み先のファイルパス（参照しない）
+
+        Raises:
+            FileSystemError: 標準出力への書き込みに失敗した場合
+        """
+        try:
+            # print() などで書き込まれたテキストを先に出力し、出力順を保つ
+            sys.stdout.flush()
+            stdout = self.stdout if self.stdout is not None else sys.stdout.buffer
+            stdout.write(data)
+            stdout.flush()
+        except Exception as e:
+            raise FileSystemError(
+                message="標準出力への書き込み中にエラーが発生しました",
+                cause=e,
+            ) from e
+
+    def remove(self, file_path: Path) -> None:
+        """何もしない（標準出力へ書き込んだ内容は取り消せない）
+
+        Args:
+            file_path: 削除するファイルパス（参照しない）
+        """
@@ -1,22 +1,75 @@
 """ファイルシステム操作クラス（Adapter実装）"""
 
+import os
+import stat
+import tempfile
+from collections.abc import Buffer, Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from example.foundation.fs.codec import (
+    Compressor,
+    OutputCompression,
+    new_compressor,
+    open_text,
+    read_bytes,
+    resolve_compression,
+)
 from example.foundation.fs.error import FileSystemError
-from example.protocol.fs import TextFileSystemReaderProtocol, TextFileSystemWriterProtocol
+from example.protocol.fs import (
+    BinaryFileSystemReaderProtocol,
+    BinaryFileSystemWriterProtocol,
+    OffsetFileSystemWriterProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
 
 
-class TextFileSystemReader(TextFileSystemReaderProtocol):
+def _current_umask() -> int:
+    """プロセスの umask を取得する
+
+    umask は設定と同時にしか取得できないため、取得後すぐに元の値へ戻す。
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _current_umask()
+"""書き込み先ファイルのパーミッション決定に使う umask（スレッド間の競合を避けるため import 時に1回だけ取得）"""
+
+_BUFFER_SIZE = 1 << 20
+"""1回の書き込みシステムコールで書き込むバイト数の目安（既定値）"""
+
+_READ_CHUNK_SIZE = 1 << 20
+"""read_lines() で1回の読み込みシステムコールで読み込むバイト数（既定値）"""
+
+_MAX_IOVECS = min(1024, os.sysconf("SC_IOV_MAX"))
+"""os.writev に1回で渡すバッファ数の上限"""
+
+
+class TextFileSystemReader(TextFileSystemReaderProtocol, BinaryFileSystemReaderProtocol):
     """ファイル読み取り専用クラス
 
     ファイルシステムからのテキストファイル読み取り機能のみを提供します。
+    gzip・bz2・xz で圧縮されたファイルは、先頭のマジックバイトで判定して伸長しながら読み込みます。
+    read_bytes() はデコードせずにバイト列のまま読み込みます。
     """
 
-    def read(self, file_path: Path) -> str:
-        """テキストファイルの内容を読み込み、文字列で返す
+    def __init__(self, chunk_size: int = _READ_CHUNK_SIZE) -> None:
+        """TextFileSystemReaderを初期化
+
+        Args:
+            chunk_size: read_lines() で1回に読み込むバイト数（読み込みバッファの大きさ）
+        """
+        self.chunk_size = chunk_size
+
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        r"""テキストファイルの内容を読み込み、文字列で返す
 
         Args:
             file_path: 読み込み対象のファイルパス
+            newline: 改行コードの扱い（open() の newline 引数と同じ。None の場合は \r\n・\r を \n に変換する）
 
         Returns:
             ファイルの内容（改行文字を含む、フィルタリングなし）
@@ -24,27 +77,100 @@ class TextFileSystemReader(TextFileSystemReaderProtocol):
         Raises:
             FileSystemError: ファイルシステムでエラーが発生した場合
         """
-        try:
-            with file_path.open(encoding="utf-8") as f:
-                return f.read()
-        except FileNotFoundError as e:
-            raise FileSystemError(
-                message=f"ファイルが見つかりません: {file_path}",
-                cause=e,
-            ) from e
-        except Exception as e:
-            raise FileSystemError(
-                message=f"ファイル読み込み中にエラーが発生しました: {file_path}",
-                cause=e,
-            ) from e
+        with translate_read_error(file_path), open_text(file_path, newline=newline) as f:
+            return f.read()
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        r"""テキストファイルを改行文字（\n）単位で逐次読み込む
+
+        newline="\n" で開くことで、改行コードを変換せずに \n のみで行を区切る。
+        メモリ使用量は最長行の長さに比例し、ファイルサイズには依存しません。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+
+        Returns:
+            行末の改行文字を含む行のイテレータ
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合（イテレート中に送出）
+        """
+        with (
+            translate_read_error(file_path),
+            open_text(file_path, newline="\n", buffering=self.chunk_size) as f,
+        ):
+            yield from f
+
+    def read_bytes(self, file_path: Path) -> bytes:
+        """ファイルの内容をデコードせずにバイト列で読み込む
+
+        圧縮されたファイルは伸長した内容を返す。改行コードの変換は行わない。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+
+        Returns:
+            ファイルの内容
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with translate_read_error(file_path):
+            return read_bytes(file_path)
+
 
+@contextmanager
+def translate_read_error(file_path: Path) -> Iterator[None]:
+    """読み込み時の例外を FileSystemError に変換する
 
-class TextFileSystemWriter(TextFileSystemWriterProtocol):
+    Args:
+        file_path: 読み込み対象のファイルパス
+
+    Raises:
+        FileSystemError: ファイルシステムでエラーが発生した場合
+    """
+    try:
+        yield
+    except FileNotFoundError as e:
+        raise FileSystemError(
+            message=f"ファイルが見つかりません: {file_path}",
+            cause=e,
+        ) from e
+    except Exception as e:
+        raise FileSystemError(
+            message=f"ファイル読み込み中にエラーが発生しました: {file_path}",
+            cause=e,
+        ) from e
+
+
+class TextFileSystemWriter(TextFileSystemWriterProtocol, BinaryFileSystemWriterProtocol):
     """ファイル書き込み専用クラス
 
     ファイルシステムへのテキストファイル書き込み機能のみを提供します。
+    圧縮形式を指定した場合（既定では書き込み先の拡張子が .gz / .bz2 / .xz の場合）は、圧縮しながら書き込みます。
+    write_bytes() はエンコード済みのバイト列をそのまま書き込みます。
     """
 
+    def __init__(
+        self,
+        buffer_size: int = _BUFFER_SIZE,
+        fsync: bool = False,
+        compression: OutputCompression = "auto",
+        compression_level: int | None = None,
+    ) -> None:
+        """TextFileSystemWriterを初期化
+
+        Args:
+            buffer_size: 1回の書き込みシステムコールで書き込むバイト数の目安
+            fsync: 書き込み先を置き換える前後に fsync し、電源断などでも書き込みを失わないようにするか
+            compression: 圧縮形式（auto: 書き込み先の拡張子から判定、none: 圧縮しない）
+            compression_level: 圧縮レベル（1〜9、None の場合は圧縮形式ごとの既定値）
+        """
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.compression: OutputCompression = compression
+        self.compression_level = compression_level
+
     def write(self, text: str, file_path: Path) -> None:
         """テキスト内容をファイルに書き込む
 
@@ -57,8 +183,63 @@ class TextFileSystemWriter(TextFileSystemWriterProtocol):
         Raises:
             FileSystemError: ファイルシステムでエラーが発生した場合
         """
+        self.write_chunks((text,), file_path)
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        """文字列チャンクを順に連結してファイルに書き込む
+
+        書き込み先のディレクトリが存在しない場合は自動的に作成します。
+        チャンクは受け取った順に逐次書き込むため、全体を連結した文字列は生成しません。
+        書き込みは一時ファイルへ行い、完了後に書き込み先を置き換えるため、
+        失敗時に書き込み先が不完全な内容になることはありません（既存ファイルはそのまま残ります）。
+
+        Args:
+            chunks: 書き込む文字列チャンクのイテラブル
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        self._ensure_parent_directory(file_path)
+        self._write_content(_encode_blocks(chunks, self.buffer_size), file_path)
+
+    def write_bytes(self, data: bytes, file_path: Path) -> None:
+        """バイト列をそのままファイルに書き込む
+
+        書き込み先のディレクトリの作成・一時ファイルを介した置き換え・圧縮は write_chunks() と同じです。
+        バイト列は buffer_size ごとに区切って書き込み、複製しません。
+
+        Args:
+            data: 書き込むバイト列
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        view = memoryview(data)
+        blocks = (
+            view[start : start + self.buffer_size]
+            for start in range(0, len(view), self.buffer_size)
+        )
         self._ensure_parent_directory(file_path)
-        self._write_content(text, file_path)
+        self._write_content(blocks, file_path)
+
+    def remove(self, file_path: Path) -> None:
+        """ファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            file_path: 削除するファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        try:
+            file_path.unlink(missing_ok=True)
+        except Exception as e:
+            raise FileSystemError(
+                message=f"ファイルの削除中にエラーが発生しました: {file_path}",
+                cause=e,
+            ) from e
 
     def _ensure_parent_directory(self, file_path: Path) -> None:
         """親ディレクトリの存在を保証する
@@ -82,31 +263,298 @@ class TextFileSystemWriter(TextFileSystemWriterProtocol):
                 cause=e,
             ) from e
 
-    def _write_content(self, text: str, file_path: Path) -> None:
+    def _write_content(self, blocks: Iterable[Buffer], file_path: Path) -> None:
         """ファイルに内容を書き込む
 
+        同じディレクトリの一時ファイルへ書き込んだ後に os.replace で置き換えるため、
+        書き込み途中で失敗しても書き込み先に不完全な内容が見えることはない。
+        失敗時は一時ファイルを削除する。
+        fsync が有効な場合は、置き換える前に一時ファイルの内容を、置き換えた後にディレクトリを
+        ストレージへ書き出す（OS がクラッシュしても、置き換え前後のどちらかの内容が残る）。
+
         Args:
-            text: 書き込む文字列
+            blocks: 書き込むバイト列のブロックのイテラブル
             file_path: 書き込み先のファイルパス
 
         Raises:
             FileSystemError: ファイル書き込みでエラーが発生した場合
         """
+        tmp_path: Path | None = None
         try:
-            with file_path.open("w", encoding="utf-8") as f:
-                f.write(text)
-        except PermissionError as e:
-            raise FileSystemError(
-                message=f"ファイルへの書き込み権限がありません: {file_path}",
-                cause=e,
-            ) from e
-        except IsADirectoryError as e:
-            raise FileSystemError(
-                message=f"指定されたパスはディレクトリです: {file_path}",
-                cause=e,
-            ) from e
-        except Exception as e:
-            raise FileSystemError(
-                message=f"ファイル書き込み中にエラーが発生しました: {file_path}",
-                cause=e,
-            ) from e
+            with _translate_write_error(file_path):
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+                )
+                tmp_path = Path(tmp_name)
+                try:
+                    os.fchmod(fd, _published_mode(file_path))
+                    _write_blocks(fd, blocks, self.buffer_size, self._compressor(file_path))
+                    if self.fsync:
+                        os.fsync(fd)
+                finally:
+                    os.close(fd)
+                # os.replace による置き換えのため、読み手には置き換え前後のどちらかの内容だけが見える
+                tmp_path.replace(file_path)
+                tmp_path = None
+                if self.fsync:
+                    _fsync_directory(file_path.parent)
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _compressor(self, file_path: Path) -> Compressor | None:
+        """書き込み先に対応する圧縮オブジェクトを返す（圧縮しない場合は None）"""
+        compression = resolve_compression(self.compression, file_path)
+        if compression is None:
+            return None
+        return new_compressor(compression, self.compression_level)
+
+
+class OffsetFileSystemWriter(OffsetFileSystemWriterProtocol):
+    """位置指定によるファイル書き込み専用クラス
+
+    書き込み先と同じディレクトリに出力サイズ分の一時ファイルを確保し、
+    各書き手は自身のファイルディスクリプタで指定位置から書き込みます。
+    書き込む範囲が重ならない限り、複数のプロセスから同時に書き込めます。
+    置き換えは TextFileSystemWriter と同じく os.replace で行うため、
+    失敗時に書き込み先が不完全な内容になることはありません。
+    """
+
+    def __init__(self, buffer_size: int = _BUFFER_SIZE, fsync: bool = False) -> None:
+        """OffsetFileSystemWriterを初期化
+
+        Args:
+            buffer_size: 1回の書き込みシステムコールで書き込むバイト数の目安
+            fsync: 書き込み先を置き換える前後に fsync し、電源断などでも書き込みを失わないようにするか
+        """
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+
+    def allocate(self, file_path: Path, size: int) -> Path:
+        """書き込み先と同じディレクトリに、指定サイズの一時ファイルを作成する
+
+        書き込み先のディレクトリが存在しない場合は自動的に作成します。
+        一時ファイルのパーミッションは、置き換え後に open("w") で作成した場合と同じになるよう設定します。
+
+        Args:
+            file_path: 最終的な書き込み先のファイルパス
+            size: 出力全体のサイズ（バイト）
+
+        Returns:
+            作成した一時ファイルのパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with _translate_write_error(file_path):
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+            )
+            try:
+                os.fchmod(fd, _published_mode(file_path))
+                os.ftruncate(fd, size)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            finally:
+                os.close(fd)
+        return Path(tmp_name)
+
+    def write_at(self, tmp_path: Path, offset: int, chunks: Iterable[str]) -> int:
+        """文字列チャンクを UTF-8 でエンコードし、一時ファイルの指定位置から書き込む
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+            offset: 書き込み開始位置（バイト）
+            chunks: 書き込む文字列チャンクのイテラブル
+
+        Returns:
+            書き込んだバイト数
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with _translate_write_error(tmp_path):
+            fd = os.open(tmp_path, os.O_WRONLY)
+            try:
+                # ファイル位置はディスクリプタごとに独立するため、他の書き手の位置には影響しない
+                os.lseek(fd, offset, os.SEEK_SET)
+                _write_blocks(fd, _encode_blocks(chunks, self.buffer_size), self.buffer_size)
+                return os.lseek(fd, 0, os.SEEK_CUR) - offset
+            finally:
+                os.close(fd)
+
+    def publish(self, tmp_path: Path, file_path: Path) -> None:
+        """書き込みを終えた一時ファイルで書き込み先を置き換える
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        with _translate_write_error(file_path):
+            if self.fsync:
+                fd = os.open(tmp_path, os.O_WRONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            tmp_path.replace(file_path)
+            if self.fsync:
+                _fsync_directory(file_path.parent)
+
+    def discard(self, tmp_path: Path) -> None:
+        """一時ファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+        """
+        tmp_path.unlink(missing_ok=True)
+
+
+@contextmanager
+def _translate_write_error(file_path: Path) -> Iterator[None]:
+    """書き込み時の例外を FileSystemError に変換する
+
+    Args:
+        file_path: 書き込み対象のファイルパス
+
+    Raises:
+        FileSystemError: ファイルシステムでエラーが発生した場合
+    """
+    try:
+        yield
+    except FileSystemError:
+        # チャンク生成元（ストリーム読み込み等）の例外は書き込みエラーに変換しない
+        raise
+    except PermissionError as e:
+        raise FileSystemError(
+            message=f"ファイルへの書き込み権限がありません: {file_path}",
+            cause=e,
+        ) from e
+    except IsADirectoryError as e:
+        raise FileSystemError(
+            message=f"指定されたパスはディレクトリです: {file_path}",
+            cause=e,
+        ) from e
+    except Exception as e:
+        raise FileSystemError(
+            message=f"ファイル書き込み中にエラーが発生しました: {file_path}",
+            cause=e,
+        ) from e
+
+
+def _published_mode(file_path: Path) -> int:
+    """置き換え後のファイルに設定するパーミッションを返す
+
+    open("w") と同じ結果になるよう、既存ファイルがあればそのパーミッションを引き継ぎ、
+    なければ umask を適用した 0o666 とする（mkstemp は 0o600 で作成するため）。
+    """
+    try:
+        return stat.S_IMODE(file_path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_directory(directory: Path) -> None:
+    """ディレクトリのエントリ（置き換えたファイル名）をストレージへ書き出す
+
+    Args:
+        directory: 対象のディレクトリ
+    """
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _encode_blocks(chunks: Iterable[str], buffer_size: int) -> Iterator[bytes]:
+    """文字列チャンクを UTF-8 でエンコードしたブロックを逐次返す
+
+    小さなチャンクは buffer_size の 1/4 の文字数程度まで連結してからエンコードする。
+    大きなチャンクは分割してエンコードするため、出力全体のバイト列をメモリに載せない。
+
+    Args:
+        chunks: 書き込む文字列チャンクのイテラブル
+        buffer_size: 1回の書き込みシステムコールで書き込むバイト数の目安
+
+    Returns:
+        エンコード済みのブロックのイテレータ
+    """
+    # 1文字は UTF-8 で最大4バイトのため、エンコード後に buffer_size を大きく超えない文字数で区切る
+    encode_size = max(1, buffer_size // 4)
+    pending: list[str] = []
+    pending_length = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        pending_length += len(chunk)
+        if pending_length >= encode_size:
+            text = "".join(pending)
+            for start in range(0, len(text), encode_size):
+                yield text[start : start + encode_size].encode("utf-8")
+            pending = []
+            pending_length = 0
+    text = "".join(pending)
+    for start in range(0, len(text), encode_size):
+        yield text[start : start + encode_size].encode("utf-8")
+
+
+def _write_blocks(
+    fd: int, blocks: Iterable[Buffer], buffer_size: int, compressor: Compressor | None = None
+) -> None:
+    """バイト列のブロックをまとめて書き込む
+
+    ブロックが buffer_size バイト程度溜まったところで os.writev で1回のシステムコールにまとめる。
+    compressor を指定した場合は、ブロックを圧縮してから書き込む。
+
+    Args:
+        fd: 書き込み先のファイルディスクリプタ
+        blocks: 書き込むバイト列のブロックのイテラブル
+        buffer_size: 1回の書き込みシステムコールで書き込むバイト数の目安
+        compressor: 圧縮オブジェクト（None の場合は圧縮しない）
+    """
+    pending: list[Buffer] = []
+    pending_size = 0
+
+    def append(block: Buffer) -> None:
+        nonlocal pending, pending_size
+        size = memoryview(block).nbytes
+        if not size:
+            return
+        pending.append(block)
+        pending_size += size
+        if pending_size >= buffer_size or len(pending) >= _MAX_IOVECS:
+            _writev_all(fd, pending)
+            pending = []
+            pending_size = 0
+
+    for block in blocks:
+        append(compressor.compress(block) if compressor is not None else block)
+    if compressor is not None:
+        append(compressor.flush())
+    if pending:
+        _writev_all(fd, pending)
+
+
+def _writev_all(fd: int, buffers: list[Buffer]) -> None:
+    """バッファ列を os.writev で書き切る
+
+    os.writev は要求より少ないバイト数しか書き込まない場合があるため、残りを書き込み直す。
+
+    Args:
+        fd: 書き込み先のファイルディスクリプタ
+        buffers: 書き込むバッファ列
+    """
+    views = [memoryview(buffer) for buffer in buffers]
+    index = 0
+    while index < len(views):
+        written = os.writev(fd, views[index:])
+        while index < len(views) and written >= len(views[index]):
+            written -= len(views[index])
+            index += 1
+        if written:
+            views[index] = views[index][written:]
@@ -0,0 +1,15 @@
+"""プロセス間通信の公開API(Foundation層)。
+
+公開APIは `example.foundation.ipc` から import すること(`__all__` のみ互換性対象)。
+標準ライブラリのみに依存するため、起動の速さが求められるクライアントからも import できる。
+
+Docs:
+    - docs/specs/foundation/ipc/requirements.md
+    - docs/specs/foundation/ipc/design.md
+"""
+
+from example.foundation.ipc.client import JsonLineClient
+from example.foundation.ipc.error import IpcError
+from example.foundation.ipc.server import JsonLineServer
+
+__all__ = ["IpcError", "JsonLineClient", "JsonLineServer"]
@@ -0,0 +1,69 @@
+"""Unix ドメインソケットによる JSON Lines クライアント"""
+
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+from example.foundation.ipc.error import IpcError
+
+
+class JsonLineClient:
+    """JsonLineServer へ1行の JSON リクエストを送り、1行の JSON レスポンスを受け取る"""
+
+    def __init__(self, socket_path: Path, timeout: float | None = None) -> None:
+        """JsonLineClientを初期化
+
+        Args:
+            socket_path: サーバーの Unix ドメインソケットのパス
+            timeout: 送受信のタイムアウト（秒）。None の場合は無制限に待つ
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """リクエストを送信し、レスポンスを返す
+
+        Args:
+            payload: リクエスト（JSON に変換できる辞書）
+
+        Returns:
+            サーバーが返したレスポンス
+
+        Raises:
+            IpcError: サーバーに接続できない場合、または通信に失敗した場合
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                with sock.makefile("rwb") as stream:
+                    stream.write(json.dumps(payload).encode("utf-8") + b"\n")
+                    stream.flush()
+                    line = stream.readline()
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise IpcError(message=f"サーバーに接続できません: {self.socket_path}", cause=e) from e
+        except OSError as e:
+            raise IpcError(
+                message=f"サーバーとの通信中にエラーが発生しました: {self.socket_path}", cause=e
+            ) from e
+
+        if not line:
+            raise IpcError(
+                message=f"サーバーからレスポンスがありません: {self.socket_path}",
+                cause="connection closed before a response was received",
+            )
+        return json.loads(line)
+
+    def is_listening(self) -> bool:
+        """サーバーが接続を受け付けているかを返す
+
+        Returns:
+            接続できた場合は True
+        """
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.connect(str(self.socket_path))
+        except OSError:
+            return False
+        return True
@@ -0,0 +1,12 @@
+"""プロセス間通信関連例外"""
+
+from example.foundation.error import ApplicationError
+
+
+class IpcError(ApplicationError):
+    """プロセス間通信エラー
+
+    サーバーへの接続失敗、ソケットの作成失敗、不正なメッセージの受信などで使用します。
+    """
+
+    pass
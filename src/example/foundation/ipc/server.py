@@ -0,0 +1,102 @@
+"""Unix ドメインソケットによる JSON Lines サーバー"""
+
+import json
+import logging
+import os
+import socketserver
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from example.foundation.ipc.client import JsonLineClient
+from example.foundation.ipc.error import IpcError
+
+type RequestHandler = Callable[[dict[str, Any]], dict[str, Any]]
+"""リクエストを受け取り、レスポンスを返すハンドラー"""
+
+logger = logging.getLogger(__name__)
+
+
+class JsonLineServer:
+    """Unix ドメインソケットでリクエストを受け付け、ハンドラーの結果を返すサーバー
+
+    1接続につき1行の JSON リクエストを受け取り、ハンドラーの戻り値を1行の JSON で返す。
+    リクエストは受け付けた順に1件ずつ処理するため、ハンドラーはスレッドセーフでなくてよい。
+
+    Constraints:
+        - ソケットファイルは所有者のみ読み書きできるパーミッション（0o600）で作成する
+        - ハンドラーが送出した例外は呼び出し元へ伝播させず、ログに記録して接続を閉じる
+    """
+
+    def __init__(self, socket_path: Path, handler: RequestHandler) -> None:
+        """JsonLineServerを初期化
+
+        Args:
+            socket_path: 待ち受ける Unix ドメインソケットのパス
+            handler: リクエストを処理するハンドラー
+        """
+        self.socket_path = socket_path
+        self.handler = handler
+        self._server: socketserver.UnixStreamServer | None = None
+
+    def serve_forever(self) -> None:
+        """ソケットを作成し、shutdown() が呼ばれるまでリクエストを処理する
+
+        終了時にソケットファイルを削除する。
+
+        Raises:
+            IpcError: 同じパスで別のサーバーが起動している場合、またはソケットを作成できない場合
+        """
+        self._remove_stale_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        handler = self.handler
+
+        class _StreamHandler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                try:
+                    response = handler(json.loads(line))
+                except Exception:
+                    logger.exception("Failed to handle request")
+                    return
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+        # 所有者以外が接続できないよう、作成時点から 0o600 にする
+        umask = os.umask(0o177)
+        try:
+            server = socketserver.UnixStreamServer(str(self.socket_path), _StreamHandler)
+        except OSError as e:
+            raise IpcError(message=f"ソケットを作成できません: {self.socket_path}", cause=e) from e
+        finally:
+            os.umask(umask)
+
+        self._server = server
+        try:
+            with server:
+                server.serve_forever()
+        finally:
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+    def shutdown(self) -> None:
+        """serve_forever() を終了させる（別スレッドから呼び出す）"""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _remove_stale_socket(self) -> None:
+        """前回のサーバーが残したソケットファイルを削除する
+
+        Raises:
+            IpcError: ソケットに接続できる（サーバーが起動している）場合
+        """
+        if not self.socket_path.exists():
+            return
+        if JsonLineClient(self.socket_path).is_listening():
+            raise IpcError(
+                message=f"サーバーは既に起動しています: {self.socket_path}",
+                cause="another server is listening on the socket",
+            )
+        self.socket_path.unlink()
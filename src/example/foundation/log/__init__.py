@@ -9,5 +9,7 @@ Docs:
 
 from example.foundation.log.configurator import LogConfigurator
 from example.foundation.log.decorator import log
+from example.foundation.log.formatter import JsonFormatter
+from example.foundation.log.rotation import LogRotation
 
-__all__ = ["LogConfigurator", "log"]
+__all__ = ["JsonFormatter", "LogConfigurator", "LogRotation", "log"]
@@ -2,13 +2,17 @@
 
 import logging
 import logging.config
+import logging.handlers
+import os
+import queue
 import sys
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Any
-from zoneinfo import ZoneInfo
+from typing import Any, cast
 
-import colorlog  # noqa: F401  # pyright: ignore[reportUnusedImport]
+from example.foundation.log.formatter import JsonFormatter
+from example.foundation.log.rotation import LogRotation, RotatingLogFileHandler
 
 
 class LogConfigurator:
@@ -22,26 +26,49 @@ class LogConfigurator:
         # 開発・本番環境用（JSON・stdout・ファイル出力なし）
         configurator = LogConfigurator(app_name="api", level="DEBUG")
         log_path = configurator.configure_json()
+
+        # 出力をバックグラウンドスレッドへ移す（呼び出し元はキューへ積むだけになる）
+        log_path = configurator.configure_plain(queue_size=10000)
+
+        # ログファイルを 64MiB でローテーションし、直近 20 回の実行のログのみを残す
+        rotation = LogRotation(max_bytes=64 << 20, backup_count=3, compress=True, max_files=20)
+        log_path = configurator.configure_plain(rotation=rotation)
     """
 
-    def __init__(self, level: str, app_name: str | None = None) -> None:
+    def __init__(
+        self,
+        level: str,
+        app_name: str | None = None,
+        logger_levels: Mapping[str, str] | None = None,
+    ) -> None:
         """ログ設定を初期化
 
         Args:
             level: コンソール出力のログレベル（DEBUG, INFO, WARNING, ERROR）
             app_name: アプリケーション名（ログファイル名の一部として使用）。省略時は "log" を使用
+            logger_levels: ロガー名ごとのログレベル（例: {"example.transform": "WARNING"}）。
+                指定したロガーと配下のロガーは、コンソール・ファイルともにこのレベル未満を出力しない
         """
         self.app_name = app_name or "log"
         self.level = level.upper()
+        self.logger_levels = {name: lvl.upper() for name, lvl in (logger_levels or {}).items()}
 
-    def configure_plain(self) -> Path | None:
+    def configure_plain(
+        self, queue_size: int | None = None, rotation: LogRotation | None = None
+    ) -> Path | None:
         """プレーンテキスト形式でログ設定を構成（ローカル環境用）
 
         - フォーマット: プレーンテキスト（カラー表示）
-        - 出力先: stderr（コンソール）+ ファイル
+        - 出力先: stderr（コンソール）+ ファイル（実行ごとに別のファイル）
         - レベル: コンソール=指定されたlevel、ファイル=DEBUG
         - RequestContext: なし
 
+        Args:
+            queue_size: 指定した場合、ログレコードを上限 queue_size 件のキューへ積み、
+                バックグラウンドスレッドで出力する（None の場合は呼び出し元のスレッドで出力）
+            rotation: ログファイルのローテーションと、過去の実行のログファイルの保持期間
+                （None の場合はローテーションせず、過去のログファイルも削除しない）
+
         Returns:
             作成したログファイルのパス。既にハンドラーが存在する場合はNoneまたはファイルパス
         """
@@ -50,21 +77,27 @@ class LogConfigurator:
             file_output=True,
             console_formatter_type="color",
             file_formatter_type="plain",
+            queue_size=queue_size,
+            rotation=rotation,
         )
 
     def configure_json(
-        self, json_formatter_class: type[logging.Formatter] | None = None
+        self,
+        json_formatter_class: type[logging.Formatter] | None = None,
+        queue_size: int | None = None,
     ) -> Path | None:
         """JSON形式でログ設定を構成（開発・本番環境用）
 
-        - フォーマット: JSON
+        - フォーマット: JSON（1行1レコード、既定では JsonFormatter）
         - 出力先: stdout（コンソールのみ）
         - レベル: コンソール=指定されたlevel
         - RequestContext: カスタムフォーマッターを指定した場合のみ利用可能
 
         Args:
             json_formatter_class: JSONフォーマッタークラス（logging.Formatterを継承したクラス）
-                指定しない場合は標準の logging.Formatter を使用
+                指定しない場合は JsonFormatter を使用
+            queue_size: 指定した場合、ログレコードを上限 queue_size 件のキューへ積み、
+                バックグラウンドスレッドで出力する（None の場合は呼び出し元のスレッドで出力）
 
         Returns:
             None（ファイル出力なし）。既にハンドラーが存在する場合はNone
@@ -75,6 +108,7 @@ class LogConfigurator:
             console_formatter_type="json_context",
             file_formatter_type="",  # 使用しない
             json_formatter_class=json_formatter_class,
+            queue_size=queue_size,
         )
 
     def _configure(
@@ -84,6 +118,8 @@ class LogConfigurator:
         console_formatter_type: str,
         file_formatter_type: str,
         json_formatter_class: type[logging.Formatter] | None = None,
+        queue_size: int | None = None,
+        rotation: LogRotation | None = None,
     ) -> Path | None:
         """ログ設定を構成する内部メソッド
 
@@ -98,6 +134,8 @@ class LogConfigurator:
                 - "": 使用しない
             json_formatter_class: JSONフォーマッタークラス（logging.Formatterを継承したクラス）
                 console_formatter_type="json_context"の場合のみ使用
+            queue_size: キューの上限件数（None の場合はキューを使わない）
+            rotation: ログファイルのローテーションと保持期間（file_output=Trueの場合のみ使用）
 
         Returns:
             作成したログファイルのパス。ファイル出力なしの場合やハンドラー存在時はNone
@@ -105,7 +143,7 @@ class LogConfigurator:
         # 再初期化を防ぐためのガード処理
         root_logger = logging.getLogger()
         if root_logger.handlers:
-            for h in root_logger.handlers:
+            for h in _flatten_handlers(root_logger.handlers):
                 if isinstance(h, logging.FileHandler):
                     return Path(h.baseFilename)
             return None
@@ -115,8 +153,14 @@ class LogConfigurator:
         if file_output:
             log_dir = Path("tmp/logs")
             log_dir.mkdir(parents=True, exist_ok=True)
+            if rotation is not None:
+                rotation.prune(log_dir, self.app_name)
+            from zoneinfo import ZoneInfo  # ログファイルを作成する場合のみ import する
+
             ts = datetime.now(ZoneInfo("Asia/Tokyo")).strftime("%Y%m%d_%H%M%S")
-            log_path = (log_dir / f"{self.app_name}_{ts}.log").resolve()  # 絶対パスに変換
+            # 同じ秒に起動した別プロセスとファイルを共有しないよう、プロセス ID を含める
+            log_name = f"{self.app_name}_{ts}_{os.getpid()}.log"
+            log_path = (log_dir / log_name).resolve()  # 絶対パスに変換
 
         # 設定辞書の生成
         config = self._build_dictconfig(
@@ -126,9 +170,12 @@ class LogConfigurator:
             console_formatter_type=console_formatter_type,
             file_formatter_type=file_formatter_type,
             json_formatter_class=json_formatter_class,
+            rotation=rotation,
         )
 
         logging.config.dictConfig(config)
+        if queue_size is not None:
+            _enqueue_handlers(root_logger, queue_size)
         logging.captureWarnings(True)
         sys.stderr.flush()
         return log_path
@@ -141,6 +188,7 @@ class LogConfigurator:
         console_formatter_type: str,
         file_formatter_type: str,
         json_formatter_class: type[logging.Formatter] | None = None,
+        rotation: LogRotation | None = None,
     ) -> dict[str, Any]:
         """ログ設定辞書を生成する
 
@@ -151,6 +199,7 @@ class LogConfigurator:
             console_formatter_type: コンソール用フォーマッタータイプ
             file_formatter_type: ファイル用フォーマッタータイプ
             json_formatter_class: JSONフォーマッタークラス（logging.Formatterを継承したクラス）
+            rotation: ログファイルのローテーション（max_bytes がある場合のみローテーションする）
 
         Returns:
             logging.config.dictConfig用の設定辞書
@@ -159,6 +208,7 @@ class LogConfigurator:
         formatters: dict[str, Any] = {}
 
         if console_formatter_type == "color":
+            # colorlog は dictConfig が文字列から解決するため、カラー表示を使う場合のみ import される
             formatters["console"] = {
                 "()": "colorlog.ColoredFormatter",
                 "format": "%(log_color)s%(levelname)-8s%(reset)s %(name)s: %(message)s",
@@ -172,19 +222,12 @@ class LogConfigurator:
                 },
             }
         elif console_formatter_type == "json_context":
-            if json_formatter_class:
-                # クラスオブジェクトを直接使用（文字列パスではなく）
-                # これにより循環importの問題を回避できる
-                formatters["console"] = {
-                    "()": json_formatter_class,
-                    "datefmt": "%Y-%m-%dT%H:%M:%S",
-                }
-            else:
-                # デフォルトは標準のFormatterを使用（JSON形式ではない）
-                formatters["console"] = {
-                    "format": "%(asctime)s %(levelname)-8s %(filename)s:%(lineno)d - %(name)s %(message)s",
-                    "datefmt": "%Y-%m-%dT%H:%M:%S",
-                }
+            # クラスオブジェクトを直接使用（文字列パスではなく）
+            # これにより循環importの問題を回避できる。デフォルトは組み込みの JsonFormatter を使用
+            formatters["console"] = {
+                "()": json_formatter_class or JsonFormatter,
+                "datefmt": "%Y-%m-%dT%H:%M:%S",
+            }
 
         if file_formatter_type == "plain":
             formatters["file"] = {
@@ -204,7 +247,18 @@ class LogConfigurator:
 
         handler_list = ["console"]
 
-        if file_output and log_path:
+        if file_output and log_path and rotation is not None and rotation.max_bytes is not None:
+            handlers["file"] = {
+                "()": RotatingLogFileHandler,
+                "filename": str(log_path),
+                "max_bytes": rotation.max_bytes,
+                "backup_count": rotation.backup_count,
+                "compress": rotation.compress,
+                "level": "DEBUG",
+                "formatter": "file",
+            }
+            handler_list.append("file")
+        elif file_output and log_path:
             handlers["file"] = {
                 "class": "logging.FileHandler",
                 "filename": str(log_path),
@@ -229,5 +283,131 @@ class LogConfigurator:
                 "asyncio": {"level": "WARNING"},
                 # "urllib3": {"level": "WARNING"},
                 # "botocore": {"level": "WARNING"},
+                # ロガーごとのレベル指定（プリセットより優先）
+                **{name: {"level": lvl} for name, lvl in self.logger_levels.items()},
             },
         }
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """ログレコードを上限付きのキューへ積み、QueueListener に出力させるハンドラー
+
+    呼び出し元のスレッドはキューへ積むだけで、ファイル・コンソールへの出力はバックグラウンドスレッドで行う。
+    キューが満杯の場合、WARNING 未満のレコードは破棄して件数を数え、WARNING 以上のレコードは空きを待つ。
+    close() でキューに残ったレコードを出力し終えてからリスナーを停止する（logging.shutdown() から呼ばれる）。
+
+    Constraints:
+        - fork した子プロセスにはリスナーのスレッドが引き継がれないため、子プロセスでは呼び出し元のスレッドで出力する
+        - メッセージの組み立て（フォーマット）もリスナーのスレッドで行うため、ログ出力の引数に渡した
+          可変オブジェクトを出力前に変更すると、変更後の内容で出力される
+    """
+
+    def __init__(self, records: queue.Queue[Any], listener: logging.handlers.QueueListener) -> None:
+        """BoundedQueueHandlerを初期化
+
+        Args:
+            records: ログレコードを積む上限付きのキュー
+            listener: records からレコードを取り出して出力するリスナー（開始は呼び出し元が行う）
+        """
+        super().__init__(records)
+        self.listener = listener
+        self.dropped = 0
+        self._pid = os.getpid()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """ログレコードをキューへ積む（fork した子プロセスでは直接出力する）"""
+        if os.getpid() != self._pid and self.listener is not None:
+            self.listener.handle(record)
+            return
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """ログレコードをそのまま積む
+
+        標準の実装はプロセス間のキューへ渡せるよう呼び出し元のスレッドでメッセージを組み立てるが、
+        このキューは同一プロセス内に閉じるため、組み立てはリスナーの出力先のハンドラーに任せる。
+        """
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """ログレコードをキューへ積む（満杯の場合は WARNING 未満を破棄し、WARNING 以上は空きを待つ）"""
+        records = cast("queue.Queue[Any]", self.queue)
+        if record.levelno >= logging.WARNING:
+            records.put(record)
+            return
+        try:
+            records.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """キューに残ったレコードを出力してリスナーを停止し、破棄した件数があれば警告を出力する"""
+        if os.getpid() == self._pid and self.listener is not None:
+            self.listener.stop()
+            if self.dropped:
+                self.listener.handle(
+                    logging.makeLogRecord(
+                        {
+                            "name": __name__,
+                            "levelno": logging.WARNING,
+                            "levelname": logging.getLevelName(logging.WARNING),
+                            "msg": f"Dropped {self.dropped} log records: the log queue was full",
+                        }
+                    )
+                )
+                self.dropped = 0
+        super().close()
+
+
+class _BlockingQueueListener(logging.handlers.QueueListener):
+    """停止の合図をキューの空きを待って積む QueueListener
+
+    標準の実装は put_nowait() で積むため、キューが満杯の場合に停止できない。
+    """
+
+    def __init__(self, records: queue.Queue[Any], *handlers: logging.Handler) -> None:
+        """_BlockingQueueListenerを初期化
+
+        Args:
+            records: ログレコードを取り出すキュー
+            handlers: 取り出したレコードを出力するハンドラー（各ハンドラーのレベルを適用する）
+        """
+        super().__init__(records, *handlers, respect_handler_level=True)
+
+    def enqueue_sentinel(self) -> None:
+        """停止の合図（None）をキューへ積む（満杯の場合はリスナーが取り出すのを待つ）"""
+        cast("queue.Queue[Any]", self.queue).put(None)
+
+
+def _enqueue_handlers(root_logger: logging.Logger, queue_size: int) -> None:
+    """ルートロガーのハンドラーを、キューを介してバックグラウンドスレッドで出力するよう置き換える
+
+    Args:
+        root_logger: ルートロガー
+        queue_size: キューの上限件数
+    """
+    handlers = root_logger.handlers[:]
+    records: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+    listener = _BlockingQueueListener(records, *handlers)
+    for handler in handlers:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(BoundedQueueHandler(records, listener))
+    listener.start()
+
+
+def _flatten_handlers(handlers: list[logging.Handler]) -> list[logging.Handler]:
+    """QueueHandler の出力先のハンドラーを含めて、ハンドラーを列挙する
+
+    Args:
+        handlers: ロガーに登録されたハンドラー
+
+    Returns:
+        ハンドラーの一覧（QueueHandler はリスナーの出力先のハンドラーに展開する）
+    """
+    flattened: list[logging.Handler] = []
+    for handler in handlers:
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.listener is not None:
+            flattened.extend(handler.listener.handlers)
+        else:
+            flattened.append(handler)
+    return flattened
@@ -1,6 +1,7 @@
 """ロギングデコレータ"""
 
 import functools
+import inspect
 import logging
 from collections.abc import Callable
 from typing import Any, cast
@@ -62,6 +63,8 @@ def log[F: Callable[..., Any]](func: F) -> F:
     - メソッド開始時: INFO レベルで関数名と引数をログ出力
     - メソッド終了時: INFO レベルで戻り値をログ出力
     - 例外発生時: ログ出力せず、例外をそのまま再送出（ErrorHandlerが担当）
+    - コルーチン関数の場合: await した結果を戻り値としてログ出力
+    - ロガーが INFO レベルを出力しない場合: 引数・戻り値の整形を行わず、関数をそのまま呼び出す
 
     Usage:
         @log
@@ -76,24 +79,26 @@ def log[F: Callable[..., Any]](func: F) -> F:
     """
     logger = logging.getLogger(func.__module__)
 
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not logger.isEnabledFor(logging.INFO):
+                return await func(*args, **kwargs)
+            qualifier = _log_call(logger, func, args, kwargs)
+            result = await func(*args, **kwargs)
+            logger.info("%s returned: %s", qualifier, _format_value(result), stacklevel=2)
+            return result
+
+        return cast(F, async_wrapper)
+
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        # クラス名の取得とselfの除外
-        if args and hasattr(args[0].__class__, func.__name__):
-            # メソッドの場合、クラス名を付加してselfを除外
-            class_name = args[0].__class__.__name__
-            qualifier = f"{class_name}.{func.__name__}"
-            log_args = args[1:]
-        else:
-            # 関数の場合、すべての引数を含める
-            qualifier = func.__name__
-            log_args = args
-
-        # 引数をfunc(arg1, arg2, key=val)形式に整形
-        parts = [_format_value(arg) for arg in log_args]
-        parts += [f"{k}={_format_value(v)}" for k, v in kwargs.items()]
-        args_str = ", ".join(parts)
-        logger.info("%s(%s)", qualifier, args_str, stacklevel=2)
+        # 出力されないログのために引数・戻り値を整形しない（ホットパスでのオーバーヘッドを避ける）
+        if not logger.isEnabledFor(logging.INFO):
+            return func(*args, **kwargs)
+
+        qualifier = _log_call(logger, func, args, kwargs)
 
         result = func(*args, **kwargs)
 
@@ -104,3 +109,39 @@ def log[F: Callable[..., Any]](func: F) -> F:
         return result
 
     return cast(F, wrapper)
+
+
+def _log_call(
+    logger: logging.Logger,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    """関数名と引数をログ出力し、ログ上の関数名を返す
+
+    Args:
+        logger: 出力先のロガー
+        func: 呼び出される関数/メソッド
+        args: 位置引数
+        kwargs: キーワード引数
+
+    Returns:
+        ログ上の関数名（メソッドの場合は「クラス名.メソッド名」）
+    """
+    # クラス名の取得とselfの除外
+    if args and hasattr(args[0].__class__, func.__name__):
+        # メソッドの場合、クラス名を付加してselfを除外
+        class_name = args[0].__class__.__name__
+        qualifier = f"{class_name}.{func.__name__}"
+        log_args = args[1:]
+    else:
+        # 関数の場合、すべての引数を含める
+        qualifier = func.__name__
+        log_args = args
+
+    # 引数をfunc(arg1, arg2, key=val)形式に整形
+    parts = [_format_value(arg) for arg in log_args]
+    parts += [f"{k}={_format_value(v)}" for k, v in kwargs.items()]
+    args_str = ", ".join(parts)
+    logger.info("%s(%s)", qualifier, args_str, stacklevel=3)
+    return qualifier
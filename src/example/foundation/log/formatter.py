@@ -0,0 +1,103 @@
+"""ログレコードを JSON に整形するフォーマッター"""
+
+import logging
+import time
+from typing import Any
+
+_RESERVED_ATTRS = frozenset([*vars(logging.makeLogRecord({})), "message", "asctime", "taskName"])
+"""LogRecord の標準の属性名（これ以外の属性は extra で渡されたフィールドとして出力する）"""
+
+_FIELDS = frozenset(
+    ["timestamp", "level", "logger", "message", "module", "line", "exception", "stack"]
+)
+"""JsonFormatter が出力するフィールド名（extra で渡されたフィールドと重なる場合は extra 側に接頭辞を付ける）"""
+
+_EXTRA_PREFIX = "extra_"
+"""出力するフィールド名と重なる extra のフィールドに付ける接頭辞"""
+
+
+class JsonFormatter(logging.Formatter):
+    """ログレコードを1行の JSON に整形するフォーマッター
+
+    出力するフィールドは固定の順序で、logging.Formatter の書式文字列は解釈しない。
+    logger.info(..., extra={...}) で渡したフィールドはトップレベルのキーとして追加する。
+    出力するフィールドと同じ名前のフィールド（extra={"level": ...} など）は、
+    出力するフィールドを上書きしないよう extra_ を付けた名前（extra_level）で追加する。
+
+    出力例:
+        {"timestamp":"2026-01-01T09:00:00.123+09:00","level":"INFO","logger":"example.cli",
+         "message":"Started transform command","module":"cli","line":42,"request_id":"abc"}
+
+    出力するフィールド:
+        - timestamp: 発生日時（ISO 8601、ミリ秒・UTC オフセット付きのローカル時刻）
+        - level: ログレベル名
+        - logger: ロガー名
+        - message: 引数を埋め込んだメッセージ
+        - module / line: ログを出力したモジュール名と行番号
+        - exception / stack: 例外・スタックの情報（ある場合のみ）
+    """
+
+    def __init__(self, datefmt: str | None = None) -> None:
+        """JsonFormatterを初期化
+
+        Args:
+            datefmt: 日時の書式（秒までの部分。ミリ秒と UTC オフセットは常に付与する）
+        """
+        import json  # JSON 形式で出力する場合のみ import する
+
+        super().__init__(datefmt=datefmt)
+        self._seconds_format = datefmt or "%Y-%m-%dT%H:%M:%S"
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+        self._cached_second = -1
+        self._cached_prefix = ""
+        self._cached_offset = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """ログレコードを1行の JSON 文字列に整形する
+
+        Args:
+            record: ログレコード
+
+        Returns:
+            JSON 文字列（改行を含まない）
+        """
+        document: dict[str, Any] = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+        }
+        # 同じレコードを複数のハンドラーで整形する場合に備え、logging.Formatter と同じくキャッシュする
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            document["exception"] = record.exc_text
+        if record.stack_info:
+            document["stack"] = self.formatStack(record.stack_info)
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS:
+                document[f"{_EXTRA_PREFIX}{key}" if key in _FIELDS else key] = value
+        return self._encoder.encode(document)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """発生日時をミリ秒・UTC オフセット付きで整形する
+
+        秒までの部分と UTC オフセットは、同じ秒のレコードが続く間は前回の整形結果を使い回す。
+
+        Args:
+            record: ログレコード
+            datefmt: 使用しない（書式はコンストラクタで指定する）
+
+        Returns:
+            整形した日時（例: 2026-01-01T09:00:00.123+09:00）
+        """
+        second = int(record.created)
+        if second != self._cached_second:
+            local = time.localtime(second)
+            offset = time.strftime("%z", local)
+            self._cached_prefix = time.strftime(self._seconds_format, local)
+            self._cached_offset = f"{offset[:3]}:{offset[3:]}"
+            self._cached_second = second
+        return f"{self._cached_prefix}.{int(record.msecs):03d}{self._cached_offset}"
@@ -0,0 +1,119 @@
+"""ログファイルのローテーションと保持期間の管理"""
+
+import logging.handlers
+import re
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class LogRotation:
+    """ログファイルのローテーションと、過去の実行のログファイルの保持期間の設定
+
+    Attributes:
+        max_bytes: ログファイルがこのバイト数を超えたら旧ファイルへ退避し、新しいファイルへ切り替える
+            （None の場合はローテーションしない）
+        backup_count: 1回の実行で残す旧ファイルの数（これを超えた古い旧ファイルは削除する）
+        compress: 退避した旧ファイルを gzip で圧縮する（ファイル名に .gz を付与する）
+        max_files: 残す実行ごとのログの数（今回の実行を含む、None の場合は数で削除しない）
+        max_age: 最終更新からこの期間を過ぎた実行のログを削除する（None の場合は期間で削除しない）
+    """
+
+    max_bytes: int | None = None
+    backup_count: int = 5
+    compress: bool = False
+    max_files: int | None = None
+    max_age: timedelta | None = None
+
+    def prune(self, log_dir: Path, app_name: str) -> list[Path]:
+        """過去の実行のログファイルのうち、保持する数・期間を超えたものを削除する
+
+        同じ実行のファイル（旧ファイル・プロファイルの出力を含む）はまとめて削除し、
+        実行の新旧はそれらのうち最も新しい更新日時で判定する。
+
+        Args:
+            log_dir: ログファイルのディレクトリ
+            app_name: アプリケーション名（この名前のログファイルのみを対象とする）
+
+        Returns:
+            削除したファイルのパス
+        """
+        if self.max_files is None and self.max_age is None:
+            return []
+        pattern = re.compile(rf"({re.escape(app_name)}_\d{{8}}_\d{{6}}(?:_\d+)?)\..+")
+        runs: dict[str, list[tuple[Path, float]]] = {}
+        for path in log_dir.iterdir():
+            match = pattern.fullmatch(path.name)
+            if match is None:
+                continue
+            try:
+                runs.setdefault(match.group(1), []).append((path, path.stat().st_mtime))
+            except FileNotFoundError:
+                continue  # 並行して実行中の別プロセスが削除した
+
+        newest_first = sorted(
+            ((max(mtime for _, mtime in files), files) for files in runs.values()),
+            key=lambda run: run[0],
+            reverse=True,
+        )
+        # 今回の実行のログファイルは削除後に作成するため、その分を1つ空けておく
+        keep = len(newest_first) if self.max_files is None else self.max_files - 1
+        cutoff = None if self.max_age is None else time.time() - self.max_age.total_seconds()
+        removed: list[Path] = []
+        for index, (updated, files) in enumerate(newest_first):
+            if index < keep and (cutoff is None or updated >= cutoff):
+                continue
+            for path, _ in files:
+                path.unlink(missing_ok=True)
+                removed.append(path)
+        return removed
+
+
+class RotatingLogFileHandler(logging.handlers.RotatingFileHandler):
+    """サイズ上限でローテーションし、退避した旧ファイルを gzip で圧縮できるファイルハンドラー
+
+    旧ファイルは「{ログファイル名}.1」から順に古くなり、compress の場合は「.gz」を付与する。
+
+    Constraints:
+        - 圧縮はローテーション時にログを出力したスレッドで行う（キュー利用時はリスナーのスレッド）
+        - 複数のプロセスから同じファイルへ出力する場合、ローテーションは排他制御されない
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int,
+        backup_count: int,
+        compress: bool = False,
+        encoding: str = "utf-8",
+    ) -> None:
+        """RotatingLogFileHandlerを初期化
+
+        Args:
+            filename: ログファイルのパス
+            max_bytes: ローテーションするログファイルのバイト数
+            backup_count: 残す旧ファイルの数
+            compress: 退避した旧ファイルを gzip で圧縮する
+            encoding: ログファイルの文字コード
+        """
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self.compress = compress
+
+    def rotation_filename(self, default_name: str) -> str:
+        """旧ファイルのファイル名を返す（compress の場合は .gz を付与する）"""
+        return f"{default_name}.gz" if self.compress else default_name
+
+    def rotate(self, source: str, dest: str) -> None:
+        """ログファイルを旧ファイルへ退避する（compress の場合は gzip で圧縮して退避する）"""
+        if not self.compress:
+            super().rotate(source, dest)
+            return
+        import gzip  # 圧縮する場合のみ import する
+
+        source_path = Path(source)
+        with source_path.open("rb") as src, gzip.open(dest, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        source_path.unlink()
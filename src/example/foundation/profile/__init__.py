@@ -0,0 +1,35 @@
+"""プロファイリング機能の公開API(Foundation層)。
+
+公開APIは `example.foundation.profile` から import すること(`__all__` のみ互換性対象)。
+
+Docs:
+    - docs/specs/foundation/profile/requirements.md
+    - docs/specs/foundation/profile/design.md
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+from example.foundation.profile.startup import StartupPhase, StartupTimer
+
+if TYPE_CHECKING:
+    from example.foundation.profile.profiler import Profiler, ProfileReport
+
+__all__ = ["ProfileReport", "Profiler", "StartupPhase", "StartupTimer"]
+
+_LAZY_IMPORTS = {
+    "Profiler": "example.foundation.profile.profiler",
+    "ProfileReport": "example.foundation.profile.profiler",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Profiler・ProfileReport を初回参照時に import する（PEP 562）
+
+    cProfile の import を、--profile を指定した実行で計測を開始する時点まで遅らせる。
+    StartupTimer のみを参照する場合（CLI の起動時）は import しない。
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
@@ -0,0 +1,69 @@
+"""cProfile によるプロファイリング"""
+
+import cProfile
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """プロファイリング結果の出力先"""
+
+    stats_path: Path
+    """pstats 形式の計測データ（pstats / snakeviz 等で読み込める）"""
+
+    summary_path: Path
+    """計測データの上位を抜き出したテキストの要約"""
+
+
+class Profiler:
+    """cProfile で処理を計測し、計測データと要約を出力する
+
+    使用例:
+        profiler = Profiler()
+        profiler.start()
+        ...  # 計測対象の処理
+        report = profiler.stop(Path("tmp/logs/transform_20240101_000000"))
+
+    Constraints:
+        - 計測対象は start() を呼び出したスレッドのみ（ワーカープロセス・スレッドは含まない）
+    """
+
+    def __init__(self, limit: int = 30, sort_key: str = "cumulative") -> None:
+        """Profilerを初期化
+
+        Args:
+            limit: 要約に出力する関数の数
+            sort_key: 要約の並び順（pstats.Stats.sort_stats のキー）
+        """
+        self.limit = limit
+        self.sort_key = sort_key
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """計測を開始する"""
+        self._profile.enable()
+
+    def stop(self, output_stem: Path) -> ProfileReport:
+        """計測を終了し、計測データと要約をファイルに出力する
+
+        Args:
+            output_stem: 出力先のパス（拡張子なし）。
+                計測データは「.pstats」、要約は「.profile.txt」を付与したパスに出力する
+
+        Returns:
+            出力したファイルのパス
+        """
+        self._profile.disable()
+        report = ProfileReport(
+            stats_path=output_stem.with_name(f"{output_stem.name}.pstats"),
+            summary_path=output_stem.with_name(f"{output_stem.name}.profile.txt"),
+        )
+        report.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        self._profile.dump_stats(report.stats_path)
+        import pstats  # 要約の出力時のみ使うため、計測しない実行では import しない
+
+        with report.summary_path.open("w", encoding="utf-8") as f:
+            stats = pstats.Stats(self._profile, stream=f)
+            stats.sort_stats(self.sort_key).print_stats(self.limit)
+        return report
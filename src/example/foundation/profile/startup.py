@@ -0,0 +1,66 @@
+"""起動処理のフェーズごとの計測"""
+
+from dataclasses import dataclass
+from time import perf_counter
+
+
+@dataclass(frozen=True)
+class StartupPhase:
+    """起動処理の1フェーズ分の計測結果"""
+
+    name: str
+    """フェーズ名（例: "import", "config"）"""
+
+    seconds: float
+    """所要時間（秒）"""
+
+
+class StartupTimer:
+    """起動処理をフェーズに区切り、フェーズごとの所要時間を計測する
+
+    `python -X importtime` がモジュール単位で計測するのに対し、
+    import・設定の読み込み・ロガーの初期化などのフェーズ単位で集計する。
+
+    使用例:
+        timer = StartupTimer()
+        config = load_config()
+        timer.mark("config")  # 直前の mark() から（初回は生成時から）の経過時間を記録する
+        print(timer.summary())
+    """
+
+    def __init__(self) -> None:
+        """StartupTimerを初期化（計測を開始）"""
+        self.phases: list[StartupPhase] = []
+        self._last = perf_counter()
+
+    def add(self, name: str, seconds: float) -> None:
+        """計測済みの所要時間をフェーズとして追加する
+
+        Args:
+            name: フェーズ名
+            seconds: 所要時間（秒）
+        """
+        self.phases.append(StartupPhase(name=name, seconds=seconds))
+
+    def mark(self, name: str) -> None:
+        """直前の区切りから現在までを1フェーズとして記録する
+
+        Args:
+            name: フェーズ名
+        """
+        now = perf_counter()
+        self.add(name, now - self._last)
+        self._last = now
+
+    def summary(self) -> str:
+        """フェーズごとの所要時間と合計をテキストの表にまとめる
+
+        Returns:
+            フェーズごとの所要時間（ミリ秒）と合計の表
+        """
+        rows = [(phase.name, phase.seconds) for phase in self.phases]
+        rows.append(("total", sum(phase.seconds for phase in self.phases)))
+        width = max(len("phase"), *(len(name) for name, _ in rows))
+        lines = [f"{'phase':<{width}} {'ms':>9}"]
+        lines += [f"{name:<{width}} {seconds * 1000:>9.1f}" for name, seconds in rows]
+        return "\n".join(lines)
@@ -7,9 +7,32 @@ Docs:
     - docs/specs/protocol/design.md
 """
 
-from example.protocol.fs import TextFileSystemReaderProtocol, TextFileSystemWriterProtocol
+from example.protocol.fs import (
+    AsyncTextFileSystemReaderProtocol,
+    AsyncTextFileSystemWriterProtocol,
+    BinaryFileSystemReaderProtocol,
+    BinaryFileSystemWriterProtocol,
+    ByteRange,
+    ByteRangeFileSystemReaderProtocol,
+    FileStamp,
+    FileSystemFinderProtocol,
+    FileSystemInspectorProtocol,
+    OffsetFileSystemWriterProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
 
 __all__ = [
+    "AsyncTextFileSystemReaderProtocol",
+    "AsyncTextFileSystemWriterProtocol",
+    "BinaryFileSystemReaderProtocol",
+    "BinaryFileSystemWriterProtocol",
+    "ByteRange",
+    "ByteRangeFileSystemReaderProtocol",
+    "FileStamp",
+    "FileSystemFinderProtocol",
+    "FileSystemInspectorProtocol",
+    "OffsetFileSystemWriterProtocol",
     "TextFileSystemReaderProtocol",
     "TextFileSystemWriterProtocol",
 ]
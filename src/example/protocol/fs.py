@@ -4,6 +4,8 @@
 複数の機能パッケージ（feature/）および基盤パッケージ（foundation/）から参照される。
 """
 
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
@@ -14,11 +16,12 @@ class TextFileSystemReaderProtocol(Protocol):
     ファイル内容の読み込み機能のみを提供します。
     """
 
-    def read(self, file_path: Path) -> str:
-        """テキストファイルを文字列で読み込む
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        r"""テキストファイルを文字列で読み込む
 
         Args:
             file_path: 読み込み対象のファイルパス
+            newline: 改行コードの扱い（None の場合は \r\n・\r を \n に変換し、それ以外は変換しない）
 
         Returns:
             ファイルの内容
@@ -28,11 +31,28 @@ class TextFileSystemReaderProtocol(Protocol):
         """
         ...
 
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        r"""テキストファイルを改行文字（\n）単位で逐次読み込む
+
+        ファイル全体をメモリに載せず、1行ずつ返す。
+        各要素は行末の改行文字を含み（最終行は含まない場合がある）、改行コードの変換は行わない。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+
+        Returns:
+            行末の改行文字を含む行のイテレータ
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時（イテレート中に送出される）
+        """
+        ...
+
 
 class TextFileSystemWriterProtocol(Protocol):
     """ファイルシステム書き込み専用プロトコル
 
-    ファイル内容の書き込み機能のみを提供します。
+    ファイル内容の書き込み機能と、不要になった出力ファイルの削除のみを提供します。
     """
 
     def write(self, text: str, file_path: Path) -> None:
@@ -46,3 +66,302 @@ class TextFileSystemWriterProtocol(Protocol):
             FileSystemError: ファイルシステムエラー時
         """
         ...
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        """文字列チャンクを順に連結してファイルに書き込む
+
+        チャンクは逐次書き込むため、呼び出し元は全体を連結した文字列を用意する必要がない。
+
+        Args:
+            chunks: 書き込む文字列チャンクのイテラブル
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def remove(self, file_path: Path) -> None:
+        """書き込んだファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            file_path: 削除するファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class AsyncTextFileSystemReaderProtocol(Protocol):
+    """ファイルシステム読み取り専用プロトコル（非同期版）
+
+    ファイル内容の読み込み機能のみを、イベントループをブロックしない形で提供します。
+    """
+
+    async def read(self, file_path: Path, newline: str | None = None) -> str:
+        """テキストファイルを文字列で読み込む
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+            newline: 改行コードの扱い（TextFileSystemReaderProtocol.read と同一）
+
+        Returns:
+            ファイルの内容（TextFileSystemReaderProtocol.read と同一）
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class AsyncTextFileSystemWriterProtocol(Protocol):
+    """ファイルシステム書き込み専用プロトコル（非同期版）
+
+    ファイル内容の書き込み機能と、不要になった出力ファイルの削除のみを、
+    イベントループをブロックしない形で提供します。
+    """
+
+    async def write(self, text: str, file_path: Path) -> None:
+        """テキスト内容をファイルに書き込む
+
+        Args:
+            text: 書き込む文字列
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    async def remove(self, file_path: Path) -> None:
+        """書き込んだファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            file_path: 削除するファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class BinaryFileSystemReaderProtocol(Protocol):
+    """ファイルシステム読み取り専用プロトコル（バイト列版）
+
+    ファイル内容をデコードせずに、バイト列のまま読み込む機能のみを提供します。
+    """
+
+    def read_bytes(self, file_path: Path) -> bytes:
+        """ファイルの内容をバイト列で読み込む
+
+        圧縮されたファイルは伸長した内容を返す。改行コードの変換は行わない。
+
+        Args:
+            file_path: 読み込み対象のファイルパス
+
+        Returns:
+            ファイルの内容
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class BinaryFileSystemWriterProtocol(Protocol):
+    """ファイルシステム書き込み専用プロトコル（バイト列版）
+
+    エンコード済みのバイト列をそのまま書き込む機能のみを提供します。
+    """
+
+    def write_bytes(self, data: bytes, file_path: Path) -> None:
+        """バイト列をファイルに書き込む
+
+        Args:
+            data: 書き込むバイト列
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class FileSystemFinderProtocol(Protocol):
+    """ファイル探索プロトコル
+
+    パス・ディレクトリ・globパターンから対象ファイルを列挙する機能のみを提供します。
+    """
+
+    def find(self, patterns: Sequence[Path], exclude: Sequence[Path] = ()) -> list[Path]:
+        """パターンに一致するファイルを列挙する
+
+        Args:
+            patterns: ファイルパス・ディレクトリ・globパターンのシーケンス
+            exclude: 配下を列挙しないディレクトリ
+
+        Returns:
+            重複を除いたファイルパスのリスト（指定順、各パターン内はパス順）
+
+        Raises:
+            FileSystemError: 探索に失敗した場合、または1件も見つからない場合
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class FileStamp:
+    """ファイルの変更検知に使うメタデータ
+
+    Attributes:
+        size: ファイルサイズ（バイト）
+        mtime_ns: 最終更新日時（ナノ秒単位のUNIX時刻）
+    """
+
+    size: int
+    mtime_ns: int
+
+
+class FileSystemInspectorProtocol(Protocol):
+    """ファイル検査プロトコル
+
+    ファイル内容を読み込まずに変更を検知するためのメタデータ取得と、内容のハッシュ計算のみを提供します。
+    """
+
+    def stamp(self, file_path: Path) -> FileStamp | None:
+        """ファイルのサイズと最終更新日時を取得する
+
+        Args:
+            file_path: 対象のファイルパス
+
+        Returns:
+            ファイルのメタデータ（ファイルが存在しない場合は None）
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def digest(self, file_path: Path) -> str:
+        """ファイル内容の SHA-256 ハッシュを計算する
+
+        Args:
+            file_path: 対象のファイルパス
+
+        Returns:
+            16進数表記のハッシュ値
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """ファイル内のバイト範囲（start 以上 end 未満）
+
+    Attributes:
+        start: 開始位置（バイト）
+        end: 終了位置（バイト、この位置を含まない）
+    """
+
+    start: int
+    end: int
+
+
+class ByteRangeFileSystemReaderProtocol(Protocol):
+    """バイト範囲単位のファイル読み取りプロトコル
+
+    1つのファイルを行境界で複数の範囲に分割し、範囲ごとに独立して読み込む機能のみを提供します。
+    """
+
+    def split(self, file_path: Path, shard_size: int) -> list[ByteRange]:
+        r"""ファイルを行境界（\n の直後）で分割したバイト範囲を返す
+
+        Args:
+            file_path: 対象のファイルパス
+            shard_size: 1範囲のバイト数の目安（行が長い場合は次の行境界まで広げる）
+
+        Returns:
+            ファイル先頭から末尾までを隙間なく覆う範囲のリスト（空ファイルの場合は空リスト）
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def read_range(self, file_path: Path, byte_range: ByteRange) -> str:
+        """バイト範囲を UTF-8 でデコードして返す
+
+        Args:
+            file_path: 対象のファイルパス
+            byte_range: 読み込む範囲（split() が返した範囲）
+
+        Returns:
+            範囲の内容（改行コードは変換しない）
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+
+class OffsetFileSystemWriterProtocol(Protocol):
+    """位置指定によるファイル書き込みプロトコル
+
+    出力サイズを確保した一時ファイルへ、複数の書き手がそれぞれの位置に書き込み、
+    完了後に書き込み先を置き換える機能のみを提供します。
+    """
+
+    def allocate(self, file_path: Path, size: int) -> Path:
+        """書き込み先と同じディレクトリに、指定サイズの一時ファイルを作成する
+
+        Args:
+            file_path: 最終的な書き込み先のファイルパス
+            size: 出力全体のサイズ（バイト）
+
+        Returns:
+            作成した一時ファイルのパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def write_at(self, tmp_path: Path, offset: int, chunks: Iterable[str]) -> int:
+        """文字列チャンクを UTF-8 でエンコードし、一時ファイルの指定位置から書き込む
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+            offset: 書き込み開始位置（バイト）
+            chunks: 書き込む文字列チャンクのイテラブル
+
+        Returns:
+            書き込んだバイト数
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def publish(self, tmp_path: Path, file_path: Path) -> None:
+        """書き込みを終えた一時ファイルで書き込み先を置き換える
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+            file_path: 書き込み先のファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムエラー時
+        """
+        ...
+
+    def discard(self, tmp_path: Path) -> None:
+        """一時ファイルを削除する（存在しない場合は何もしない）
+
+        Args:
+            tmp_path: allocate() が返した一時ファイルのパス
+        """
+        ...
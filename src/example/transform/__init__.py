@@ -7,10 +7,18 @@ Docs:
     - docs/specs/transform/design.md
 """
 
-from example.transform.context import TransformContext
+from example.transform.context import (
+    TransformBatchContext,
+    TransformContext,
+    TransformShardContext,
+)
 from example.transform.provider import TransformOrchestratorProvider
+from example.transform.types import FileTransformResult
 
 __all__ = [
+    "FileTransformResult",
+    "TransformBatchContext",
     "TransformContext",
     "TransformOrchestratorProvider",
+    "TransformShardContext",
 ]
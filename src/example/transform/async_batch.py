@@ -0,0 +1,108 @@
+"""複数ファイルの一括変換を制御する（非同期版）
+
+対象ファイルを列挙し、同時実行数の上限内でファイルごとの AsyncTransformOrchestrator を並行実行する。
+"""
+
+import asyncio
+import time
+
+from example.foundation.error import ApplicationError
+from example.foundation.log import log
+from example.protocol.fs import FileSystemInspectorProtocol
+from example.transform.async_orchestrator import AsyncTransformOrchestrator
+from example.transform.context import TransformBatchContext, TransformContext
+from example.transform.finder import TargetFinder
+from example.transform.types import BatchTransformResult, FileResultListener, FileTransformResult
+
+
+class AsyncTransformBatchOrchestrator:
+    """複数のテキストファイルに行番号を付与して出力する（非同期版）
+
+    集計結果とファイルごとの結果は TransformBatchOrchestrator と同一。
+
+    Flow:
+        1. TargetFinderで対象ファイルを列挙
+        2. セマフォで同時実行数を制限しながら、ファイルごとに AsyncTransformOrchestrator を実行
+        3. （listener 指定時）ファイルの処理が完了するたびに、その結果を listener へ渡す
+        4. ファイルごとの結果を集約して返す
+
+    ファイル I/O はスレッドへ委譲されるため、実際の並行度はイベントループの
+    デフォルトスレッドプールの大きさにも制限される。
+
+    1ファイルの失敗で全体を中断しないよう、ApplicationError はファイルごとの結果に記録する。
+    それ以外の例外は想定外のエラーとしてそのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        finder: TargetFinder,
+        orchestrator: AsyncTransformOrchestrator,
+        inspector: FileSystemInspectorProtocol | None = None,
+    ):
+        """AsyncTransformBatchOrchestratorを初期化
+
+        Args:
+            finder: 変換対象ファイルの探索
+            orchestrator: 1ファイルを変換する AsyncTransformOrchestrator
+            inspector: 変換前のファイルサイズの取得（None の場合は src_bytes を 0 とする）
+        """
+        self.finder = finder
+        self.orchestrator = orchestrator
+        self.inspector = inspector
+
+    @log
+    async def orchestrate(
+        self, context: TransformBatchContext, listener: FileResultListener | None = None
+    ) -> BatchTransformResult:
+        """複数のテキストファイルに行番号を付与して出力
+
+        Args:
+            context: 一括変換の実行時コンテキスト
+            listener: ファイルの処理が完了するたびに結果を受け取る関数（完了順に呼び出す）
+
+        Returns:
+            集計結果とファイルごとの結果（ファイルの順序は列挙順）
+        """
+        target_files = await asyncio.to_thread(
+            self.finder.find, context.targets, context.excluded_dirs()
+        )
+        semaphore = asyncio.Semaphore(context.concurrency)
+
+        async def process(file_context: TransformContext) -> FileTransformResult:
+            async with semaphore:
+                file = await self._process(file_context)
+            if listener is not None:
+                listener(file)
+            return file
+
+        files = await asyncio.gather(
+            *(process(context.file_context(target_file)) for target_file in target_files)
+        )
+        return BatchTransformResult.aggregate(list(files))
+
+    async def _process(self, context: TransformContext) -> FileTransformResult:
+        """1ファイルを変換し、結果を処理時間・ファイルサイズとともに FileTransformResult に変換する
+
+        Args:
+            context: 1ファイル分の実行時コンテキスト
+
+        Returns:
+            1ファイル分の結果（ApplicationError 発生時は status="error"）
+        """
+        path = str(context.target_file)
+        started = time.perf_counter()
+        try:
+            result = await self.orchestrator.orchestrate(context)
+            stamp = (
+                await asyncio.to_thread(self.inspector.stamp, context.target_file)
+                if self.inspector is not None
+                else None
+            )
+        except ApplicationError as e:
+            return FileTransformResult.failed(path, e.message, time.perf_counter() - started)
+        return FileTransformResult.succeeded(
+            path,
+            result,
+            src_bytes=stamp.size if stamp is not None else 0,
+            duration_seconds=time.perf_counter() - started,
+        )
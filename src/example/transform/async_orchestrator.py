@@ -0,0 +1,171 @@
+"""Transform層の中核（非同期版）
+
+TransformOrchestrator と同じ変換パイプラインを、ファイル I/O を await しながら実行する。
+"""
+
+import asyncio
+from pathlib import Path
+
+from example.foundation.log import log
+from example.transform.cache import TransformCache
+from example.transform.context import TransformContext
+from example.transform.layout import OutputLayout
+from example.transform.reader import AsyncTextReader
+from example.transform.transformer import TextTransformer
+from example.transform.types import TransformedDatetime, TransformResult
+from example.transform.writer import AsyncTextWriter
+
+
+class AsyncTransformOrchestrator:
+    """テキストファイルを読み込み、行番号を付与して出力する（非同期版）
+
+    出力内容と TransformResult は TransformOrchestrator と同一。
+    ファイル I/O を待つ間にイベントループが他のファイルを処理できるため、
+    I/O の待ち時間が支配的な環境で多数のファイルを並行して変換できる。
+
+    Flow:
+        0. OutputLayoutで出力ファイルパスを決定（layout を指定しない場合は tmp_dir 直下の同名ファイル）
+        1. （インクリメンタル変換時）TransformCacheで前回の結果を再利用できるか判定
+        2. AsyncTextReaderでファイル読み込み
+        3. TextTransformerでテキストを変換
+        4. AsyncTextWriterで書き込み
+        5. （インクリメンタル変換時）TransformCacheへ結果を記録し、OutputLayoutへ出力ファイルパスを記録
+        6. 実行結果を返す
+
+    Constraints:
+        - ストリーミングモード（TransformContext.streaming）には対応しない
+        - TransformContext.memory_budget は参照しない（常にファイル全体を読み込む）
+    """
+
+    def __init__(
+        self,
+        reader: AsyncTextReader,
+        transformer: TextTransformer,
+        writer: AsyncTextWriter,
+        cache: TransformCache | None = None,
+        layout: OutputLayout | None = None,
+    ):
+        """AsyncTransformOrchestratorを初期化
+
+        Args:
+            reader: テキストファイル読み込み
+            transformer: テキストファイル変換
+            writer: テキストファイル書き込み
+            cache: インクリメンタル変換のマニフェスト（None の場合は常に変換する）
+            layout: 出力ファイルパスの決定と対応表の記録（None の場合は context.layout が flat のみ対応）
+        """
+        self.reader = reader
+        self.transformer = transformer
+        self.writer = writer
+        self.cache = cache
+        self.layout = layout
+
+    @log
+    async def orchestrate(self, context: TransformContext) -> TransformResult:
+        """テキストファイルに行番号を付与して出力
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+
+        Returns:
+            Transform処理の実行結果
+
+        Raises:
+            ValueError: 非対応のモード（streaming・memory_budget・binary・stats）が指定された場合、
+                または context.layout が flat 以外で layout が指定されていない場合
+        """
+        # 同期版と異なる出力・結果を黙って返さないよう、対応しないモードは受け付けない
+        if context.streaming:
+            raise ValueError("AsyncTransformOrchestrator does not support streaming mode")
+        if context.memory_budget is not None:
+            raise ValueError("AsyncTransformOrchestrator does not support memory_budget")
+        if context.binary:
+            raise ValueError("AsyncTransformOrchestrator does not support binary mode")
+        if context.stats:
+            raise ValueError("AsyncTransformOrchestrator does not support stats")
+
+        if not context.incremental or self.cache is None:
+            dst_path = await self._dst_path(context)
+            result = await self._transform(context, dst_path)
+        else:
+            # マニフェストの判定・記録は同期 I/O のため、スレッドへ委譲する
+            previous_dst_path = await self._previous_dst_path(context)
+            if not context.force and previous_dst_path is not None:
+                cached = await asyncio.to_thread(
+                    self.cache.lookup,
+                    context.target_file,
+                    previous_dst_path,
+                    context.cache_dir,
+                    context.output_options(),
+                )
+                if cached is not None:
+                    return cached
+
+            src_stamp = await asyncio.to_thread(self.cache.stamp, context.target_file)
+            dst_path = await self._dst_path(context)
+            result = await self._transform(context, dst_path)
+            if previous_dst_path not in (None, dst_path):
+                # content の前回の出力は同じ内容の別の変換元と共有しうるため削除せず、
+                # この変換元の前回の出力に対応するマニフェストのみを削除する
+                await asyncio.to_thread(
+                    self.cache.discard, context.target_file, previous_dst_path, context.cache_dir
+                )
+            await asyncio.to_thread(
+                self.cache.store,
+                context.target_file,
+                src_stamp,
+                dst_path,
+                result,
+                context.cache_dir,
+                context.output_options(),
+            )
+
+        if self.layout is not None and context.layout != "flat":
+            await asyncio.to_thread(self.layout.record, context, dst_path)
+        return result
+
+    async def _dst_path(self, context: TransformContext) -> Path:
+        """出力ファイルパスを決定する
+
+        決定（content の場合はハッシュ計算）は同期 I/O のため、スレッドへ委譲する。
+
+        Raises:
+            ValueError: context.layout が flat 以外で、layout が指定されていない場合
+        """
+        if self.layout is not None:
+            return await asyncio.to_thread(self.layout.dst_path, context)
+        if context.layout != "flat":
+            raise ValueError(f"{context.layout} output layout requires layout")
+        return context.tmp_dir / context.target_file.name
+
+    async def _previous_dst_path(self, context: TransformContext) -> Path | None:
+        """インクリメンタル変換の判定に使う、前回の出力ファイルパスを返す
+
+        TransformOrchestrator._previous_dst_path() と同じく、layout が指定されている場合は委譲する。
+        """
+        if self.layout is not None:
+            return await asyncio.to_thread(self.layout.previous_dst_path, context)
+        return await self._dst_path(context)
+
+    async def _transform(self, context: TransformContext, dst_path: Path) -> TransformResult:
+        """テキストファイルを読み込み・変換・書き込みする
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+            dst_path: 出力ファイルパス
+
+        Returns:
+            Transform処理の実行結果
+        """
+        # テキストファイルを読み込み
+        src_text = await self.reader.read(context.target_file, context.newline)
+
+        # テキストファイルを変換
+        datetime = TransformedDatetime(context.current_datetime)
+        dst_text = self.transformer.transform(text=src_text, datetime=datetime)
+
+        # テキストファイルに書き込み
+        await self.writer.write(dst_text, dst_path)
+
+        # 実行結果を返す
+        return TransformResult(src_length=src_text.length(), dst_length=dst_text.length())
@@ -0,0 +1,187 @@
+"""複数ファイルの一括変換を制御する
+
+対象ファイルを列挙し、ファイルごとの TransformOrchestrator の実行結果を集約する。
+ワーカー数が2以上の場合はプロセスプールで並列実行する。
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from example.foundation.error import ApplicationError
+from example.foundation.log import log
+from example.protocol.fs import FileSystemInspectorProtocol
+from example.transform.context import TransformBatchContext, TransformContext
+from example.transform.finder import TargetFinder
+from example.transform.orchestrator import TransformOrchestrator
+from example.transform.types import BatchTransformResult, FileResultListener, FileTransformResult
+
+type OrchestratorFactory = Callable[[], TransformOrchestrator]
+"""TransformOrchestrator を生成する関数（プロセスプール利用時は pickle 可能であること）"""
+
+_MAX_CHUNKSIZE = 64
+"""ワーカーへ一度に渡すコンテキスト数の上限"""
+
+_worker_orchestrator: TransformOrchestrator | None = None
+"""ワーカープロセス内で再利用する TransformOrchestrator"""
+
+_worker_inspector: FileSystemInspectorProtocol | None = None
+"""ワーカープロセス内で変換前のファイルサイズを取得する FileSystemInspector"""
+
+
+class TransformBatchOrchestrator:
+    """複数のテキストファイルに行番号を付与して出力する
+
+    Flow:
+        1. TargetFinderで対象ファイルを列挙
+        2. ファイルごとに TransformOrchestrator を実行
+        3. （listener 指定時）ファイルの処理が完了するたびに、その結果を listener へ渡す
+        4. ファイルごとの結果を集約して返す
+
+    1ファイルの失敗で全体を中断しないよう、ApplicationError はファイルごとの結果に記録する。
+    それ以外の例外は想定外のエラーとしてそのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        finder: TargetFinder,
+        orchestrator_factory: OrchestratorFactory,
+        inspector: FileSystemInspectorProtocol | None = None,
+    ):
+        """TransformBatchOrchestratorを初期化
+
+        Args:
+            finder: 変換対象ファイルの探索
+            orchestrator_factory: 1ファイルを変換する TransformOrchestrator の生成関数
+            inspector: 変換前のファイルサイズの取得（None の場合は src_bytes を 0 とする）
+        """
+        self.finder = finder
+        self.orchestrator_factory = orchestrator_factory
+        self.inspector = inspector
+
+    @log
+    def orchestrate(
+        self, context: TransformBatchContext, listener: FileResultListener | None = None
+    ) -> BatchTransformResult:
+        """複数のテキストファイルに行番号を付与して出力
+
+        Args:
+            context: 一括変換の実行時コンテキスト
+            listener: ファイルの処理が完了するたびに結果を受け取る関数（完了順に呼び出す）
+
+        Returns:
+            集計結果とファイルごとの結果（ファイルの順序は列挙順）
+        """
+        target_files = self.finder.find(context.targets, context.excluded_dirs())
+        file_contexts = [context.file_context(target_file) for target_file in target_files]
+
+        if context.workers <= 1 or len(file_contexts) <= 1:
+            orchestrator = self.orchestrator_factory()
+            files: list[FileTransformResult] = []
+            for file_context in file_contexts:
+                file = _process(orchestrator, self.inspector, file_context)
+                if listener is not None:
+                    listener(file)
+                files.append(file)
+        else:
+            files = self._orchestrate_parallel(file_contexts, context.workers, listener)
+
+        return BatchTransformResult.aggregate(files)
+
+    def _orchestrate_parallel(
+        self,
+        file_contexts: list[TransformContext],
+        workers: int,
+        listener: FileResultListener | None,
+    ) -> list[FileTransformResult]:
+        """プロセスプールで並列に変換する
+
+        ワーカーごとに TransformOrchestrator を1回だけ生成して再利用し、
+        コンテキストをチャンクにまとめて渡すことでプロセス間通信の回数を抑える。
+        listener へはチャンクの処理が完了した順に結果を渡す。
+
+        Args:
+            file_contexts: ファイルごとの実行時コンテキスト
+            workers: ワーカープロセス数
+            listener: ファイルの処理が完了するたびに結果を受け取る関数
+
+        Returns:
+            ファイルごとの結果（file_contexts と同じ順序）
+        """
+        workers = min(workers, len(file_contexts))
+        chunksize = max(1, min(_MAX_CHUNKSIZE, len(file_contexts) // (workers * 4)))
+        chunks: dict[int, list[FileTransformResult]] = {}
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(self.orchestrator_factory, self.inspector),
+        ) as executor:
+            futures = {
+                executor.submit(_process_in_worker, file_contexts[start : start + chunksize]): start
+                for start in range(0, len(file_contexts), chunksize)
+            }
+            for future in as_completed(futures):
+                chunk = future.result()
+                if listener is not None:
+                    for file in chunk:
+                        listener(file)
+                chunks[futures[future]] = chunk
+        return [file for start in sorted(chunks) for file in chunks[start]]
+
+
+def _initialize_worker(
+    orchestrator_factory: OrchestratorFactory, inspector: FileSystemInspectorProtocol | None
+) -> None:
+    """ワーカープロセスの初期化時に TransformOrchestrator を生成する
+
+    Args:
+        orchestrator_factory: TransformOrchestrator の生成関数
+        inspector: 変換前のファイルサイズの取得
+    """
+    global _worker_orchestrator, _worker_inspector
+    _worker_orchestrator = orchestrator_factory()
+    _worker_inspector = inspector
+
+
+def _process_in_worker(contexts: list[TransformContext]) -> list[FileTransformResult]:
+    """ワーカープロセス内でチャンク内のファイルを順に変換する
+
+    Args:
+        contexts: チャンク内のファイルごとの実行時コンテキスト
+
+    Returns:
+        ファイルごとの結果（contexts と同じ順序）
+    """
+    if _worker_orchestrator is None:
+        raise RuntimeError("worker orchestrator is not initialized")
+    return [_process(_worker_orchestrator, _worker_inspector, context) for context in contexts]
+
+
+def _process(
+    orchestrator: TransformOrchestrator,
+    inspector: FileSystemInspectorProtocol | None,
+    context: TransformContext,
+) -> FileTransformResult:
+    """1ファイルを変換し、結果を処理時間・ファイルサイズとともに FileTransformResult に変換する
+
+    Args:
+        orchestrator: 1ファイルを変換する TransformOrchestrator
+        inspector: 変換前のファイルサイズの取得（None の場合は src_bytes を 0 とする）
+        context: 1ファイル分の実行時コンテキスト
+
+    Returns:
+        1ファイル分の結果（ApplicationError 発生時は status="error"）
+    """
+    path = str(context.target_file)
+    started = time.perf_counter()
+    try:
+        result = orchestrator.orchestrate(context)
+        stamp = inspector.stamp(context.target_file) if inspector is not None else None
+    except ApplicationError as e:
+        return FileTransformResult.failed(path, e.message, time.perf_counter() - started)
+    return FileTransformResult.succeeded(
+        path,
+        result,
+        src_bytes=stamp.size if stamp is not None else 0,
+        duration_seconds=time.perf_counter() - started,
+    )
@@ -0,0 +1,201 @@
+"""インクリメンタル変換のマニフェストを管理する
+
+変換済みファイルのマニフェストを出力先ディレクトリ（または指定したディレクトリ）に記録し、
+変換元・出力ファイルが前回から変わっていなければ前回の変換結果を返す。
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Literal
+
+from pydantic import ValidationError
+
+from example.foundation.fs import FileSystemError
+from example.foundation.log import log
+from example.protocol.fs import (
+    FileStamp,
+    FileSystemInspectorProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
+from example.transform.types import ManifestEntry, OutputOptions, TransformResult
+
+MANIFEST_DIR_NAME = ".manifest"
+"""出力先ディレクトリ配下のマニフェスト格納ディレクトリ名"""
+
+
+class TransformCache:
+    """変換結果のマニフェストを読み書きし、変換の要否を判定する
+
+    マニフェストは変換元ファイルごとに1ファイル（JSON）とし、並列実行時にも競合しない。
+
+    Flow:
+        1. 変換元ファイルの stat（サイズ・更新日時）をマニフェストと比較する
+        2. 出力ファイルの stat をマニフェストと比較する（出力の削除・上書きを検知する）
+        3. 変換元ファイルの更新日時のみ異なる場合は、内容のハッシュを比較する
+
+    変換時のオプション（OutputOptions）が前回と異なる場合も、変換が必要なものとして扱う。
+    出力の圧縮形式・圧縮レベルはファイルごとではなく生成時に受け取り、オプションに加えて判定する。
+    """
+
+    def __init__(
+        self,
+        fs_reader: TextFileSystemReaderProtocol,
+        fs_writer: TextFileSystemWriterProtocol,
+        inspector: FileSystemInspectorProtocol,
+        compression: Literal["auto", "none", "gzip", "bz2", "xz"] = "auto",
+        compression_level: int | None = None,
+    ):
+        """初期化
+
+        Args:
+            fs_reader: マニフェストの読み込み
+            fs_writer: マニフェストの書き込み
+            inspector: ファイルのメタデータ取得・ハッシュ計算
+            compression: 出力の圧縮形式の指定
+            compression_level: 出力の圧縮レベル（None の場合は圧縮形式ごとの既定値）
+        """
+        self.fs_reader = fs_reader
+        self.fs_writer = fs_writer
+        self.inspector = inspector
+        self.compression: Literal["auto", "none", "gzip", "bz2", "xz"] = compression
+        self.compression_level = compression_level
+
+    @log
+    def stamp(self, source: Path) -> FileStamp | None:
+        """変換前に変換元ファイルのメタデータを取得する
+
+        変換中にファイルが更新された場合に備え、読み込み前の値をマニフェストへ記録する。
+
+        Args:
+            source: 変換元ファイルパス
+
+        Returns:
+            ファイルのメタデータ（ファイルが存在しない場合は None）
+        """
+        return self.inspector.stamp(source)
+
+    @log
+    def lookup(
+        self,
+        source: Path,
+        dst_path: Path,
+        cache_dir: Path | None = None,
+        options: OutputOptions | None = None,
+    ) -> TransformResult | None:
+        """前回の変換結果を再利用できる場合に、その結果を返す
+
+        Args:
+            source: 変換元ファイルパス
+            dst_path: 出力ファイルパス
+            cache_dir: マニフェストの格納ディレクトリ（None の場合は出力先ディレクトリ配下）
+            options: 今回の変換オプション（None の場合は既定値）
+
+        Returns:
+            前回の変換結果（変換が必要な場合は None）
+        """
+        manifest_path = _manifest_path(source, dst_path, cache_dir)
+        entry = self._load(manifest_path)
+        if entry is None or entry.path != str(source.resolve()):
+            return None
+        if entry.options != self._options(options):
+            return None
+
+        src_stamp = self.inspector.stamp(source)
+        if src_stamp is None or src_stamp.size != entry.size:
+            return None
+        if self.inspector.stamp(dst_path) != FileStamp(
+            size=entry.dst_size, mtime_ns=entry.dst_mtime_ns
+        ):
+            return None
+
+        if src_stamp.mtime_ns != entry.mtime_ns:
+            if self.inspector.digest(source) != entry.sha256:
+                return None
+            # 内容が同じであれば、次回は stat のみで判定できるよう更新日時を記録し直す
+            updated = entry.model_copy(update={"mtime_ns": src_stamp.mtime_ns})
+            self.fs_writer.write(updated.to_json(), manifest_path)
+
+        return entry.result
+
+    @log
+    def store(
+        self,
+        source: Path,
+        src_stamp: FileStamp | None,
+        dst_path: Path,
+        result: TransformResult,
+        cache_dir: Path | None = None,
+        options: OutputOptions | None = None,
+    ) -> None:
+        """変換結果をマニフェストに記録する
+
+        Args:
+            source: 変換元ファイルパス
+            src_stamp: 変換前に取得した変換元ファイルのメタデータ
+            dst_path: 出力ファイルパス
+            result: 変換結果
+            cache_dir: マニフェストの格納ディレクトリ（None の場合は出力先ディレクトリ配下）
+            options: 変換時のオプション（None の場合は既定値）
+        """
+        dst_stamp = self.inspector.stamp(dst_path)
+        if src_stamp is None or dst_stamp is None:
+            return
+
+        entry = ManifestEntry(
+            path=str(source.resolve()),
+            size=src_stamp.size,
+            mtime_ns=src_stamp.mtime_ns,
+            sha256=self.inspector.digest(source),
+            dst_size=dst_stamp.size,
+            dst_mtime_ns=dst_stamp.mtime_ns,
+            result=result,
+            options=self._options(options),
+        )
+        self.fs_writer.write(entry.to_json(), _manifest_path(source, dst_path, cache_dir))
+
+    @log
+    def discard(self, source: Path, dst_path: Path, cache_dir: Path | None = None) -> None:
+        """変換元ファイルの、以前の出力ファイルに対応するマニフェストを削除する
+
+        出力ファイルパスが変わった場合（content で変換元の内容が変わった場合）に、
+        以前の出力先に残るマニフェストを削除する。出力ファイル自体は削除しない。
+
+        Args:
+            source: 変換元ファイルパス
+            dst_path: 以前の出力ファイルパス
+            cache_dir: マニフェストの格納ディレクトリ（None の場合は出力先ディレクトリ配下）
+
+        Raises:
+            FileSystemError: マニフェストの削除に失敗した場合
+        """
+        self.fs_writer.remove(_manifest_path(source, dst_path, cache_dir))
+
+    def _options(self, options: OutputOptions | None) -> OutputOptions:
+        """変換オプションに出力の圧縮形式・圧縮レベルを加える"""
+        return (options or OutputOptions()).model_copy(
+            update={"compression": self.compression, "compression_level": self.compression_level}
+        )
+
+    def _load(self, manifest_path: Path) -> ManifestEntry | None:
+        """マニフェストを読み込む
+
+        マニフェストが存在しない・壊れている場合は、変換が必要なものとして None を返す。
+        """
+        try:
+            return ManifestEntry.model_validate_json(self.fs_reader.read(manifest_path))
+        except (FileSystemError, ValidationError):
+            return None
+
+
+def _manifest_path(source: Path, dst_path: Path, cache_dir: Path | None) -> Path:
+    """変換元ファイルに対応するマニフェストのパスを返す
+
+    ファイル名は変換元の絶対パスのハッシュとし、同名の変換元ファイルを区別する。
+    格納ディレクトリを指定した場合は複数の出力先で共有されるため、出力ファイルの絶対パスもハッシュに含める。
+    """
+    if cache_dir is None:
+        key = hashlib.sha256(str(source.resolve()).encode()).hexdigest()
+        return dst_path.parent / MANIFEST_DIR_NAME / f"{key}.json"
+    key = hashlib.sha256(f"{source.resolve()}\0{dst_path.resolve()}".encode()).hexdigest()
+    return cache_dir / f"{key}.json"
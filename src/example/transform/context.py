@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from example.transform.types import NewlineMode, OutputLayoutMode, OutputOptions
+
 
 @dataclass(frozen=True)
 class TransformContext:
@@ -19,8 +21,142 @@ class TransformContext:
         target_file: 変換対象のテキストファイルパス
         tmp_dir: 一時ディレクトリパス（出力先の親ディレクトリ）
         current_datetime: 現在日時（変換結果の先頭に付与される）
+        streaming: 1行ずつ逐次変換するか（True の場合、メモリ使用量が最長行の長さで抑えられる）
+        incremental: 前回から変更のないファイルの変換を省略するか（マニフェストを記録・参照する）
+        force: incremental 有効時に、マニフェストを参照せずに変換し直すか
+        memory_budget: ファイルサイズがこの値（バイト）を超える場合は streaming が False でも逐次変換する
+            （None の場合は制限しない）
+        cache_dir: マニフェストの格納ディレクトリ（None の場合は出力先ディレクトリ配下の .manifest/）
+        stats: 読み込み・変換・書き込みの段階ごとの所要時間と処理量を計測し、実行結果に含めるか
+        binary: ファイル全体をデコードせずにバイト列のまま変換するか（streaming・memory_budget より優先する）
+        encoding: binary 時の入力（と出力）の文字コード
+        errors: binary 時に、ASCII 互換でない文字コードでデコード・エンコードできない文字の扱い
+        newline: 行の区切り規則（binary 時は参照しない）
+        layout: 出力ファイルの配置規則（flat の場合は tmp_dir 直下に変換元と同じファイル名で出力する）
+        fan_out: layout が hashed・content の場合の、各階層のサブディレクトリ数
+    """
+
+    target_file: Path
+    tmp_dir: Path
+    current_datetime: datetime
+    streaming: bool = False
+    incremental: bool = False
+    force: bool = False
+    memory_budget: int | None = None
+    cache_dir: Path | None = None
+    stats: bool = False
+    binary: bool = False
+    encoding: str = "utf-8"
+    errors: str = "strict"
+    newline: NewlineMode = "universal"
+    layout: OutputLayoutMode = "flat"
+    fan_out: int = 256
+
+    def output_options(self) -> OutputOptions:
+        """出力内容を左右するオプションを返す（マニフェストとの比較に用いる）"""
+        return OutputOptions(
+            binary=self.binary, encoding=self.encoding, errors=self.errors, newline=self.newline
+        )
+
+
+@dataclass(frozen=True)
+class TransformBatchContext:
+    """複数ファイルを一括変換する際の実行時コンテキスト
+
+    Lifecycle:
+        処理開始時に生成され、処理完了まで不変のまま保持される
+
+    Attributes:
+        targets: 変換対象（ファイルパス・ディレクトリ・globパターン）
+        tmp_dir: 一時ディレクトリパス（出力先の親ディレクトリ）
+        current_datetime: 現在日時（全ファイルの変換結果の先頭に付与される）
+        workers: 並列実行するワーカープロセス数（1 の場合は同一プロセスで逐次実行）
+        concurrency: 非同期実行時に同時に処理するファイル数の上限
+        streaming: 1行ずつ逐次変換するか
+        incremental: 前回から変更のないファイルの変換を省略するか
+        force: incremental 有効時に、マニフェストを参照せずに変換し直すか
+        memory_budget: ファイルサイズがこの値（バイト）を超える場合は逐次変換する（None の場合は制限しない）
+        cache_dir: マニフェストの格納ディレクトリ（None の場合は出力先ディレクトリ配下の .manifest/）
+        binary: ファイル全体をデコードせずにバイト列のまま変換するか
+        encoding: binary 時の入力（と出力）の文字コード
+        errors: binary 時に、ASCII 互換でない文字コードでデコード・エンコードできない文字の扱い
+        newline: 行の区切り規則（binary 時は参照しない）
+        layout: 出力ファイルの配置規則（flat の場合は tmp_dir 直下に変換元と同じファイル名で出力する）
+        fan_out: layout が hashed・content の場合の、各階層のサブディレクトリ数
+        exclude: targets のディレクトリ・globパターンの探索から除外するディレクトリ
+            （tmp_dir・cache_dir は指定しなくても除外する）
+    """
+
+    targets: tuple[Path, ...]
+    tmp_dir: Path
+    current_datetime: datetime
+    workers: int = 1
+    concurrency: int = 64
+    streaming: bool = False
+    incremental: bool = False
+    force: bool = False
+    memory_budget: int | None = None
+    cache_dir: Path | None = None
+    binary: bool = False
+    encoding: str = "utf-8"
+    errors: str = "strict"
+    newline: NewlineMode = "universal"
+    layout: OutputLayoutMode = "flat"
+    fan_out: int = 256
+    exclude: tuple[Path, ...] = ()
+
+    def excluded_dirs(self) -> tuple[Path, ...]:
+        """探索から除外するディレクトリを返す
+
+        前回の実行の出力・マニフェストを変換対象として拾わないよう、tmp_dir・cache_dir を含める。
+        """
+        cache_dirs = () if self.cache_dir is None else (self.cache_dir,)
+        return (self.tmp_dir, *cache_dirs, *self.exclude)
+
+    def file_context(self, target_file: Path) -> TransformContext:
+        """1ファイル分の実行時コンテキストを生成する
+
+        Args:
+            target_file: 変換対象のテキストファイルパス
+
+        Returns:
+            1ファイル分の TransformContext
+        """
+        return TransformContext(
+            target_file=target_file,
+            tmp_dir=self.tmp_dir,
+            current_datetime=self.current_datetime,
+            streaming=self.streaming,
+            incremental=self.incremental,
+            force=self.force,
+            memory_budget=self.memory_budget,
+            cache_dir=self.cache_dir,
+            binary=self.binary,
+            encoding=self.encoding,
+            errors=self.errors,
+            newline=self.newline,
+            layout=self.layout,
+            fan_out=self.fan_out,
+        )
+
+
+@dataclass(frozen=True)
+class TransformShardContext:
+    """1つのファイルを分割して並列に変換する際の実行時コンテキスト
+
+    Lifecycle:
+        処理開始時に生成され、処理完了まで不変のまま保持される
+
+    Attributes:
+        target_file: 変換対象のテキストファイルパス
+        tmp_dir: 一時ディレクトリパス（出力先の親ディレクトリ）
+        current_datetime: 現在日時（変換結果の先頭に付与される）
+        workers: 並列実行するワーカープロセス数（1 の場合は同一プロセスで逐次実行）
+        shard_size: 1ワーカーが1回に担当する範囲のバイト数の目安
     """
 
     target_file: Path
     tmp_dir: Path
     current_datetime: datetime
+    workers: int = 1
+    shard_size: int = 32 << 20
@@ -0,0 +1,41 @@
+"""Transform層の対象ファイル探索を担当する薄いラッパー
+
+基盤層への委譲のみを行い、例外処理やデータ変換は行わない。
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from example.foundation.log import log
+from example.protocol.fs import FileSystemFinderProtocol
+
+
+class TargetFinder:
+    """変換対象のパターンからファイルを列挙する
+
+    基盤層への薄いラッパー。例外処理は行わず、そのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        fs_finder: FileSystemFinderProtocol,
+    ):
+        """初期化
+
+        Args:
+            fs_finder: ファイル探索
+        """
+        self.fs_finder = fs_finder
+
+    @log
+    def find(self, targets: Sequence[Path], exclude: Sequence[Path] = ()) -> list[Path]:
+        """変換対象のファイルを列挙する
+
+        Args:
+            targets: ファイルパス・ディレクトリ・globパターン
+            exclude: 配下を列挙しないディレクトリ
+
+        Returns:
+            変換対象のファイルパスのリスト
+        """
+        return self.fs_finder.find(targets, exclude)
@@ -0,0 +1,195 @@
+"""出力ファイルの配置を決定し、変換元との対応表を管理する
+
+変換元ファイルごとの出力ファイルパスを配置規則（OutputLayoutMode）に従って決定し、
+flat 以外の配置規則では、変換元から出力ファイルを走査せずに引けるよう対応表を記録する。
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Literal
+
+from pydantic import ValidationError
+
+from example.foundation.fs import FileSystemError, with_compression_suffix
+from example.foundation.log import log
+from example.protocol.fs import (
+    FileSystemInspectorProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
+from example.transform.context import TransformContext
+from example.transform.types import OutputMapEntry
+
+OUTPUT_MAP_DIR_NAME = ".outputs"
+"""出力先ディレクトリ配下の対応表の格納ディレクトリ名"""
+
+_KEY_PREFIX_LENGTH = 16
+"""hashed で出力ファイル名に付与するハッシュの文字数"""
+
+
+class OutputLayout:
+    """変換元ファイルに対応する出力ファイルパスを決定し、その対応を記録する
+
+    配置規則:
+        - flat: 出力先ディレクトリ直下に変換元と同じファイル名で出力する（同名の変換元は上書きし合う）
+        - mirror: 変換元のカレントディレクトリからの相対パスを出力先ディレクトリ配下に再現する
+          （カレントディレクトリ外の変換元はルートからの絶対パスを再現する）
+        - hashed: 変換元の絶対パスの SHA-256 から求めた2階層のサブディレクトリに、
+          ハッシュの先頭16文字と変換元のファイル名を連結したファイル名で出力する
+        - content: 変換元の内容の SHA-256 から求めた2階層のサブディレクトリに、
+          ハッシュと変換元の拡張子を連結したファイル名で出力する（同じ内容の変換元は同じ出力を共有する）
+
+    hashed・content の各階層のサブディレクトリ数は fan_out 個（ディレクトリ名は16進数）。
+    対応表は変換元ごとに1ファイル（JSON）とし、並列実行時にも競合しない。
+
+    Constraints:
+        - 対応表のファイル名は変換元の絶対パスのハッシュのため、変換元のパスから直接引ける
+        - 出力ファイルの拡張子は、compression が auto の場合は変換元と同じにし（拡張子による出力の圧縮形式の判定を保つ）、
+          それ以外の場合は圧縮形式に合わせる（.gz / .bz2 / .xz を付け替える、none の場合は取り除く）
+    """
+
+    def __init__(
+        self,
+        fs_reader: TextFileSystemReaderProtocol,
+        fs_writer: TextFileSystemWriterProtocol,
+        inspector: FileSystemInspectorProtocol,
+        compression: Literal["auto", "none", "gzip", "bz2", "xz"] = "auto",
+    ):
+        """初期化
+
+        Args:
+            fs_reader: 対応表の読み込み
+            fs_writer: 対応表の書き込み
+            inspector: content の場合の変換元の内容のハッシュ計算
+            compression: 出力の圧縮形式の指定（出力ファイルの拡張子を合わせる）
+        """
+        self.fs_reader = fs_reader
+        self.fs_writer = fs_writer
+        self.inspector = inspector
+        self.compression: Literal["auto", "none", "gzip", "bz2", "xz"] = compression
+
+    @log
+    def dst_path(self, context: TransformContext) -> Path:
+        """変換元ファイルに対応する出力ファイルパスを返す
+
+        Args:
+            context: Transform処理の実行時コンテキスト（layout・fan_out を参照する）
+
+        Returns:
+            出力ファイルパス
+
+        Raises:
+            FileSystemError: content の場合に、変換元の内容のハッシュを計算できないとき
+        """
+        source = context.target_file
+        match context.layout:
+            case "flat":
+                dst_path = context.tmp_dir / source.name
+            case "mirror":
+                dst_path = context.tmp_dir / _relative_source(source)
+            case "hashed":
+                key = _path_key(source)
+                name = f"{key[:_KEY_PREFIX_LENGTH]}_{source.name}"
+                dst_path = context.tmp_dir.joinpath(*_buckets(key, context.fan_out), name)
+            case "content":
+                digest = self.inspector.digest(source)
+                name = f"{digest}{source.suffix}"
+                dst_path = context.tmp_dir.joinpath(*_buckets(digest, context.fan_out), name)
+        return with_compression_suffix(dst_path, self.compression)
+
+    @log
+    def previous_dst_path(self, context: TransformContext) -> Path | None:
+        """インクリメンタル変換の判定に使う、前回の出力ファイルパスを返す
+
+        content は変換元の内容のハッシュを計算しないよう、対応表に記録した出力ファイルパスを返す
+        （記録がない場合と、圧縮形式の指定が変わり拡張子が合わない場合は None）。
+        それ以外の配置規則は dst_path() と同じパスを返す。
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+
+        Returns:
+            前回の出力ファイルパス（変換が必要と判断できる場合は None）
+        """
+        if context.layout != "content":
+            return self.dst_path(context)
+        recorded = self.locate(context.target_file, context.tmp_dir)
+        if recorded is None or with_compression_suffix(recorded, self.compression) != recorded:
+            return None
+        return recorded
+
+    @log
+    def record(self, context: TransformContext, dst_path: Path) -> None:
+        """変換元ファイルと出力ファイルの対応を記録する（flat の場合は記録しない）
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+            dst_path: 出力ファイルパス（dst_path() の戻り値）
+        """
+        if context.layout == "flat":
+            return
+        entry = OutputMapEntry(
+            path=str(context.target_file.resolve()),
+            layout=context.layout,
+            output=dst_path.relative_to(context.tmp_dir).as_posix(),
+        )
+        self.fs_writer.write(entry.to_json(), _map_path(context.target_file, context.tmp_dir))
+
+    @log
+    def locate(self, source: Path, tmp_dir: Path) -> Path | None:
+        """対応表から変換元ファイルの出力ファイルパスを引く
+
+        Args:
+            source: 変換元ファイルパス
+            tmp_dir: 出力先ディレクトリ
+
+        Returns:
+            記録した出力ファイルパス（対応表が存在しない・壊れている場合は None）
+        """
+        try:
+            entry = OutputMapEntry.model_validate_json(
+                self.fs_reader.read(_map_path(source, tmp_dir))
+            )
+        except (FileSystemError, ValidationError):
+            return None
+        if entry.path != str(source.resolve()):
+            return None
+        return tmp_dir / entry.output
+
+
+def _path_key(source: Path) -> str:
+    """変換元ファイルの絶対パスの SHA-256 ハッシュ（16進数）を返す"""
+    return hashlib.sha256(str(source.resolve()).encode()).hexdigest()
+
+
+def _map_path(source: Path, tmp_dir: Path) -> Path:
+    """変換元ファイルに対応する対応表のパスを返す"""
+    return tmp_dir / OUTPUT_MAP_DIR_NAME / f"{_path_key(source)}.json"
+
+
+def _relative_source(source: Path) -> Path:
+    """変換元ファイルのカレントディレクトリからの相対パスを返す（外部の場合はルートからのパス）
+
+    シンボリックリンクと .. を解決してから求めるため、出力先ディレクトリの外を指すことはない。
+    """
+    resolved = source.resolve()
+    try:
+        return resolved.relative_to(Path.cwd().resolve())
+    except ValueError:
+        return resolved.relative_to(resolved.anchor)
+
+
+def _buckets(key: str, fan_out: int) -> tuple[str, str]:
+    """ハッシュから2階層のサブディレクトリ名を求める
+
+    Args:
+        key: 16進数表記のハッシュ
+        fan_out: 各階層のサブディレクトリ数
+
+    Returns:
+        上位・下位のサブディレクトリ名（fan_out - 1 の桁数にそろえた16進数）
+    """
+    value = int(key, 16)
+    width = len(f"{fan_out - 1:x}")
+    upper, lower = value % fan_out, value // fan_out % fan_out
+    return f"{upper:0{width}x}", f"{lower:0{width}x}"
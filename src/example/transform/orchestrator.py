@@ -3,22 +3,32 @@
 変換パイプライン全体を制御し、入力・変換・出力の流れを調整する。
 """
 
+from pathlib import Path
+
 from example.foundation.log import log
+from example.protocol.fs import FileSystemInspectorProtocol
+from example.transform.cache import TransformCache
 from example.transform.context import TransformContext
-from example.transform.reader import TextReader
+from example.transform.layout import OutputLayout
+from example.transform.reader import BinaryReader, TextReader
+from example.transform.stats import StageTimer, utf8_size
 from example.transform.transformer import TextTransformer
 from example.transform.types import TransformedDatetime, TransformResult
-from example.transform.writer import TextWriter
+from example.transform.writer import BinaryWriter, TextWriter
 
 
 class TransformOrchestrator:
     """テキストファイルを読み込み、行番号を付与して出力する
 
     Flow:
-        1. TextReaderでファイル読み込み
-        2. TextTransformerでテキストを変換
-        3. TextWriterで書き込み
-        4. 実行結果を返す
+        0. OutputLayoutで出力ファイルパスを決定（layout を指定しない場合は tmp_dir 直下の同名ファイル）
+        1. （インクリメンタル変換時）TransformCacheで前回の結果を再利用できるか判定
+        2. TextReaderでファイル読み込み（ストリーミング時、またはファイルサイズが memory_budget を超える場合は逐次読み込み。
+           context.binary の場合は BinaryReader でバイト列のまま読み込む）
+        3. TextTransformerでテキストを変換
+        4. TextWriterで書き込み（context.binary の場合は BinaryWriter）
+        5. （インクリメンタル変換時）TransformCacheへ結果を記録し、OutputLayoutへ出力ファイルパスを記録
+        6. 実行結果を返す（context.stats の場合は段階ごとの所要時間と処理量を含める）
 
     Returns:
         TransformResult: 変換前後のテキスト行数を含む実行結果
@@ -29,6 +39,11 @@ class TransformOrchestrator:
         reader: TextReader,
         transformer: TextTransformer,
         writer: TextWriter,
+        cache: TransformCache | None = None,
+        inspector: FileSystemInspectorProtocol | None = None,
+        binary_reader: BinaryReader | None = None,
+        binary_writer: BinaryWriter | None = None,
+        layout: OutputLayout | None = None,
     ):
         """TransformOrchestratorを初期化
 
@@ -36,10 +51,20 @@ class TransformOrchestrator:
             reader: テキストファイル読み込み
             transformer: テキストファイル変換
             writer: テキストファイル書き込み
+            cache: インクリメンタル変換のマニフェスト（None の場合は常に変換する）
+            inspector: memory_budget の判定に使うファイルサイズの取得（None の場合は判定しない）
+            binary_reader: context.binary の場合のバイト列の読み込み
+            binary_writer: context.binary の場合のバイト列の書き込み
+            layout: 出力ファイルパスの決定と対応表の記録（None の場合は context.layout が flat のみ対応）
         """
         self.reader = reader
         self.transformer = transformer
         self.writer = writer
+        self.cache = cache
+        self.inspector = inspector
+        self.binary_reader = binary_reader
+        self.binary_writer = binary_writer
+        self.layout = layout
 
     @log
     def orchestrate(self, context: TransformContext) -> TransformResult:
@@ -51,16 +76,187 @@ class TransformOrchestrator:
         Returns:
             Transform処理の実行結果
         """
+        if not context.incremental or self.cache is None:
+            dst_path = self._dst_path(context)
+            result = self._transform(context, dst_path)
+        else:
+            # 変換元・出力ファイルが前回から変わっていなければ、読み込み・書き込みを省略する
+            previous_dst_path = self._previous_dst_path(context)
+            if not context.force and previous_dst_path is not None:
+                cached = self.cache.lookup(
+                    context.target_file,
+                    previous_dst_path,
+                    context.cache_dir,
+                    context.output_options(),
+                )
+                if cached is not None:
+                    return cached
+
+            src_stamp = self.cache.stamp(context.target_file)
+            dst_path = self._dst_path(context)
+            result = self._transform(context, dst_path)
+            if previous_dst_path not in (None, dst_path):
+                # content の前回の出力は同じ内容の別の変換元と共有しうるため削除せず、
+                # この変換元の前回の出力に対応するマニフェストのみを削除する
+                self.cache.discard(context.target_file, previous_dst_path, context.cache_dir)
+            # 計測値は実行ごとに変わるため、マニフェストには記録しない（再利用時は stats を含めない）
+            stored = result.model_copy(update={"stats": None})
+            self.cache.store(
+                context.target_file,
+                src_stamp,
+                dst_path,
+                stored,
+                context.cache_dir,
+                context.output_options(),
+            )
+
+        if self.layout is not None and context.layout != "flat":
+            self.layout.record(context, dst_path)
+        return result
+
+    def _dst_path(self, context: TransformContext) -> Path:
+        """出力ファイルパスを決定する
+
+        Raises:
+            ValueError: context.layout が flat 以外で、layout が指定されていない場合
+        """
+        if self.layout is not None:
+            return self.layout.dst_path(context)
+        if context.layout != "flat":
+            raise ValueError(f"{context.layout} output layout requires layout")
+        return context.tmp_dir / context.target_file.name
+
+    def _previous_dst_path(self, context: TransformContext) -> Path | None:
+        """インクリメンタル変換の判定に使う、前回の出力ファイルパスを返す
+
+        layout が指定されている場合は OutputLayout.previous_dst_path() に委譲する
+        （content は変換元の内容のハッシュを計算せず、対応表に記録したパスを返す）。
+        """
+        if self.layout is not None:
+            return self.layout.previous_dst_path(context)
+        return self._dst_path(context)
+
+    def _transform(self, context: TransformContext, dst_path: Path) -> TransformResult:
+        """テキストファイルを読み込み・変換・書き込みする
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+            dst_path: 出力ファイルパス
+
+        Returns:
+            Transform処理の実行結果
+        """
+        timer = StageTimer()
+        if context.binary:
+            return self._orchestrate_binary(context, dst_path, timer)
+        if context.streaming or self._exceeds_memory_budget(context):
+            return self._orchestrate_stream(context, dst_path, timer)
+
         # テキストファイルを読み込み
-        src_text = self.reader.read(context.target_file)
+        with timer.measure("read"):
+            src_text = self.reader.read(context.target_file, context.newline)
 
         # テキストファイルを変換
         datetime = TransformedDatetime(context.current_datetime)
-        dst_text = self.transformer.transform(text=src_text, datetime=datetime)
+        with timer.measure("transform"):
+            dst_text = self.transformer.transform(text=src_text, datetime=datetime)
 
         # テキストファイルに書き込み
-        dst_path = context.tmp_dir / context.target_file.name
-        self.writer.write(dst_text, dst_path)
+        with timer.measure("write"):
+            self.writer.write(dst_text, dst_path)
 
         # 実行結果を返す
-        return TransformResult(src_length=src_text.length(), dst_length=dst_text.length())
+        src_length = src_text.length()
+        stats = None
+        if context.stats:
+            src_bytes, dst_bytes = utf8_size(src_text.text), utf8_size(dst_text.text)
+            stats = timer.stats(src_length=src_length, src_bytes=src_bytes, dst_bytes=dst_bytes)
+        return TransformResult(src_length=src_length, dst_length=dst_text.length(), stats=stats)
+
+    def _exceeds_memory_budget(self, context: TransformContext) -> bool:
+        """ファイルサイズが memory_budget を超えるかを判定する
+
+        通常の変換はファイル全体と変換後のテキストを同時に保持するため、大きなファイルは逐次変換に切り替える。
+        """
+        if context.memory_budget is None or self.inspector is None:
+            return False
+        stamp = self.inspector.stamp(context.target_file)
+        return stamp is not None and stamp.size > context.memory_budget
+
+    def _orchestrate_stream(
+        self, context: TransformContext, dst_path: Path, timer: StageTimer
+    ) -> TransformResult:
+        """テキストファイルを1行ずつ読み込み・変換・書き込みする
+
+        読み込み・変換・書き込みはイテレータで連結され、書き込みの消費に合わせて逐次実行される。
+        出力内容は orchestrate() の通常経路と一致する。
+        context.stats の場合は、読み込み・変換のイテレータから1行取り出すごとに所要時間を計測する。
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+            dst_path: 出力ファイルパス
+            timer: 段階ごとの所要時間の計測
+
+        Returns:
+            Transform処理の実行結果
+        """
+        src_text = self.reader.read_stream(context.target_file, context.newline)
+        if context.stats:
+            src_text = src_text.wrap_lines(lambda lines: timer.iterate("read", lines))
+        datetime = TransformedDatetime(context.current_datetime)
+        dst_text = self.transformer.transform_stream(text=src_text, datetime=datetime)
+        if context.stats:
+            dst_text = dst_text.wrap_lines(lambda lines: timer.iterate("transform", lines))
+
+        # 書き込みがストリームを最後まで消費した時点で、行数が確定する
+        with timer.measure("write"):
+            self.writer.write_stream(dst_text, dst_path)
+
+        src_length, dst_length = src_text.length(), dst_text.length()
+        stats = None
+        if context.stats:
+            # 出力は行を区切り文字で連結したもの（末尾に区切り文字を付与しない）
+            separators = len(dst_text.separator) * max(dst_length - 1, 0)
+            dst_bytes = timer.sizes["transform"] + separators
+            stats = timer.stats(src_length, src_bytes=timer.sizes["read"], dst_bytes=dst_bytes)
+        return TransformResult(src_length=src_length, dst_length=dst_length, stats=stats)
+
+    def _orchestrate_binary(
+        self, context: TransformContext, dst_path: Path, timer: StageTimer
+    ) -> TransformResult:
+        """ファイルをデコードせずにバイト列のまま読み込み・変換・書き込みする
+
+        Args:
+            context: Transform処理の実行時コンテキスト
+            dst_path: 出力ファイルパス
+            timer: 段階ごとの所要時間の計測
+
+        Returns:
+            Transform処理の実行結果
+
+        Raises:
+            ValueError: binary_reader・binary_writer が指定されていない場合
+        """
+        if self.binary_reader is None or self.binary_writer is None:
+            raise ValueError("binary transform requires binary_reader and binary_writer")
+
+        with timer.measure("read"):
+            src_bytes = self.binary_reader.read(context.target_file)
+
+        datetime = TransformedDatetime(context.current_datetime)
+        with timer.measure("transform"):
+            dst_bytes = self.transformer.transform_bytes(
+                text=src_bytes, datetime=datetime, encoding=context.encoding, errors=context.errors
+            )
+
+        with timer.measure("write"):
+            self.binary_writer.write(dst_bytes, dst_path)
+
+        src_length = src_bytes.length(context.encoding, context.errors)
+        dst_length = dst_bytes.length()
+        stats = None
+        if context.stats:
+            stats = timer.stats(
+                src_length, src_bytes=len(src_bytes.data), dst_bytes=len(dst_bytes.data)
+            )
+        return TransformResult(src_length=src_length, dst_length=dst_length, stats=stats)
@@ -1,25 +1,126 @@
 """TransformOrchestratorとその依存を一括生成するファクトリー
 
 具象クラスへの依存を隠蔽し、Transform層の生成ロジックを一元化する。
+生成したコンポーネントは依存性注入コンテナで保持し、複数回の変換で使い回す。
 """
 
-from example.foundation.fs import TextFileSystemReader, TextFileSystemWriter
+from contextlib import AbstractContextManager
+from typing import Any, Literal
+
+from example.foundation.di import Container, Scope
+from example.foundation.fs import (
+    AsyncTextFileSystemReader,
+    AsyncTextFileSystemWriter,
+    ByteRangeFileSystemReader,
+    FileSystemFinder,
+    FileSystemInspector,
+    MemoryTextFileSystemWriter,
+    MmapTextFileSystemReader,
+    OffsetFileSystemWriter,
+    StdinTextFileSystemReader,
+    StdoutTextFileSystemWriter,
+    TextFileSystemReader,
+    TextFileSystemWriter,
+)
 from example.foundation.log import log
+from example.protocol.fs import (
+    BinaryFileSystemReaderProtocol,
+    BinaryFileSystemWriterProtocol,
+    ByteRangeFileSystemReaderProtocol,
+    FileSystemFinderProtocol,
+    FileSystemInspectorProtocol,
+    OffsetFileSystemWriterProtocol,
+    TextFileSystemReaderProtocol,
+    TextFileSystemWriterProtocol,
+)
+from example.transform.async_batch import AsyncTransformBatchOrchestrator
+from example.transform.async_orchestrator import AsyncTransformOrchestrator
+from example.transform.batch import TransformBatchOrchestrator
+from example.transform.cache import TransformCache
+from example.transform.finder import TargetFinder
+from example.transform.layout import OutputLayout
 from example.transform.orchestrator import TransformOrchestrator
-from example.transform.reader import TextReader
+from example.transform.reader import AsyncTextReader, BinaryReader, TextReader
+from example.transform.sharded import ShardedTransformOrchestrator
 from example.transform.transformer import TextTransformer
-from example.transform.writer import TextWriter
+from example.transform.writer import AsyncTextWriter, BinaryWriter, TextWriter
 
 
 class TransformOrchestratorProvider:
     """TransformOrchestratorとその依存を生成するファクトリー
 
     具象クラスの選択と依存注入を一箇所に集約する。
+    コンポーネントは Container に登録し、provide*() の呼び出しをまたいで同じインスタンスを返す。
+    書き込み先をメモリとする場合（writer_backend="memory"）、書き込みとそれに依存する
+    コンポーネントは run() の範囲ごとに生成する（実行ごとに出力を破棄するため）。
+
+    使用例:
+        provider = TransformOrchestratorProvider()
+        with provider.run():
+            result = provider.provide().orchestrate(context)
+
+        # テストでは登録を差し替えて実装を置き換えられる
+        provider.container.register(TextFileSystemWriterProtocol, lambda c: FakeWriter())
+
+    Constraints:
+        - プロセスプールのワーカーへはコンストラクタの引数のみを引き継ぎ、
+          ワーカーごとにコンテナを構築し直す（container.register による差し替えは引き継がない）
     """
 
-    def __init__(self) -> None:
-        """Providerを初期化"""
-        pass
+    def __init__(
+        self,
+        reader_backend: Literal["standard", "mmap"] = "standard",
+        writer_backend: Literal["file", "memory", "stdout"] = "file",
+        io_buffer_size: int = 1 << 20,
+        read_chunk_size: int = 1 << 20,
+        durability: Literal["none", "fsync"] = "none",
+        output_compression: Literal["auto", "none", "gzip", "bz2", "xz"] = "auto",
+        compression_level: int | None = None,
+    ) -> None:
+        """Providerを初期化
+
+        Args:
+            reader_backend: ファイル読み込みの実装（standard: 通常のファイル読み込み、mmap: メモリマップ）
+            writer_backend: ファイル書き込みの実装（file: ファイルシステム、memory: メモリ上に保持、stdout: 標準出力）
+            io_buffer_size: 1回の書き込みシステムコールで書き込むバイト数の目安
+            read_chunk_size: 逐次読み込みで1回に読み込む（mmap の場合はデコードする）バイト数
+            durability: 書き込みの永続性（none: OS に任せる、fsync: 書き込み先の置き換え前後に fsync する）
+            output_compression: 出力の圧縮形式（auto: 書き込み先の拡張子から判定、none: 圧縮しない）
+            compression_level: 出力の圧縮レベル（1〜9、None の場合は圧縮形式ごとの既定値）
+        """
+        self.reader_backend = reader_backend
+        self.writer_backend = writer_backend
+        self.io_buffer_size = io_buffer_size
+        self.read_chunk_size = read_chunk_size
+        self.durability = durability
+        self.output_compression: Literal["auto", "none", "gzip", "bz2", "xz"] = output_compression
+        self.compression_level = compression_level
+        self.container = self._build_container()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """プロセスプールのワーカーへ渡すため、生成済みのコンポーネントを除いて pickle する"""
+        return (
+            TransformOrchestratorProvider,
+            (
+                self.reader_backend,
+                self.writer_backend,
+                self.io_buffer_size,
+                self.read_chunk_size,
+                self.durability,
+                self.output_compression,
+                self.compression_level,
+            ),
+        )
+
+    def run(self) -> AbstractContextManager[None]:
+        """1回の実行の範囲を表すコンテキストマネージャーを返す
+
+        範囲内では run スコープのコンポーネントを共有し、範囲を抜けると破棄する。
+
+        Returns:
+            コンテナの run スコープ
+        """
+        return self.container.run()
 
     @log
     def provide(self) -> TransformOrchestrator:
@@ -28,11 +129,220 @@ class TransformOrchestratorProvider:
         Returns:
             設定済みのTransformOrchestrator
         """
-        reader = TextReader(TextFileSystemReader())
-        writer = TextWriter(TextFileSystemWriter())
+        return self.container.resolve(TransformOrchestrator)
+
+    @log
+    def provide_batch(self) -> TransformBatchOrchestrator:
+        """TransformBatchOrchestratorを構築
+
+        ファイルごとの変換には provide() で構築した TransformOrchestrator を使う。
+
+        Returns:
+            設定済みのTransformBatchOrchestrator
+        """
+        return self.container.resolve(TransformBatchOrchestrator)
+
+    @log
+    def provide_async(self) -> AsyncTransformOrchestrator:
+        """AsyncTransformOrchestratorを構築
+
+        ファイル I/O は reader_backend / writer_backend に応じた同期版の実装をスレッドへ委譲して実行する。
+
+        Returns:
+            設定済みのAsyncTransformOrchestrator
+        """
+        return self.container.resolve(AsyncTransformOrchestrator)
+
+    @log
+    def provide_async_batch(self) -> AsyncTransformBatchOrchestrator:
+        """AsyncTransformBatchOrchestratorを構築
+
+        全ファイルの変換で、provide_async() で構築した1つの AsyncTransformOrchestrator を共有する。
+
+        Returns:
+            設定済みのAsyncTransformBatchOrchestrator
+        """
+        return self.container.resolve(AsyncTransformBatchOrchestrator)
+
+    @log
+    def provide_sharded(self) -> ShardedTransformOrchestrator:
+        """ShardedTransformOrchestratorを構築
+
+        reader_backend にかかわらず、シャードの範囲はメモリマップで探索し、範囲ごとに読み込む。
+
+        Returns:
+            設定済みのShardedTransformOrchestrator
+
+        Raises:
+            ValueError: writer_backend が file 以外の場合、または出力の圧縮形式を指定した場合
+                （位置指定の書き込みは非圧縮のファイルシステムのみ対応）
+        """
+        if self.writer_backend != "file":
+            raise ValueError(
+                f"sharded transform does not support writer_backend={self.writer_backend}"
+            )
+        if self.output_compression not in ("auto", "none"):
+            raise ValueError(
+                f"sharded transform does not support output_compression={self.output_compression}"
+            )
+        return self.container.resolve(ShardedTransformOrchestrator)
+
+    def _build_container(self) -> Container:
+        """コンストラクタの引数に応じた実装を登録したコンテナを構築する"""
+        container = Container()
+        # 書き込み先をメモリとする場合、書き込みに依存するコンポーネントは実行ごとに生成する
+        output_scope: Scope = "run" if self.writer_backend == "memory" else "singleton"
+
+        # Adapter
+        container.register(TextFileSystemReaderProtocol, lambda c: self._provide_fs_reader())
+        container.register(
+            TextFileSystemWriterProtocol, lambda c: self._provide_fs_writer(), output_scope
+        )
+        # バイト列の読み込みは全体を1回で読み込むため、reader_backend にかかわらず通常の読み込みを使う
+        container.register(
+            BinaryFileSystemReaderProtocol,
+            lambda c: TextFileSystemReader(chunk_size=self.read_chunk_size),
+        )
+        container.register(
+            BinaryFileSystemWriterProtocol, lambda c: self._provide_fs_writer(), output_scope
+        )
+        container.register(ByteRangeFileSystemReaderProtocol, lambda c: ByteRangeFileSystemReader())
+        container.register(
+            OffsetFileSystemWriterProtocol,
+            lambda c: OffsetFileSystemWriter(
+                buffer_size=self.io_buffer_size, fsync=self.durability == "fsync"
+            ),
+        )
+        container.register(FileSystemFinderProtocol, lambda c: FileSystemFinder())
+        container.register(FileSystemInspectorProtocol, lambda c: FileSystemInspector())
+
+        # Transform
+        container.register(
+            TextReader, lambda c: TextReader(c.resolve(TextFileSystemReaderProtocol))
+        )
+        container.register(
+            TextWriter, lambda c: TextWriter(c.resolve(TextFileSystemWriterProtocol)), output_scope
+        )
+        container.register(
+            BinaryReader, lambda c: BinaryReader(c.resolve(BinaryFileSystemReaderProtocol))
+        )
+        container.register(
+            BinaryWriter,
+            lambda c: BinaryWriter(c.resolve(BinaryFileSystemWriterProtocol)),
+            output_scope,
+        )
+        container.register(
+            AsyncTextReader,
+            lambda c: AsyncTextReader(
+                AsyncTextFileSystemReader(c.resolve(TextFileSystemReaderProtocol))
+            ),
+        )
+        container.register(
+            AsyncTextWriter,
+            lambda c: AsyncTextWriter(
+                AsyncTextFileSystemWriter(c.resolve(TextFileSystemWriterProtocol))
+            ),
+            output_scope,
+        )
+        container.register(TextTransformer, lambda c: TextTransformer())
+        container.register(
+            TargetFinder, lambda c: TargetFinder(c.resolve(FileSystemFinderProtocol))
+        )
+        # マニフェストは書き込み先の設定にかかわらずファイルシステムに保存する
+        container.register(
+            TransformCache,
+            lambda c: TransformCache(
+                fs_reader=TextFileSystemReader(),
+                fs_writer=TextFileSystemWriter(fsync=self.durability == "fsync"),
+                inspector=c.resolve(FileSystemInspectorProtocol),
+                compression=self.output_compression,
+                compression_level=self.compression_level,
+            ),
+        )
+        # 対応表もマニフェストと同じく、書き込み先の設定にかかわらずファイルシステムに保存する
+        container.register(
+            OutputLayout,
+            lambda c: OutputLayout(
+                fs_reader=TextFileSystemReader(),
+                fs_writer=TextFileSystemWriter(fsync=self.durability == "fsync"),
+                inspector=c.resolve(FileSystemInspectorProtocol),
+                compression=self.output_compression,
+            ),
+        )
+
+        # Orchestrator
+        container.register(
+            TransformOrchestrator,
+            lambda c: TransformOrchestrator(
+                reader=c.resolve(TextReader),
+                transformer=c.resolve(TextTransformer),
+                writer=c.resolve(TextWriter),
+                cache=c.resolve(TransformCache),
+                inspector=c.resolve(FileSystemInspectorProtocol),
+                binary_reader=c.resolve(BinaryReader),
+                binary_writer=c.resolve(BinaryWriter),
+                layout=c.resolve(OutputLayout),
+            ),
+            output_scope,
+        )
+        container.register(
+            TransformBatchOrchestrator,
+            lambda c: TransformBatchOrchestrator(
+                finder=c.resolve(TargetFinder),
+                orchestrator_factory=self.provide,
+                inspector=c.resolve(FileSystemInspectorProtocol),
+            ),
+            output_scope,
+        )
+        container.register(
+            AsyncTransformOrchestrator,
+            lambda c: AsyncTransformOrchestrator(
+                reader=c.resolve(AsyncTextReader),
+                transformer=c.resolve(TextTransformer),
+                writer=c.resolve(AsyncTextWriter),
+                cache=c.resolve(TransformCache),
+                layout=c.resolve(OutputLayout),
+            ),
+            output_scope,
+        )
+        container.register(
+            AsyncTransformBatchOrchestrator,
+            lambda c: AsyncTransformBatchOrchestrator(
+                finder=c.resolve(TargetFinder),
+                orchestrator=c.resolve(AsyncTransformOrchestrator),
+                inspector=c.resolve(FileSystemInspectorProtocol),
+            ),
+            output_scope,
+        )
+        container.register(
+            ShardedTransformOrchestrator,
+            lambda c: ShardedTransformOrchestrator(
+                reader=c.resolve(ByteRangeFileSystemReaderProtocol),
+                transformer=c.resolve(TextTransformer),
+                writer=c.resolve(OffsetFileSystemWriterProtocol),
+            ),
+        )
+        return container
+
+    def _provide_fs_reader(self) -> TextFileSystemReaderProtocol:
+        """reader_backend に応じたファイル読み込みの実装を返す（ファイルパス `-` は標準入力から読み込む）"""
+        if self.reader_backend == "mmap":
+            return StdinTextFileSystemReader(
+                MmapTextFileSystemReader(window_size=self.read_chunk_size)
+            )
+        return StdinTextFileSystemReader(TextFileSystemReader(chunk_size=self.read_chunk_size))
 
-        return TransformOrchestrator(
-            reader=reader,
-            transformer=TextTransformer(),
-            writer=writer,
+    def _provide_fs_writer(
+        self,
+    ) -> TextFileSystemWriter | MemoryTextFileSystemWriter | StdoutTextFileSystemWriter:
+        """writer_backend に応じたファイル書き込みの実装を返す（テキスト・バイト列の両方を書き込める）"""
+        if self.writer_backend == "memory":
+            return MemoryTextFileSystemWriter()
+        if self.writer_backend == "stdout":
+            return StdoutTextFileSystemWriter(buffer_size=self.io_buffer_size)
+        return TextFileSystemWriter(
+            buffer_size=self.io_buffer_size,
+            fsync=self.durability == "fsync",
+            compression=self.output_compression,
+            compression_level=self.compression_level,
         )
@@ -6,8 +6,12 @@
 from pathlib import Path
 
 from example.foundation.log import log
-from example.protocol.fs import TextFileSystemReaderProtocol
-from example.transform.types import SrcText
+from example.protocol.fs import (
+    AsyncTextFileSystemReaderProtocol,
+    BinaryFileSystemReaderProtocol,
+    TextFileSystemReaderProtocol,
+)
+from example.transform.types import NewlineMode, SrcBytes, SrcText, SrcTextStream
 
 
 class TextReader:
@@ -28,16 +32,98 @@ class TextReader:
         self.fs_reader = fs_reader
 
     @log
-    def read(self, path: Path) -> SrcText:
+    def read(self, path: Path, newline: NewlineMode = "universal") -> SrcText:
         r"""テキストファイルを読み込んで文字列を返す
 
         指定されたファイルパスのファイルを読み込み、
         文字列として返します。
+        newline が universal 以外の場合は、改行コードを変換せずに読み込みます。
 
         Args:
             path: 読み込むテキストファイル
+            newline: 行の区切り規則
 
         Returns:
             読み込んだ文字列
         """
-        return SrcText(self.fs_reader.read(path))
+        text = self.fs_reader.read(path, None if newline == "universal" else "")
+        return SrcText(text, newline)
+
+    @log
+    def read_stream(self, path: Path, newline: NewlineMode = "universal") -> SrcTextStream:
+        """テキストファイルを行単位のストリームとして読み込む
+
+        ファイル全体をメモリに載せず、消費に合わせて1行ずつ読み込みます。
+
+        Args:
+            path: 読み込むテキストファイル
+            newline: 行の区切り規則
+
+        Returns:
+            読み込み元の行ストリーム
+        """
+        return SrcTextStream(self.fs_reader.read_lines(path), newline)
+
+
+class BinaryReader:
+    """ファイルをデコードせずにバイト列として読み込む
+
+    基盤層への薄いラッパー。例外処理は行わず、そのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        fs_reader: BinaryFileSystemReaderProtocol,
+    ):
+        """初期化
+
+        Args:
+            fs_reader: ファイルシステム読み取り（バイト列版）
+        """
+        self.fs_reader = fs_reader
+
+    @log
+    def read(self, path: Path) -> SrcBytes:
+        """ファイルを読み込んでバイト列を返す
+
+        Args:
+            path: 読み込むファイル
+
+        Returns:
+            読み込んだバイト列（圧縮されている場合は伸長後）
+        """
+        return SrcBytes(self.fs_reader.read_bytes(path))
+
+
+class AsyncTextReader:
+    """テキストファイルを読み込んで文字列として返す（非同期版）
+
+    基盤層への薄いラッパー。例外処理は行わず、そのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        fs_reader: AsyncTextFileSystemReaderProtocol,
+    ):
+        """初期化
+
+        Args:
+            fs_reader: ファイルシステム読み取り（非同期版）
+        """
+        self.fs_reader = fs_reader
+
+    @log
+    async def read(self, path: Path, newline: NewlineMode = "universal") -> SrcText:
+        """テキストファイルを読み込んで文字列を返す
+
+        TextReader.read と同じ内容を返します。
+
+        Args:
+            path: 読み込むテキストファイル
+            newline: 行の区切り規則
+
+        Returns:
+            読み込んだ文字列
+        """
+        text = await self.fs_reader.read(path, None if newline == "universal" else "")
+        return SrcText(text, newline)
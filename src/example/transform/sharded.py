@@ -0,0 +1,233 @@
+r"""1つの大きなファイルを行境界で分割し、並列に変換する
+
+ファイルを行境界で複数の範囲（シャード）に分割し、2段階で変換する。
+1段階目でシャードごとの行数と出力サイズを求め、その累積和から各シャードの先頭の行番号と
+出力ファイル内の書き込み位置を決める。2段階目で各シャードを変換し、決まった位置へ直接書き込む。
+出力は TransformOrchestrator でファイル全体を変換した場合と1バイトも違わない。
+"""
+
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from example.foundation.log import log
+from example.protocol.fs import (
+    ByteRange,
+    ByteRangeFileSystemReaderProtocol,
+    OffsetFileSystemWriterProtocol,
+)
+from example.transform.context import TransformShardContext
+from example.transform.transformer import TextTransformer
+from example.transform.types import SrcText, TransformedDatetime, TransformResult
+
+
+class _InlineExecutor(Executor):
+    """submit() した関数をその場で実行する Executor（ワーカー数が1の場合に使う）"""
+
+    def submit[T](self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        """関数を同一プロセスで実行し、完了済みの Future を返す"""
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+@dataclass(frozen=True)
+class ShardStats:
+    """1段階目で求めたシャードの統計
+
+    Attributes:
+        line_count: シャードの行数
+        content_size: 行区切り文字を除いた行の内容のバイト数
+    """
+
+    line_count: int
+    content_size: int
+
+
+@dataclass(frozen=True)
+class ShardPlan:
+    """2段階目で1シャードを変換・書き込みするための計画
+
+    Attributes:
+        byte_range: 入力ファイル内のシャードの範囲
+        first_number: シャードの先頭行に付与する行番号
+        offset: 出力ファイル内の書き込み開始位置（バイト）
+        size: シャードの出力のバイト数
+    """
+
+    byte_range: ByteRange
+    first_number: int
+    offset: int
+    size: int
+
+
+class ShardedTransformOrchestrator:
+    """1つのテキストファイルを分割して並列に変換し、行番号を付与して出力する
+
+    Flow:
+        1. ファイルを行境界でシャードに分割
+        2. シャードごとの行数と出力サイズを並列に計測
+        3. 累積和から各シャードの先頭の行番号と書き込み位置を決定
+        4. 出力サイズ分の一時ファイルを確保し、先頭に日時ヘッダーを書き込む
+        5. 各シャードを並列に変換し、決まった位置へ書き込む
+        6. 書き込み先を一時ファイルで置き換え、実行結果を返す
+
+    Constraints:
+        - 各シャードを2回デコードする（計測時と変換時）。代わりに全体を保持するメモリは不要で、
+          1ワーカーのメモリ使用量はシャードサイズに比例する
+        - 1段階目と2段階目の間に入力ファイルが更新された場合の出力は保証しない
+    """
+
+    def __init__(
+        self,
+        reader: ByteRangeFileSystemReaderProtocol,
+        transformer: TextTransformer,
+        writer: OffsetFileSystemWriterProtocol,
+    ):
+        """ShardedTransformOrchestratorを初期化
+
+        Args:
+            reader: バイト範囲単位のファイル読み込み（プロセスプール利用時は pickle 可能であること）
+            transformer: テキストファイル変換
+            writer: 位置指定によるファイル書き込み（プロセスプール利用時は pickle 可能であること）
+        """
+        self.reader = reader
+        self.transformer = transformer
+        self.writer = writer
+
+    @log
+    def orchestrate(self, context: TransformShardContext) -> TransformResult:
+        """テキストファイルを分割して並列に変換し、行番号を付与して出力
+
+        Args:
+            context: 分割変換の実行時コンテキスト
+
+        Returns:
+            Transform処理の実行結果（TransformOrchestrator と同一）
+
+        Raises:
+            FileSystemError: ファイルの読み込み・書き込みに失敗した場合（出力先は更新しない）
+        """
+        ranges = self.reader.split(context.target_file, context.shard_size)
+        header = self.transformer.header(TransformedDatetime(context.current_datetime))
+        dst_path = context.tmp_dir / context.target_file.name
+
+        with _executor(min(context.workers, len(ranges))) as executor:
+            # 1段階目: シャードごとの行数と出力サイズを計測
+            stats = list(executor.map(partial(_measure, self.reader, context.target_file), ranges))
+            header_size = len(header.encode("utf-8"))
+            plans = self._plan(ranges, stats, header_size)
+            total_size = plans[-1].offset + plans[-1].size if plans else header_size
+
+            # 2段階目: 各シャードを変換し、決まった位置へ書き込む
+            tmp_path = self.writer.allocate(dst_path, total_size)
+            try:
+                self.writer.write_at(tmp_path, 0, (header,))
+                write = partial(
+                    _write,
+                    self.reader,
+                    self.transformer,
+                    self.writer,
+                    context.target_file,
+                    tmp_path,
+                )
+                for plan, written in zip(plans, executor.map(write, plans), strict=True):
+                    if written != plan.size:
+                        raise RuntimeError(
+                            f"shard output size mismatch at offset {plan.offset}: "
+                            f"expected {plan.size} bytes, wrote {written} bytes"
+                        )
+                self.writer.publish(tmp_path, dst_path)
+            except BaseException:
+                self.writer.discard(tmp_path)
+                raise
+
+        src_length = sum(s.line_count for s in stats)
+        return TransformResult(src_length=src_length, dst_length=src_length + 1)
+
+    def _plan(
+        self, ranges: list[ByteRange], stats: list[ShardStats], header_size: int
+    ) -> list[ShardPlan]:
+        """シャードごとの統計の累積和から、先頭の行番号と書き込み位置を決める
+
+        Args:
+            ranges: シャードの範囲
+            stats: シャードごとの統計（ranges と同じ順序）
+            header_size: 日時ヘッダーのバイト数
+
+        Returns:
+            シャードごとの計画（ranges と同じ順序）
+        """
+        first_numbers = list(accumulate((s.line_count for s in stats), initial=1))
+        sizes = [
+            self.transformer.shard_size(first_number, s.line_count, s.content_size)
+            for first_number, s in zip(first_numbers, stats, strict=False)
+        ]
+        offsets = accumulate(sizes, initial=header_size)
+        return [
+            ShardPlan(byte_range=r, first_number=n, offset=o, size=size)
+            for r, n, o, size in zip(ranges, first_numbers, offsets, sizes, strict=False)
+        ]
+
+
+def _executor(workers: int) -> Executor:
+    """ワーカー数に応じて、シャードの処理に使う Executor を返す
+
+    ワーカー数が2以上の場合はプロセスプールで並列に、それ以外は同一プロセスで逐次実行する。
+
+    Args:
+        workers: ワーカープロセス数（シャード数を上限とする）
+    """
+    if workers <= 1:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def _measure(
+    reader: ByteRangeFileSystemReaderProtocol, file_path: Path, byte_range: ByteRange
+) -> ShardStats:
+    """シャードを読み込み、行数と行の内容のバイト数を求める（ワーカープロセスで実行）
+
+    Args:
+        reader: バイト範囲単位のファイル読み込み
+        file_path: 変換対象のファイルパス
+        byte_range: シャードの範囲
+
+    Returns:
+        シャードの統計
+    """
+    text = SrcText(reader.read_range(file_path, byte_range))
+    return ShardStats(line_count=text.length(), content_size=text.content_size())
+
+
+def _write(
+    reader: ByteRangeFileSystemReaderProtocol,
+    transformer: TextTransformer,
+    writer: OffsetFileSystemWriterProtocol,
+    file_path: Path,
+    tmp_path: Path,
+    plan: ShardPlan,
+) -> int:
+    """シャードを変換し、計画した位置へ書き込む（ワーカープロセスで実行）
+
+    Args:
+        reader: バイト範囲単位のファイル読み込み
+        transformer: テキストファイル変換
+        writer: 位置指定によるファイル書き込み
+        file_path: 変換対象のファイルパス
+        tmp_path: 書き込み先の一時ファイルのパス
+        plan: シャードの計画
+
+    Returns:
+        書き込んだバイト数
+    """
+    text = SrcText(reader.read_range(file_path, plan.byte_range))
+    dst_text = transformer.transform_shard(text, plan.first_number)
+    return writer.write_at(tmp_path, plan.offset, (dst_text.text,))
@@ -0,0 +1,128 @@
+"""変換の段階ごとの所要時間と処理量の計測
+
+読み込み・変換・書き込みの各段階の所要時間を単調増加の時計（perf_counter）で計測する。
+逐次変換では3段階がイテレータで連結されて交互に実行されるため、
+実行中の段階を切り替えながら、経過時間をその時点で実行していた段階に加算する。
+"""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Literal
+
+from example.transform.types import TransformStats
+
+type Stage = Literal["read", "transform", "write"]
+"""計測する変換の段階"""
+
+
+def utf8_size(text: str) -> int:
+    """文字列を UTF-8 でエンコードした場合のバイト数を返す
+
+    ASCII のみの文字列はエンコードせずに文字数を返す。
+
+    Args:
+        text: 対象の文字列
+
+    Returns:
+        UTF-8 でのバイト数
+    """
+    return len(text) if text.isascii() else len(text.encode("utf-8"))
+
+
+class StageTimer:
+    """変換の段階ごとの所要時間と、段階を通過したテキストのバイト数を計測する
+
+    使用例:
+        timer = StageTimer()
+        with timer.measure("read"):
+            text = reader.read(path)
+        lines = timer.iterate("transform", transformed_lines)  # 1行取り出すごとに計測する
+        stats = timer.stats(src_length=10, src_bytes=100, dst_bytes=130)
+
+    Constraints:
+        - 段階の計測は入れ子にでき、経過時間は最も内側で実行中の段階にのみ加算する
+        - 単一スレッドでの利用を前提とする
+    """
+
+    def __init__(self) -> None:
+        """StageTimerを初期化（全体の計測を開始）"""
+        self.seconds: dict[Stage, float] = {"read": 0.0, "transform": 0.0, "write": 0.0}
+        self.sizes: dict[Stage, int] = {"read": 0, "transform": 0, "write": 0}
+        self._started = perf_counter()
+        self._last = self._started
+        self._current: Stage | None = None
+
+    @contextmanager
+    def measure(self, stage: Stage) -> Iterator[None]:
+        """With ブロックの実行中を stage の所要時間として計測する
+
+        Args:
+            stage: 計測する段階
+        """
+        previous = self._switch(stage)
+        try:
+            yield
+        finally:
+            self._switch(previous)
+
+    def iterate(self, stage: Stage, items: Iterable[str]) -> Iterator[str]:
+        """要素を1つ取り出すごとに、その所要時間を stage に加算しながら逐次返す
+
+        取り出した要素の UTF-8 でのバイト数を sizes[stage] に加算する。
+
+        Args:
+            stage: 計測する段階
+            items: 計測対象の文字列のイテラブル
+
+        Returns:
+            items と同じ要素を返すイテレータ
+        """
+        iterator = iter(items)
+        while True:
+            previous = self._switch(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._switch(previous)
+            self.sizes[stage] += utf8_size(item)
+            yield item
+
+    def stats(self, src_length: int, src_bytes: int, dst_bytes: int) -> TransformStats:
+        """計測を終了し、段階ごとの所要時間と処理量をまとめる
+
+        Args:
+            src_length: 変換前のテキスト行数（1秒あたりの行数の算出に使う）
+            src_bytes: 読み込んだテキストの UTF-8 でのバイト数
+            dst_bytes: 書き込んだテキストの UTF-8 でのバイト数
+
+        Returns:
+            段階ごとの所要時間と処理量
+        """
+        total = perf_counter() - self._started
+        return TransformStats(
+            read_seconds=self.seconds["read"],
+            transform_seconds=self.seconds["transform"],
+            write_seconds=self.seconds["write"],
+            total_seconds=total,
+            src_bytes=src_bytes,
+            dst_bytes=dst_bytes,
+            lines_per_second=src_length / total if total > 0 else 0.0,
+        )
+
+    def _switch(self, stage: Stage | None) -> Stage | None:
+        """直前の切り替えからの経過時間を実行中の段階に加算し、実行中の段階を切り替える
+
+        Args:
+            stage: 以降に実行する段階（None の場合はどの段階にも加算しない）
+
+        Returns:
+            切り替える前に実行中だった段階
+        """
+        now = perf_counter()
+        if self._current is not None:
+            self.seconds[self._current] += now - self._last
+        previous, self._current, self._last = self._current, stage, now
+        return previous
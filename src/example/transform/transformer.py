@@ -3,8 +3,21 @@
 行番号付与と日時ヘッダー追加を担当する。
 """
 
+from collections.abc import Iterator
+from itertools import chain
+
+from example.foundation.error import ApplicationError
 from example.foundation.log import log
-from example.transform.types import DstText, SrcText, TransformedDatetime
+from example.transform.types import (
+    DstBytes,
+    DstText,
+    DstTextStream,
+    SrcBytes,
+    SrcText,
+    SrcTextStream,
+    TransformedDatetime,
+    is_ascii_compatible,
+)
 
 
 class TextTransformer:
@@ -20,6 +33,9 @@ class TextTransformer:
     def transform(self, text: SrcText, datetime: TransformedDatetime) -> DstText:
         """テキストに行番号と日時ヘッダーを付与
 
+        text.newline が preserve の場合は、各行を入力の行末のまま連結し、
+        日時ヘッダーの行末には先頭行と同じ改行コードを使う。
+
         Args:
             text: 変換対象のテキスト
             datetime: 先頭に付与する日時
@@ -27,8 +43,173 @@ class TextTransformer:
         Returns:
             日時ヘッダーと行番号を付与したテキスト
         """
+        if text.newline == "preserve":
+            lines = text.numbered_lines()
+            ending = _line_ending(lines[0]) if lines else ""
+            output = "".join([self.header(datetime), ending, *lines])
+            return DstText(output, line_count=text.length() + 1)
+
         # 先頭に現在日時を追加し、テキストに行番号を付与
-        output_lines = [str(datetime), *text.numbered_lines()]
+        output_lines = [self.header(datetime), *text.numbered_lines()]
+
+        # 改行区切りのテキストに戻す（行数は入力の行インデックスと日時ヘッダーの1行から求める）
+        return DstText("\n".join(output_lines), line_count=text.length() + 1)
+
+    @log
+    def transform_stream(self, text: SrcTextStream, datetime: TransformedDatetime) -> DstTextStream:
+        """テキストストリームに行番号と日時ヘッダーを逐次付与
+
+        transform() のストリーム版。変換は出力ストリームの消費に合わせて遅延実行され、
+        連結結果は transform() の出力と一致する。
+
+        Args:
+            text: 変換対象のテキストストリーム
+            datetime: 先頭に付与する日時
+
+        Returns:
+            日時ヘッダーと行番号を付与したテキストストリーム
+        """
+        lines = text.numbered_lines()
+        if text.newline == "preserve":
+            return DstTextStream(_preserved_lines(self.header(datetime), lines), separator="")
+        return DstTextStream(chain([self.header(datetime)], lines))
+
+    @log
+    def transform_bytes(
+        self,
+        text: SrcBytes,
+        datetime: TransformedDatetime,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+    ) -> DstBytes:
+        r"""バイト列のままテキストに行番号と日時ヘッダーを付与
+
+        encoding が ASCII 互換（UTF-8・Latin-1・Shift_JIS・EUC-JP 等）の場合は、
+        改行と行番号のバイト表現が ASCII と同じになるため、デコードせずにバイト列のまま変換する。
+        UTF-8 として不正なバイトを含む行も、そのままのバイト列で出力する。
+        ASCII 互換でない場合（UTF-16 等）のみ encoding・errors でデコードし、変換後に同じ指定でエンコードする。
+        行の区切りは \r・\n・\r\n のみ（SrcBytes を参照）。
+
+        Args:
+            text: 変換対象のバイト列
+            datetime: 先頭に付与する日時
+            encoding: 入力の文字コード（出力も同じ文字コードで書き込む）
+            errors: デコード・エンコードできない文字の扱い（bytes.decode() の errors 引数と同じ）
+
+        Returns:
+            日時ヘッダーと行番号を付与したバイト列
+
+        Raises:
+            ApplicationError: ASCII 互換でない文字コードで、errors="strict" の場合にデコード・エンコードできないとき
+        """
+        header = self.header(datetime)
+        if is_ascii_compatible(encoding):
+            lines = text.data.splitlines()
+            numbered = (b"%d: %s" % (i, line) for i, line in enumerate(lines, start=1))
+            data = b"\n".join([header.encode("ascii"), *numbered])
+            return DstBytes(data, line_count=len(lines) + 1)
+
+        try:
+            decoded = text.data.decode(encoding, errors)
+        except UnicodeError as e:
+            raise ApplicationError(
+                message=f"文字コード {encoding} としてデコードできません",
+                cause=e,
+            ) from e
+        decoded_lines = decoded.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if decoded_lines[-1] == "":
+            # 末尾の改行の後ろは行として数えない（bytes.splitlines() と同じ）
+            decoded_lines.pop()
+        output_lines = [header, *(f"{i}: {line}" for i, line in enumerate(decoded_lines, start=1))]
+        try:
+            data = "\n".join(output_lines).encode(encoding, errors)
+        except UnicodeError as e:
+            raise ApplicationError(
+                message=f"文字コード {encoding} でエンコードできません",
+                cause=e,
+            ) from e
+        return DstBytes(data, line_count=len(output_lines))
+
+    def header(self, datetime: TransformedDatetime) -> str:
+        """出力の先頭行（日時ヘッダー）を返す
+
+        Args:
+            datetime: 先頭に付与する日時
 
-        # 改行区切りのテキストに戻す
-        return DstText("\n".join(output_lines))
+        Returns:
+            日時ヘッダー（改行文字を含まない）
+        """
+        return str(datetime)
+
+    @log
+    def transform_shard(self, text: SrcText, first_number: int) -> DstText:
+        """ファイルの一部（シャード）のテキストに、指定した番号から始まる行番号を付与
+
+        各行の前に改行文字を置くため、日時ヘッダーの後ろに全シャードの出力を順に連結すると
+        ファイル全体に対する transform() の出力と一致する。
+
+        Args:
+            text: 変換対象のシャードのテキスト
+            first_number: シャードの先頭行に付与する行番号
+
+        Returns:
+            行番号を付与したテキスト（行数はシャードの行数）
+        """
+        lines = text.numbered_lines(first_number)
+        return DstText("".join(f"\n{line}" for line in lines), line_count=len(lines))
+
+    def shard_size(self, first_number: int, line_count: int, content_size: int) -> int:
+        r"""transform_shard() の出力の UTF-8 でのバイト数を、変換せずに求める
+
+        各行の出力は "\nN: 行内容" のため、行ごとに改行・区切り（": "）の3バイトと行番号の桁数が加わる。
+
+        Args:
+            first_number: シャードの先頭行に付与する行番号
+            line_count: シャードの行数
+            content_size: シャードの行の内容のバイト数（SrcText.content_size()）
+
+        Returns:
+            出力のバイト数
+        """
+        last_number = first_number + line_count - 1
+        digits = 0
+        lower = 1
+        while lower <= last_number:
+            upper = lower * 10 - 1
+            # 桁数が同じ行番号の区間 [lower, upper] ごとに、範囲内の行数 × 桁数を加算する
+            count = min(upper, last_number) - max(lower, first_number) + 1
+            if count > 0:
+                digits += count * len(str(lower))
+            lower *= 10
+        return content_size + line_count * 3 + digits
+
+
+def _line_ending(line: str) -> str:
+    r"""行末の改行コードを返す（\r\n で終わる行は \r\n、それ以外は \n）
+
+    Args:
+        line: 行末の改行文字を含む行
+
+    Returns:
+        日時ヘッダーの行末に使う改行コード
+    """
+    return "\r\n" if line.endswith("\r\n") else "\n"
+
+
+def _preserved_lines(header: str, lines: Iterator[str]) -> Iterator[str]:
+    """日時ヘッダーに先頭行と同じ行末を付与し、行末を含む各行を逐次返す（preserve の場合）
+
+    Args:
+        header: 日時ヘッダー（改行文字を含まない）
+        lines: 行末の改行文字を含む、行番号を付与した行のイテレータ
+
+    Returns:
+        行末の改行文字を含む出力行のイテレータ（空テキストの場合は日時ヘッダーのみ）
+    """
+    first = next(lines, None)
+    if first is None:
+        yield header
+        return
+    yield f"{header}{_line_ending(first)}"
+    yield first
+    yield from lines
@@ -1,8 +1,13 @@
 """Transform向けドメインモデル定義"""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
+import codecs
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import NewType
+from functools import cache
+from typing import Literal, NewType
 
 from pydantic import Field
 
@@ -11,11 +16,73 @@ from example.foundation.model import CoreModel
 TransformedDatetime = NewType("TransformedDatetime", datetime)
 """テキスト変換日時"""
 
+type NewlineMode = Literal["universal", "lf", "preserve"]
+r"""行の区切り規則
+
+- universal: \r\n・\r を \n に変換して読み込み、str.splitlines() の規則（\x0b・\x0c・U+2028 等を含む）で分割する
+- lf: 改行コードを変換せずに読み込み、\n のみで分割する（行数は wc -l と同じ。ただし末尾に改行のない最終行も数える）。
+  行末の \r\n は \n と同じく行末として除くため出力の改行は \n のみになり、単独の \r は行の内容に残る
+- preserve: lf と同じく \n のみで分割し、出力の各行に入力の行末（\r\n・\n）をそのまま残す
+"""
+
+type OutputLayoutMode = Literal["flat", "mirror", "hashed", "content"]
+"""出力ファイルの配置規則（OutputLayout を参照）"""
+
+
+@dataclass(frozen=True)
+class LineIndex:
+    """テキストを1回だけ行分割した結果を保持する行インデックス
+
+    行番号の付与・行数の取得はこのインデックスから行い、テキストを再走査しない。
+    行の区切り規則は NewlineMode に従う（既定は str.splitlines() と同じ）。
+
+    Constraints:
+        - インスタンス生成後は変更不可（frozen=True）
+    """
+
+    lines: tuple[str, ...]
+    """行区切り文字を除いた各行の内容（preserve の場合は行末の改行文字を含む）"""
+
+    @classmethod
+    def build(cls, text: str, newline: NewlineMode = "universal") -> LineIndex:
+        """テキストを1回走査して行インデックスを構築する
+
+        Args:
+            text: 対象テキスト
+            newline: 行の区切り規則
+
+        Returns:
+            構築した行インデックス
+        """
+        if newline == "universal":
+            return cls(tuple(text.splitlines()))
+        lines = text.split("\n")
+        if newline == "preserve":
+            # 最終行以外は \n で終わるため、分割で除いた \n を戻す
+            lines[:-1] = [f"{line}\n" for line in lines[:-1]]
+        else:
+            # 最終行以外は \n で終わるため、\r\n の \r も行末として除く
+            lines[:-1] = [line.removesuffix("\r") for line in lines[:-1]]
+        if lines[-1] == "":
+            # 末尾の改行の後ろ（空テキストの場合は全体）は行として数えない
+            lines.pop()
+        return cls(tuple(lines))
+
+    def length(self) -> int:
+        """行数を返す
+
+        Returns:
+            インデックスに含まれる行数。空テキストの場合は0を返す。
+        """
+        return len(self.lines)
+
 
 @dataclass(frozen=True)
 class SrcText:
     """変換前の入力テキストを保持する不変オブジェクト
 
+    生成時に行インデックスを1回だけ構築し、行番号の付与と行数の取得で共有する。
+
     Constraints:
         - インスタンス生成後は変更不可（frozen=True）
     """
@@ -23,13 +90,36 @@ class SrcText:
     text: str
     """変換対象の生テキスト"""
 
-    def numbered_lines(self) -> list[str]:
-        """各行に行番号（1始まり）を付与したリストを返す
+    newline: NewlineMode = "universal"
+    """行の区切り規則（lf・preserve の場合、text は改行コードを変換せずに読み込んだもの）"""
+
+    index: LineIndex = field(init=False, repr=False, compare=False)
+    """生成時に構築した行インデックス"""
+
+    def __post_init__(self) -> None:
+        """行インデックスを構築する"""
+        # frozen=True のため、生成時のみ object.__setattr__ で設定する
+        object.__setattr__(self, "index", LineIndex.build(self.text, self.newline))
+
+    def numbered_lines(self, first_number: int = 1) -> list[str]:
+        """各行に行番号（既定は1始まり）を付与したリストを返す
+
+        Args:
+            first_number: 先頭行に付与する行番号（ファイルの途中から始まるテキストの場合に指定する）
+
+        Returns:
+            "N: 行内容" 形式の文字列リスト（preserve の場合は行末の改行文字を含む）。
+            空テキストの場合は空リストを返す。
+        """
+        return [f"{i}: {line}" for i, line in enumerate(self.index.lines, start=first_number)]
+
+    def content_size(self) -> int:
+        """行区切り文字を除いた各行の内容の UTF-8 でのバイト数の合計を返す
 
         Returns:
-            "N: 行内容" 形式の文字列リスト。空テキストの場合は空リストを返す。
+            行の内容のバイト数。空テキストの場合は0を返す。
         """
-        return [f"{i + 1}: {line}" for i, line in enumerate(self.text.splitlines())]
+        return sum(len(line.encode("utf-8")) for line in self.index.lines)
 
     def length(self) -> int:
         """テキストの行数を返す
@@ -37,7 +127,7 @@ class SrcText:
         Returns:
             改行で分割した行数。空テキストの場合は0を返す。
         """
-        return len(self.text.splitlines())
+        return self.index.length()
 
 
 @dataclass(frozen=True)
@@ -51,12 +141,17 @@ class DstText:
     text: str
     """変換済みテキスト"""
 
+    line_count: int | None = field(default=None, repr=False, compare=False)
+    """変換時に判明している行数（None の場合は length() でテキストを走査する）"""
+
     def length(self) -> int:
         """テキストの行数を返す
 
         Returns:
             改行で分割した行数。空テキストの場合は0を返す。
         """
+        if self.line_count is not None:
+            return self.line_count
         return len(self.text.splitlines())
 
     def __str__(self) -> str:
@@ -68,11 +163,418 @@ class DstText:
         return self.text
 
 
+_ASCII_PROBE = "\r\n0123456789: -.+T"
+"""ASCII 互換の判定に使う文字列（改行・行番号・日時ヘッダーに現れる文字）"""
+
+
+@cache
+def is_ascii_compatible(encoding: str) -> bool:
+    """文字コードで改行・数字・記号が ASCII と同じバイト列になるかを判定する
+
+    Args:
+        encoding: 文字コード名
+
+    Returns:
+        ASCII 互換の場合は True
+
+    Raises:
+        LookupError: 未知の文字コード名の場合
+    """
+    codec = codecs.lookup(encoding)
+    try:
+        return codec.encode(_ASCII_PROBE)[0] == _ASCII_PROBE.encode("ascii")
+    except UnicodeError:
+        return False
+
+
+@dataclass(frozen=True)
+class SrcBytes:
+    r"""変換前の入力をデコードせずにバイト列のまま保持する不変オブジェクト
+
+    行の区切りは \r・\n・\r\n のみ（bytes.splitlines() と同じ）で、
+    str.splitlines() が区切りとして扱う \x0b・\x0c・\x1c〜\x1e・\x85・U+2028 等は行の内容として扱う。
+
+    Constraints:
+        - インスタンス生成後は変更不可（frozen=True）
+    """
+
+    data: bytes
+    """変換対象の生のバイト列"""
+
+    def __repr__(self) -> str:
+        """ログ出力用にバイト数のみを返す（ファイル全体をログに出力しない）"""
+        return f"SrcBytes(<{len(self.data)} bytes>)"
+
+    def length(self, encoding: str = "utf-8", errors: str = "strict") -> int:
+        r"""行数を返す（TextTransformer.transform_bytes() と同じく \r・\n・\r\n で区切る）
+
+        ASCII 互換の文字コードでは、行に分割せずにバイト列のまま改行を数える。
+        ASCII 互換でない場合（UTF-16 等）のみ encoding・errors でデコードしてから数える。
+
+        Args:
+            encoding: 入力の文字コード
+            errors: デコードできない文字の扱い（bytes.decode() の errors 引数と同じ）
+
+        Returns:
+            行数（末尾の改行の後ろは行として数えない）
+
+        Raises:
+            UnicodeError: ASCII 互換でない文字コードで、errors="strict" の場合にデコードできないとき
+        """
+        if is_ascii_compatible(encoding):
+            data = self.data
+            breaks = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+            unterminated = bool(data) and not data.endswith((b"\n", b"\r"))
+        else:
+            text = self.data.decode(encoding, errors)
+            breaks = text.count("\n") + text.count("\r") - text.count("\r\n")
+            unterminated = bool(text) and not text.endswith(("\n", "\r"))
+        return breaks + unterminated
+
+
+@dataclass(frozen=True)
+class DstBytes:
+    """変換後の出力をエンコード済みのバイト列で保持する不変オブジェクト
+
+    Constraints:
+        - インスタンス生成後は変更不可（frozen=True）
+    """
+
+    data: bytes
+    """変換済みのバイト列"""
+
+    line_count: int
+    """変換後の行数"""
+
+    def __repr__(self) -> str:
+        """ログ出力用にバイト数と行数のみを返す（ファイル全体をログに出力しない）"""
+        return f"DstBytes(<{len(self.data)} bytes>, line_count={self.line_count})"
+
+    def length(self) -> int:
+        """変換後の行数を返す
+
+        Returns:
+            変換時に数えた行数
+        """
+        return self.line_count
+
+
+class SrcTextStream:
+    """変換前の入力テキストを行単位のストリームとして保持する
+
+    ファイル全体をメモリに載せずに変換するための SrcText のストリーム版。
+    行の分割規則は SrcText と同じ（NewlineMode に従う）。
+
+    Constraints:
+        - numbered_lines() は1回のみ消費できる（入力イテレータを使い切るため）
+        - length() は numbered_lines() を最後まで消費した後に確定する
+    """
+
+    def __init__(self, lines: Iterable[str], newline: NewlineMode = "universal") -> None:
+        r"""初期化
+
+        Args:
+            lines: 行末の改行文字を含む物理行のイテラブル（\n 単位で区切り、改行コードは変換しないもの）
+            newline: 行の区切り規則
+        """
+        self._lines = lines
+        self.newline: NewlineMode = newline
+        self._length = 0
+
+    def wrap_lines(self, wrap: Callable[[Iterable[str]], Iterable[str]]) -> SrcTextStream:
+        """入力の物理行のイテラブルを wrap で包んだストリームを返す（読み込みの計測などに使う）
+
+        Args:
+            wrap: 物理行のイテラブルを受け取り、同じ行を返すイテラブルを返す関数
+
+        Returns:
+            包んだ物理行を入力とする新しいストリーム（消費前に呼び出すこと）
+        """
+        return SrcTextStream(wrap(self._lines), self.newline)
+
+    def numbered_lines(self) -> Iterator[str]:
+        """各行に行番号（1始まり）を付与して逐次返す
+
+        Returns:
+            "N: 行内容" 形式の文字列イテレータ（preserve の場合は行末の改行文字を含む）。
+            空テキストの場合は何も返さない。
+        """
+        if self.newline != "universal":
+            yield from self._numbered_physical_lines()
+            return
+        number = 0
+        for physical_line in self._lines:
+            # 物理行内の \r や \x0b 等も splitlines() と同じ規則で行区切りとして扱う
+            for line in physical_line.splitlines():
+                number += 1
+                self._length = number
+                yield f"{number}: {line}"
+
+    def _numbered_physical_lines(self) -> Iterator[str]:
+        r"""物理行をそのまま1行として行番号を付与する（lf・preserve の場合）
+
+        物理行は \n 単位で区切られているため、再分割せずに行末の \n（\r\n の場合はその \r も）を除く
+        （preserve の場合は除かない）。
+        """
+        preserve = self.newline == "preserve"
+        for number, physical_line in enumerate(self._lines, start=1):
+            self._length = number
+            if preserve:
+                line = physical_line
+            elif physical_line.endswith("\r\n"):
+                line = physical_line[:-2]
+            else:
+                line = physical_line.removesuffix("\n")
+            yield f"{number}: {line}"
+
+    def length(self) -> int:
+        """これまでに読み取った行数を返す
+
+        Returns:
+            numbered_lines() が返した行数。消費前は0を返す。
+        """
+        return self._length
+
+
+class DstTextStream:
+    """変換後の出力テキストを行単位のストリームとして保持する
+
+    DstText のストリーム版。各行を区切り文字（既定は改行文字）で連結したチャンクとして逐次返す。
+
+    Constraints:
+        - chunks() は1回のみ消費できる
+        - length() は chunks() を最後まで消費した後に確定する
+    """
+
+    def __init__(self, lines: Iterable[str], separator: str = "\n") -> None:
+        """初期化
+
+        Args:
+            lines: 出力する行のイテラブル（separator が空文字列の場合は行末の改行文字を含むもの）
+            separator: 行の間に挿入する区切り文字
+        """
+        self._lines = lines
+        self.separator = separator
+        self._length = 0
+
+    def wrap_lines(self, wrap: Callable[[Iterable[str]], Iterable[str]]) -> DstTextStream:
+        """出力する行のイテラブルを wrap で包んだストリームを返す（変換の計測などに使う）
+
+        Args:
+            wrap: 行のイテラブルを受け取り、同じ行を返すイテラブルを返す関数
+
+        Returns:
+            包んだ行を出力する新しいストリーム（消費前に呼び出すこと）
+        """
+        return DstTextStream(wrap(self._lines), self.separator)
+
+    def chunks(self) -> Iterator[str]:
+        """区切り文字で連結した出力チャンクを逐次返す
+
+        連結結果は separator.join(lines) と一致する（末尾に区切り文字を付与しない）。
+
+        Returns:
+            書き込み用の文字列チャンクのイテレータ
+        """
+        separator = ""
+        for line in self._lines:
+            self._length += 1
+            yield f"{separator}{line}"
+            separator = self.separator
+
+    def length(self) -> int:
+        """これまでに出力した行数を返す
+
+        Returns:
+            chunks() が返した行数。消費前は0を返す。
+        """
+        return self._length
+
+
+class TransformStats(CoreModel):
+    """1ファイルの変換の段階ごとの所要時間と処理量を保持する不変な計測結果
+
+    所要時間は段階ごとに重複せず、合計と段階ごとの和の差は段階の間の処理（結果の集計など）にかかった時間。
+    """
+
+    read_seconds: float = Field(..., description="読み込みの所要時間（秒）")
+    transform_seconds: float = Field(..., description="変換の所要時間（秒）")
+    write_seconds: float = Field(..., description="書き込みの所要時間（秒）")
+    total_seconds: float = Field(
+        ..., description="読み込み開始から書き込み完了までの所要時間（秒）"
+    )
+    src_bytes: int = Field(
+        ...,
+        description="読み込んだテキストのバイト数（伸長後、バイト列で変換する場合以外は UTF-8 換算）",
+    )
+    dst_bytes: int = Field(
+        ...,
+        description="書き込んだテキストのバイト数（圧縮前、バイト列で変換する場合以外は UTF-8 換算）",
+    )
+    lines_per_second: float = Field(..., description="1秒あたりに処理した変換前の行数")
+
+
 class TransformResult(CoreModel):
     """変換前後のテキスト行数を保持する不変な結果オブジェクト"""
 
     src_length: int = Field(..., description="変換前のテキスト行数")
     dst_length: int = Field(..., description="変換後のテキスト行数")
+    stats: TransformStats | None = Field(
+        default=None, description="段階ごとの所要時間と処理量（計測した場合のみ）"
+    )
+
+    def to_json(self) -> str:
+        """JSON文字列として返す（計測していない場合、stats は含めない）"""
+        return self.model_dump_json(exclude_none=True)
+
+
+_MEASUREMENT_FIELDS = {"src_bytes", "duration_seconds"}
+"""FileTransformResult のうち、実行ごとに値が変わる計測値のフィールド"""
+
+
+class FileTransformResult(CoreModel):
+    """複数ファイル変換における1ファイル分の結果"""
+
+    path: str = Field(..., description="変換対象のファイルパス")
+    src_length: int = Field(default=0, description="変換前のテキスト行数")
+    dst_length: int = Field(default=0, description="変換後のテキスト行数")
+    src_bytes: int = Field(default=0, description="変換前のファイルサイズ（バイト）")
+    duration_seconds: float = Field(default=0.0, description="1ファイルの処理にかかった時間（秒）")
+    status: Literal["ok", "error"] = Field(default="ok", description="処理結果")
+    error: str | None = Field(default=None, description="失敗時のエラーメッセージ")
+
+    @classmethod
+    def succeeded(
+        cls, path: str, result: TransformResult, src_bytes: int = 0, duration_seconds: float = 0.0
+    ) -> FileTransformResult:
+        """変換に成功したファイルの結果を生成する
+
+        Args:
+            path: 変換対象のファイルパス
+            result: 変換結果
+            src_bytes: 変換前のファイルサイズ（バイト）
+            duration_seconds: 1ファイルの処理にかかった時間（秒）
+
+        Returns:
+            1ファイル分の結果
+        """
+        return cls(
+            path=path,
+            src_length=result.src_length,
+            dst_length=result.dst_length,
+            src_bytes=src_bytes,
+            duration_seconds=duration_seconds,
+        )
+
+    @classmethod
+    def failed(cls, path: str, error: str, duration_seconds: float = 0.0) -> FileTransformResult:
+        """変換に失敗したファイルの結果を生成する
+
+        Args:
+            path: 変換対象のファイルパス
+            error: エラーメッセージ
+            duration_seconds: 1ファイルの処理にかかった時間（秒）
+
+        Returns:
+            1ファイル分の結果（status="error"）
+        """
+        return cls(path=path, status="error", error=error, duration_seconds=duration_seconds)
+
+    def to_json(self) -> str:
+        """JSON文字列として返す"""
+        return self.model_dump_json()
+
+
+type FileResultListener = Callable[[FileTransformResult], None]
+"""1ファイルの処理が完了するたびに、その結果を受け取る関数"""
+
+
+class BatchTransformResult(CoreModel):
+    """複数ファイル変換の集計結果とファイルごとの結果を保持する不変な結果オブジェクト"""
+
+    src_length: int = Field(..., description="変換前のテキスト行数の合計")
+    dst_length: int = Field(..., description="変換後のテキスト行数の合計")
+    file_count: int = Field(..., description="処理したファイル数")
+    error_count: int = Field(..., description="変換に失敗したファイル数")
+    files: list[FileTransformResult] = Field(..., description="ファイルごとの結果")
+
+    @classmethod
+    def aggregate(cls, files: list[FileTransformResult]) -> BatchTransformResult:
+        """ファイルごとの結果を集計する
+
+        Args:
+            files: ファイルごとの結果
+
+        Returns:
+            集計結果
+        """
+        return cls(
+            src_length=sum(f.src_length for f in files),
+            dst_length=sum(f.dst_length for f in files),
+            file_count=len(files),
+            error_count=sum(1 for f in files if f.status == "error"),
+            files=files,
+        )
+
+    def to_json(self) -> str:
+        """JSON文字列として返す
+
+        ファイルごとの計測値（src_bytes・duration_seconds）は含めない。
+        計測値は FileTransformResult.to_json() で1ファイルずつ出力する。
+        """
+        return self.model_dump_json(exclude={"files": {"__all__": _MEASUREMENT_FIELDS}})
+
+
+class OutputOptions(CoreModel):
+    """出力内容を左右する変換オプション
+
+    インクリメンタル変換で、前回と異なるオプションで変換した出力を再利用しないためにマニフェストへ記録する。
+    実行ごとに変わる現在日時は、変換を省略できなくなるため含めない。
+    """
+
+    binary: bool = Field(default=False, description="バイト列のまま変換するか")
+    encoding: str = Field(default="utf-8", description="binary 時の入力（と出力）の文字コード")
+    errors: str = Field(default="strict", description="binary 時のデコード・エンコードエラーの扱い")
+    newline: NewlineMode = Field(default="universal", description="行の区切り規則")
+    compression: Literal["auto", "none", "gzip", "bz2", "xz"] = Field(
+        default="auto", description="出力の圧縮形式"
+    )
+    compression_level: int | None = Field(
+        default=None, description="出力の圧縮レベル（None の場合は圧縮形式ごとの既定値）"
+    )
+
+
+class ManifestEntry(CoreModel):
+    """インクリメンタル変換のマニフェストに記録する1ファイル分のエントリ
+
+    変換元ファイルのメタデータ・内容のハッシュと、変換結果・出力ファイルのメタデータ、
+    変換時のオプションを保持する。
+    """
+
+    path: str = Field(..., description="変換元ファイルの絶対パス")
+    size: int = Field(..., description="変換元ファイルのサイズ（バイト）")
+    mtime_ns: int = Field(..., description="変換元ファイルの最終更新日時（ナノ秒）")
+    sha256: str = Field(..., description="変換元ファイル内容の SHA-256 ハッシュ")
+    dst_size: int = Field(..., description="出力ファイルのサイズ（バイト）")
+    dst_mtime_ns: int = Field(..., description="出力ファイルの最終更新日時（ナノ秒）")
+    result: TransformResult = Field(..., description="変換結果")
+    options: OutputOptions = Field(
+        default_factory=OutputOptions, description="変換時の出力内容を左右するオプション"
+    )
+
+    def to_json(self) -> str:
+        """JSON文字列として返す"""
+        return self.model_dump_json()
+
+
+class OutputMapEntry(CoreModel):
+    """変換元ファイルと出力ファイルの対応表に記録する1ファイル分のエントリ"""
+
+    path: str = Field(..., description="変換元ファイルの絶対パス")
+    layout: OutputLayoutMode = Field(..., description="出力ファイルの配置規則")
+    output: str = Field(
+        ..., description="出力ファイルの出力先ディレクトリからの相対パス（/ 区切り）"
+    )
 
     def to_json(self) -> str:
         """JSON文字列として返す"""
@@ -6,8 +6,12 @@
 from pathlib import Path
 
 from example.foundation.log import log
-from example.protocol.fs import TextFileSystemWriterProtocol
-from example.transform.types import DstText
+from example.protocol.fs import (
+    AsyncTextFileSystemWriterProtocol,
+    BinaryFileSystemWriterProtocol,
+    TextFileSystemWriterProtocol,
+)
+from example.transform.types import DstBytes, DstText, DstTextStream
 
 
 class TextWriter:
@@ -42,3 +46,82 @@ class TextWriter:
             FileSystemError: ファイルシステムでエラーが発生した場合
         """
         self.fs_writer.write(str(text), path)
+
+    @log
+    def write_stream(self, text: DstTextStream, path: Path) -> None:
+        """テキストストリームをファイルに逐次保存
+
+        ストリームのチャンクを消費しながら書き込むため、出力全体をメモリに載せません。
+
+        Args:
+            text: 保存するテキストストリーム
+            path: 保存先ファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        self.fs_writer.write_chunks(text.chunks(), path)
+
+
+class BinaryWriter:
+    """変換済みのバイト列を指定パスへ書き出す
+
+    基盤層への薄いラッパー。例外処理は行わず、そのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        fs_writer: BinaryFileSystemWriterProtocol,
+    ):
+        """BinaryWriterインスタンスを初期化
+
+        Args:
+            fs_writer: ファイルシステム書き込み（バイト列版）
+        """
+        self.fs_writer = fs_writer
+
+    @log
+    def write(self, text: DstBytes, path: Path) -> None:
+        """バイト列をファイルに保存
+
+        Args:
+            text: 保存するバイト列
+            path: 保存先ファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        self.fs_writer.write_bytes(text.data, path)
+
+
+class AsyncTextWriter:
+    """変換済みテキストを指定パスへ書き出す（非同期版）
+
+    基盤層への薄いラッパー。例外処理は行わず、そのまま伝播させる。
+    """
+
+    def __init__(
+        self,
+        fs_writer: AsyncTextFileSystemWriterProtocol,
+    ):
+        """AsyncTextWriterインスタンスを初期化
+
+        Args:
+            fs_writer: ファイルシステム書き込み（非同期版）
+        """
+        self.fs_writer = fs_writer
+
+    @log
+    async def write(self, text: DstText, path: Path) -> None:
+        """テキストをファイルに保存
+
+        TextWriter.write と同じ内容を書き込みます。
+
+        Args:
+            text: 保存するテキスト
+            path: 保存先ファイルパス
+
+        Raises:
+            FileSystemError: ファイルシステムでエラーが発生した場合
+        """
+        await self.fs_writer.write(str(text), path)
@@ -0,0 +1,53 @@
+"""ベンチマーク共通のフィクスチャ
+
+`--benchmark-sizes` で指定したサイズと行の種類の組み合わせごとに合成コーパスを生成する。
+コーパスはセッション内で1回だけ生成し、各ベンチマークで共有する。
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from tests.benchmark.corpus import LINE_KINDS, generate_corpus
+from tests.benchmark.plugin import benchmark_sizes, parse_size
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """生成済みの合成コーパス"""
+
+    path: Path
+    """コーパスのファイルパス"""
+
+    label: str
+    """ベンチマーク名に使うラベル（例: "unicode-1MB"）"""
+
+    size: int
+    """ファイルサイズ（バイト）"""
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """合成コーパス（corpus フィクスチャ）を使うテストを、サイズと行の種類の組み合わせでパラメータ化する"""
+    if "corpus" in metafunc.fixturenames:
+        params = [
+            f"{kind}-{size}" for size in benchmark_sizes(metafunc.config) for kind in LINE_KINDS
+        ]
+        metafunc.parametrize("corpus", params, indirect=True)
+
+
+@pytest.fixture(scope="session")
+def corpus_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """合成コーパスの保存先ディレクトリ"""
+    return tmp_path_factory.mktemp("corpus")
+
+
+@pytest.fixture
+def corpus(request: pytest.FixtureRequest, corpus_dir: Path) -> Corpus:
+    """パラメータ（"行の種類-サイズ"）に対応する合成コーパス（未生成の場合のみ生成する）"""
+    label: str = request.param
+    kind, size_label = label.split("-")
+    path = corpus_dir / f"{label}.txt"
+    if not path.exists():
+        generate_corpus(path, parse_size(size_label), kind)
+    return Corpus(path=path, label=label, size=path.stat().st_size)
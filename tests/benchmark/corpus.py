@@ -0,0 +1,71 @@
+"""ベンチマーク用の合成コーパス
+
+行の種類ごとに、指定サイズのテキストファイルを生成する。
+GB 単位のファイルもメモリに載せずに生成できるよう、一定サイズのブロックを繰り返し書き込む。
+"""
+
+from pathlib import Path
+
+_BLOCK_SIZE = 1 << 20
+
+LINE_KINDS = ("short", "long", "unicode")
+"""生成できる行の種類（short: 短い ASCII 行、long: 長い ASCII 行、unicode: マルチバイト文字中心の行）"""
+
+
+def _line(kind: str, number: int) -> str:
+    """行の種類に応じた1行分のテキストを返す
+
+    Args:
+        kind: 行の種類
+        number: 行番号（行ごとに内容を変えるために使う）
+
+    Returns:
+        改行を含む1行分のテキスト
+    """
+    if kind == "short":
+        return f"line {number}\n"
+    if kind == "long":
+        return f"{number}: " + "lorem ipsum dolor sit amet " * 36 + "\n"
+    if kind == "unicode":
+        return f"{number}: 日本語のテキスト行です。絵文字🚀も含みます。Ünïcödé テキスト\n"
+    raise ValueError(f"unknown line kind: {kind!r}")
+
+
+def generate_corpus(path: Path, size: int, kind: str) -> Path:
+    """指定サイズのテキストファイルを生成する
+
+    行の途中で切れないよう、サイズを超えない範囲の行だけを書き込む。
+
+    Args:
+        path: 出力先のファイルパス
+        size: ファイルサイズの上限（バイト）
+        kind: 行の種類（LINE_KINDS のいずれか）
+
+    Returns:
+        生成したファイルのパス
+    """
+    lines: list[bytes] = []
+    block_size = 0
+    number = 1
+    while block_size < min(size, _BLOCK_SIZE):
+        line = _line(kind, number).encode("utf-8")
+        if lines and block_size + len(line) > min(size, _BLOCK_SIZE):
+            break
+        lines.append(line)
+        block_size += len(line)
+        number += 1
+    block = b"".join(lines)
+
+    with path.open("wb") as f:
+        remaining = size
+        while remaining >= len(block):
+            f.write(block)
+            remaining -= len(block)
+        # 残りはブロック先頭の行単位で埋める
+        tail = 0
+        for line in lines:
+            if tail + len(line) > remaining:
+                break
+            tail += len(line)
+        f.write(block[:tail])
+    return path
@@ -0,0 +1,300 @@
+"""ベンチマーク用の pytest プラグイン
+
+計測結果を JSON で保存し、保存済みのベースラインと比較して性能劣化を検出する。
+ベースラインのないベンチマークは比較できないため、実行結果のサマリーに一覧を表示する
+（`--benchmark-require-baseline` 指定時は失敗させる）。
+`benchmark` マーカー付きのテストは既定では実行されない（`make benchmark` で実行する）。
+"""
+
+import json
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+_DEFAULT_SIZES = "1KB,1MB,16MB"
+_DEFAULT_OUTPUT = "tmp/benchmark/results.json"
+_DEFAULT_BASELINE = "tests/benchmark/baseline.json"
+
+_SIZE_UNITS = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+
+
+def parse_size(label: str) -> int:
+    """サイズ表記（例: 1KB, 16MB, 2GB）をバイト数に変換する
+
+    Args:
+        label: サイズ表記（単位は KB / MB / GB、1024 倍単位）
+
+    Returns:
+        バイト数
+
+    Raises:
+        ValueError: サイズ表記が不正な場合
+    """
+    unit = label[-2:].upper()
+    if unit not in _SIZE_UNITS or not label[:-2].isdigit():
+        raise ValueError(f"invalid benchmark size: {label!r}")
+    return int(label[:-2]) * _SIZE_UNITS[unit]
+
+
+@dataclass(frozen=True)
+class BenchmarkRecord:
+    """1ベンチマーク分の計測結果"""
+
+    name: str
+    """ベンチマーク名（ベースラインとの対応付けに使う）"""
+
+    size: int
+    """入力サイズ（バイト）"""
+
+    rounds: int
+    """計測回数"""
+
+    min_seconds: float
+    """最小実行時間（秒）"""
+
+    median_seconds: float
+    """実行時間の中央値（秒）"""
+
+    throughput_mb_s: float
+    """中央値から求めたスループット（MB/s）"""
+
+
+class BenchmarkRecorder:
+    """ベンチマークを計測し、結果の記録とベースラインとの比較を行う"""
+
+    def __init__(
+        self,
+        rounds: int,
+        baseline: dict[str, dict[str, Any]] | None,
+        tolerance: float,
+        require_baseline: bool = False,
+    ):
+        """BenchmarkRecorderを初期化
+
+        Args:
+            rounds: 1ベンチマークあたりの計測回数
+            baseline: ベンチマーク名をキーとしたベースラインの計測結果（None の場合は比較しない）
+            tolerance: ベースラインの中央値に対して許容する増加率（0.25 なら 25% まで）
+            require_baseline: ベースラインのないベンチマークを失敗させるか
+        """
+        self.rounds = rounds
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.require_baseline = require_baseline
+        self.records: list[BenchmarkRecord] = []
+        self.missing: list[str] = []
+        """ベースラインがなく比較できなかったベンチマーク名"""
+
+    def measure(
+        self,
+        name: str,
+        func: Callable[[], object],
+        size: int,
+        setup: Callable[[], object] | None = None,
+    ) -> BenchmarkRecord:
+        """関数の実行時間を計測し、ベースラインより遅くなっていれば失敗させる
+
+        Args:
+            name: ベンチマーク名
+            func: 計測対象の処理
+            size: 入力サイズ（バイト、スループットの算出に使う）
+            setup: 計測ごとに事前実行する処理（計測時間に含めない）
+
+        Returns:
+            計測結果
+        """
+        timings: list[float] = []
+        for _ in range(self.rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        median = statistics.median(timings)
+        record = BenchmarkRecord(
+            name=name,
+            size=size,
+            rounds=self.rounds,
+            min_seconds=min(timings),
+            median_seconds=median,
+            throughput_mb_s=size / (1 << 20) / median if median > 0 else 0.0,
+        )
+        self.records.append(record)
+        self._compare(record)
+        return record
+
+    def _compare(self, record: BenchmarkRecord) -> None:
+        """ベースラインと比較し、許容範囲を超えて遅くなっていればテストを失敗させる
+
+        ベースラインのないベンチマークは missing に記録する（require_baseline の場合は失敗させる）。
+
+        Args:
+            record: 今回の計測結果
+        """
+        if self.baseline is None:
+            return
+        baseline = self.baseline.get(record.name)
+        if baseline is None:
+            self.missing.append(record.name)
+            if self.require_baseline:
+                pytest.fail(
+                    f"no baseline for {record.name}: run `make benchmark-baseline` on this machine first"
+                )
+            return
+        limit = baseline["median_seconds"] * (1 + self.tolerance)
+        if record.median_seconds > limit:
+            pytest.fail(
+                f"performance regression: {record.name} "
+                f"median {record.median_seconds:.6f}s > baseline {baseline['median_seconds']:.6f}s "
+                f"(tolerance {self.tolerance:.0%})"
+            )
+
+    def to_json(self) -> str:
+        """計測結果を実行環境の情報とあわせて JSON に変換する
+
+        Returns:
+            JSON 文字列（results はベンチマーク名をキーとする）
+        """
+        document: dict[str, Any] = {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": {record.name: asdict(record) for record in self.records},
+        }
+        return json.dumps(document, ensure_ascii=False, indent=2)
+
+
+_RECORDER_KEY = pytest.StashKey[BenchmarkRecorder]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """ベンチマーク用のコマンドラインオプションを登録する"""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark-sizes",
+        default=_DEFAULT_SIZES,
+        help=f"comma separated corpus sizes such as 1KB,1MB,2GB (default: {_DEFAULT_SIZES})",
+    )
+    group.addoption(
+        "--benchmark-rounds", type=int, default=3, help="rounds per benchmark (default: 3)"
+    )
+    group.addoption(
+        "--benchmark-output",
+        default=_DEFAULT_OUTPUT,
+        help=f"path of the results JSON (default: {_DEFAULT_OUTPUT})",
+    )
+    group.addoption(
+        "--benchmark-baseline",
+        default=_DEFAULT_BASELINE,
+        help=f"path of the baseline JSON to compare against (default: {_DEFAULT_BASELINE})",
+    )
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.25,
+        help="allowed slowdown ratio against the baseline median (default: 0.25)",
+    )
+    group.addoption(
+        "--benchmark-require-baseline",
+        action="store_true",
+        help="fail benchmarks that have no baseline entry instead of only reporting them",
+    )
+    group.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        help="save the results as the new baseline instead of comparing against it",
+    )
+
+
+def _option_path(config: pytest.Config, name: str) -> Path:
+    """パスを指定するオプションの値を、ルートディレクトリからの絶対パスとして返す
+
+    Args:
+        config: pytest の設定
+        name: オプション名
+
+    Returns:
+        オプションで指定されたパス
+    """
+    return config.rootpath / str(config.getoption(name))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """BenchmarkRecorder を生成し、ベースラインを読み込む
+
+    ベースラインのファイルがない場合は、全ベンチマークをベースラインなしとして扱う。
+    """
+    baseline: dict[str, dict[str, Any]] | None = None
+    baseline_path = _option_path(config, "--benchmark-baseline")
+    if not config.getoption("--benchmark-save-baseline"):
+        baseline = {}
+        if baseline_path.exists():
+            baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+
+    config.stash[_RECORDER_KEY] = BenchmarkRecorder(
+        rounds=cast(int, config.getoption("--benchmark-rounds")),
+        baseline=baseline,
+        tolerance=cast(float, config.getoption("--benchmark-tolerance")),
+        require_baseline=cast(bool, config.getoption("--benchmark-require-baseline")),
+    )
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """計測結果を JSON に保存する（ベースライン保存指定時はベースラインも更新する）"""
+    config = session.config
+    recorder = config.stash[_RECORDER_KEY]
+    if not recorder.records:
+        return
+
+    paths = [_option_path(config, "--benchmark-output")]
+    if config.getoption("--benchmark-save-baseline"):
+        paths.append(_option_path(config, "--benchmark-baseline"))
+    for path in paths:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(recorder.to_json() + "\n", encoding="utf-8")
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: pytest.Config
+) -> None:
+    """ベースラインがなく比較しなかったベンチマークを一覧表示する"""
+    recorder = config.stash[_RECORDER_KEY]
+    if not recorder.missing:
+        return
+    baseline_path = _option_path(config, "--benchmark-baseline")
+    terminalreporter.write_sep("=", "benchmarks without baseline (not compared)", yellow=True)
+    for name in recorder.missing:
+        terminalreporter.write_line(name)
+    terminalreporter.write_line(
+        f"{len(recorder.missing)} benchmarks have no entry in {baseline_path}: "
+        "run `make benchmark-baseline` on this machine to record one"
+    )
+
+
+@pytest.fixture
+def bench(request: pytest.FixtureRequest) -> BenchmarkRecorder:
+    """ベンチマークの計測・記録を行う BenchmarkRecorder"""
+    return request.config.stash[_RECORDER_KEY]
+
+
+def benchmark_sizes(config: pytest.Config) -> list[str]:
+    """--benchmark-sizes で指定されたサイズ表記の一覧を返す
+
+    Args:
+        config: pytest の設定
+
+    Returns:
+        サイズ表記のリスト
+    """
+    labels = [label.strip() for label in str(config.getoption("--benchmark-sizes")).split(",")]
+    for label in labels:
+        parse_size(label)
+    return labels
@@ -0,0 +1,53 @@
+"""foundation.fs パッケージのベンチマーク
+
+テキストファイルの読み取り・書き込みの実行時間を計測する。
+"""
+
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import (
+    MmapTextFileSystemReader,
+    TextFileSystemReader,
+    TextFileSystemWriter,
+)
+from tests.benchmark.conftest import Corpus
+from tests.benchmark.plugin import BenchmarkRecorder
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestReaderBenchmark:
+    """TextFileSystemReader / MmapTextFileSystemReaderのベンチマーク"""
+
+    @pytest.mark.parametrize(
+        "reader",
+        [TextFileSystemReader(), MmapTextFileSystemReader()],
+        ids=["TextFileSystemReader", "MmapTextFileSystemReader"],
+    )
+    def test_read(
+        self,
+        bench: BenchmarkRecorder,
+        corpus: Corpus,
+        reader: TextFileSystemReader | MmapTextFileSystemReader,
+    ):
+        bench.measure(
+            f"{type(reader).__name__}.read[{corpus.label}]",
+            lambda: reader.read(corpus.path),
+            corpus.size,
+        )
+
+
+class TestTextFileSystemWriterBenchmark:
+    """TextFileSystemWriterのベンチマーク"""
+
+    def test_write(self, bench: BenchmarkRecorder, corpus: Corpus, tmp_path: Path):
+        content = corpus.path.read_text(encoding="utf-8")
+        writer = TextFileSystemWriter()
+
+        bench.measure(
+            f"TextFileSystemWriter.write[{corpus.label}]",
+            lambda: writer.write(content, tmp_path / "output.txt"),
+            corpus.size,
+        )
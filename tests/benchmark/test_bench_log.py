@@ -0,0 +1,79 @@
+"""@log デコレータとログフォーマッターのベンチマーク
+
+同じ関数をデコレートした場合としない場合で、多数回呼び出したときの実行時間を計測する。
+ロガーが INFO を出力しない場合（disabled）と出力する場合（enabled）の両方を計測する。
+フォーマッターは、同じログレコードを JsonFormatter と標準のテキスト形式で整形する時間を比較する。
+"""
+
+import logging
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from example.foundation.log import JsonFormatter, log
+from tests.benchmark.plugin import BenchmarkRecorder
+
+pytestmark = pytest.mark.benchmark
+
+CALLS = 100_000
+ARGUMENT = [f"item {i}" for i in range(100)]
+RECORDS = 100_000
+PLAIN_FORMAT = "%(asctime)s %(levelname)-8s %(filename)s:%(lineno)d - %(name)s %(message)s"
+
+
+def _count(items: list[str]) -> int:
+    return len(items)
+
+
+@pytest.fixture(params=["disabled", "enabled"])
+def log_state(request: pytest.FixtureRequest) -> Iterator[str]:
+    """@log が使うロガーのレベルを切り替え、出力先を NullHandler に差し替える"""
+    logger = logging.getLogger(__name__)
+    original_level, original_propagate = logger.level, logger.propagate
+    handler = logging.NullHandler()
+    logger.setLevel(logging.INFO if request.param == "enabled" else logging.WARNING)
+    logger.addHandler(handler)
+    logger.propagate = False
+    yield request.param
+    logger.removeHandler(handler)
+    logger.setLevel(original_level)
+    logger.propagate = original_propagate
+
+
+class TestLogBenchmark:
+    """@logデコレータのベンチマーク"""
+
+    @pytest.mark.parametrize("decorated", [False, True], ids=["plain", "decorated"])
+    def test_overhead(self, bench: BenchmarkRecorder, log_state: str, decorated: bool):
+        func: Callable[[list[str]], int] = log(_count) if decorated else _count
+
+        def call_many() -> None:
+            for _ in range(CALLS):
+                func(ARGUMENT)
+
+        kind = "decorated" if decorated else "plain"
+        bench.measure(f"log[{kind}-{log_state}-{CALLS}calls]", call_many, size=0)
+
+
+class TestLogFormatterBenchmark:
+    """ログフォーマッターのベンチマーク"""
+
+    @pytest.mark.parametrize("kind", ["plain", "json"])
+    def test_format(self, bench: BenchmarkRecorder, kind: str):
+        formatter = (
+            JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+            if kind == "json"
+            else logging.Formatter(PLAIN_FORMAT, datefmt="%Y-%m-%dT%H:%M:%S")
+        )
+        records = [
+            logging.LogRecord(
+                __name__, logging.INFO, __file__, 42, "processed %s: %d lines", ("a.txt", i), None
+            )
+            for i in range(RECORDS)
+        ]
+
+        def format_many() -> None:
+            for record in records:
+                formatter.format(record)
+
+        bench.measure(f"log_formatter[{kind}-{RECORDS}records]", format_many, size=0)
@@ -0,0 +1,31 @@
+"""CLI のコールドスタートのベンチマーク
+
+新しいインタープリターで CLI を起動し、終了するまでの時間を計測する。
+ベースラインと比較することで、起動時の import の追加などによる起動時間の劣化を検出する。
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.benchmark.plugin import BenchmarkRecorder
+
+pytestmark = pytest.mark.benchmark
+
+
+class TestStartupBenchmark:
+    """CLIのコールドスタートのベンチマーク"""
+
+    @pytest.mark.parametrize("command", ["help", "transform"])
+    def test_cold_start(self, bench: BenchmarkRecorder, tmp_path: Path, command: str):
+        input_file = tmp_path / "input.txt"
+        input_file.write_text("line\n", encoding="utf-8")
+        args = ["--help"] if command == "help" else ["transform", str(input_file)]
+        cmd = [sys.executable, "-m", "example.cli", "--log-level", "ERROR", *args]
+
+        def run() -> None:
+            subprocess.run(cmd, cwd=tmp_path, capture_output=True, check=True)
+
+        bench.measure(f"startup[{command}]", run, size=0)
@@ -0,0 +1,109 @@
+"""transform パッケージのベンチマーク
+
+行番号付与・テキスト変換・1ファイル分の変換全体（分割による並列変換を含む）の実行時間を計測する。
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import (
+    ByteRangeFileSystemReader,
+    OffsetFileSystemWriter,
+    TextFileSystemReader,
+    TextFileSystemWriter,
+)
+from example.transform.context import TransformContext, TransformShardContext
+from example.transform.orchestrator import TransformOrchestrator
+from example.transform.reader import BinaryReader, TextReader
+from example.transform.sharded import ShardedTransformOrchestrator
+from example.transform.transformer import TextTransformer
+from example.transform.types import SrcText, TransformedDatetime
+from example.transform.writer import BinaryWriter, TextWriter
+from tests.benchmark.conftest import Corpus
+from tests.benchmark.plugin import BenchmarkRecorder
+
+pytestmark = pytest.mark.benchmark
+
+DATETIME = datetime(2024, 12, 26, 15, 30, 45)
+
+
+class TestSrcTextBenchmark:
+    """SrcTextのベンチマーク"""
+
+    def test_numbered_lines(self, bench: BenchmarkRecorder, corpus: Corpus):
+        src_text = SrcText(corpus.path.read_text(encoding="utf-8"))
+
+        bench.measure(
+            f"SrcText.numbered_lines[{corpus.label}]", src_text.numbered_lines, corpus.size
+        )
+
+
+class TestTextTransformerBenchmark:
+    """TextTransformerのベンチマーク"""
+
+    def test_transform(self, bench: BenchmarkRecorder, corpus: Corpus):
+        src_text = SrcText(corpus.path.read_text(encoding="utf-8"))
+        transformer = TextTransformer()
+
+        bench.measure(
+            f"TextTransformer.transform[{corpus.label}]",
+            lambda: transformer.transform(text=src_text, datetime=TransformedDatetime(DATETIME)),
+            corpus.size,
+        )
+
+
+class TestTransformOrchestratorBenchmark:
+    """TransformOrchestratorのベンチマーク（実ファイルの読み書きを含む）"""
+
+    @pytest.mark.parametrize("mode", ["normal", "stream", "bytes", "lf", "stream-lf"])
+    def test_orchestrate(self, bench: BenchmarkRecorder, corpus: Corpus, tmp_path: Path, mode: str):
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(TextFileSystemReader()),
+            transformer=TextTransformer(),
+            writer=TextWriter(TextFileSystemWriter()),
+            binary_reader=BinaryReader(TextFileSystemReader()),
+            binary_writer=BinaryWriter(TextFileSystemWriter()),
+        )
+        context = TransformContext(
+            target_file=corpus.path,
+            tmp_dir=tmp_path,
+            current_datetime=DATETIME,
+            streaming=mode.startswith("stream"),
+            binary=mode == "bytes",
+            newline="lf" if mode.endswith("lf") else "universal",
+        )
+
+        bench.measure(
+            f"TransformOrchestrator.orchestrate[{mode}-{corpus.label}]",
+            lambda: orchestrator.orchestrate(context),
+            corpus.size,
+        )
+
+
+class TestShardedTransformOrchestratorBenchmark:
+    """ShardedTransformOrchestratorのベンチマーク（実ファイルの読み書きを含む）"""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_orchestrate(
+        self, bench: BenchmarkRecorder, corpus: Corpus, tmp_path: Path, workers: int
+    ):
+        orchestrator = ShardedTransformOrchestrator(
+            reader=ByteRangeFileSystemReader(),
+            transformer=TextTransformer(),
+            writer=OffsetFileSystemWriter(),
+        )
+        context = TransformShardContext(
+            target_file=corpus.path,
+            tmp_dir=tmp_path,
+            current_datetime=DATETIME,
+            workers=workers,
+            shard_size=4 << 20,
+        )
+
+        bench.measure(
+            f"ShardedTransformOrchestrator.orchestrate[workers{workers}-{corpus.label}]",
+            lambda: orchestrator.orchestrate(context),
+            corpus.size,
+        )
@@ -11,6 +11,9 @@ import pytest
 
 from example.config.path import PathConfig
 
+# ベンチマーク用のオプション・フィクスチャ・結果の保存を登録する
+pytest_plugins = ["tests.benchmark.plugin"]
+
 
 def pytest_configure(config: Any) -> None:
     """pytest設定フック: テスト実行前に環境変数を設定"""
@@ -3,9 +3,13 @@
 CLIの共通動作を検証
 """
 
+import gzip
 import json
+import os
 import subprocess
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 import pytest
@@ -80,6 +84,705 @@ class TestIntegrationCLI:
         assert (cli_tmp_dir / "input.txt").exists()
         assert not (env_tmp_dir / "input.txt").exists()
 
+    def test_transform_正常系_streamオプションでも出力がバイト単位で一致する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_bytes("first\r\nsecond\n\n日本語\x0bthird\n".encode())
+        outputs: list[tuple[bytes, dict[str, int]]] = []
+
+        for options, dir_name in (([], "eager"), (["--stream"], "stream")):
+            out_dir = tmp_dir / dir_name
+
+            # Act
+            cmd = [
+                sys.executable,
+                "-m",
+                "example.cli",
+                "transform",
+                str(input_file),
+                "--tmp-dir",
+                str(out_dir),
+                *options,
+            ]
+            result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+            assert result.returncode == 0
+            outputs.append(((out_dir / "input.txt").read_bytes(), json.loads(result.stdout)))
+
+        # Assert（ヘッダーの日時は実行時刻に依存するため、2行目以降を比較する）
+        eager, stream = outputs
+        assert eager[0].split(b"\n", 1)[1] == stream[0].split(b"\n", 1)[1]
+        assert eager[1] == stream[1]
+
+    def test_transform_正常系_複数ファイルを並列に一括変換する(self, tmp_dir: Path):
+        # Arrange
+        src_dir = tmp_dir / "src"
+        src_dir.mkdir()
+        for name in ("a.txt", "b.txt", "c.txt"):
+            (src_dir / name).write_text(f"{name}\nline2", encoding="utf-8")
+        out_dir = tmp_dir / "out"
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(src_dir / "a.txt"),
+            str(src_dir / "[bc].txt"),
+            "--tmp-dir",
+            str(out_dir),
+            "--workers",
+            "2",
+        ]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=30)
+
+        # Assert
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert data["file_count"] == 3
+        assert data["src_length"] == 6
+        assert data["dst_length"] == 9
+        assert [f["status"] for f in data["files"]] == ["ok", "ok", "ok"]
+        assert sorted(p.name for p in out_dir.iterdir()) == ["a.txt", "b.txt", "c.txt"]
+
+    def test_transform_正常系_layoutで同名のファイルを上書きせずに出力し対応を記録する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        for dir_name in ("a", "b"):
+            (tmp_dir / "logs" / dir_name).mkdir(parents=True)
+            (tmp_dir / "logs" / dir_name / "app.log").write_text(dir_name, encoding="utf-8")
+
+        for layout in ("mirror", "hashed", "content"):
+            out_dir = tmp_dir / layout
+
+            # Act
+            cmd = [sys.executable, "-m", "example.cli", "transform", "logs/", "--layout", layout]
+            result = subprocess.run(
+                [*cmd, "--tmp-dir", str(out_dir), "--fan-out", "16"],
+                cwd=tmp_dir,
+                capture_output=True,
+                text=True,
+                timeout=30,
+            )
+
+            # Assert
+            assert result.returncode == 0
+            outputs = sorted(p for p in out_dir.rglob("*.log") if ".outputs" not in p.parts)
+            assert len(outputs) == 2
+            assert sorted(p.read_text(encoding="utf-8")[-4:] for p in outputs) == ["1: a", "1: b"]
+            assert len(list((out_dir / ".outputs").iterdir())) == 2
+        assert (tmp_dir / "mirror" / "logs" / "a" / "app.log").exists()
+
+    def test_transform_正常系_EXAMPLE_WRITER_BACKEND_memoryでは出力ファイルを作成しない(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        src_dir = tmp_dir / "src"
+        src_dir.mkdir()
+        for name in ("a.txt", "b.txt"):
+            (src_dir / name).write_text(f"{name}\nline2", encoding="utf-8")
+        out_dir = tmp_dir / "out"
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(src_dir),
+            "--tmp-dir",
+            str(out_dir),
+            "--workers",
+            "2",
+        ]
+        result = subprocess.run(
+            cmd,
+            cwd=tmp_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env={**__import__("os").environ, "EXAMPLE_WRITER_BACKEND": "memory"},
+        )
+
+        # Assert
+        assert result.returncode == 0
+        data = json.loads(result.stdout)
+        assert data["file_count"] == 2
+        assert [f["status"] for f in data["files"]] == ["ok", "ok"]
+        assert not out_dir.exists()
+
+    def test_transform_正常系_engine_asyncでもprocessと同じ結果を出力する(self, tmp_dir: Path):
+        # Arrange
+        src_dir = tmp_dir / "src"
+        src_dir.mkdir()
+        for i in range(10):
+            (src_dir / f"{i}.txt").write_text(f"file{i}\nline2\r\nline3", encoding="utf-8")
+
+        def run(engine: str) -> tuple[dict[str, object], dict[str, str]]:
+            out_dir = tmp_dir / engine
+            cmd = [
+                sys.executable,
+                "-m",
+                "example.cli",
+                "transform",
+                str(src_dir),
+                "--tmp-dir",
+                str(out_dir),
+                "--engine",
+                engine,
+                "--concurrency",
+                "4",
+            ]
+            result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=30)
+            assert result.returncode == 0
+            # 先頭行は実行日時のため比較対象から除外する
+            outputs = {
+                p.name: p.read_text(encoding="utf-8").split("\n", 1)[1] for p in out_dir.iterdir()
+            }
+            return json.loads(result.stdout), outputs
+
+        # Act
+        process_result = run("process")
+        async_result = run("async")
+
+        # Assert
+        assert async_result == process_result
+
+    def test_transform_正常系_results_ndjsonでファイルごとに1行ずつ出力する(self, tmp_dir: Path):
+        # Arrange
+        src_dir = tmp_dir / "src"
+        src_dir.mkdir()
+        for i in range(5):
+            (src_dir / f"{i}.txt").write_text(f"file{i}\nline2", encoding="utf-8")
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(src_dir),
+            str(tmp_dir / "missing.txt"),
+            "--results",
+            "ndjson",
+            "--workers",
+            "2",
+        ]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=30)
+
+        # Assert
+        assert result.returncode == 1
+        records = {Path(r["path"]).name: r for r in map(json.loads, result.stdout.splitlines())}
+        assert sorted(records) == ["0.txt", "1.txt", "2.txt", "3.txt", "4.txt", "missing.txt"]
+        assert records["0.txt"]["status"] == "ok"
+        assert records["0.txt"]["src_length"] == 2
+        assert records["0.txt"]["src_bytes"] == len("file0\nline2")
+        assert records["0.txt"]["duration_seconds"] > 0
+        assert records["missing.txt"]["status"] == "error"
+
+    def test_transform_異常系_一括変換で失敗したファイルがあればexit_code_1で終了する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(input_file),
+            str(tmp_dir / "missing.txt"),
+        ]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=30)
+
+        # Assert
+        assert result.returncode == 1
+        data = json.loads(result.stdout)
+        assert [f["status"] for f in data["files"]] == ["ok", "error"]
+
+    def test_transform_正常系_incrementalで変更のないファイルは書き込まない(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("line1\nline2", encoding="utf-8")
+        out_dir = tmp_dir / "out"
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(input_file),
+            "--tmp-dir",
+            str(out_dir),
+            "--incremental",
+        ]
+
+        def run(*extra: str) -> tuple[str, int]:
+            result = subprocess.run(
+                [*cmd, *extra], cwd=tmp_dir, capture_output=True, text=True, timeout=10
+            )
+            assert result.returncode == 0
+            return result.stdout, (out_dir / "input.txt").stat().st_mtime_ns
+
+        # Act
+        first_stdout, first_mtime = run()
+        second_stdout, second_mtime = run()
+        _, forced_mtime = run("--force")
+
+        # Assert
+        assert json.loads(second_stdout) == json.loads(first_stdout)
+        assert second_mtime == first_mtime
+        assert forced_mtime != first_mtime
+
+    def test_transform_正常系_カレントディレクトリを繰り返し変換しても出力とログを拾わない(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        (tmp_dir / "sub").mkdir()
+        (tmp_dir / "a.txt").write_text("line1\nline2", encoding="utf-8")
+        (tmp_dir / "sub" / "b.txt").write_text("line1", encoding="utf-8")
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            ".",
+            "--incremental",
+            "--layout",
+            "mirror",
+        ]
+
+        def run() -> list[str]:
+            result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=30)
+            assert result.returncode == 0
+            return [file["path"] for file in json.loads(result.stdout)["files"]]
+
+        # Act
+        first = run()
+        second = run()
+
+        # Assert
+        assert first == second == ["a.txt", str(Path("sub") / "b.txt")]
+        assert (tmp_dir / "tmp" / "logs").is_dir()
+
+    def test_transform_正常系_性能設定の環境変数を変換に反映する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("line1\nline2", encoding="utf-8")
+        out_dir = tmp_dir / "out"
+        cache_dir = tmp_dir / "cache"
+        env = {
+            **os.environ,
+            "EXAMPLE_CACHE_DIR": str(cache_dir),
+            "EXAMPLE_MEMORY_BUDGET": "4096",
+            "EXAMPLE_IO_BUFFER_SIZE": "64KiB",
+            "EXAMPLE_DURABILITY": "fsync",
+        }
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "transform",
+            str(input_file),
+            "--tmp-dir",
+            str(out_dir),
+            "--incremental",
+        ]
+        result = subprocess.run(
+            cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10, env=env
+        )
+
+        # Assert
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {"src_length": 2, "dst_length": 3}
+        assert "1: line1" in (out_dir / "input.txt").read_text(encoding="utf-8")
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        assert not (out_dir / ".manifest").exists()
+
+    def test_transform_正常系_shardで分割して並列に変換しても出力が一致する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        lines = [f"{i}: 日本語🚀 line" for i in range(1, 2000)]
+        input_file.write_bytes(("\n".join(lines) + "\r\ncrlf\rcr\n\nlast").encode())
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(input_file)]
+
+        # Act
+        sequential = subprocess.run(
+            [*cmd, "--tmp-dir", "sequential"],
+            cwd=tmp_dir,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        sharded = subprocess.run(
+            [*cmd, "--tmp-dir", "sharded", "--shard", "--workers", "2", "--shard-size", "4096"],
+            cwd=tmp_dir,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+
+        # Assert
+        assert sharded.returncode == 0, sharded.stderr
+        assert json.loads(sharded.stdout) == json.loads(sequential.stdout)
+        # 先頭行（変換日時）以外が1バイトも違わないこと
+        expected = (tmp_dir / "sequential" / "input.txt").read_bytes()
+        actual = (tmp_dir / "sharded" / "input.txt").read_bytes()
+        assert actual.split(b"\n", 1)[1] == expected.split(b"\n", 1)[1]
+        assert not list((tmp_dir / "sharded").glob(".*.tmp"))
+
+    def test_transform_正常系_gzipの入力を伸長して同じ拡張子のgzipで出力する(self, tmp_dir: Path):
+        # Arrange
+        content = "line1\n日本語\nline3".encode()
+        (tmp_dir / "plain.txt").write_bytes(content)
+        (tmp_dir / "input.txt.gz").write_bytes(gzip.compress(content))
+        cmd = [sys.executable, "-m", "example.cli", "transform"]
+
+        # Act
+        plain = subprocess.run(
+            [*cmd, "plain.txt"], cwd=tmp_dir, capture_output=True, text=True, timeout=10
+        )
+        compressed = subprocess.run(
+            [*cmd, "input.txt.gz", "--compress-level", "1"],
+            cwd=tmp_dir,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+
+        # Assert
+        assert compressed.returncode == 0, compressed.stderr
+        assert json.loads(compressed.stdout) == json.loads(plain.stdout)
+        expected = (tmp_dir / "tmp" / "plain.txt").read_bytes()
+        actual = gzip.decompress((tmp_dir / "tmp" / "input.txt.gz").read_bytes())
+        assert actual.split(b"\n", 1)[1] == expected.split(b"\n", 1)[1]
+
+    def test_transform_正常系_ハイフンで標準入力を変換して標準出力へ書き込む(self, tmp_dir: Path):
+        # Arrange
+        content = "line1\r\n日本語\nline3".encode()
+        (tmp_dir / "input.txt").write_bytes(content)
+        cmd = [sys.executable, "-m", "example.cli", "transform"]
+
+        # Act
+        file = subprocess.run(
+            [*cmd, "input.txt"], cwd=tmp_dir, capture_output=True, text=True, timeout=10
+        )
+        piped = subprocess.run(
+            [*cmd, "-"], cwd=tmp_dir, input=content, capture_output=True, timeout=10
+        )
+
+        # Assert
+        assert piped.returncode == 0, piped.stderr
+        expected = (tmp_dir / "tmp" / "input.txt").read_bytes()
+        assert piped.stdout.split(b"\n", 1)[1] == expected.split(b"\n", 1)[1]
+        # 実行結果の JSON は標準エラー出力の最終行に出力する
+        result_line = piped.stderr.decode().strip().splitlines()[-1]
+        assert json.loads(result_line) == json.loads(file.stdout)
+        assert not (tmp_dir / "tmp" / "-").exists()
+
+    def test_transform_異常系_stdoutは複数ファイルの指定で使えない(self, tmp_dir: Path):
+        # Arrange
+        (tmp_dir / "a.txt").write_text("a", encoding="utf-8")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(tmp_dir), "--stdout"]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 2
+        assert "--stdout" in result.stderr
+
+    def test_transform_異常系_shardは複数ファイルの指定で使えない(self, tmp_dir: Path):
+        # Arrange
+        (tmp_dir / "a.txt").write_text("a", encoding="utf-8")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(tmp_dir), "--shard"]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 2
+        assert "--shard" in result.stderr
+
+    def test_transform_正常系_profileオプションでログファイルの隣に計測結果を出力する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "--profile", "transform", str(input_file)]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 0
+        (log_file,) = (tmp_dir / "tmp" / "logs").glob("transform_*.log")
+        stats_file = log_file.with_suffix(".pstats")
+        summary_file = log_file.with_suffix(".profile.txt")
+        assert stats_file.exists()
+        assert "function calls" in summary_file.read_text(encoding="utf-8")
+        assert f"Profile summary: {summary_file}" in log_file.read_text(encoding="utf-8")
+
+    def test_transform_正常系_statsオプションで段階ごとの所要時間と処理量を出力する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("line1\nline2\n", encoding="utf-8")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(input_file), "--stats"]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert (output["src_length"], output["dst_length"]) == (2, 3)
+        assert output["stats"]["src_bytes"] == 12
+        assert set(output["stats"]) >= {"read_seconds", "transform_seconds", "write_seconds"}
+
+    def test_transform_正常系_bytesオプションで不正なバイトを含むファイルもそのまま変換する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_bytes(b"line1\r\n\xff\xfe broken\n")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(input_file), "--bytes"]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert (output["src_length"], output["dst_length"]) == (2, 3)
+        content = (tmp_dir / "tmp" / "input.txt").read_bytes()
+        assert content.endswith(b"\n1: line1\n2: \xff\xfe broken")
+
+    def test_transform_正常系_newline_preserveで入力の行末を残して変換する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_bytes(b"line1\r\nline2\rstill2\r\n")
+
+        # Act
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(input_file)]
+        result = subprocess.run(
+            [*cmd, "--newline", "preserve"], cwd=tmp_dir, capture_output=True, text=True, timeout=10
+        )
+
+        # Assert
+        assert result.returncode == 0
+        output = json.loads(result.stdout)
+        assert (output["src_length"], output["dst_length"]) == (2, 3)
+        content = (tmp_dir / "tmp" / "input.txt").read_bytes()
+        assert content.endswith(b"\r\n1: line1\r\n2: line2\rstill2\r\n")
+
+    def test_transform_正常系_LOG_MAX_FILES指定時は過去の実行のログファイルを削除する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+        env = {**os.environ, "EXAMPLE_LOG_MAX_FILES": "1"}
+        cmd = [sys.executable, "-m", "example.cli", "transform", str(input_file)]
+
+        # Act
+        results = [
+            subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10, env=env)
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert [r.returncode for r in results] == [0, 0]
+        (log_file,) = (tmp_dir / "tmp" / "logs").iterdir()
+        assert f"Log file: {log_file}" in results[1].stderr
+
+    def test_transform_正常系_startup_timingオプションでフェーズごとの所要時間を表示する(
+        self, tmp_dir: Path
+    ):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+
+        # Act
+        cmd = [
+            sys.executable,
+            "-m",
+            "example.cli",
+            "--startup-timing",
+            "--log-level",
+            "ERROR",
+            "transform",
+            str(input_file),
+        ]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {"src_length": 1, "dst_length": 2}
+        phases = [line.split()[0] for line in result.stderr.splitlines()]
+        assert phases == ["phase", "import", "config", "logger", "provider", "total"]
+
+    def test_help_正常系_重い依存ライブラリをimportしない(self, tmp_dir: Path):
+        # Arrange
+        heavy = ["pydantic", "pydantic_settings", "colorlog", "zoneinfo", "asyncio", "cProfile"]
+        script = (
+            "import sys\n"
+            "from example.cli import app\n"
+            "try:\n"
+            "    app(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            f"print(','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)\n"
+        )
+
+        # Act
+        cmd = [sys.executable, "-c", script]
+        result = subprocess.run(cmd, cwd=tmp_dir, capture_output=True, text=True, timeout=10)
+
+        # Assert
+        assert result.returncode == 0
+        assert "transform" in result.stdout
+        assert result.stderr.strip() == ""
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix ドメインソケットは Unix 系のみ")
+    def test_serve_正常系_clientの実行結果が直接実行と一致する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+        socket_dir = tempfile.TemporaryDirectory(
+            prefix="serve"
+        )  # ソケットのパス長制限のため短くする
+        socket_path = Path(socket_dir.name) / "example.sock"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "example.cli", "serve", "--socket", str(socket_path)],
+            cwd=tmp_dir,
+            stderr=subprocess.DEVNULL,
+        )
+        client = [sys.executable, "-m", "example.client", "--socket", str(socket_path)]
+
+        try:
+            while not socket_path.exists():
+                assert server.poll() is None
+                time.sleep(0.05)
+
+            # Act
+            served = subprocess.run(
+                [*client, "transform", "input.txt"],
+                cwd=tmp_dir,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            failed = subprocess.run(
+                [*client, "transform", "missing.txt"],
+                cwd=tmp_dir,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+            socket_dir.cleanup()
+        direct = subprocess.run(
+            [sys.executable, "-m", "example.cli", "transform", "input.txt"],
+            cwd=tmp_dir,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+
+        # Assert
+        assert served.returncode == 0
+        assert json.loads(served.stdout) == json.loads(direct.stdout)
+        assert failed.returncode == 1
+        assert "missing.txt" in failed.stderr
+        assert server.returncode == 0
+        assert not socket_path.exists()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix ドメインソケットは Unix 系のみ")
+    def test_serve_異常系_clientからは標準入力と標準出力を使えない(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+        socket_dir = tempfile.TemporaryDirectory(
+            prefix="serve"
+        )  # ソケットのパス長制限のため短くする
+        socket_path = Path(socket_dir.name) / "example.sock"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "example.cli", "serve", "--socket", str(socket_path)],
+            cwd=tmp_dir,
+            stdin=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        client = [sys.executable, "-m", "example.client", "--socket", str(socket_path)]
+
+        try:
+            while not socket_path.exists():
+                assert server.poll() is None
+                time.sleep(0.05)
+
+            # Act
+            to_stdout = subprocess.run(
+                [*client, "transform", "input.txt", "--stdout"],
+                cwd=tmp_dir,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+            from_stdin = subprocess.run(
+                [*client, "transform", "-"],
+                cwd=tmp_dir,
+                input="hi\n",
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+            socket_dir.cleanup()
+
+        # Assert
+        for result in (to_stdout, from_stdin):
+            assert result.returncode == 2
+            assert result.stdout == ""
+            assert "example-client" in result.stderr
+        assert not (tmp_dir / "tmp" / "input.txt").exists()
+
+    def test_client_正常系_サーバーが起動していなければ直接実行する(self, tmp_dir: Path):
+        # Arrange
+        input_file = tmp_dir / "input.txt"
+        input_file.write_text("test line", encoding="utf-8")
+        socket_dir = tempfile.TemporaryDirectory(
+            prefix="serve"
+        )  # ソケットのパス長制限のため短くする
+        socket_path = Path(socket_dir.name) / "missing.sock"
+
+        # Act
+        cmd = [sys.executable, "-m", "example.client", "--socket", str(socket_path)]
+        with socket_dir:
+            result = subprocess.run(
+                [*cmd, "transform", "input.txt"],
+                cwd=tmp_dir,
+                capture_output=True,
+                text=True,
+                timeout=10,
+            )
+
+        # Assert
+        assert result.returncode == 0
+        assert json.loads(result.stdout) == {"src_length": 1, "dst_length": 2}
+        assert (tmp_dir / "tmp" / "input.txt").exists()
+
     # このテストは main() の ErrorHandler が例外を捕捉して sys.exit(1) に変換する経路を検証する。
     # 未知のサブコマンドでは Typer が先に exit code 2 で終了し ErrorHandler に到達しないため、
     # 実在するサブコマンド経由で例外を発生させる必要がある。
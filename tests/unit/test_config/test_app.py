@@ -1,3 +1,4 @@
+from datetime import timedelta
 from pathlib import Path
 
 import pytest
@@ -31,3 +32,83 @@ class TestAppConfig:
         monkeypatch.delenv("EXAMPLE_TMP_DIR")
         monkeypatch.chdir(tmp_path)
         assert AppConfig.build(EnvVarConfig()).tmp_dir == tmp_path / "tmp"
+
+    def test_build_正常系_EXAMPLE_READER_BACKENDの値を引き継ぐ(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_READER_BACKEND", "mmap")
+
+        # Act
+        result = AppConfig.build(EnvVarConfig())
+
+        # Assert
+        assert result.reader_backend == "mmap"
+
+    def test_build_正常系_EXAMPLE_WRITER_BACKENDの値を引き継ぐ(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_WRITER_BACKEND", "memory")
+
+        # Act
+        result = AppConfig.build(EnvVarConfig())
+
+        # Assert
+        assert result.writer_backend == "memory"
+
+    def test_build_正常系_EXAMPLE_LOG_LEVELSの値を引き継ぐ(self, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_LOG_LEVELS", '{"example.transform": "ERROR"}')
+
+        # Act
+        result = AppConfig.build(EnvVarConfig())
+
+        # Assert
+        assert result.log_levels == {"example.transform": "ERROR"}
+
+    def test_build_正常系_EXAMPLE_WORKERS未設定時は使用可能なCPU数を使う(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.delenv("EXAMPLE_WORKERS", raising=False)
+        monkeypatch.setattr("os.process_cpu_count", lambda: 3)
+
+        # Act
+        result = AppConfig.build(EnvVarConfig())
+
+        # Assert
+        assert result.workers == 3
+
+    def test_build_正常系_性能設定の値を引き継ぐ(self, monkeypatch: pytest.MonkeyPatch):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_WORKERS", "8")
+        monkeypatch.setenv("EXAMPLE_IO_BUFFER_SIZE", "64KiB")
+        monkeypatch.setenv("EXAMPLE_READ_CHUNK_SIZE", "8KiB")
+        monkeypatch.setenv("EXAMPLE_MEMORY_BUDGET", "256MiB")
+        monkeypatch.setenv("EXAMPLE_CACHE_DIR", "/var/cache/example")
+        monkeypatch.setenv("EXAMPLE_DURABILITY", "fsync")
+        monkeypatch.setenv("EXAMPLE_OUTPUT_COMPRESSION", "xz")
+        monkeypatch.setenv("EXAMPLE_COMPRESSION_LEVEL", "6")
+        monkeypatch.setenv("EXAMPLE_LOG_QUEUE_SIZE", "10000")
+        monkeypatch.setenv("EXAMPLE_LOG_MAX_BYTES", "64MiB")
+        monkeypatch.setenv("EXAMPLE_LOG_BACKUP_COUNT", "3")
+        monkeypatch.setenv("EXAMPLE_LOG_COMPRESS", "true")
+        monkeypatch.setenv("EXAMPLE_LOG_MAX_FILES", "20")
+        monkeypatch.setenv("EXAMPLE_LOG_MAX_AGE", "P7D")
+
+        # Act
+        result = AppConfig.build(EnvVarConfig())
+
+        # Assert
+        assert result.workers == 8
+        assert result.io_buffer_size == 64 * 1024
+        assert result.read_chunk_size == 8 * 1024
+        assert result.memory_budget == 256 * 1024 * 1024
+        assert result.cache_dir == Path("/var/cache/example")
+        assert result.durability == "fsync"
+        assert (result.output_compression, result.compression_level) == ("xz", 6)
+        assert result.log_queue_size == 10000
+        assert (result.log_max_bytes, result.log_backup_count) == (64 * 1024 * 1024, 3)
+        assert result.log_compress is True
+        assert (result.log_max_files, result.log_max_age) == (20, timedelta(days=7))
@@ -43,6 +43,28 @@ class TestEnvVarConfig:
         with pytest.raises(ValidationError):
             EnvVarConfig()
 
+    def test_log_levels_正常系_JSONで指定したロガーごとのレベルを返す(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_LOG_LEVELS", '{"example.transform": "WARNING"}')
+
+        # Act
+        result = EnvVarConfig()
+
+        # Assert
+        assert result.log_levels == {"example.transform": "WARNING"}
+
+    def test_log_levels_異常系_不正なレベルはValidationErrorを送出(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_LOG_LEVELS", '{"example.transform": "INVALID"}')
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            EnvVarConfig()
+
     def test_tmp_dir_正常系_環境変数未設定時はNoneがデフォルト(
         self, monkeypatch: pytest.MonkeyPatch
     ):
@@ -66,3 +88,77 @@ class TestEnvVarConfig:
 
         # Assert
         assert result.tmp_dir == Path("/tmp/example")
+
+    def test_reader_backend_正常系_環境変数未設定時はstandardがデフォルト(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.delenv("EXAMPLE_READER_BACKEND", raising=False)
+
+        # Act
+        result = EnvVarConfig()
+
+        # Assert
+        assert result.reader_backend == "standard"
+
+    def test_reader_backend_異常系_不正な値はValidationErrorを送出(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_READER_BACKEND", "INVALID")
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            EnvVarConfig()
+
+    def test_writer_backend_正常系_環境変数未設定時はfileがデフォルト(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.delenv("EXAMPLE_WRITER_BACKEND", raising=False)
+
+        # Act
+        result = EnvVarConfig()
+
+        # Assert
+        assert result.writer_backend == "file"
+
+    def test_io_buffer_size_正常系_単位付きの表記をバイト数に変換する(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setenv("EXAMPLE_IO_BUFFER_SIZE", "4MiB")
+        monkeypatch.setenv("EXAMPLE_MEMORY_BUDGET", "1GB")
+
+        # Act
+        result = EnvVarConfig()
+
+        # Assert
+        assert result.io_buffer_size == 4 * 1024 * 1024
+        assert result.memory_budget == 1000 * 1000 * 1000
+
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("EXAMPLE_WORKERS", "0"),
+            ("EXAMPLE_IO_BUFFER_SIZE", "1KiB"),
+            ("EXAMPLE_READ_CHUNK_SIZE", "large"),
+            ("EXAMPLE_DURABILITY", "INVALID"),
+            ("EXAMPLE_OUTPUT_COMPRESSION", "zip"),
+            ("EXAMPLE_COMPRESSION_LEVEL", "10"),
+            ("EXAMPLE_LOG_QUEUE_SIZE", "0"),
+            ("EXAMPLE_LOG_MAX_BYTES", "0"),
+            ("EXAMPLE_LOG_BACKUP_COUNT", "0"),
+            ("EXAMPLE_LOG_MAX_FILES", "0"),
+            ("EXAMPLE_LOG_MAX_AGE", "-1"),
+        ],
+    )
+    def test_performance_settings_異常系_不正な値はValidationErrorを送出(
+        self, monkeypatch: pytest.MonkeyPatch, name: str, value: str
+    ):
+        # Arrange
+        monkeypatch.setenv(name, value)
+
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            EnvVarConfig()
@@ -0,0 +1,103 @@
+"""example.foundation.di.container のテスト
+
+コンポーネントの登録・解決とライフタイムの管理をテストします。
+"""
+
+import pytest
+
+from example.foundation.di import Container
+
+
+class Dependency:
+    """解決対象のコンポーネント"""
+
+
+class Dependent:
+    """Dependency に依存するコンポーネント"""
+
+    def __init__(self, dependency: Dependency):
+        self.dependency = dependency
+
+
+class TestContainer:
+    """Container クラスのテスト"""
+
+    def test_resolve_正常系_singletonは同じインスタンスを返す(self):
+        # Arrange
+        container = Container()
+        container.register(Dependency, lambda c: Dependency())
+
+        # Act
+        first = container.resolve(Dependency)
+        second = container.resolve(Dependency)
+
+        # Assert
+        assert first is second
+
+    def test_resolve_正常系_依存するコンポーネントをコンテナから注入する(self):
+        # Arrange
+        container = Container()
+        container.register(Dependency, lambda c: Dependency())
+        container.register(Dependent, lambda c: Dependent(c.resolve(Dependency)))
+
+        # Act
+        result = container.resolve(Dependent)
+
+        # Assert
+        assert result.dependency is container.resolve(Dependency)
+
+    def test_resolve_正常系_runスコープは範囲内で同じインスタンスを共有し範囲ごとに作り直す(self):
+        # Arrange
+        container = Container()
+        container.register(Dependency, lambda c: Dependency(), scope="run")
+
+        # Act
+        with container.run():
+            first = container.resolve(Dependency)
+            same_run = container.resolve(Dependency)
+        with container.run():
+            next_run = container.resolve(Dependency)
+
+        # Assert
+        assert first is same_run
+        assert first is not next_run
+
+    def test_resolve_正常系_runスコープを範囲外で解決すると毎回生成する(self):
+        # Arrange
+        container = Container()
+        container.register(Dependency, lambda c: Dependency(), scope="run")
+
+        # Act & Assert
+        assert container.resolve(Dependency) is not container.resolve(Dependency)
+
+    def test_register_正常系_登録し直すと生成済みのインスタンスを破棄する(self):
+        # Arrange
+        container = Container()
+        container.register(Dependency, lambda c: Dependency())
+        container.register(Dependent, lambda c: Dependent(c.resolve(Dependency)))
+        before = container.resolve(Dependent)
+        replacement = Dependency()
+
+        # Act
+        container.register(Dependency, lambda c: replacement)
+        after = container.resolve(Dependent)
+
+        # Assert
+        assert after is not before
+        assert after.dependency is replacement
+
+    def test_resolve_異常系_未登録のキーはLookupErrorを送出(self):
+        # Arrange
+        container = Container()
+
+        # Act & Assert
+        with pytest.raises(LookupError, match="Dependency"):
+            container.resolve(Dependency)
+
+    def test_run_異常系_入れ子で開始するとRuntimeErrorを送出(self):
+        # Arrange
+        container = Container()
+
+        # Act & Assert
+        with container.run(), pytest.raises(RuntimeError), container.run():
+            pass
@@ -0,0 +1,82 @@
+"""foundation.fs.async_text モジュールのテスト
+
+非同期ファイル読み取り・書き込みクラスをテストします。
+"""
+
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import (
+    AsyncTextFileSystemReader,
+    AsyncTextFileSystemWriter,
+    FileSystemError,
+    MmapTextFileSystemReader,
+)
+
+
+class TestAsyncTextFileSystemReader:
+    """AsyncTextFileSystemReader クラスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_read_正常系_ファイル内容を文字列で返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_bytes("line1\r\nline2\n日本語テスト".encode())
+
+        reader = AsyncTextFileSystemReader()
+
+        # Act
+        result = await reader.read(test_file)
+
+        # Assert
+        assert result == "line1\nline2\n日本語テスト"
+
+    @pytest.mark.asyncio
+    async def test_read_正常系_指定した同期版の実装へ委譲する(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_text("line1\nline2", encoding="utf-8")
+
+        reader = AsyncTextFileSystemReader(MmapTextFileSystemReader())
+
+        # Act
+        result = await reader.read(test_file)
+
+        # Assert
+        assert result == "line1\nline2"
+
+    @pytest.mark.asyncio
+    async def test_read_異常系_存在しないファイルでFileSystemError(self, tmp_path: Path):
+        # Arrange
+        reader = AsyncTextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            await reader.read(tmp_path / "存在しないファイル.txt")
+
+
+class TestAsyncTextFileSystemWriter:
+    """AsyncTextFileSystemWriter クラスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_write_正常系_存在しないディレクトリを作成して書き込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "nested" / "test.txt"
+
+        writer = AsyncTextFileSystemWriter()
+
+        # Act
+        await writer.write("Hello\n日本語", test_file)
+
+        # Assert
+        assert test_file.read_text(encoding="utf-8") == "Hello\n日本語"
+
+    @pytest.mark.asyncio
+    async def test_write_異常系_ファイルパスがディレクトリでFileSystemError(self, tmp_path: Path):
+        # Arrange
+        writer = AsyncTextFileSystemWriter()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            await writer.write("test content", tmp_path)
@@ -0,0 +1,160 @@
+"""foundation.fs.codec モジュールのテスト
+
+圧縮形式の判定と、圧縮・伸長のストリーム処理をテストします。
+"""
+
+import bz2
+import gzip
+import lzma
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs.codec import (
+    Compression,
+    OutputCompression,
+    detect_compression,
+    new_compressor,
+    open_text,
+    resolve_compression,
+    with_compression_suffix,
+)
+
+_DECOMPRESS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.decompress,
+    "bz2": bz2.decompress,
+    "xz": lzma.decompress,
+}
+
+
+class TestDetectCompression:
+    """detect_compression 関数のテスト"""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            (gzip.compress(b"line1\n"), "gzip"),
+            (bz2.compress(b"line1\n"), "bz2"),
+            (bz2.compress(b""), "bz2"),
+            (lzma.compress(b"line1\n"), "xz"),
+        ],
+    )
+    def test_detect_compression_正常系_マジックバイトから圧縮形式を判定する(
+        self, content: bytes, expected: Compression
+    ):
+        # Act
+        result = detect_compression(content)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize("content", [b"", b"line1\n", b"BZh9 is plain text\n"])
+    def test_detect_compression_正常系_テキストファイルはNoneを返す(self, content: bytes):
+        # Act
+        result = detect_compression(content)
+
+        # Assert
+        assert result is None
+
+
+class TestResolveCompression:
+    """resolve_compression 関数のテスト"""
+
+    @pytest.mark.parametrize(
+        ("file_name", "expected"),
+        [("a.txt.gz", "gzip"), ("a.txt.bz2", "bz2"), ("a.txt.XZ", "xz"), ("a.txt", None)],
+    )
+    def test_resolve_compression_正常系_autoは拡張子から判定する(
+        self, file_name: str, expected: Compression | None
+    ):
+        # Act
+        result = resolve_compression("auto", Path(file_name))
+
+        # Assert
+        assert result == expected
+
+    def test_resolve_compression_正常系_明示した指定は拡張子より優先する(self):
+        # Act & Assert
+        assert resolve_compression("none", Path("a.txt.gz")) is None
+        assert resolve_compression("xz", Path("a.txt")) == "xz"
+
+
+class TestWithCompressionSuffix:
+    """with_compression_suffix 関数のテスト"""
+
+    @pytest.mark.parametrize(
+        ("output_compression", "file_name", "expected"),
+        [
+            ("auto", "a.txt.gz", "a.txt.gz"),
+            ("none", "a.txt.gz", "a.txt"),
+            ("none", "a.txt", "a.txt"),
+            ("gzip", "a.txt", "a.txt.gz"),
+            ("xz", "a.txt.GZ", "a.txt.xz"),
+            ("bz2", "a.txt.bz2", "a.txt.bz2"),
+        ],
+    )
+    def test_with_compression_suffix_正常系_拡張子を圧縮形式に合わせる(
+        self, output_compression: OutputCompression, file_name: str, expected: str
+    ):
+        # Act
+        result = with_compression_suffix(Path("out") / file_name, output_compression)
+
+        # Assert
+        assert result == Path("out") / expected
+        assert resolve_compression(output_compression, result) == resolve_compression(
+            "auto", result
+        )
+
+
+class TestNewCompressor:
+    """new_compressor 関数のテスト"""
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "xz"])
+    @pytest.mark.parametrize("level", [None, 1, 9])
+    def test_new_compressor_正常系_分割して圧縮した結果を伸長すると元に戻る(
+        self, compression: Compression, level: int | None
+    ):
+        # Arrange
+        compressor = new_compressor(compression, level)
+        blocks = [b"line1\n", "日本語\n".encode(), b"", b"line3"]
+
+        # Act
+        compressed = b"".join(compressor.compress(block) for block in blocks) + compressor.flush()
+
+        # Assert
+        assert detect_compression(compressed) == compression
+        assert _DECOMPRESS[compression](compressed) == b"".join(blocks)
+
+    def test_new_compressor_正常系_gzipは同じ入力から同じ出力を生成する(self):
+        # Act
+        results = [
+            new_compressor("gzip").compress(b"line1\n") + new_compressor("gzip").flush()
+            for _ in range(2)
+        ]
+
+        # Assert
+        assert results[0] == results[1]
+
+
+class TestOpenText:
+    """open_text 関数のテスト"""
+
+    @pytest.mark.parametrize("compression", ["gzip", "bz2", "xz", None])
+    def test_open_text_正常系_圧縮形式にかかわらず同じテキストを返す(
+        self, tmp_path: Path, compression: Compression | None
+    ):
+        # Arrange
+        content = "line1\r\n日本語\nline3".encode()
+        if compression is not None:
+            compressor = new_compressor(compression)
+            content = compressor.compress(content) + compressor.flush()
+        test_file = tmp_path / "input.bin"
+        test_file.write_bytes(content)
+
+        # Act
+        with open_text(test_file, newline="\n") as text:
+            result = text.read()
+
+        # Assert
+        assert result == "line1\r\n日本語\nline3"
@@ -0,0 +1,108 @@
+"""foundation.fs.finder モジュールのテスト
+
+ファイル探索クラスをテストします。
+"""
+
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import FileSystemError, FileSystemFinder
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    """探索対象のディレクトリツリー"""
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "docs" / "b.log").write_text("b", encoding="utf-8")
+    (tmp_path / "docs" / "sub" / "c.txt").write_text("c", encoding="utf-8")
+    return tmp_path
+
+
+class TestFileSystemFinder:
+    """FileSystemFinder クラスのテスト"""
+
+    def test_find_正常系_ファイルパスはそのまま返す(self, tree: Path):
+        # Arrange
+        target = tree / "docs" / "a.txt"
+
+        # Act
+        result = FileSystemFinder().find([target])
+
+        # Assert
+        assert result == [target]
+
+    def test_find_正常系_ディレクトリは配下のファイルを再帰的に列挙する(self, tree: Path):
+        # Act
+        result = FileSystemFinder().find([tree / "docs"])
+
+        # Assert
+        assert result == [
+            tree / "docs" / "a.txt",
+            tree / "docs" / "b.log",
+            tree / "docs" / "sub" / "c.txt",
+        ]
+
+    def test_find_正常系_ディレクトリ配下の隠しディレクトリと除外ディレクトリは列挙しない(
+        self, tree: Path
+    ):
+        # Arrange
+        (tree / "docs" / ".manifest").mkdir()
+        (tree / "docs" / ".manifest" / "entry.json").write_text("{}", encoding="utf-8")
+        (tree / "docs" / "out").mkdir()
+        (tree / "docs" / "out" / "a.txt").write_text("1: a", encoding="utf-8")
+
+        # Act
+        result = FileSystemFinder().find([tree / "docs"], exclude=[tree / "docs" / "out"])
+
+        # Assert
+        assert result == [
+            tree / "docs" / "a.txt",
+            tree / "docs" / "b.log",
+            tree / "docs" / "sub" / "c.txt",
+        ]
+
+    def test_find_正常系_globパターンでも除外ディレクトリのファイルは列挙しない(self, tree: Path):
+        # Act
+        result = FileSystemFinder().find(
+            [tree / "docs" / "**" / "*.txt"], exclude=[tree / "docs" / "sub"]
+        )
+
+        # Assert
+        assert result == [tree / "docs" / "a.txt"]
+
+    def test_find_正常系_globパターンに一致するファイルを列挙する(self, tree: Path):
+        # Act
+        result = FileSystemFinder().find([tree / "docs" / "**" / "*.txt"])
+
+        # Assert
+        assert result == [tree / "docs" / "a.txt", tree / "docs" / "sub" / "c.txt"]
+
+    def test_find_正常系_相対globパターンはカレントディレクトリ基準で列挙する(
+        self, tree: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.chdir(tree)
+
+        # Act
+        result = FileSystemFinder().find([Path("docs/*.log")])
+
+        # Assert
+        assert result == [Path("docs/b.log")]
+
+    def test_find_正常系_重複を除いて指定順を保持する(self, tree: Path):
+        # Arrange
+        a = tree / "docs" / "a.txt"
+        c = tree / "docs" / "sub" / "c.txt"
+
+        # Act
+        result = FileSystemFinder().find([c, tree / "docs" / "*.txt", a])
+
+        # Assert
+        assert result == [c, a]
+
+    def test_find_異常系_一致するファイルがない場合はFileSystemError(self, tree: Path):
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            FileSystemFinder().find([tree / "docs" / "*.md"])
@@ -0,0 +1,60 @@
+"""foundation.fs.inspector モジュールのテスト
+
+ファイル検査クラスをテストします。
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import FileSystemError, FileSystemInspector
+from example.protocol.fs import FileStamp
+
+
+class TestFileSystemInspector:
+    """FileSystemInspector クラスのテスト"""
+
+    def test_stamp_正常系_サイズと更新日時を返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"hello")
+
+        inspector = FileSystemInspector()
+
+        # Act
+        result = inspector.stamp(test_file)
+
+        # Assert
+        assert result == FileStamp(size=5, mtime_ns=test_file.stat().st_mtime_ns)
+
+    def test_stamp_正常系_存在しないファイルでNoneを返す(self, tmp_path: Path):
+        # Arrange
+        inspector = FileSystemInspector()
+
+        # Act
+        result = inspector.stamp(tmp_path / "missing.txt")
+
+        # Assert
+        assert result is None
+
+    def test_digest_正常系_内容のSHA256ハッシュを返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes("line1\n日本語".encode())
+
+        inspector = FileSystemInspector()
+
+        # Act
+        result = inspector.digest(test_file)
+
+        # Assert
+        assert result == hashlib.sha256("line1\n日本語".encode()).hexdigest()
+
+    def test_digest_異常系_存在しないファイルでFileSystemError(self, tmp_path: Path):
+        # Arrange
+        inspector = FileSystemInspector()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            inspector.digest(tmp_path / "missing.txt")
@@ -0,0 +1,208 @@
+"""foundation.fs.mapped モジュールのテスト
+
+メモリマップによるファイル読み取りクラスをテストします。
+"""
+
+import bz2
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import (
+    ByteRangeFileSystemReader,
+    FileSystemError,
+    MmapTextFileSystemReader,
+    TextFileSystemReader,
+)
+from example.protocol.fs import ByteRange
+
+
+class TestMmapTextFileSystemReader:
+    """MmapTextFileSystemReader クラスのテスト"""
+
+    def test_read_正常系_TextFileSystemReaderと同じ文字列を返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_bytes("line1\r\nline2\rline3\n日本語テスト".encode())
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = reader.read(test_file)
+
+        # Assert
+        assert result == "line1\nline2\nline3\n日本語テスト"
+        assert result == TextFileSystemReader().read(test_file)
+
+    def test_read_正常系_newline指定時は改行コードを変換せずに返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"line1\r\nline2\rline3\n")
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = reader.read(test_file, newline="")
+
+        # Assert
+        assert result == "line1\r\nline2\rline3\n"
+        assert result == TextFileSystemReader().read(test_file, newline="")
+
+    def test_read_正常系_空ファイルで空文字列返却(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "empty.txt"
+        test_file.write_text("", encoding="utf-8")
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = reader.read(test_file)
+
+        # Assert
+        assert result == ""
+
+    def test_read_異常系_存在しないファイルでFileSystemError(self):
+        # Arrange
+        reader = MmapTextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="ファイルが見つかりません"):
+            reader.read(Path("存在しないファイル.txt"))
+
+    def test_read_異常系_エンコーディング不正でFileSystemError(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "invalid_encoding.txt"
+        test_file.write_bytes(b"valid\n\xff\xfe")
+
+        reader = MmapTextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            reader.read(test_file)
+
+    def test_read_lines_正常系_改行コードを変換せずに行単位で返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_lines.txt"
+        test_file.write_bytes("line1\r\nline2\rline3\n日本語".encode())
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["line1\r\n", "line2\rline3\n", "日本語"]
+        assert result == list(TextFileSystemReader().read_lines(test_file))
+
+    def test_read_lines_正常系_分割単位をまたぐ行も同じ結果を返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_window.txt"
+        test_file.write_bytes("a\n日本語の長い行\n\nbc\r\nd".encode())
+        reader = MmapTextFileSystemReader(window_size=4)
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["a\n", "日本語の長い行\n", "\n", "bc\r\n", "d"]
+
+    def test_read_lines_正常系_空ファイルで行を返さない(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "empty.txt"
+        test_file.write_text("", encoding="utf-8")
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == []
+
+    def test_read_lines_異常系_存在しないファイルでFileSystemError(self):
+        # Arrange
+        reader = MmapTextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            list(reader.read_lines(Path("存在しないファイル.txt")))
+
+    def test_read_lines_正常系_圧縮ファイルは伸長して行単位で返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "compressed.txt.bz2"
+        test_file.write_bytes(bz2.compress("line1\r\n日本語".encode()))
+
+        reader = MmapTextFileSystemReader()
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["line1\r\n", "日本語"]
+        assert reader.read(test_file) == "line1\n日本語"
+
+
+class TestByteRangeFileSystemReader:
+    """ByteRangeFileSystemReader クラスのテスト"""
+
+    def test_split_正常系_行境界で分割しファイル全体を覆う(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_bytes(b"aa\nbbbbbb\nc\nd")
+
+        reader = ByteRangeFileSystemReader()
+
+        # Act
+        result = reader.split(test_file, 2)
+
+        # Assert
+        assert result == [ByteRange(0, 3), ByteRange(3, 10), ByteRange(10, 12), ByteRange(12, 13)]
+
+    def test_split_正常系_空ファイルは空リストを返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "empty.txt"
+        test_file.write_bytes(b"")
+
+        reader = ByteRangeFileSystemReader()
+
+        # Act
+        result = reader.split(test_file, 4)
+
+        # Assert
+        assert result == []
+
+    def test_read_range_正常系_範囲ごとの行を連結するとreadの行と一致する(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_bytes("日本語\r\nline2\rline3\x0bline4\n\n🚀".encode() * 50)
+
+        reader = ByteRangeFileSystemReader()
+
+        # Act
+        lines = [
+            line
+            for byte_range in reader.split(test_file, 16)
+            for line in reader.read_range(test_file, byte_range).splitlines()
+        ]
+
+        # Assert
+        assert lines == TextFileSystemReader().read(test_file).splitlines()
+
+    def test_split_異常系_存在しないファイルでFileSystemError(self):
+        # Arrange
+        reader = ByteRangeFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="ファイルが見つかりません"):
+            reader.split(Path("/nonexistent/file.txt"), 4)
+
+    def test_split_異常系_圧縮ファイルはFileSystemError(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "compressed.txt.bz2"
+        test_file.write_bytes(bz2.compress(b"line1\nline2"))
+
+        reader = ByteRangeFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="圧縮されたファイル"):
+            reader.split(test_file, 4)
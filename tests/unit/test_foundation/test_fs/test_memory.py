@@ -0,0 +1,47 @@
+"""foundation.fs.memory モジュールのテスト
+
+メモリ上のファイル書き込みクラスをテストします。
+"""
+
+from pathlib import Path
+
+from example.foundation.fs import MemoryTextFileSystemWriter
+
+
+class TestMemoryTextFileSystemWriter:
+    """MemoryTextFileSystemWriter クラスのテスト"""
+
+    def test_write_正常系_ファイルシステムに書き込まずに内容を保持する(self, tmp_path: Path):
+        # Arrange
+        writer = MemoryTextFileSystemWriter()
+        file_path = tmp_path / "output.txt"
+
+        # Act
+        writer.write("Hello\n", file_path)
+
+        # Assert
+        assert writer.files == {file_path: "Hello\n"}
+        assert not file_path.exists()
+
+    def test_write_chunks_正常系_チャンクを連結して保持する(self, tmp_path: Path):
+        # Arrange
+        writer = MemoryTextFileSystemWriter()
+        file_path = tmp_path / "output.txt"
+
+        # Act
+        writer.write_chunks(iter(["1: a\n", "2: b\n"]), file_path)
+
+        # Assert
+        assert writer.files[file_path] == "1: a\n2: b\n"
+
+    def test_write_bytes_正常系_テキストとは別にバイト列を保持する(self, tmp_path: Path):
+        # Arrange
+        writer = MemoryTextFileSystemWriter()
+        file_path = tmp_path / "output.txt"
+
+        # Act
+        writer.write_bytes(b"1: \xff\n", file_path)
+
+        # Assert
+        assert writer.blobs == {file_path: b"1: \xff\n"}
+        assert writer.files == {}
@@ -0,0 +1,119 @@
+"""foundation.fs.stdio モジュールのテスト
+
+標準入力・標準出力による読み書きクラスをテストします。
+"""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import (
+    FileSystemError,
+    StdinTextFileSystemReader,
+    StdoutTextFileSystemWriter,
+    TextFileSystemReader,
+)
+
+
+class TestStdinTextFileSystemReader:
+    """StdinTextFileSystemReader クラスのテスト"""
+
+    def test_read_正常系_ハイフンは標準入力をTextFileSystemReaderと同じ文字列で返す(
+        self, tmp_path: Path
+    ):
+        # Arrange
+        content = "line1\r\nline2\rline3\n日本語".encode()
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_bytes(content)
+
+        reader = StdinTextFileSystemReader(TextFileSystemReader(), stdin=io.BytesIO(content))
+
+        # Act
+        result = reader.read(Path("-"))
+
+        # Assert
+        assert result == TextFileSystemReader().read(test_file)
+
+    def test_read_lines_正常系_ハイフンは標準入力を改行コードを変換せずに行単位で返す(self):
+        # Arrange
+        stdin = io.BytesIO("line1\r\nline2\rline3\n日本語".encode())
+        reader = StdinTextFileSystemReader(TextFileSystemReader(), stdin=stdin)
+
+        # Act
+        result = list(reader.read_lines(Path("-")))
+
+        # Assert
+        assert result == ["line1\r\n", "line2\rline3\n", "日本語"]
+        assert not stdin.closed
+
+    def test_read_正常系_ハイフン以外のパスは委譲先で読み込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_reader.txt"
+        test_file.write_text("file content", encoding="utf-8")
+
+        reader = StdinTextFileSystemReader(TextFileSystemReader(), stdin=io.BytesIO(b"stdin"))
+
+        # Act
+        result = reader.read(test_file)
+
+        # Assert
+        assert result == "file content"
+
+    def test_read_lines_異常系_エンコーディング不正でFileSystemError(self):
+        # Arrange
+        reader = StdinTextFileSystemReader(
+            TextFileSystemReader(), stdin=io.BytesIO(b"line1\n\xff\xfe")
+        )
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="ファイル読み込み中にエラーが発生しました: -"):
+            list(reader.read_lines(Path("-")))
+
+
+class TestStdoutTextFileSystemWriter:
+    """StdoutTextFileSystemWriter クラスのテスト"""
+
+    def test_write_chunks_正常系_チャンクを順に標準出力へ書き込む(self):
+        # Arrange
+        stdout = io.BytesIO()
+        writer = StdoutTextFileSystemWriter(buffer_size=4, stdout=stdout)
+
+        # Act
+        writer.write_chunks(iter(["line1\n", "日本語\n", "", "line3"]), Path("ignored.txt"))
+
+        # Assert
+        assert stdout.getvalue() == "line1\n日本語\nline3".encode()
+
+    def test_write_正常系_書き込み先のファイルを作成しない(self, tmp_path: Path):
+        # Arrange
+        stdout = io.BytesIO()
+        writer = StdoutTextFileSystemWriter(stdout=stdout)
+
+        # Act
+        writer.write("line1", tmp_path / "output.txt")
+
+        # Assert
+        assert stdout.getvalue() == b"line1"
+        assert not (tmp_path / "output.txt").exists()
+
+    def test_write_異常系_標準出力が閉じている場合はFileSystemError(self):
+        # Arrange
+        stdout = io.BytesIO()
+        stdout.close()
+        writer = StdoutTextFileSystemWriter(stdout=stdout)
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="標準出力"):
+            writer.write("line1", Path("ignored.txt"))
+
+    def test_write_bytes_正常系_バイト列をそのまま標準出力へ書き込む(self):
+        # Arrange
+        stdout = io.BytesIO()
+        writer = StdoutTextFileSystemWriter(stdout=stdout)
+
+        # Act
+        writer.write_bytes(b"line1\r\n\xff", Path("ignored.txt"))
+
+        # Assert
+        assert stdout.getvalue() == b"line1\r\n\xff"
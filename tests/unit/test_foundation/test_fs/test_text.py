@@ -3,13 +3,17 @@
 ファイル読み取り・書き込み専用クラスをテストします。
 """
 
+import gzip
+import lzma
 import os
+import stat
 from pathlib import Path
 
 import pytest
 
 from example.foundation.fs import (
     FileSystemError,
+    OffsetFileSystemWriter,
     TextFileSystemReader,
     TextFileSystemWriter,
 )
@@ -35,6 +39,19 @@ line2
         expected = "line1\nline2\n日本語テスト"
         assert result == expected
 
+    def test_read_正常系_newline指定時は改行コードを変換せずに返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "crlf.txt"
+        test_file.write_bytes(b"line1\r\nline2\rline3\n")
+
+        reader = TextFileSystemReader()
+
+        # Act
+        result = reader.read(test_file, newline="")
+
+        # Assert
+        assert result == "line1\r\nline2\rline3\n"
+
     def test_read_正常系_空ファイルで空文字列返却(self, tmp_path: Path):
         # Arrange
         test_file = tmp_path / "empty.txt"
@@ -89,6 +106,93 @@ line2
         with pytest.raises(FileSystemError):
             reader.read(test_file)  # UTF-8で読み込もうとして失敗
 
+    def test_read_lines_正常系_改行コードを変換せずに行単位で返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_lines.txt"
+        test_file.write_bytes("line1\r\nline2\rline3\n日本語".encode())
+
+        reader = TextFileSystemReader()
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["line1\r\n", "line2\rline3\n", "日本語"]
+
+    def test_read_lines_正常系_読み込み単位より長い行も同じ結果を返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "test_chunk.txt"
+        content = "a\n" + "日本語の長い行" * 10 + "\n\nb"
+        test_file.write_text(content, encoding="utf-8")
+
+        reader = TextFileSystemReader(chunk_size=4)
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["a\n", "日本語の長い行" * 10 + "\n", "\n", "b"]
+
+    def test_read_正常系_圧縮ファイルを伸長して返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "compressed.txt.gz"
+        test_file.write_bytes(gzip.compress("line1\r\n日本語".encode()))
+
+        reader = TextFileSystemReader()
+
+        # Act
+        result = reader.read(test_file)
+
+        # Assert
+        assert result == "line1\n日本語"
+
+    def test_read_lines_正常系_圧縮ファイルは拡張子によらず伸長して返す(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "compressed.txt"
+        test_file.write_bytes(lzma.compress("line1\r\n日本語".encode()))
+
+        reader = TextFileSystemReader(chunk_size=4)
+
+        # Act
+        result = list(reader.read_lines(test_file))
+
+        # Assert
+        assert result == ["line1\r\n", "日本語"]
+
+    def test_read_lines_異常系_存在しないファイルでFileSystemError(self):
+        # Arrange
+        reader = TextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            list(reader.read_lines(Path("存在しないファイル.txt")))
+
+    def test_read_bytes_正常系_デコードせずに改行コードも変換せずに返す(self, tmp_path: Path):
+        # Arrange
+        content = b"line1\r\n\xff\xfe invalid\rline3"
+        test_file = tmp_path / "raw.txt"
+        test_file.write_bytes(content)
+        compressed_file = tmp_path / "raw.txt.gz"
+        compressed_file.write_bytes(gzip.compress(content))
+
+        reader = TextFileSystemReader()
+
+        # Act
+        result = reader.read_bytes(test_file)
+        decompressed = reader.read_bytes(compressed_file)
+
+        # Assert
+        assert result == content
+        assert decompressed == content
+
+    def test_read_bytes_異常系_存在しないファイルでFileSystemError(self):
+        # Arrange
+        reader = TextFileSystemReader()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            reader.read_bytes(Path("存在しないファイル.txt"))
+
 
 class TestTextFileSystemWriter:
     """TextFileSystemWriter クラスのテスト"""
@@ -243,3 +347,247 @@ class TestTextFileSystemWriter:
         # Act & Assert
         with pytest.raises(FileSystemError):
             writer.write("test content", test_file)
+
+    def test_write_chunks_正常系_チャンクを連結して書き込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "chunks.txt"
+
+        writer = TextFileSystemWriter()
+
+        # Act
+        writer.write_chunks(iter(["Hello", "\nWorld", "\n日本語"]), test_file)
+
+        # Assert
+        assert test_file.read_text(encoding="utf-8") == "Hello\nWorld\n日本語"
+
+    def test_write_chunks_異常系_チャンク生成元のFileSystemErrorはそのまま伝播する(
+        self, tmp_path: Path
+    ):
+        # Arrange
+        test_file = tmp_path / "chunks.txt"
+        error = FileSystemError(message="読み込み失敗")
+
+        def failing_chunks():
+            yield "partial"
+            raise error
+
+        writer = TextFileSystemWriter()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError) as exc_info:
+            writer.write_chunks(failing_chunks(), test_file)
+        assert exc_info.value is error
+        assert list(tmp_path.iterdir()) == []
+
+    def test_write_chunks_異常系_失敗時は既存ファイルの内容を残し一時ファイルを削除する(
+        self, tmp_path: Path
+    ):
+        # Arrange
+        test_file = tmp_path / "existing.txt"
+        test_file.write_text("original content", encoding="utf-8")
+
+        def failing_chunks():
+            yield "partial"
+            raise OSError("書き込み途中の失敗")
+
+        writer = TextFileSystemWriter()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            writer.write_chunks(failing_chunks(), test_file)
+        assert test_file.read_text(encoding="utf-8") == "original content"
+        assert list(tmp_path.iterdir()) == [test_file]
+
+    def test_write_chunks_正常系_分割書き込みでも内容が一致する(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        test_file = tmp_path / "chunks.txt"
+        content = "日本語の行\n" * 10
+        original_writev = os.writev
+
+        # 1回の書き込みを最大5バイトに制限し、途中までしか書き込まれない場合を再現する
+        def partial_writev(fd: int, buffers: list[memoryview]) -> int:
+            return original_writev(fd, [bytes(b"".join(buffers)[:5])])
+
+        monkeypatch.setattr(os, "writev", partial_writev)
+
+        writer = TextFileSystemWriter(buffer_size=4)
+
+        # Act
+        writer.write_chunks(iter([content[:7], content[7:]]), test_file)
+
+        # Assert
+        assert test_file.read_text(encoding="utf-8") == content
+
+    @pytest.mark.skipif(os.name == "nt", reason="Unix系システムでのみ有効な権限テスト")
+    def test_write_正常系_パーミッションはopenで作成した場合と同じになる(self, tmp_path: Path):
+        # Arrange
+        new_file = tmp_path / "new.txt"
+        existing_file = tmp_path / "existing.txt"
+        existing_file.write_text("old", encoding="utf-8")
+        existing_file.chmod(0o640)
+        # 通常のファイル作成（umask 適用済みの 0o666）で作成したファイルを比較対象とする
+        reference = tmp_path / "reference.txt"
+        reference.touch()
+        expected_new_mode = stat.S_IMODE(reference.stat().st_mode)
+
+        writer = TextFileSystemWriter()
+
+        # Act
+        writer.write("new", new_file)
+        writer.write("new", existing_file)
+
+        # Assert
+        assert stat.S_IMODE(new_file.stat().st_mode) == expected_new_mode
+        assert stat.S_IMODE(existing_file.stat().st_mode) == 0o640
+
+    def test_write_正常系_fsync有効時はファイルとディレクトリをfsyncする(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        test_file = tmp_path / "durable.txt"
+        synced: list[int] = []
+        original_fsync = os.fsync
+
+        def recording_fsync(fd: int) -> None:
+            synced.append(fd)
+            original_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", recording_fsync)
+
+        # Act
+        TextFileSystemWriter().write("relaxed", tmp_path / "relaxed.txt")
+        relaxed_count = len(synced)
+        TextFileSystemWriter(fsync=True).write("durable", test_file)
+
+        # Assert
+        assert relaxed_count == 0
+        assert len(synced) == 2
+        assert test_file.read_text(encoding="utf-8") == "durable"
+
+    def test_write_chunks_正常系_圧縮形式の拡張子なら圧縮して書き込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "output.txt.gz"
+        writer = TextFileSystemWriter(buffer_size=4)
+
+        # Act
+        writer.write_chunks(iter(["line1\n", "日本語\n", "", "line3"]), test_file)
+
+        # Assert
+        assert gzip.decompress(test_file.read_bytes()).decode() == "line1\n日本語\nline3"
+
+    def test_write_正常系_明示した圧縮形式と圧縮レベルで書き込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "output.txt"
+        writer = TextFileSystemWriter(compression="xz", compression_level=1)
+
+        # Act
+        writer.write("line1\n日本語", test_file)
+
+        # Assert
+        assert lzma.decompress(test_file.read_bytes()).decode() == "line1\n日本語"
+
+    def test_write_正常系_圧縮しない指定なら拡張子によらずそのまま書き込む(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "output.txt.gz"
+        writer = TextFileSystemWriter(compression="none")
+
+        # Act
+        writer.write("line1", test_file)
+
+        # Assert
+        assert test_file.read_bytes() == b"line1"
+
+    def test_write_bytes_正常系_バイト列を分割してそのまま書き込む(self, tmp_path: Path):
+        # Arrange
+        content = b"line1\r\n\xff\xfe invalid\n" * 10
+        test_file = tmp_path / "sub" / "output.txt"
+        compressed_file = tmp_path / "output.txt.gz"
+        writer = TextFileSystemWriter(buffer_size=7)
+
+        # Act
+        writer.write_bytes(content, test_file)
+        writer.write_bytes(content, compressed_file)
+
+        # Assert
+        assert test_file.read_bytes() == content
+        assert gzip.decompress(compressed_file.read_bytes()) == content
+        assert [p.name for p in test_file.parent.iterdir()] == ["output.txt"]
+
+    def test_remove_正常系_ファイルを削除し存在しなければ何もしない(self, tmp_path: Path):
+        # Arrange
+        test_file = tmp_path / "output.txt"
+        test_file.write_text("line1", encoding="utf-8")
+        writer = TextFileSystemWriter()
+
+        # Act
+        writer.remove(test_file)
+        writer.remove(test_file)
+
+        # Assert
+        assert not test_file.exists()
+
+
+class TestOffsetFileSystemWriter:
+    """OffsetFileSystemWriter クラスのテスト"""
+
+    def test_write_at_正常系_書き込み順にかかわらず指定位置に書き込む(self, tmp_path: Path):
+        # Arrange
+        file_path = tmp_path / "sub" / "output.txt"
+        writer = OffsetFileSystemWriter(buffer_size=4)
+        tmp = writer.allocate(file_path, len("header\n日本語\nlast".encode()))
+
+        # Act
+        written = [
+            writer.write_at(
+                tmp, len(b"header\n\xe6\x97\xa5\xe6\x9c\xac\xe8\xaa\x9e"), ["\nla", "st"]
+            ),
+            writer.write_at(tmp, 0, ["header"]),
+            writer.write_at(tmp, len(b"header"), ["\n日本語"]),
+        ]
+        writer.publish(tmp, file_path)
+
+        # Assert
+        assert file_path.read_text(encoding="utf-8") == "header\n日本語\nlast"
+        assert written == [5, 6, 10]
+        assert not tmp.exists()
+
+    def test_allocate_正常系_既存ファイルのパーミッションを引き継ぐ(self, tmp_path: Path):
+        # Arrange
+        file_path = tmp_path / "output.txt"
+        file_path.write_text("old", encoding="utf-8")
+        file_path.chmod(0o640)
+        writer = OffsetFileSystemWriter()
+
+        # Act
+        tmp = writer.allocate(file_path, 3)
+
+        # Assert
+        assert tmp.parent == tmp_path
+        assert tmp.stat().st_size == 3
+        assert stat.S_IMODE(tmp.stat().st_mode) == 0o640
+        assert file_path.read_text(encoding="utf-8") == "old"
+
+    def test_discard_正常系_一時ファイルを削除して書き込み先を更新しない(self, tmp_path: Path):
+        # Arrange
+        file_path = tmp_path / "output.txt"
+        file_path.write_text("old", encoding="utf-8")
+        writer = OffsetFileSystemWriter()
+        tmp = writer.allocate(file_path, 3)
+        writer.write_at(tmp, 0, ["new"])
+
+        # Act
+        writer.discard(tmp)
+
+        # Assert
+        assert not tmp.exists()
+        assert file_path.read_text(encoding="utf-8") == "old"
+
+    def test_write_at_異常系_一時ファイルが存在しない場合はFileSystemError(self, tmp_path: Path):
+        # Arrange
+        writer = OffsetFileSystemWriter()
+
+        # Act & Assert
+        with pytest.raises(FileSystemError, match="ファイル書き込み中にエラーが発生しました"):
+            writer.write_at(tmp_path / "missing.tmp", 0, ["text"])
@@ -0,0 +1,126 @@
+"""example.foundation.ipc のテスト
+
+JSON Lines サーバー・クライアントのテストを実装します。
+"""
+
+import os
+import stat
+import tempfile
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from example.foundation.ipc import IpcError, JsonLineClient, JsonLineServer
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="Unix ドメインソケットは Unix 系のみ")
+
+
+@pytest.fixture
+def socket_path() -> Iterator[Path]:
+    """ソケットのパス（Unix ドメインソケットのパス長制限のため、短いディレクトリに作成する）"""
+    with tempfile.TemporaryDirectory(prefix="ipc") as tmp_dir:
+        yield Path(tmp_dir) / "server.sock"
+
+
+def _echo(request: dict[str, Any]) -> dict[str, Any]:
+    if request.get("fail"):
+        raise RuntimeError("handler failed")
+    return {"echo": request["message"]}
+
+
+@pytest.fixture
+def server(socket_path: Path) -> Iterator[JsonLineServer]:
+    """別スレッドで起動した JsonLineServer"""
+    server = JsonLineServer(socket_path, _echo)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    client = JsonLineClient(socket_path)
+    while not client.is_listening():
+        pass
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+class TestJsonLineServer:
+    """JsonLineServer / JsonLineClient クラスのテスト"""
+
+    def test_request_正常系_ハンドラーの戻り値をレスポンスとして返す(
+        self, server: JsonLineServer, socket_path: Path
+    ):
+        # Arrange
+        client = JsonLineClient(socket_path, timeout=5)
+
+        # Act
+        response = client.request({"message": "こんにちは"})
+
+        # Assert
+        assert response == {"echo": "こんにちは"}
+
+    def test_serve_forever_正常系_ソケットは所有者のみアクセスでき終了時に削除される(
+        self, socket_path: Path
+    ):
+        # Arrange
+        server = JsonLineServer(socket_path, _echo)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        while not JsonLineClient(socket_path).is_listening():
+            pass
+
+        # Act
+        mode = stat.S_IMODE(socket_path.stat().st_mode)
+        server.shutdown()
+        thread.join()
+
+        # Assert
+        assert mode == 0o600
+        assert not socket_path.exists()
+
+    def test_serve_forever_正常系_前回のサーバーが残したソケットファイルを置き換える(
+        self, socket_path: Path
+    ):
+        # Arrange
+        socket_path.touch()
+        server = JsonLineServer(socket_path, _echo)
+        thread = threading.Thread(target=server.serve_forever)
+
+        # Act
+        thread.start()
+        while not JsonLineClient(socket_path).is_listening():
+            pass
+        response = JsonLineClient(socket_path, timeout=5).request({"message": "ok"})
+        server.shutdown()
+        thread.join()
+
+        # Assert
+        assert response == {"echo": "ok"}
+
+    def test_serve_forever_異常系_起動中のサーバーと同じパスではIpcError(
+        self, server: JsonLineServer, socket_path: Path
+    ):
+        # Act & Assert
+        with pytest.raises(IpcError, match="既に起動しています"):
+            JsonLineServer(socket_path, _echo).serve_forever()
+
+    def test_request_異常系_ハンドラーの例外で接続が閉じられるとIpcError(
+        self, server: JsonLineServer, socket_path: Path
+    ):
+        # Arrange
+        client = JsonLineClient(socket_path, timeout=5)
+
+        # Act & Assert
+        with pytest.raises(IpcError, match="レスポンスがありません"):
+            client.request({"fail": True})
+        assert client.request({"message": "next"}) == {"echo": "next"}
+
+    def test_request_異常系_サーバーが起動していなければIpcError(self, socket_path: Path):
+        # Arrange
+        client = JsonLineClient(socket_path)
+
+        # Act & Assert
+        with pytest.raises(IpcError) as exc_info:
+            client.request({"message": "hello"})
+        assert isinstance(exc_info.value.cause, FileNotFoundError)
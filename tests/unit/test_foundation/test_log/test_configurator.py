@@ -4,9 +4,16 @@
 """
 
 import logging
+import logging.handlers
+import os
+import queue
 from pathlib import Path
 
-from example.foundation.log.configurator import LogConfigurator
+import pytest
+
+from example.foundation.log import JsonFormatter, LogRotation
+from example.foundation.log.configurator import BoundedQueueHandler, LogConfigurator
+from example.foundation.log.rotation import RotatingLogFileHandler
 
 
 class TestLogConfigurator:
@@ -94,6 +101,20 @@ class TestLogConfigurator:
             for handler in pytest_handlers:
                 logger.addHandler(handler)
 
+    def test_configure_json_正常系_既定ではJsonFormatterで出力する(self):
+        """json_formatter_class を省略すると、コンソールに JsonFormatter を使う"""
+        logger = logging.getLogger()
+        pytest_handlers = logger.handlers[:]
+        for handler in pytest_handlers:
+            logger.removeHandler(handler)
+        try:
+            LogConfigurator(level="INFO").configure_json()
+
+            assert isinstance(logger.handlers[0].formatter, JsonFormatter)
+        finally:
+            for handler in pytest_handlers:
+                logger.addHandler(handler)
+
     def test_configure_json_with_custom_formatter_正常系_カスタムフォーマッターを使用(self):
         """configure_json にカスタムフォーマッタークラスを渡すと None を返す"""
         logger = logging.getLogger()
@@ -113,3 +134,150 @@ class TestLogConfigurator:
         finally:
             for handler in pytest_handlers:
                 logger.addHandler(handler)
+
+    def test_configure_json_正常系_ロガーごとのログレベルを適用する(self):
+        """logger_levels で指定したロガーにだけレベルを設定する"""
+        logger = logging.getLogger()
+        pytest_handlers = logger.handlers[:]
+        for handler in pytest_handlers:
+            logger.removeHandler(handler)
+        target = logging.getLogger("example.transform")
+        try:
+            configurator = LogConfigurator(
+                level="INFO", logger_levels={"example.transform": "warning"}
+            )
+            configurator.configure_json()
+
+            assert target.level == logging.WARNING
+            assert not logging.getLogger("example.transform.reader").isEnabledFor(logging.INFO)
+            assert logging.getLogger("example.cli").isEnabledFor(logging.INFO)
+        finally:
+            target.setLevel(logging.NOTSET)
+            for handler in pytest_handlers:
+                logger.addHandler(handler)
+
+    def test_configure_json_正常系_queue_size指定時はキューを介して出力する(self):
+        """queue_size を指定すると、ルートロガーは QueueHandler のみを持ち、close で出力し終える"""
+        logger = logging.getLogger()
+        pytest_handlers = logger.handlers[:]
+        for handler in pytest_handlers:
+            logger.removeHandler(handler)
+        records: list[str] = []
+        try:
+
+            class CollectingFormatter(logging.Formatter):
+                def format(self, record: logging.LogRecord) -> str:
+                    records.append(record.getMessage())
+                    return record.getMessage()
+
+            configurator = LogConfigurator(level="DEBUG")
+            configurator.configure_json(json_formatter_class=CollectingFormatter, queue_size=100)
+            queue_handler = logger.handlers[0]
+            for i in range(10):
+                logging.getLogger("example.test").info("message %d", i)
+            queue_handler.close()
+
+            assert len(logger.handlers) == 1
+            assert isinstance(queue_handler, BoundedQueueHandler)
+            assert records == [f"message {i}" for i in range(10)]
+        finally:
+            for handler in pytest_handlers:
+                logger.addHandler(handler)
+
+    def test_configure_plain_正常系_queue_size指定時も再初期化防止でログファイルのパスを返す(self):
+        """QueueHandler の出力先に FileHandler があれば、2回目の呼び出しでそのパスを返す"""
+        logger = logging.getLogger()
+        pytest_handlers = logger.handlers[:]
+        for handler in pytest_handlers:
+            logger.removeHandler(handler)
+        try:
+            log_path = LogConfigurator(level="INFO").configure_plain(queue_size=100)
+            log_path_2 = LogConfigurator(level="INFO").configure_plain(queue_size=100)
+
+            assert isinstance(log_path, Path)
+            assert log_path_2 == log_path
+        finally:
+            for handler in pytest_handlers:
+                logger.addHandler(handler)
+
+    def test_configure_plain_正常系_rotation指定時はローテーションし古いログファイルを削除する(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Rotation を指定すると RotatingLogFileHandler で出力し、保持数を超えた過去のログを削除する"""
+        monkeypatch.chdir(tmp_path)
+        log_dir = tmp_path / "tmp" / "logs"
+        log_dir.mkdir(parents=True)
+        previous = log_dir / "test_app_20260101_000000_1.log"
+        previous.write_text("old", encoding="utf-8")
+        logger = logging.getLogger()
+        pytest_handlers = logger.handlers[:]
+        for handler in pytest_handlers:
+            logger.removeHandler(handler)
+        try:
+            rotation = LogRotation(max_bytes=1024, backup_count=2, compress=True, max_files=1)
+            log_path = LogConfigurator(app_name="test_app", level="INFO").configure_plain(
+                rotation=rotation
+            )
+
+            assert log_path is not None
+            assert log_path.name.endswith(f"_{os.getpid()}.log")
+            assert list(log_dir.iterdir()) == [log_path]
+            (file_handler,) = (h for h in logger.handlers if isinstance(h, RotatingLogFileHandler))
+            assert (file_handler.maxBytes, file_handler.backupCount) == (1024, 2)
+            assert file_handler.compress is True
+        finally:
+            for handler in pytest_handlers:
+                logger.addHandler(handler)
+
+
+class TestBoundedQueueHandler:
+    """BoundedQueueHandler クラスのテスト"""
+
+    def test_emit_正常系_キューが満杯ならWARNING未満を破棄し件数を数える(self):
+        """満杯のキューへ INFO を積むと破棄し、close でキューの内容と破棄件数の警告を出力する"""
+        # Arrange
+        messages: list[str] = []
+        target = logging.Handler()
+        target.emit = lambda record: messages.append(record.getMessage())
+        records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+        listener = logging.handlers.QueueListener(records, target)
+        handler = BoundedQueueHandler(records, listener)
+        logger = logging.getLogger("test_bounded_queue_handler")
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        # Act（リスナーを開始する前に積むため、3件目以降はキューが満杯）
+        try:
+            for i in range(4):
+                logger.info("message %d", i)
+            listener.start()
+            handler.close()
+        finally:
+            logger.removeHandler(handler)
+            logger.propagate = True
+
+        # Assert
+        assert messages == [
+            "message 0",
+            "message 1",
+            "Dropped 2 log records: the log queue was full",
+        ]
+
+    def test_emit_正常系_メッセージを組み立てずにレコードをそのまま積む(self):
+        """呼び出し元のスレッドではフォーマットせず、msg・args を保ったレコードを積む"""
+        # Arrange
+        records: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=2)
+        listener = logging.handlers.QueueListener(records)
+        handler = BoundedQueueHandler(records, listener)
+        handler.format = lambda record: pytest.fail("formatted on the caller thread")
+        record = logging.makeLogRecord({"levelno": logging.INFO, "msg": "message %d", "args": (1,)})
+
+        # Act
+        handler.emit(record)
+
+        # Assert
+        queued = records.get_nowait()
+        assert queued is record
+        assert (queued.msg, queued.args) == ("message %d", (1,))
+        assert handler.queue is records
+        assert handler.listener is listener
@@ -3,6 +3,7 @@
 import logging
 
 import pytest
+from pytest_mock import MockerFixture
 
 from example.foundation.log.decorator import log
 
@@ -45,6 +46,53 @@ class TestLogDecorator:
         assert result == "hello"
         assert len(caplog.records) > 0
 
+    @pytest.mark.asyncio
+    async def test_log_coroutine_function_logs_awaited_result(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        @log
+        async def async_function(x: int) -> int:
+            return x * 2
+
+        with caplog.at_level(logging.INFO):
+            result = await async_function(21)
+
+        assert result == 42
+        assert caplog.records[-1].getMessage() == "async_function returned: 42"
+
+    def test_log_skips_formatting_when_info_is_disabled(
+        self, caplog: pytest.LogCaptureFixture, mocker: MockerFixture
+    ) -> None:
+        format_value = mocker.patch("example.foundation.log.decorator._format_value")
+
+        @log
+        def sample_function(x: int) -> int:
+            return x + 1
+
+        with caplog.at_level(logging.WARNING, logger=__name__):
+            result = sample_function(1)
+
+        assert result == 2
+        format_value.assert_not_called()
+        assert caplog.records == []
+
+    @pytest.mark.asyncio
+    async def test_log_coroutine_function_skips_formatting_when_info_is_disabled(
+        self, caplog: pytest.LogCaptureFixture, mocker: MockerFixture
+    ) -> None:
+        format_value = mocker.patch("example.foundation.log.decorator._format_value")
+
+        @log
+        async def async_function(x: int) -> int:
+            return x * 2
+
+        with caplog.at_level(logging.WARNING, logger=__name__):
+            result = await async_function(21)
+
+        assert result == 42
+        format_value.assert_not_called()
+        assert caplog.records == []
+
     def test_log_does_not_suppress_exception(self) -> None:
         @log
         def failing_function() -> None:
@@ -0,0 +1,102 @@
+"""example.foundation.log.formatter のテスト
+
+JSON フォーマッターのテストを実装します。
+"""
+
+import json
+import logging
+import re
+import sys
+
+from example.foundation.log import JsonFormatter
+
+
+def _record(msg: str, *args: object, **attrs: object) -> logging.LogRecord:
+    """テスト用のログレコードを生成する"""
+    record = logging.LogRecord("example.test", logging.INFO, "/src/app.py", 42, msg, args, None)
+    record.__dict__.update(attrs)
+    return record
+
+
+class TestJsonFormatter:
+    """JsonFormatter クラスのテスト"""
+
+    def test_format_正常系_固定のフィールドを1行のJSONで出力する(self):
+        # Arrange
+        formatter = JsonFormatter()
+
+        # Act
+        result = formatter.format(_record("処理件数: %d", 3))
+
+        # Assert
+        assert "\n" not in result
+        document = json.loads(result)
+        assert list(document) == ["timestamp", "level", "logger", "message", "module", "line"]
+        assert document["level"] == "INFO"
+        assert document["logger"] == "example.test"
+        assert document["message"] == "処理件数: 3"
+        assert (document["module"], document["line"]) == ("app", 42)
+        assert re.fullmatch(
+            r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}[+-]\d\d:\d\d", document["timestamp"]
+        )
+
+    def test_format_正常系_extraのフィールドを追加しJSONにできない値は文字列にする(self):
+        # Arrange
+        formatter = JsonFormatter()
+        record = _record("message", request_id="abc", elapsed=0.5, target=object())
+
+        # Act
+        document = json.loads(formatter.format(record))
+
+        # Assert
+        assert document["request_id"] == "abc"
+        assert document["elapsed"] == 0.5
+        assert document["target"].startswith("<object object")
+
+    def test_format_正常系_出力するフィールドと同じ名前のextraは接頭辞を付けて追加する(self):
+        # Arrange
+        formatter = JsonFormatter()
+        record = _record("message", level="custom", logger="other", exception="none")
+
+        # Act
+        document = json.loads(formatter.format(record))
+
+        # Assert
+        assert document["level"] == "INFO"
+        assert document["logger"] == "example.test"
+        assert "exception" not in document
+        assert document["extra_level"] == "custom"
+        assert document["extra_logger"] == "other"
+        assert document["extra_exception"] == "none"
+
+    def test_format_正常系_例外情報をexceptionに出力する(self):
+        # Arrange
+        formatter = JsonFormatter()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = _record("failed", exc_info=sys.exc_info())
+
+        # Act
+        document = json.loads(formatter.format(record))
+
+        # Assert
+        assert document["message"] == "failed"
+        assert document["exception"].startswith("Traceback")
+        assert "ValueError: boom" in document["exception"]
+
+    def test_formatTime_正常系_同じ秒のレコードはミリ秒のみ変わる(self):
+        # Arrange
+        formatter = JsonFormatter(datefmt="%Y/%m/%d %H:%M:%S")
+        first = _record("first", created=1_700_000_000.001, msecs=1.0)
+        second = _record("second", created=1_700_000_000.999, msecs=999.0)
+
+        # Act
+        first_time = formatter.formatTime(first)
+        second_time = formatter.formatTime(second)
+
+        # Assert
+        assert first_time[:19] == second_time[:19]
+        assert (first_time[19:23], second_time[19:23]) == (".001", ".999")
+        assert first_time[23:] == second_time[23:]
+        assert "/" in first_time
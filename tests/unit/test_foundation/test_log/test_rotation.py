@@ -0,0 +1,115 @@
+"""example.foundation.log.rotation のテスト
+
+ログファイルのローテーションと保持期間のテストを実装します。
+"""
+
+import gzip
+import logging
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from example.foundation.log import LogRotation
+from example.foundation.log.rotation import RotatingLogFileHandler
+
+
+def _touch(path: Path, age_seconds: float) -> Path:
+    """ファイルを作成し、更新日時を age_seconds 秒前にする"""
+    path.write_text("log", encoding="utf-8")
+    mtime = time.time() - age_seconds
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestLogRotation:
+    """LogRotation クラスのテスト"""
+
+    def test_prune_正常系_今回の実行を含めてmax_files件になるよう古い実行をまとめて削除する(
+        self, tmp_path: Path
+    ):
+        # Arrange
+        oldest = [
+            _touch(tmp_path / "app_20260101_000000.log", 300),
+            _touch(tmp_path / "app_20260101_000000.pstats", 300),
+        ]
+        older = [
+            _touch(tmp_path / "app_20260101_000100_11.log", 200),
+            _touch(tmp_path / "app_20260101_000100_11.log.1.gz", 250),
+        ]
+        newer = [_touch(tmp_path / "app_20260101_000200_12.log", 100)]
+        others = [
+            _touch(tmp_path / "other_20260101_000000.log", 300),
+            _touch(tmp_path / "app.log", 300),
+        ]
+
+        # Act
+        result = LogRotation(max_files=2).prune(tmp_path, "app")
+
+        # Assert
+        assert sorted(result) == sorted(oldest + older)
+        assert sorted(tmp_path.iterdir()) == sorted(newer + others)
+
+    def test_prune_正常系_max_ageを過ぎた実行を削除する(self, tmp_path: Path):
+        # Arrange
+        expired = _touch(tmp_path / "app_20260101_000000_10.log", 7200)
+        recent = _touch(tmp_path / "app_20260101_010000_11.log", 60)
+
+        # Act
+        result = LogRotation(max_age=timedelta(hours=1)).prune(tmp_path, "app")
+
+        # Assert
+        assert result == [expired]
+        assert list(tmp_path.iterdir()) == [recent]
+
+    def test_prune_正常系_保持する数と期間を指定しなければ削除しない(self, tmp_path: Path):
+        # Arrange
+        log_file = _touch(tmp_path / "app_20260101_000000_10.log", 10**8)
+
+        # Act
+        result = LogRotation(max_bytes=1024).prune(tmp_path, "app")
+
+        # Assert
+        assert result == []
+        assert log_file.exists()
+
+
+class TestRotatingLogFileHandler:
+    """RotatingLogFileHandler クラスのテスト"""
+
+    def _emit(self, handler: logging.Handler, count: int) -> None:
+        """1行 100 バイト程度のログを count 件出力する"""
+        for i in range(count):
+            handler.emit(logging.makeLogRecord({"msg": f"{i:03d} " + "x" * 96}))
+
+    def test_emit_正常系_サイズ上限でローテーションしbackup_count件の旧ファイルを残す(
+        self, tmp_path: Path
+    ):
+        # Arrange
+        log_file = tmp_path / "app.log"
+        handler = RotatingLogFileHandler(str(log_file), max_bytes=1000, backup_count=2)
+
+        # Act
+        self._emit(handler, 50)
+        handler.close()
+
+        # Assert
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["app.log", "app.log.1", "app.log.2"]
+        assert all(p.stat().st_size <= 1000 for p in tmp_path.iterdir())
+
+    def test_emit_正常系_compress指定時は旧ファイルをgzipで圧縮する(self, tmp_path: Path):
+        # Arrange
+        log_file = tmp_path / "app.log"
+        handler = RotatingLogFileHandler(
+            str(log_file), max_bytes=1000, backup_count=3, compress=True
+        )
+
+        # Act
+        self._emit(handler, 15)
+        handler.close()
+
+        # Assert
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["app.log", "app.log.1.gz"]
+        first = gzip.decompress((tmp_path / "app.log.1.gz").read_bytes()).decode("utf-8")
+        assert first.startswith("000 ")
+        assert (first + log_file.read_text(encoding="utf-8")).count("\n") == 15
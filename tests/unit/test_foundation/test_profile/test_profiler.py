@@ -0,0 +1,35 @@
+"""example.foundation.profile.profiler のテスト
+
+プロファイリング機能のテストを実装します。
+"""
+
+import pstats
+from pathlib import Path
+
+from example.foundation.profile import Profiler
+
+
+def _profiled_function() -> int:
+    return sum(range(100))
+
+
+class TestProfiler:
+    """Profiler クラスのテスト"""
+
+    def test_stop_正常系_計測データと要約を出力先に書き込む(self, tmp_path: Path):
+        # Arrange
+        profiler = Profiler(limit=5)
+        profiler.start()
+        _profiled_function()
+
+        # Act
+        report = profiler.stop(tmp_path / "logs" / "transform_20240101_000000")
+
+        # Assert
+        assert report.stats_path == tmp_path / "logs" / "transform_20240101_000000.pstats"
+        assert report.summary_path == tmp_path / "logs" / "transform_20240101_000000.profile.txt"
+        stats = pstats.Stats(str(report.stats_path))
+        assert "_profiled_function" in stats.get_stats_profile().func_profiles
+        summary = report.summary_path.read_text(encoding="utf-8")
+        assert "Ordered by: cumulative time" in summary
+        assert "to 5 due to restriction <5>" in summary
@@ -0,0 +1,47 @@
+"""example.foundation.profile.startup のテスト
+
+起動処理のフェーズごとの計測機能のテストを実装します。
+"""
+
+from pytest_mock import MockerFixture
+
+from example.foundation.profile import StartupPhase, StartupTimer
+
+
+class TestStartupTimer:
+    """StartupTimer クラスのテスト"""
+
+    def test_mark_正常系_直前の区切りからの経過時間をフェーズとして記録する(
+        self, mocker: MockerFixture
+    ):
+        # Arrange
+        perf_counter = mocker.patch("example.foundation.profile.startup.perf_counter")
+        perf_counter.side_effect = [10.0, 10.5, 10.75]
+        timer = StartupTimer()
+
+        # Act
+        timer.mark("config")
+        timer.mark("logger")
+
+        # Assert
+        assert timer.phases == [
+            StartupPhase(name="config", seconds=0.5),
+            StartupPhase(name="logger", seconds=0.25),
+        ]
+
+    def test_summary_正常系_フェーズごとの所要時間と合計をミリ秒で出力する(self):
+        # Arrange
+        timer = StartupTimer()
+        timer.add("import", 0.08)
+        timer.add("config", 0.0125)
+
+        # Act
+        summary = timer.summary()
+
+        # Assert
+        assert summary.splitlines() == [
+            "phase         ms",
+            "import      80.0",
+            "config      12.5",
+            "total       92.5",
+        ]
@@ -1,5 +1,11 @@
+import asyncio
+import io
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
 
+from example.foundation.fs import FileSystemError
+from example.protocol.fs import ByteRange, FileStamp
+
 
 class InMemoryFsReader:
     """TextFileSystemReaderProtocol の InMemory 実装"""
@@ -7,10 +13,26 @@ class InMemoryFsReader:
     def __init__(self, content: str = ""):
         self.content = content
         self.read_path: Path | None = None
+        self.streamed = False
 
-    def read(self, file_path: Path) -> str:
+    def read(self, file_path: Path, newline: str | None = None) -> str:
         self.read_path = file_path
-        return self.content
+        return io.StringIO(self.content, newline=newline).read()
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        self.read_path = file_path
+        self.streamed = True
+        return iter(io.StringIO(self.content, newline="\n"))
+
+
+class FailingFsReader:
+    """TextFileSystemReaderProtocol の常に失敗する実装"""
+
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        raise FileSystemError(message=f"読み込み失敗: {file_path}")
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        raise FileSystemError(message=f"読み込み失敗: {file_path}")
 
 
 class InMemoryFsWriter:
@@ -19,7 +41,190 @@ class InMemoryFsWriter:
     def __init__(self):
         self.written_text: str | None = None
         self.written_path: Path | None = None
+        self.removed_paths: list[Path] = []
 
     def write(self, text: str, file_path: Path) -> None:
         self.written_text = text
         self.written_path = file_path
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        self.written_text = "".join(chunks)
+        self.written_path = file_path
+
+    def remove(self, file_path: Path) -> None:
+        self.removed_paths.append(file_path)
+
+
+class InMemoryBinaryFsReader:
+    """BinaryFileSystemReaderProtocol の InMemory 実装"""
+
+    def __init__(self, content: bytes = b""):
+        self.content = content
+        self.read_path: Path | None = None
+
+    def read_bytes(self, file_path: Path) -> bytes:
+        self.read_path = file_path
+        return self.content
+
+
+class InMemoryBinaryFsWriter:
+    """BinaryFileSystemWriterProtocol の InMemory 実装"""
+
+    def __init__(self):
+        self.written_data: bytes | None = None
+        self.written_path: Path | None = None
+
+    def write_bytes(self, data: bytes, file_path: Path) -> None:
+        self.written_data = data
+        self.written_path = file_path
+
+
+class InMemoryFsFinder:
+    """FileSystemFinderProtocol の InMemory 実装"""
+
+    def __init__(self, paths: list[Path]):
+        self.paths = paths
+        self.patterns: Sequence[Path] | None = None
+        self.exclude: Sequence[Path] | None = None
+
+    def find(self, patterns: Sequence[Path], exclude: Sequence[Path] = ()) -> list[Path]:
+        self.patterns = patterns
+        self.exclude = exclude
+        return self.paths
+
+
+class InMemoryFsStore:
+    """TextFileSystemReaderProtocol / TextFileSystemWriterProtocol の辞書による InMemory 実装"""
+
+    def __init__(self):
+        self.files: dict[Path, str] = {}
+
+    def read(self, file_path: Path, newline: str | None = None) -> str:
+        if file_path not in self.files:
+            raise FileSystemError(message=f"ファイルが見つかりません: {file_path}")
+        return io.StringIO(self.files[file_path], newline=newline).read()
+
+    def read_lines(self, file_path: Path) -> Iterator[str]:
+        return iter(io.StringIO(self.read(file_path, ""), newline="\n"))
+
+    def write(self, text: str, file_path: Path) -> None:
+        self.files[file_path] = text
+
+    def write_chunks(self, chunks: Iterable[str], file_path: Path) -> None:
+        self.files[file_path] = "".join(chunks)
+
+    def remove(self, file_path: Path) -> None:
+        self.files.pop(file_path, None)
+
+
+class InMemoryFsInspector:
+    """FileSystemInspectorProtocol の InMemory 実装"""
+
+    def __init__(self, stamps: dict[Path, FileStamp], digests: dict[Path, str] | None = None):
+        self.stamps = stamps
+        self.digests = digests if digests is not None else {}
+        self.digest_paths: list[Path] = []
+
+    def stamp(self, file_path: Path) -> FileStamp | None:
+        return self.stamps.get(file_path)
+
+    def digest(self, file_path: Path) -> str:
+        self.digest_paths.append(file_path)
+        return self.digests.get(file_path, "")
+
+
+class AsyncInMemoryFsReader:
+    """AsyncTextFileSystemReaderProtocol の InMemory 実装
+
+    同時に読み込み中のファイル数の最大値を記録する。
+    """
+
+    def __init__(self, content: str = "", fail: bool = False):
+        self.content = content
+        self.fail = fail
+        self.read_paths: list[Path] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def read(self, file_path: Path, newline: str | None = None) -> str:
+        self.read_paths.append(file_path)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            # 他のタスクへ制御を渡し、並行実行を発生させる
+            await asyncio.sleep(0)
+            if self.fail:
+                raise FileSystemError(message=f"読み込み失敗: {file_path}")
+            return io.StringIO(self.content, newline=newline).read()
+        finally:
+            self.active -= 1
+
+
+class AsyncInMemoryFsWriter:
+    """AsyncTextFileSystemWriterProtocol の InMemory 実装"""
+
+    def __init__(self):
+        self.written: dict[Path, str] = {}
+
+    async def write(self, text: str, file_path: Path) -> None:
+        self.written[file_path] = text
+
+    async def remove(self, file_path: Path) -> None:
+        self.written.pop(file_path, None)
+
+
+class InMemoryByteRangeReader:
+    r"""ByteRangeFileSystemReaderProtocol の InMemory 実装
+
+    バイト列を行境界（\n の直後）で分割する。
+    """
+
+    def __init__(self, content: bytes = b""):
+        self.content = content
+        self.read_ranges: list[ByteRange] = []
+
+    def split(self, file_path: Path, shard_size: int) -> list[ByteRange]:
+        ranges: list[ByteRange] = []
+        start = 0
+        while start < len(self.content):
+            newline = self.content.find(b"\n", start + shard_size - 1)
+            end = len(self.content) if newline == -1 else newline + 1
+            ranges.append(ByteRange(start=start, end=end))
+            start = end
+        return ranges
+
+    def read_range(self, file_path: Path, byte_range: ByteRange) -> str:
+        self.read_ranges.append(byte_range)
+        return self.content[byte_range.start : byte_range.end].decode("utf-8")
+
+
+class InMemoryOffsetWriter:
+    """OffsetFileSystemWriterProtocol の InMemory 実装
+
+    一時ファイルをバイト列で保持し、publish() で書き込み先のテキストとして確定する。
+    """
+
+    def __init__(self, fail_at: int | None = None):
+        self.fail_at = fail_at
+        self.buffers: dict[Path, bytearray] = {}
+        self.published: dict[Path, str] = {}
+        self.discarded: list[Path] = []
+
+    def allocate(self, file_path: Path, size: int) -> Path:
+        tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+        self.buffers[tmp_path] = bytearray(size)
+        return tmp_path
+
+    def write_at(self, tmp_path: Path, offset: int, chunks: Iterable[str]) -> int:
+        if offset == self.fail_at:
+            raise FileSystemError(message=f"書き込み失敗: {tmp_path}")
+        data = "".join(chunks).encode("utf-8")
+        self.buffers[tmp_path][offset : offset + len(data)] = data
+        return len(data)
+
+    def publish(self, tmp_path: Path, file_path: Path) -> None:
+        self.published[file_path] = self.buffers.pop(tmp_path).decode("utf-8")
+
+    def discard(self, tmp_path: Path) -> None:
+        self.buffers.pop(tmp_path, None)
+        self.discarded.append(tmp_path)
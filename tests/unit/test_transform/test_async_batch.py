@@ -0,0 +1,86 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from example.transform.async_batch import AsyncTransformBatchOrchestrator
+from example.transform.async_orchestrator import AsyncTransformOrchestrator
+from example.transform.context import TransformBatchContext
+from example.transform.finder import TargetFinder
+from example.transform.reader import AsyncTextReader
+from example.transform.transformer import TextTransformer
+from example.transform.types import FileTransformResult
+from example.transform.writer import AsyncTextWriter
+from tests.unit.test_transform.fakes import (
+    AsyncInMemoryFsReader,
+    AsyncInMemoryFsWriter,
+    InMemoryFsFinder,
+)
+
+
+def _batch(paths: list[Path], fs_reader: AsyncInMemoryFsReader) -> AsyncTransformBatchOrchestrator:
+    orchestrator = AsyncTransformOrchestrator(
+        reader=AsyncTextReader(fs_reader),
+        transformer=TextTransformer(),
+        writer=AsyncTextWriter(AsyncInMemoryFsWriter()),
+    )
+    return AsyncTransformBatchOrchestrator(
+        finder=TargetFinder(InMemoryFsFinder(paths)), orchestrator=orchestrator
+    )
+
+
+def _context(concurrency: int) -> TransformBatchContext:
+    return TransformBatchContext(
+        targets=(Path("docs"),),
+        tmp_dir=Path("/tmp/output"),
+        current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+        concurrency=concurrency,
+    )
+
+
+class TestAsyncTransformBatchOrchestrator:
+    """AsyncTransformBatchOrchestratorクラスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_正常系_同時実行数を上限内に抑えて全ファイルを変換すること(self):
+        # Arrange
+        paths = [Path(f"docs/{i}.txt") for i in range(20)]
+        fs_reader = AsyncInMemoryFsReader(content="line1\nline2")
+        batch = _batch(paths, fs_reader)
+
+        # Act
+        result = await batch.orchestrate(_context(concurrency=3))
+
+        # Assert
+        assert fs_reader.max_active == 3
+        assert [f.path for f in result.files] == [str(p) for p in paths]
+        assert result.src_length == 40
+        assert result.dst_length == 60
+        assert result.error_count == 0
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_異常系_ApplicationErrorはファイルごとの結果に記録すること(self):
+        # Arrange
+        batch = _batch([Path("missing.txt")], AsyncInMemoryFsReader(fail=True))
+
+        # Act
+        result = await batch.orchestrate(_context(concurrency=4))
+
+        # Assert
+        assert result.error_count == 1
+        assert result.files[0].status == "error"
+        assert result.files[0].error == "読み込み失敗: missing.txt"
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_正常系_ファイルごとの結果を処理完了時にlistenerへ渡すこと(self):
+        # Arrange
+        paths = [Path(f"docs/{i}.txt") for i in range(5)]
+        batch = _batch(paths, AsyncInMemoryFsReader(content="line1\nline2"))
+        received: list[FileTransformResult] = []
+
+        # Act
+        result = await batch.orchestrate(_context(concurrency=2), listener=received.append)
+
+        # Assert
+        assert sorted(f.path for f in received) == sorted(f.path for f in result.files)
+        assert len(received) == 5
@@ -0,0 +1,170 @@
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from example.protocol.fs import FileStamp
+from example.transform.async_orchestrator import AsyncTransformOrchestrator
+from example.transform.cache import TransformCache
+from example.transform.context import TransformContext
+from example.transform.layout import OutputLayout
+from example.transform.orchestrator import TransformOrchestrator
+from example.transform.reader import AsyncTextReader, TextReader
+from example.transform.transformer import TextTransformer
+from example.transform.writer import AsyncTextWriter, TextWriter
+from tests.unit.test_transform.fakes import (
+    AsyncInMemoryFsReader,
+    AsyncInMemoryFsWriter,
+    InMemoryFsInspector,
+    InMemoryFsReader,
+    InMemoryFsStore,
+    InMemoryFsWriter,
+)
+
+CONTEXT = TransformContext(
+    target_file=Path("input.txt"),
+    tmp_dir=Path("/tmp/output"),
+    current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+)
+
+
+class TestAsyncTransformOrchestrator:
+    """AsyncTransformOrchestratorクラスのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_正常系_同期版と同じ変換結果を書き込むこと(self):
+        # Arrange
+        content = "line1\nline2\r\nline3\n"
+        fs_writer = InMemoryFsWriter()
+        sync_result = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content=content)),
+            transformer=TextTransformer(),
+            writer=TextWriter(fs_writer),
+        ).orchestrate(CONTEXT)
+
+        async_fs_writer = AsyncInMemoryFsWriter()
+        orchestrator = AsyncTransformOrchestrator(
+            reader=AsyncTextReader(AsyncInMemoryFsReader(content=content)),
+            transformer=TextTransformer(),
+            writer=AsyncTextWriter(async_fs_writer),
+        )
+
+        # Act
+        result = await orchestrator.orchestrate(CONTEXT)
+
+        # Assert
+        assert result == sync_result
+        assert async_fs_writer.written == {Path("/tmp/output/input.txt"): fs_writer.written_text}
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_異常系_streaming指定時はValueErrorを送出すること(self):
+        # Arrange
+        orchestrator = AsyncTransformOrchestrator(
+            reader=AsyncTextReader(AsyncInMemoryFsReader()),
+            transformer=TextTransformer(),
+            writer=AsyncTextWriter(AsyncInMemoryFsWriter()),
+        )
+        context = TransformContext(
+            target_file=CONTEXT.target_file,
+            tmp_dir=CONTEXT.tmp_dir,
+            current_datetime=CONTEXT.current_datetime,
+            streaming=True,
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await orchestrator.orchestrate(context)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "context",
+        [
+            replace(CONTEXT, memory_budget=1024),
+            replace(CONTEXT, binary=True),
+            replace(CONTEXT, stats=True),
+        ],
+        ids=["memory_budget", "binary", "stats"],
+    )
+    async def test_orchestrate_異常系_非対応のモード指定時はValueErrorを送出すること(
+        self, context: TransformContext
+    ):
+        # Arrange
+        async_fs_writer = AsyncInMemoryFsWriter()
+        orchestrator = AsyncTransformOrchestrator(
+            reader=AsyncTextReader(AsyncInMemoryFsReader()),
+            transformer=TextTransformer(),
+            writer=AsyncTextWriter(async_fs_writer),
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            await orchestrator.orchestrate(context)
+        assert async_fs_writer.written == {}
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_正常系_layoutで決定したパスに書き込み対応を記録すること(self):
+        # Arrange
+        store = InMemoryFsStore()
+        layout = OutputLayout(
+            fs_reader=store, fs_writer=store, inspector=InMemoryFsInspector(stamps={})
+        )
+        async_fs_writer = AsyncInMemoryFsWriter()
+        orchestrator = AsyncTransformOrchestrator(
+            reader=AsyncTextReader(AsyncInMemoryFsReader(content="line1")),
+            transformer=TextTransformer(),
+            writer=AsyncTextWriter(async_fs_writer),
+            layout=layout,
+        )
+        context = TransformContext(
+            target_file=Path("logs/a/app.log"),
+            tmp_dir=CONTEXT.tmp_dir,
+            current_datetime=CONTEXT.current_datetime,
+            layout="mirror",
+        )
+
+        # Act
+        await orchestrator.orchestrate(context)
+
+        # Assert
+        dst_path = CONTEXT.tmp_dir / "logs" / "a" / "app.log"
+        assert list(async_fs_writer.written) == [dst_path]
+        assert layout.locate(context.target_file, context.tmp_dir) == dst_path
+
+    @pytest.mark.asyncio
+    async def test_orchestrate_正常系_incrementalのcontentは内容が変わっても前回の出力を削除しないこと(
+        self,
+    ):
+        # Arrange
+        source = Path("/var/log/a/app.log")
+        store = InMemoryFsStore()
+        inspector = InMemoryFsInspector(
+            stamps={source: FileStamp(size=5, mtime_ns=100)}, digests={source: "ab" * 32}
+        )
+        layout = OutputLayout(fs_reader=store, fs_writer=store, inspector=inspector)
+        async_fs_writer = AsyncInMemoryFsWriter()
+        orchestrator = AsyncTransformOrchestrator(
+            reader=AsyncTextReader(AsyncInMemoryFsReader(content="line1")),
+            transformer=TextTransformer(),
+            writer=AsyncTextWriter(async_fs_writer),
+            cache=TransformCache(fs_reader=store, fs_writer=store, inspector=inspector),
+            layout=layout,
+        )
+        context = TransformContext(
+            target_file=source,
+            tmp_dir=CONTEXT.tmp_dir,
+            current_datetime=CONTEXT.current_datetime,
+            incremental=True,
+            layout="content",
+        )
+
+        # Act
+        await orchestrator.orchestrate(context)
+        first = list(async_fs_writer.written)
+        inspector.digests[source] = "cd" * 32
+        await orchestrator.orchestrate(context)
+
+        # Assert
+        assert len(first) == 1
+        assert list(async_fs_writer.written) == [first[0], layout.locate(source, context.tmp_dir)]
+        assert not any(path.parent.parent == first[0].parent for path in store.files)
@@ -0,0 +1,114 @@
+from datetime import datetime
+from pathlib import Path
+
+from example.protocol.fs import FileStamp
+from example.transform.batch import TransformBatchOrchestrator
+from example.transform.context import TransformBatchContext
+from example.transform.finder import TargetFinder
+from example.transform.orchestrator import TransformOrchestrator
+from example.transform.reader import TextReader
+from example.transform.transformer import TextTransformer
+from example.transform.types import FileTransformResult
+from example.transform.writer import TextWriter
+from tests.unit.test_transform.fakes import (
+    FailingFsReader,
+    InMemoryFsFinder,
+    InMemoryFsInspector,
+    InMemoryFsReader,
+    InMemoryFsWriter,
+)
+
+
+def _context(targets: tuple[Path, ...]) -> TransformBatchContext:
+    return TransformBatchContext(
+        targets=targets,
+        tmp_dir=Path("/tmp/output"),
+        current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+    )
+
+
+class TestTransformBatchOrchestrator:
+    """TransformBatchOrchestratorクラスのテスト"""
+
+    def test_orchestrate_正常系_列挙した全ファイルを変換して集計すること(self):
+        # Arrange
+        paths = [Path("a/input.txt"), Path("b/other.txt")]
+        fs_finder = InMemoryFsFinder(paths)
+        created: list[TransformOrchestrator] = []
+
+        def factory() -> TransformOrchestrator:
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(InMemoryFsReader(content="line1\nline2")),
+                transformer=TextTransformer(),
+                writer=TextWriter(InMemoryFsWriter()),
+            )
+            created.append(orchestrator)
+            return orchestrator
+
+        batch = TransformBatchOrchestrator(
+            finder=TargetFinder(fs_finder), orchestrator_factory=factory
+        )
+        context = _context((Path("a"), Path("b/*.txt")))
+
+        # Act
+        result = batch.orchestrate(context)
+
+        # Assert
+        assert fs_finder.patterns == context.targets
+        assert fs_finder.exclude == (context.tmp_dir,)
+        assert len(created) == 1
+        assert [f.path for f in result.files] == [str(p) for p in paths]
+        assert result.src_length == 4
+        assert result.dst_length == 6
+        assert result.file_count == 2
+        assert result.error_count == 0
+
+    def test_orchestrate_異常系_ApplicationErrorはファイルごとの結果に記録すること(self):
+        # Arrange
+        fs_finder = InMemoryFsFinder([Path("missing.txt")])
+
+        def factory() -> TransformOrchestrator:
+            return TransformOrchestrator(
+                reader=TextReader(FailingFsReader()),
+                transformer=TextTransformer(),
+                writer=TextWriter(InMemoryFsWriter()),
+            )
+
+        batch = TransformBatchOrchestrator(
+            finder=TargetFinder(fs_finder), orchestrator_factory=factory
+        )
+
+        # Act
+        result = batch.orchestrate(_context((Path("missing.txt"),)))
+
+        # Assert
+        assert result.error_count == 1
+        assert result.files[0].status == "error"
+        assert result.files[0].error == "読み込み失敗: missing.txt"
+
+    def test_orchestrate_正常系_ファイルごとの結果を処理完了時にlistenerへ渡すこと(self):
+        # Arrange
+        paths = [Path("a.txt"), Path("b.txt")]
+        inspector = InMemoryFsInspector({Path("a.txt"): FileStamp(size=12, mtime_ns=0)})
+
+        def factory() -> TransformOrchestrator:
+            return TransformOrchestrator(
+                reader=TextReader(InMemoryFsReader(content="line1\nline2")),
+                transformer=TextTransformer(),
+                writer=TextWriter(InMemoryFsWriter()),
+            )
+
+        batch = TransformBatchOrchestrator(
+            finder=TargetFinder(InMemoryFsFinder(paths)),
+            orchestrator_factory=factory,
+            inspector=inspector,
+        )
+        received: list[FileTransformResult] = []
+
+        # Act
+        result = batch.orchestrate(_context((Path(),)), listener=received.append)
+
+        # Assert
+        assert received == result.files
+        assert [f.src_bytes for f in received] == [12, 0]
+        assert all(f.duration_seconds > 0 for f in received)
@@ -0,0 +1,181 @@
+from pathlib import Path
+from typing import Literal
+
+from example.protocol.fs import FileStamp
+from example.transform.cache import TransformCache
+from example.transform.types import OutputOptions, TransformResult
+from tests.unit.test_transform.fakes import InMemoryFsInspector, InMemoryFsStore
+
+SOURCE = Path("/src/input.txt")
+DST_PATH = Path("/tmp/output/input.txt")
+RESULT = TransformResult(src_length=3, dst_length=4)
+
+
+def _stored_cache(inspector: InMemoryFsInspector) -> TransformCache:
+    """変換結果を1件記録済みの TransformCache を返す"""
+    store = InMemoryFsStore()
+    cache = TransformCache(fs_reader=store, fs_writer=store, inspector=inspector)
+    cache.store(SOURCE, inspector.stamp(SOURCE), DST_PATH, RESULT)
+    inspector.digest_paths.clear()
+    return cache
+
+
+def _inspector() -> InMemoryFsInspector:
+    return InMemoryFsInspector(
+        stamps={
+            SOURCE: FileStamp(size=10, mtime_ns=100),
+            DST_PATH: FileStamp(size=20, mtime_ns=200),
+        },
+        digests={SOURCE: "hash"},
+    )
+
+
+class TestTransformCache:
+    """TransformCacheクラスのテスト"""
+
+    def test_lookup_正常系_マニフェストがなければNoneを返す(self):
+        # Arrange
+        store = InMemoryFsStore()
+        cache = TransformCache(fs_reader=store, fs_writer=store, inspector=_inspector())
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert
+        assert result is None
+
+    def test_lookup_正常系_statが一致すればハッシュを計算せずに前回の結果を返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert
+        assert result == RESULT
+        assert inspector.digest_paths == []
+
+    def test_lookup_正常系_更新日時のみ異なり内容が同じなら前回の結果を返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+        inspector.stamps[SOURCE] = FileStamp(size=10, mtime_ns=101)
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+        inspector.digest_paths.clear()
+        second = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert - 2回目は記録し直した更新日時と一致するため、ハッシュを計算しない
+        assert result == RESULT
+        assert second == RESULT
+        assert inspector.digest_paths == []
+
+    def test_lookup_正常系_内容が変わっていればNoneを返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+        inspector.stamps[SOURCE] = FileStamp(size=10, mtime_ns=101)
+        inspector.digests[SOURCE] = "changed"
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert
+        assert result is None
+
+    def test_lookup_正常系_サイズが変わっていればハッシュを計算せずにNoneを返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+        inspector.stamps[SOURCE] = FileStamp(size=11, mtime_ns=100)
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert
+        assert result is None
+        assert inspector.digest_paths == []
+
+    def test_lookup_正常系_出力ファイルが削除されていればNoneを返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+        del inspector.stamps[DST_PATH]
+
+        # Act
+        result = cache.lookup(SOURCE, DST_PATH)
+
+        # Assert
+        assert result is None
+
+    def test_lookup_正常系_変換オプションが前回と異なればNoneを返す(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+
+        # Act
+        binary = cache.lookup(SOURCE, DST_PATH, options=OutputOptions(binary=True))
+        preserve = cache.lookup(SOURCE, DST_PATH, options=OutputOptions(newline="preserve"))
+        default = cache.lookup(SOURCE, DST_PATH, options=OutputOptions())
+
+        # Assert
+        assert binary is None
+        assert preserve is None
+        assert default == RESULT
+
+    def test_lookup_正常系_圧縮形式か圧縮レベルが前回と異なればNoneを返す(self):
+        # Arrange
+        store = InMemoryFsStore()
+        inspector = _inspector()
+        settings: list[tuple[Literal["auto", "none", "gzip", "bz2", "xz"], int | None]] = [
+            ("gzip", 1),
+            ("gzip", 9),
+            ("gzip", None),
+            ("xz", 1),
+        ]
+        caches = [
+            TransformCache(
+                fs_reader=store,
+                fs_writer=store,
+                inspector=inspector,
+                compression=compression,
+                compression_level=level,
+            )
+            for compression, level in settings
+        ]
+        caches[0].store(SOURCE, inspector.stamp(SOURCE), DST_PATH, RESULT)
+
+        # Act
+        results = [cache.lookup(SOURCE, DST_PATH) for cache in caches]
+
+        # Assert
+        assert results == [RESULT, None, None, None]
+
+    def test_store_正常系_cache_dirを指定するとその配下にマニフェストを記録する(self):
+        # Arrange
+        store = InMemoryFsStore()
+        inspector = _inspector()
+        cache = TransformCache(fs_reader=store, fs_writer=store, inspector=inspector)
+        cache_dir = Path("/var/cache/example")
+
+        # Act
+        cache.store(SOURCE, inspector.stamp(SOURCE), DST_PATH, RESULT, cache_dir)
+
+        # Assert
+        assert [path.parent for path in store.files] == [cache_dir]
+        assert cache.lookup(SOURCE, DST_PATH, cache_dir) == RESULT
+        assert cache.lookup(SOURCE, DST_PATH) is None
+
+    def test_discard_正常系_マニフェストのみを削除する(self):
+        # Arrange
+        inspector = _inspector()
+        cache = _stored_cache(inspector)
+
+        # Act
+        cache.discard(SOURCE, DST_PATH)
+
+        # Assert
+        assert cache.lookup(SOURCE, DST_PATH) is None
+        assert DST_PATH in inspector.stamps
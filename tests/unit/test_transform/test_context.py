@@ -1,7 +1,7 @@
 from datetime import datetime
 from pathlib import Path
 
-from example.transform.context import TransformContext
+from example.transform.context import TransformBatchContext, TransformContext
 
 
 class TestTransformContext:
@@ -24,3 +24,34 @@ class TestTransformContext:
         assert context.target_file == target_file
         assert context.tmp_dir == tmp_dir
         assert context.current_datetime == current_datetime
+
+
+class TestTransformBatchContext:
+    """TransformBatchContextクラスのテスト"""
+
+    def test_file_context_正常系_共通パラメータを引き継いだTransformContextを返す(self):
+        # Arrange
+        batch_context = TransformBatchContext(
+            targets=(Path("docs"),),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            workers=4,
+            streaming=True,
+            incremental=True,
+            memory_budget=1024,
+            cache_dir=Path("/var/cache/example"),
+        )
+
+        # Act
+        result = batch_context.file_context(Path("docs/a.txt"))
+
+        # Assert
+        assert result == TransformContext(
+            target_file=Path("docs/a.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            streaming=True,
+            incremental=True,
+            memory_budget=1024,
+            cache_dir=Path("/var/cache/example"),
+        )
@@ -0,0 +1,21 @@
+from pathlib import Path
+
+from example.transform.finder import TargetFinder
+from tests.unit.test_transform.fakes import InMemoryFsFinder
+
+
+class TestTargetFinder:
+    """TargetFinderクラスのテスト"""
+
+    def test_find_正常系_列挙結果をパススルーで返すこと(self):
+        # Arrange
+        paths = [Path("a.txt"), Path("b.txt")]
+        fs_finder = InMemoryFsFinder(paths)
+        finder = TargetFinder(fs_finder)
+
+        # Act
+        result = finder.find([Path("*.txt")])
+
+        # Assert
+        assert result == paths
+        assert fs_finder.patterns == [Path("*.txt")]
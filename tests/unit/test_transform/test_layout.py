@@ -0,0 +1,151 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+from example.transform.context import TransformContext
+from example.transform.layout import OUTPUT_MAP_DIR_NAME, OutputLayout
+from example.transform.types import OutputLayoutMode
+from tests.unit.test_transform.fakes import InMemoryFsInspector, InMemoryFsStore
+
+TMP_DIR = Path("/tmp/output")
+
+
+def _layout(
+    digests: dict[Path, str] | None = None,
+    compression: Literal["auto", "none", "gzip", "bz2", "xz"] = "auto",
+) -> tuple[OutputLayout, InMemoryFsStore]:
+    store = InMemoryFsStore()
+    inspector = InMemoryFsInspector(stamps={}, digests=digests)
+    layout = OutputLayout(
+        fs_reader=store, fs_writer=store, inspector=inspector, compression=compression
+    )
+    return layout, store
+
+
+def _context(source: Path, layout: OutputLayoutMode, fan_out: int = 256) -> TransformContext:
+    return TransformContext(
+        target_file=source,
+        tmp_dir=TMP_DIR,
+        current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+        layout=layout,
+        fan_out=fan_out,
+    )
+
+
+class TestOutputLayout:
+    """OutputLayoutクラスのテスト"""
+
+    def test_dst_path_正常系_flatは出力先直下に同名で出力する(self):
+        # Arrange
+        layout, _ = _layout()
+
+        # Act
+        result = layout.dst_path(_context(Path("/var/log/a/app.log"), "flat"))
+
+        # Assert
+        assert result == TMP_DIR / "app.log"
+
+    def test_dst_path_正常系_mirrorは変換元の相対パスを再現する(self):
+        # Arrange
+        layout, _ = _layout()
+
+        # Act
+        inside = layout.dst_path(_context(Path("logs/a/app.log"), "mirror"))
+        outside = layout.dst_path(_context(Path("/var/log/../log/a/app.log"), "mirror"))
+
+        # Assert
+        assert inside == TMP_DIR / "logs" / "a" / "app.log"
+        assert outside == TMP_DIR / "var" / "log" / "a" / "app.log"
+
+    def test_dst_path_正常系_hashedは同名の変換元を別のパスに分散する(self):
+        # Arrange
+        layout, _ = _layout()
+
+        # Act
+        first = layout.dst_path(_context(Path("/var/log/a/app.log"), "hashed", fan_out=16))
+        second = layout.dst_path(_context(Path("/var/log/b/app.log"), "hashed", fan_out=16))
+
+        # Assert
+        assert first != second
+        for result in (first, second):
+            upper, lower, name = result.relative_to(TMP_DIR).parts
+            assert len(upper) == len(lower) == 1
+            assert int(upper, 16) < 16 and int(lower, 16) < 16
+            assert name.endswith("_app.log")
+
+    def test_dst_path_正常系_contentは同じ内容の変換元を同じパスに出力する(self):
+        # Arrange
+        digest = "ab" * 32
+        first, second = Path("/var/log/a/app.log.gz"), Path("/var/log/b/other.gz")
+        layout, _ = _layout(digests={first: digest, second: digest})
+
+        # Act
+        results = [layout.dst_path(_context(source, "content")) for source in (first, second)]
+
+        # Assert
+        assert results[0] == results[1]
+        assert results[0].name == f"{digest}.gz"
+        assert len(results[0].relative_to(TMP_DIR).parts) == 3
+
+    def test_dst_path_正常系_圧縮形式を指定すると拡張子を合わせる(self):
+        # Arrange
+        gzip_layout, _ = _layout(compression="gzip")
+        none_layout, _ = _layout(compression="none")
+
+        # Act
+        compressed = gzip_layout.dst_path(_context(Path("logs/a/app.log"), "mirror"))
+        plain = none_layout.dst_path(_context(Path("/var/log/app.log.xz"), "flat"))
+
+        # Assert
+        assert compressed == TMP_DIR / "logs" / "a" / "app.log.gz"
+        assert plain == TMP_DIR / "app.log"
+
+    def test_previous_dst_path_正常系_contentは記録したパスを返し圧縮形式が変われば無効にする(
+        self,
+    ):
+        # Arrange
+        source = Path("/var/log/a/app.log")
+        digests = {source: "ab" * 32}
+        layout, store = _layout(digests=digests, compression="gzip")
+        context = _context(source, "content")
+        dst_path = layout.dst_path(context)
+        layout.record(context, dst_path)
+        plain_layout = OutputLayout(
+            fs_reader=store, fs_writer=store, inspector=layout.inspector, compression="none"
+        )
+
+        # Act
+        recorded = layout.previous_dst_path(context)
+        mismatched = plain_layout.previous_dst_path(context)
+
+        # Assert
+        assert recorded == dst_path
+        assert dst_path.name == f"{digests[source]}.log.gz"
+        assert mismatched is None
+
+    def test_locate_正常系_記録した出力ファイルパスを返す(self):
+        # Arrange
+        layout, store = _layout()
+        context = _context(Path("/var/log/a/app.log"), "hashed")
+        dst_path = layout.dst_path(context)
+
+        # Act
+        layout.record(context, dst_path)
+        result = layout.locate(context.target_file, TMP_DIR)
+
+        # Assert
+        assert result == dst_path
+        assert [path.parent for path in store.files] == [TMP_DIR / OUTPUT_MAP_DIR_NAME]
+
+    def test_locate_正常系_記録がなければNoneを返す(self):
+        # Arrange
+        layout, store = _layout()
+        context = _context(Path("/var/log/a/app.log"), "flat")
+
+        # Act
+        layout.record(context, layout.dst_path(context))
+        result = layout.locate(context.target_file, TMP_DIR)
+
+        # Assert
+        assert result is None
+        assert store.files == {}
@@ -1,12 +1,26 @@
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+
+from example.protocol.fs import FileStamp
+from example.transform.cache import MANIFEST_DIR_NAME, TransformCache
 from example.transform.context import TransformContext
+from example.transform.layout import OutputLayout
 from example.transform.orchestrator import TransformOrchestrator
-from example.transform.reader import TextReader
+from example.transform.reader import BinaryReader, TextReader
 from example.transform.transformer import TextTransformer
-from example.transform.writer import TextWriter
-from tests.unit.test_transform.fakes import InMemoryFsReader, InMemoryFsWriter
+from example.transform.types import NewlineMode, TransformResult
+from example.transform.writer import BinaryWriter, TextWriter
+from tests.unit.test_transform.fakes import (
+    InMemoryBinaryFsReader,
+    InMemoryBinaryFsWriter,
+    InMemoryFsInspector,
+    InMemoryFsReader,
+    InMemoryFsStore,
+    InMemoryFsWriter,
+)
 
 
 class TestTransformOrchestrator:
@@ -35,3 +49,405 @@ class TestTransformOrchestrator:
         assert fs_writer.written_path == context.tmp_dir / context.target_file.name
         assert fs_writer.written_text is not None
         assert result.src_length == 3
+
+    def test_orchestrate_正常系_streamingでも同じ変換結果を書き込むこと(self):
+        # Arrange
+        content = "line1\nline2\nline3\n"
+        current_datetime = datetime(2024, 12, 26, 15, 30, 45)
+        results: list[tuple[str | None, int, int]] = []
+        for streaming in (False, True):
+            fs_writer = InMemoryFsWriter()
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(InMemoryFsReader(content=content)),
+                transformer=TextTransformer(),
+                writer=TextWriter(fs_writer),
+            )
+            context = TransformContext(
+                target_file=Path("input.txt"),
+                tmp_dir=Path("/tmp/output"),
+                current_datetime=current_datetime,
+                streaming=streaming,
+            )
+
+            # Act
+            result = orchestrator.orchestrate(context)
+            results.append((fs_writer.written_text, result.src_length, result.dst_length))
+
+        # Assert
+        assert results[0] == results[1]
+
+    def test_orchestrate_正常系_incrementalで変更がなければ読み込み書き込みを省略すること(self):
+        # Arrange
+        store = InMemoryFsStore()
+        inspector = InMemoryFsInspector(
+            stamps={
+                Path("input.txt"): FileStamp(size=17, mtime_ns=100),
+                Path("/tmp/output/input.txt"): FileStamp(size=40, mtime_ns=200),
+            }
+        )
+        cache = TransformCache(fs_reader=store, fs_writer=store, inspector=inspector)
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            incremental=True,
+        )
+
+        def run(context: TransformContext) -> tuple[int, Path | None]:
+            fs_reader = InMemoryFsReader(content="line1\nline2\nline3")
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(fs_reader),
+                transformer=TextTransformer(),
+                writer=TextWriter(InMemoryFsWriter()),
+                cache=cache,
+            )
+            return orchestrator.orchestrate(context).src_length, fs_reader.read_path
+
+        # Act
+        first = run(context)
+        second = run(context)
+        forced = run(replace(context, force=True))
+
+        # Assert
+        assert first == (3, Path("input.txt"))
+        assert second == (3, None)
+        assert forced == (3, Path("input.txt"))
+
+    def test_orchestrate_正常系_incrementalで前回とbinary指定が異なれば変換し直すこと(self):
+        # Arrange
+        store = InMemoryFsStore()
+        inspector = InMemoryFsInspector(
+            stamps={
+                Path("input.txt"): FileStamp(size=17, mtime_ns=100),
+                Path("/tmp/output/input.txt"): FileStamp(size=40, mtime_ns=200),
+            }
+        )
+        cache = TransformCache(fs_reader=store, fs_writer=store, inspector=inspector)
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            incremental=True,
+        )
+
+        def run(context: TransformContext) -> tuple[Path | None, Path | None]:
+            fs_reader = InMemoryFsReader(content="line1\nline2\nline3")
+            binary_fs_reader = InMemoryBinaryFsReader(content=b"line1\nline2\nline3")
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(fs_reader),
+                transformer=TextTransformer(),
+                writer=TextWriter(InMemoryFsWriter()),
+                cache=cache,
+                binary_reader=BinaryReader(binary_fs_reader),
+                binary_writer=BinaryWriter(InMemoryBinaryFsWriter()),
+            )
+            orchestrator.orchestrate(context)
+            return fs_reader.read_path, binary_fs_reader.read_path
+
+        # Act
+        text = run(context)
+        binary = run(replace(context, binary=True))
+        binary_again = run(replace(context, binary=True))
+        latin1 = run(replace(context, binary=True, encoding="latin-1"))
+
+        # Assert
+        assert text == (Path("input.txt"), None)
+        assert binary == (None, Path("input.txt"))
+        assert binary_again == (None, None)
+        assert latin1 == (None, Path("input.txt"))
+
+    def test_orchestrate_正常系_layoutで決定したパスに書き込み対応を記録すること(self):
+        # Arrange
+        store = InMemoryFsStore()
+        layout = OutputLayout(
+            fs_reader=store, fs_writer=store, inspector=InMemoryFsInspector(stamps={})
+        )
+        fs_writer = InMemoryFsWriter()
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content="line1\nline2")),
+            transformer=TextTransformer(),
+            writer=TextWriter(fs_writer),
+            layout=layout,
+        )
+        context = TransformContext(
+            target_file=Path("/var/log/a/app.log"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            layout="hashed",
+        )
+
+        # Act
+        orchestrator.orchestrate(context)
+
+        # Assert
+        assert fs_writer.written_path == layout.dst_path(context)
+        assert layout.locate(context.target_file, context.tmp_dir) == fs_writer.written_path
+
+    def test_orchestrate_正常系_incrementalのcontentは変更がなければハッシュを計算しないこと(self):
+        # Arrange
+        source = Path("/var/log/a/app.log")
+        store = InMemoryFsStore()
+        inspector = InMemoryFsInspector(
+            stamps={source: FileStamp(size=11, mtime_ns=100)}, digests={source: "ab" * 32}
+        )
+        layout = OutputLayout(fs_reader=store, fs_writer=store, inspector=inspector)
+        fs_writer = InMemoryFsWriter()
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content="line1\nline2")),
+            transformer=TextTransformer(),
+            writer=TextWriter(fs_writer),
+            cache=TransformCache(fs_reader=store, fs_writer=store, inspector=inspector),
+            layout=layout,
+        )
+        context = TransformContext(
+            target_file=source,
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            incremental=True,
+            layout="content",
+        )
+        first_dst_path = layout.dst_path(context)
+        inspector.stamps[first_dst_path] = FileStamp(size=40, mtime_ns=200)
+
+        # Act
+        orchestrator.orchestrate(context)
+        inspector.digest_paths.clear()
+        fs_writer.written_path = None
+        orchestrator.orchestrate(context)
+        unchanged = (inspector.digest_paths.copy(), fs_writer.written_path)
+        inspector.stamps[source] = FileStamp(size=12, mtime_ns=300)
+        inspector.digests[source] = "cd" * 32
+        orchestrator.orchestrate(context)
+
+        # Assert
+        assert unchanged == ([], None)
+        assert fs_writer.written_path not in (None, first_dst_path)
+        assert fs_writer.removed_paths == []
+        assert layout.locate(source, context.tmp_dir) == fs_writer.written_path
+
+    def test_orchestrate_正常系_incrementalのcontentは共有する出力を一方の変更で削除しないこと(
+        self,
+    ):
+        # Arrange
+        first, second = Path("/var/log/a.txt"), Path("/var/log/b.txt")
+        store = InMemoryFsStore()
+        inspector = InMemoryFsInspector(
+            stamps={source: FileStamp(size=5, mtime_ns=100) for source in (first, second)},
+            digests={first: "ab" * 32, second: "ab" * 32},
+        )
+        layout = OutputLayout(fs_reader=store, fs_writer=store, inspector=inspector)
+        fs_writer = InMemoryFsWriter()
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content="same\n")),
+            transformer=TextTransformer(),
+            writer=TextWriter(fs_writer),
+            cache=TransformCache(fs_reader=store, fs_writer=store, inspector=inspector),
+            layout=layout,
+        )
+        contexts = [
+            TransformContext(
+                target_file=source,
+                tmp_dir=Path("/tmp/output"),
+                current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+                incremental=True,
+                layout="content",
+            )
+            for source in (first, second)
+        ]
+        shared_dst_path = layout.dst_path(contexts[0])
+        inspector.stamps[shared_dst_path] = FileStamp(size=20, mtime_ns=200)
+        manifest_dir = shared_dst_path.parent / MANIFEST_DIR_NAME
+        for context in contexts:
+            orchestrator.orchestrate(context)
+        shared_manifests = [path for path in store.files if path.parent == manifest_dir]
+
+        # Act
+        inspector.stamps[first] = FileStamp(size=8, mtime_ns=300)
+        inspector.digests[first] = "cd" * 32
+        fs_writer.written_path = None
+        orchestrator.orchestrate(contexts[1])
+        cached_written_path = fs_writer.written_path
+        orchestrator.orchestrate(contexts[0])
+
+        # Assert
+        assert cached_written_path is None
+        assert fs_writer.removed_paths == []
+        assert layout.locate(second, contexts[1].tmp_dir) == shared_dst_path
+        assert layout.locate(first, contexts[0].tmp_dir) == fs_writer.written_path
+        assert len(shared_manifests) == 2
+        assert len([path for path in store.files if path.parent == manifest_dir]) == 1
+
+    def test_orchestrate_異常系_layoutなしでflat以外の配置はValueError(self):
+        # Arrange
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content="line1")),
+            transformer=TextTransformer(),
+            writer=TextWriter(InMemoryFsWriter()),
+        )
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            layout="mirror",
+        )
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="mirror output layout requires layout"):
+            orchestrator.orchestrate(context)
+
+    def test_orchestrate_正常系_memory_budgetを超えるファイルは逐次変換すること(self):
+        # Arrange
+        content = "line1\nline2\nline3\n"
+        inspector = InMemoryFsInspector(stamps={Path("input.txt"): FileStamp(size=18, mtime_ns=1)})
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+        )
+
+        def run(memory_budget: int | None) -> tuple[bool, str | None]:
+            fs_reader = InMemoryFsReader(content=content)
+            fs_writer = InMemoryFsWriter()
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(fs_reader),
+                transformer=TextTransformer(),
+                writer=TextWriter(fs_writer),
+                inspector=inspector,
+            )
+            orchestrator.orchestrate(replace(context, memory_budget=memory_budget))
+            return fs_reader.streamed, fs_writer.written_text
+
+        # Act
+        unlimited = run(None)
+        within = run(18)
+        exceeded = run(17)
+
+        # Assert
+        assert unlimited[0] is False
+        assert within[0] is False
+        assert exceeded[0] is True
+        assert exceeded[1] == unlimited[1]
+
+    def test_orchestrate_正常系_statsで段階ごとの所要時間と処理量を含めること(self):
+        # Arrange
+        content = "line1\nline2\nあ\n"
+        current_datetime = datetime(2024, 12, 26, 15, 30, 45)
+        results: list[tuple[TransformResult, str | None]] = []
+        for streaming in (False, True):
+            fs_writer = InMemoryFsWriter()
+            orchestrator = TransformOrchestrator(
+                reader=TextReader(InMemoryFsReader(content=content)),
+                transformer=TextTransformer(),
+                writer=TextWriter(fs_writer),
+            )
+            context = TransformContext(
+                target_file=Path("input.txt"),
+                tmp_dir=Path("/tmp/output"),
+                current_datetime=current_datetime,
+                streaming=streaming,
+                stats=True,
+            )
+
+            # Act
+            results.append((orchestrator.orchestrate(context), fs_writer.written_text))
+
+        # Assert
+        for result, written_text in results:
+            assert result.stats is not None
+            assert result.src_length == 3
+            assert result.stats.src_bytes == len(content.encode("utf-8"))
+            assert written_text is not None
+            assert result.stats.dst_bytes == len(written_text.encode("utf-8"))
+            assert result.stats.total_seconds >= (
+                result.stats.read_seconds
+                + result.stats.transform_seconds
+                + result.stats.write_seconds
+            )
+            assert result.stats.lines_per_second > 0
+
+    def test_orchestrate_正常系_newlineに応じた行数を返すこと(self):
+        # Arrange
+        content = "line1\r\nline2\rline3\x0bline4\r\n"
+        expected: dict[NewlineMode, int] = {"universal": 4, "lf": 2, "preserve": 2}
+        for newline, src_length in expected.items():
+            for streaming in (False, True):
+                fs_writer = InMemoryFsWriter()
+                orchestrator = TransformOrchestrator(
+                    reader=TextReader(InMemoryFsReader(content=content)),
+                    transformer=TextTransformer(),
+                    writer=TextWriter(fs_writer),
+                )
+                context = TransformContext(
+                    target_file=Path("input.txt"),
+                    tmp_dir=Path("/tmp/output"),
+                    current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+                    streaming=streaming,
+                    stats=True,
+                    newline=newline,
+                )
+
+                # Act
+                result = orchestrator.orchestrate(context)
+
+                # Assert
+                assert result.src_length == src_length
+                assert result.dst_length == src_length + 1
+                assert result.stats is not None
+                assert fs_writer.written_text is not None
+                assert result.stats.dst_bytes == len(fs_writer.written_text.encode("utf-8"))
+        assert fs_writer.written_text == (
+            "2024-12-26 15:30:45\r\n1: line1\r\n2: line2\rline3\x0bline4\r\n"
+        )
+
+    def test_orchestrate_正常系_statsを指定しなければ計測結果を含めないこと(self):
+        # Arrange
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader(content="line1")),
+            transformer=TextTransformer(),
+            writer=TextWriter(InMemoryFsWriter()),
+        )
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+        )
+
+        # Act
+        result = orchestrator.orchestrate(context)
+
+        # Assert
+        assert result.stats is None
+
+    def test_orchestrate_正常系_binaryでバイト列のまま変換結果を書き込むこと(self):
+        # Arrange
+        content = b"line1\r\n\xff\xfe\nline3"
+        fs_reader = InMemoryBinaryFsReader(content=content)
+        fs_writer = InMemoryBinaryFsWriter()
+        text_writer = InMemoryFsWriter()
+        orchestrator = TransformOrchestrator(
+            reader=TextReader(InMemoryFsReader()),
+            transformer=TextTransformer(),
+            writer=TextWriter(text_writer),
+            binary_reader=BinaryReader(fs_reader),
+            binary_writer=BinaryWriter(fs_writer),
+        )
+        context = TransformContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=datetime(2024, 12, 26, 15, 30, 45),
+            binary=True,
+            stats=True,
+        )
+
+        # Act
+        result = orchestrator.orchestrate(context)
+
+        # Assert
+        assert fs_reader.read_path == context.target_file
+        assert fs_writer.written_path == context.tmp_dir / context.target_file.name
+        assert fs_writer.written_data == b"2024-12-26 15:30:45\n1: line1\n2: \xff\xfe\n3: line3"
+        assert text_writer.written_text is None
+        assert (result.src_length, result.dst_length) == (3, 4)
+        assert result.stats is not None
+        assert result.stats.src_bytes == len(content)
+        assert result.stats.dst_bytes == len(fs_writer.written_data)
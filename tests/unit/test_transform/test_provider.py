@@ -1,5 +1,24 @@
+import pickle
+
+import pytest
+
+from example.foundation.fs import (
+    ByteRangeFileSystemReader,
+    MemoryTextFileSystemWriter,
+    MmapTextFileSystemReader,
+    OffsetFileSystemWriter,
+    StdinTextFileSystemReader,
+    StdoutTextFileSystemWriter,
+    TextFileSystemReader,
+    TextFileSystemWriter,
+)
+from example.protocol.fs import TextFileSystemWriterProtocol
 from example.transform import TransformOrchestratorProvider
+from example.transform.async_batch import AsyncTransformBatchOrchestrator
+from example.transform.async_orchestrator import AsyncTransformOrchestrator
+from example.transform.batch import TransformBatchOrchestrator
 from example.transform.orchestrator import TransformOrchestrator
+from example.transform.sharded import ShardedTransformOrchestrator
 
 
 class TestTransformOrchestratorProvider:
@@ -11,3 +30,173 @@ class TestTransformOrchestratorProvider:
 
         # Assert
         assert isinstance(result, TransformOrchestrator)
+
+    def test_provide_正常系_reader_backendに応じた読み込み実装を注入する(self):
+        # Act
+        standard = TransformOrchestratorProvider().provide()
+        mmap = TransformOrchestratorProvider(reader_backend="mmap").provide()
+
+        # Assert（ファイルパス - の場合に標準入力から読み込む実装で包む）
+        standard_reader = standard.reader.fs_reader
+        mmap_reader = mmap.reader.fs_reader
+        assert isinstance(standard_reader, StdinTextFileSystemReader)
+        assert isinstance(mmap_reader, StdinTextFileSystemReader)
+        assert isinstance(standard_reader.delegate, TextFileSystemReader)
+        assert isinstance(mmap_reader.delegate, MmapTextFileSystemReader)
+
+    def test_provide_正常系_writer_backendに応じた書き込み実装を注入する(self):
+        # Act
+        file = TransformOrchestratorProvider().provide()
+        memory = TransformOrchestratorProvider(writer_backend="memory").provide()
+        stdout = TransformOrchestratorProvider(writer_backend="stdout").provide()
+
+        # Assert
+        assert isinstance(file.writer.fs_writer, TextFileSystemWriter)
+        assert isinstance(memory.writer.fs_writer, MemoryTextFileSystemWriter)
+        assert isinstance(stdout.writer.fs_writer, StdoutTextFileSystemWriter)
+
+    def test_provide_正常系_バイト列の読み書きの実装を注入する(self):
+        # Act
+        file = TransformOrchestratorProvider(reader_backend="mmap").provide()
+        stdout = TransformOrchestratorProvider(writer_backend="stdout").provide()
+
+        # Assert（バイト列の読み込みは reader_backend によらず通常の読み込みを使う）
+        assert file.binary_reader is not None
+        assert isinstance(file.binary_reader.fs_reader, TextFileSystemReader)
+        assert file.binary_writer is not None
+        assert isinstance(file.binary_writer.fs_writer, TextFileSystemWriter)
+        assert stdout.binary_writer is not None
+        assert isinstance(stdout.binary_writer.fs_writer, StdoutTextFileSystemWriter)
+
+    def test_provide_正常系_I_Oの設定値を読み書きの実装に渡す(self):
+        # Act
+        result = TransformOrchestratorProvider(
+            io_buffer_size=65536, read_chunk_size=8192, durability="fsync"
+        ).provide()
+
+        # Assert
+        fs_reader = result.reader.fs_reader
+        fs_writer = result.writer.fs_writer
+        assert isinstance(fs_reader, StdinTextFileSystemReader)
+        assert isinstance(fs_reader.delegate, TextFileSystemReader)
+        assert isinstance(fs_writer, TextFileSystemWriter)
+        assert fs_reader.delegate.chunk_size == 8192
+        assert (fs_writer.buffer_size, fs_writer.fsync) == (65536, True)
+
+    def test_provide_正常系_圧縮の設定値を書き込みの実装に渡す(self):
+        # Act
+        result = TransformOrchestratorProvider(
+            output_compression="bz2", compression_level=1
+        ).provide()
+
+        # Assert
+        fs_writer = result.writer.fs_writer
+        assert isinstance(fs_writer, TextFileSystemWriter)
+        assert (fs_writer.compression, fs_writer.compression_level) == ("bz2", 1)
+
+    def test_provide_正常系_構築済みのインスタンスを使い回す(self):
+        # Arrange
+        provider = TransformOrchestratorProvider()
+
+        # Act
+        first = provider.provide()
+        second = provider.provide()
+
+        # Assert
+        assert first is second
+        assert provider.provide_async().transformer is first.transformer
+
+    def test_provide_正常系_memoryの書き込みは実行ごとに作り直す(self):
+        # Arrange
+        provider = TransformOrchestratorProvider(writer_backend="memory")
+
+        # Act
+        with provider.run():
+            first = provider.provide()
+            same_run = provider.provide()
+        with provider.run():
+            next_run = provider.provide()
+
+        # Assert
+        assert first is same_run
+        assert first.writer.fs_writer is not next_run.writer.fs_writer
+
+    def test_provide_正常系_コンテナの登録を差し替えて実装を置き換えられる(self):
+        # Arrange
+        provider = TransformOrchestratorProvider()
+        fs_writer = MemoryTextFileSystemWriter()
+
+        # Act
+        provider.container.register(TextFileSystemWriterProtocol, lambda c: fs_writer)
+        result = provider.provide()
+
+        # Assert
+        assert result.writer.fs_writer is fs_writer
+
+    def test_pickle_正常系_設定のみを引き継いで復元する(self):
+        # Arrange
+        provider = TransformOrchestratorProvider(reader_backend="mmap", writer_backend="memory")
+
+        # Act
+        restored = pickle.loads(pickle.dumps(provider))
+
+        # Assert
+        assert (restored.reader_backend, restored.writer_backend) == ("mmap", "memory")
+        assert restored.container is not provider.container
+
+    def test_provide_batch_正常系_TransformBatchOrchestratorインスタンスを返す(self):
+        # Act
+        result = TransformOrchestratorProvider().provide_batch()
+
+        # Assert
+        assert isinstance(result, TransformBatchOrchestrator)
+
+    def test_provide_async_正常系_AsyncTransformOrchestratorインスタンスを返す(self):
+        # Act
+        result = TransformOrchestratorProvider().provide_async()
+
+        # Assert
+        assert isinstance(result, AsyncTransformOrchestrator)
+
+    def test_provide_async_batch_正常系_AsyncTransformBatchOrchestratorインスタンスを返す(self):
+        # Act
+        result = TransformOrchestratorProvider().provide_async_batch()
+
+        # Assert
+        assert isinstance(result, AsyncTransformBatchOrchestrator)
+
+    def test_provide_sharded_正常系_ShardedTransformOrchestratorインスタンスを返す(self):
+        # Act
+        result = TransformOrchestratorProvider(
+            io_buffer_size=65536, durability="fsync"
+        ).provide_sharded()
+
+        # Assert
+        assert isinstance(result, ShardedTransformOrchestrator)
+        assert isinstance(result.reader, ByteRangeFileSystemReader)
+        assert isinstance(result.writer, OffsetFileSystemWriter)
+        assert (result.writer.buffer_size, result.writer.fsync) == (65536, True)
+
+    def test_provide_sharded_異常系_writer_backendがmemoryの場合はValueError(self):
+        # Arrange
+        provider = TransformOrchestratorProvider(writer_backend="memory")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="writer_backend=memory"):
+            provider.provide_sharded()
+
+    def test_provide_sharded_異常系_圧縮形式を指定した場合はValueError(self):
+        # Arrange
+        provider = TransformOrchestratorProvider(output_compression="gzip")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="output_compression=gzip"):
+            provider.provide_sharded()
+
+    def test_provide_sharded_異常系_writer_backendがstdoutの場合はValueError(self):
+        # Arrange
+        provider = TransformOrchestratorProvider(writer_backend="stdout")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="writer_backend=stdout"):
+            provider.provide_sharded()
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from example.transform.reader import TextReader
-from example.transform.types import SrcText
+from example.transform.types import SrcText, SrcTextStream
 from tests.unit.test_transform.fakes import InMemoryFsReader
 
 
@@ -20,3 +20,31 @@ class TestTextReader:
         # Assert
         assert result == SrcText("test content")
         assert fs_reader.read_path == path
+
+    def test_read_正常系_universal以外は改行コードを変換せずに読み込むこと(self):
+        # Arrange
+        fs_reader = InMemoryFsReader(content="line1\r\nline2\r")
+        reader = TextReader(fs_reader)
+
+        # Act
+        universal = reader.read(Path("some/file.txt"))
+        lf = reader.read(Path("some/file.txt"), "lf")
+
+        # Assert
+        assert universal.text == "line1\nline2\n"
+        assert lf == SrcText("line1\r\nline2\r", "lf")
+        assert lf.length() == 2
+
+    def test_read_stream_正常系_指定パスの行ストリームを返すこと(self):
+        # Arrange
+        path = Path("some/file.txt")
+        fs_reader = InMemoryFsReader(content="line1\nline2")
+        reader = TextReader(fs_reader)
+
+        # Act
+        result = reader.read_stream(path)
+
+        # Assert
+        assert isinstance(result, SrcTextStream)
+        assert list(result.numbered_lines()) == ["1: line1", "2: line2"]
+        assert fs_reader.read_path == path
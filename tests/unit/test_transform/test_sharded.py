@@ -0,0 +1,128 @@
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from example.foundation.fs import FileSystemError
+from example.protocol.fs import ByteRange
+from example.transform.context import TransformShardContext
+from example.transform.sharded import ShardedTransformOrchestrator
+from example.transform.transformer import TextTransformer
+from example.transform.types import SrcText, TransformedDatetime
+from tests.unit.test_transform.fakes import InMemoryByteRangeReader, InMemoryOffsetWriter
+
+_CURRENT_DATETIME = datetime(2024, 12, 26, 15, 30, 45)
+
+
+def _sequential(content: bytes) -> str:
+    """同じ入力をファイル全体で変換した場合の出力（TextFileSystemReader.read と同じく改行コードを変換する）"""
+    text = content.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return TextTransformer().transform(SrcText(text), TransformedDatetime(_CURRENT_DATETIME)).text
+
+
+class TestShardedTransformOrchestrator:
+    """ShardedTransformOrchestratorクラスのテスト"""
+
+    @pytest.mark.parametrize("shard_size", [1, 7, 64, 1 << 20])
+    def test_orchestrate_正常系_ファイル全体の変換と同じ出力を書き込むこと(self, shard_size: int):
+        # Arrange
+        lines = [f"line{i} 日本語🚀" for i in range(1, 120)]
+        content = ("\n".join(lines) + "\r\nCRLF\rCR\x0bVT\n\nlast").encode()
+        reader = InMemoryByteRangeReader(content)
+        writer = InMemoryOffsetWriter()
+        orchestrator = ShardedTransformOrchestrator(reader, TextTransformer(), writer)
+        context = TransformShardContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=_CURRENT_DATETIME,
+            shard_size=shard_size,
+        )
+
+        # Act
+        result = orchestrator.orchestrate(context)
+
+        # Assert
+        expected = _sequential(content)
+        assert writer.published == {Path("/tmp/output/input.txt"): expected}
+        assert (result.src_length, result.dst_length) == (124, 125)
+        assert len(expected.splitlines()) == result.dst_length
+
+    def test_orchestrate_正常系_空ファイルは日時ヘッダーのみ書き込むこと(self):
+        # Arrange
+        writer = InMemoryOffsetWriter()
+        orchestrator = ShardedTransformOrchestrator(
+            InMemoryByteRangeReader(b""), TextTransformer(), writer
+        )
+        context = TransformShardContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=_CURRENT_DATETIME,
+        )
+
+        # Act
+        result = orchestrator.orchestrate(context)
+
+        # Assert
+        assert writer.published == {Path("/tmp/output/input.txt"): "2024-12-26 15:30:45"}
+        assert (result.src_length, result.dst_length) == (0, 1)
+
+    def test_orchestrate_正常系_行番号が桁上がりするシャード境界でも位置がずれないこと(self):
+        # Arrange
+        content = "".join(f"{i}\n" for i in range(1, 1002)).encode()
+        reader = InMemoryByteRangeReader(content)
+        writer = InMemoryOffsetWriter()
+        orchestrator = ShardedTransformOrchestrator(reader, TextTransformer(), writer)
+        context = TransformShardContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=_CURRENT_DATETIME,
+            shard_size=100,
+        )
+
+        # Act
+        orchestrator.orchestrate(context)
+
+        # Assert
+        assert writer.published[Path("/tmp/output/input.txt")] == _sequential(content)
+
+    def test_orchestrate_異常系_書き込み失敗時は一時ファイルを破棄して書き込み先を更新しないこと(
+        self,
+    ):
+        # Arrange
+        reader = InMemoryByteRangeReader(b"first\nsecond\n")
+        header_size = len("2024-12-26 15:30:45")
+        writer = InMemoryOffsetWriter(fail_at=header_size)
+        orchestrator = ShardedTransformOrchestrator(reader, TextTransformer(), writer)
+        context = TransformShardContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=_CURRENT_DATETIME,
+            shard_size=1,
+        )
+
+        # Act & Assert
+        with pytest.raises(FileSystemError):
+            orchestrator.orchestrate(context)
+        assert writer.published == {}
+        assert writer.discarded == [Path("/tmp/output/.input.txt.tmp")]
+        assert writer.buffers == {}
+
+    def test_orchestrate_正常系_シャードごとに計測と変換の2回読み込むこと(self):
+        # Arrange
+        reader = InMemoryByteRangeReader(b"a\nb\n")
+        orchestrator = ShardedTransformOrchestrator(
+            reader, TextTransformer(), InMemoryOffsetWriter()
+        )
+        context = TransformShardContext(
+            target_file=Path("input.txt"),
+            tmp_dir=Path("/tmp/output"),
+            current_datetime=_CURRENT_DATETIME,
+            shard_size=1,
+        )
+
+        # Act
+        orchestrator.orchestrate(context)
+
+        # Assert
+        ranges = [ByteRange(0, 2), ByteRange(2, 4)]
+        assert reader.read_ranges == ranges + ranges
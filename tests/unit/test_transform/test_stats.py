@@ -0,0 +1,67 @@
+import pytest
+
+from example.transform import stats as stats_module
+from example.transform.stats import StageTimer, utf8_size
+
+
+class FakeClock:
+    """呼び出すたびに1秒ずつ進む時計"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 1.0
+        return self.now
+
+
+class TestStageTimer:
+    """StageTimerクラスのテスト"""
+
+    def test_iterate_正常系_入れ子の段階は最も内側の段階にのみ時間を加算すること(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        # Arrange
+        monkeypatch.setattr(stats_module, "perf_counter", FakeClock())
+        timer = StageTimer()
+        read = timer.iterate("read", ["a\n", "bc\n"])
+        transformed = timer.iterate("transform", (f"1: {line.rstrip()}" for line in read))
+
+        # Act
+        with timer.measure("write"):
+            written = list(transformed)
+        result = timer.stats(src_length=2, src_bytes=timer.sizes["read"], dst_bytes=10)
+
+        # Assert
+        assert written == ["1: a", "1: bc"]
+        assert timer.sizes == {"read": 5, "transform": 9, "write": 0}
+        assert result.read_seconds == 3.0
+        assert result.transform_seconds == 6.0
+        assert result.write_seconds == 4.0
+        assert result.total_seconds == 15.0
+        assert (result.src_bytes, result.dst_bytes) == (5, 10)
+        assert result.lines_per_second == 2 / 15
+
+    def test_measure_正常系_例外が発生しても段階を元に戻すこと(self):
+        # Arrange
+        timer = StageTimer()
+
+        # Act
+        with pytest.raises(ValueError), timer.measure("read"):
+            raise ValueError("boom")
+        with timer.measure("transform"):
+            pass
+
+        # Assert
+        assert timer.seconds["read"] > 0
+        assert timer.seconds["transform"] > 0
+        assert timer.seconds["write"] == 0
+
+
+class TestUtf8Size:
+    """utf8_size関数のテスト"""
+
+    @pytest.mark.parametrize(("text", "expected"), [("", 0), ("abc\n", 4), ("あい", 6), ("a😀", 5)])
+    def test_utf8_size_正常系_UTF8でのバイト数を返すこと(self, text: str, expected: int):
+        # Act & Assert
+        assert utf8_size(text) == expected
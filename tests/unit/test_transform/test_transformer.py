@@ -1,7 +1,16 @@
 from datetime import datetime
 
+import pytest
+
+from example.foundation.error import ApplicationError
 from example.transform.transformer import TextTransformer
-from example.transform.types import DstText, SrcText, TransformedDatetime
+from example.transform.types import (
+    DstText,
+    SrcBytes,
+    SrcText,
+    SrcTextStream,
+    TransformedDatetime,
+)
 
 
 class TestTextTransformer:
@@ -18,6 +27,7 @@ class TestTextTransformer:
 
         # Assert
         assert result == DstText("2026-02-18 12:00:00\n1: first\n2: second\n3: third")
+        assert result.length() == len(str(result).splitlines())
 
     def test_transform_正常系_空テキストは日時のみ(self):
         # Arrange
@@ -42,3 +52,153 @@ class TestTextTransformer:
 
         # Assert
         assert result == DstText("2026-02-18 00:00:00\n1: こんにちは\n2: 世界")
+
+    def test_transform_stream_正常系_transformと同じ出力を返す(self):
+        # Arrange
+        text = "first\nsecond\r\nthird\n"
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.transform_stream(
+            SrcTextStream(text.splitlines(True)), current_datetime
+        )
+
+        # Assert
+        expected = transformer.transform(SrcText(text), current_datetime)
+        assert "".join(result.chunks()) == str(expected)
+        assert result.length() == expected.length()
+
+    def test_transform_正常系_preserveは入力の行末を残す(self):
+        # Arrange
+        text = SrcText("first\r\nsecond\nthird\r\n", newline="preserve")
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.transform(text, current_datetime)
+
+        # Assert
+        assert result == DstText("2026-02-18 12:00:00\r\n1: first\r\n2: second\n3: third\r\n")
+        assert result.length() == 4
+
+    def test_transform_正常系_lfは行末のCRLFをLFにしpreserveは残す(self):
+        # Arrange
+        text = "first\r\nsecond\rmiddle\nthird\r\n"
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        lf = transformer.transform(SrcText(text, newline="lf"), current_datetime)
+        preserve = transformer.transform(SrcText(text, newline="preserve"), current_datetime)
+
+        # Assert
+        assert lf == DstText("2026-02-18 12:00:00\n1: first\n2: second\rmiddle\n3: third")
+        assert preserve == DstText(
+            "2026-02-18 12:00:00\r\n1: first\r\n2: second\rmiddle\n3: third\r\n"
+        )
+        assert lf.length() == preserve.length() == 4
+
+    def test_transform_stream_正常系_preserveはtransformと同じ出力を返す(self):
+        # Arrange
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        for text in ("first\r\nsecond\nthird", "only\n", ""):
+            # Act
+            result = transformer.transform_stream(
+                SrcTextStream(text.splitlines(True), "preserve"), current_datetime
+            )
+
+            # Assert
+            expected = transformer.transform(SrcText(text, "preserve"), current_datetime)
+            assert "".join(result.chunks()) == str(expected)
+            assert result.length() == expected.length()
+
+    def test_transform_bytes_正常系_transformと同じ出力をバイト列で返す(self):
+        # Arrange
+        text = "first\nsecond\r\n日本語\rlast\n"
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.transform_bytes(SrcBytes(text.encode()), current_datetime)
+
+        # Assert
+        expected = transformer.transform(SrcText(text), current_datetime)
+        assert result.data == str(expected).encode()
+        assert result.length() == expected.length()
+
+    def test_transform_bytes_正常系_UTF_8として不正なバイトもそのまま出力する(self):
+        # Arrange
+        text = SrcBytes(b"ok\n\xff\xfe broken\n")
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.transform_bytes(text, current_datetime, encoding="shift_jis")
+
+        # Assert
+        assert result.data == b"2026-02-18 12:00:00\n1: ok\n2: \xff\xfe broken"
+        assert result.length() == 3
+
+    def test_transform_bytes_正常系_ASCII互換でない文字コードはデコードして同じ文字コードで返す(
+        self,
+    ):
+        # Arrange
+        text = SrcBytes("first\r\n日本語\n".encode("utf-16"))
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.transform_bytes(text, current_datetime, encoding="utf-16")
+
+        # Assert
+        assert result.data.decode("utf-16") == "2026-02-18 12:00:00\n1: first\n2: 日本語"
+        assert result.length() == 3
+
+    def test_transform_bytes_異常系_デコードできない場合はApplicationError(self):
+        # Arrange
+        text = SrcBytes(b"\x00\xd8")  # UTF-16LE の対になっていないサロゲート
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act & Assert
+        with pytest.raises(ApplicationError, match="utf-16-le"):
+            transformer.transform_bytes(text, current_datetime, encoding="utf-16-le")
+
+    def test_transform_shard_正常系_連結結果がtransformの出力と一致する(self):
+        # Arrange
+        shards = ["first\nsecond\r\n", "third\x0bfourth\n", "", "fifth"]
+        current_datetime = TransformedDatetime(datetime(2026, 2, 18, 12, 0, 0))
+        transformer = TextTransformer()
+
+        # Act
+        outputs: list[str] = []
+        first_number = 1
+        for shard in shards:
+            dst = transformer.transform_shard(SrcText(shard), first_number)
+            outputs.append(str(dst))
+            first_number += dst.length()
+        result = transformer.header(current_datetime) + "".join(outputs)
+
+        # Assert
+        expected = transformer.transform(SrcText("".join(shards)), current_datetime)
+        assert result == str(expected)
+
+    @pytest.mark.parametrize(
+        ("first_number", "line_count"), [(1, 0), (1, 9), (1, 10), (5, 200), (98, 5), (999, 3)]
+    )
+    def test_shard_size_正常系_transform_shardの出力のバイト数と一致する(
+        self, first_number: int, line_count: int
+    ):
+        # Arrange
+        text = SrcText("日本語🚀\n" * line_count)
+        transformer = TextTransformer()
+
+        # Act
+        result = transformer.shard_size(first_number, line_count, text.content_size())
+
+        # Assert
+        expected = transformer.transform_shard(text, first_number)
+        assert result == len(str(expected).encode("utf-8"))
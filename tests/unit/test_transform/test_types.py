@@ -1,6 +1,19 @@
+import io
 import json
 
-from example.transform.types import DstText, SrcText, TransformResult
+from example.transform.types import (
+    BatchTransformResult,
+    DstBytes,
+    DstText,
+    DstTextStream,
+    FileTransformResult,
+    LineIndex,
+    SrcBytes,
+    SrcText,
+    SrcTextStream,
+    TransformResult,
+    TransformStats,
+)
 
 
 class TestTransformResult:
@@ -18,10 +31,87 @@ class TestTransformResult:
         assert data["src_length"] == 3
         assert data["dst_length"] == 4
 
+    def test_to_json_正常系_statsがあれば既存のフィールドに追加して出力すること(self):
+        # Arrange
+        stats = TransformStats(
+            read_seconds=0.1,
+            transform_seconds=0.2,
+            write_seconds=0.3,
+            total_seconds=0.7,
+            src_bytes=10,
+            dst_bytes=20,
+            lines_per_second=4.0,
+        )
+        result = TransformResult(src_length=3, dst_length=4, stats=stats)
+
+        # Act
+        data = json.loads(result.to_json())
+
+        # Assert
+        assert list(data) == ["src_length", "dst_length", "stats"]
+        assert data["stats"]["src_bytes"] == 10
+        assert data["stats"]["lines_per_second"] == 4.0
+        assert "stats" not in json.loads(TransformResult(src_length=3, dst_length=4).to_json())
+
+
+class TestLineIndex:
+    """LineIndexクラスのテスト"""
+
+    def test_build_正常系_splitlinesと同じ規則で行を分割する(self):
+        # Arrange
+        text = "a\r\nb\rc\x0bd\n\ne\n"
+
+        # Act
+        result = LineIndex.build(text)
+
+        # Assert
+        assert result.lines == tuple(text.splitlines())
+        assert result.length() == 6
+
+    def test_build_正常系_空テキストは0行(self):
+        # Act
+        result = LineIndex.build("")
+
+        # Assert
+        assert result.length() == 0
+
+    def test_build_正常系_lfは改行文字のみで行を分割し行末のCRLFを除く(self):
+        # Arrange
+        text = "a\r\nb\rc\x0bd\n\ne\r\n"
+
+        # Act
+        result = LineIndex.build(text, "lf")
+
+        # Assert
+        assert result.lines == ("a", "b\rc\x0bd", "", "e")
+        assert result.length() == text.count("\n")
+
+    def test_build_正常系_preserveは行末の改行文字を残す(self):
+        # Arrange
+        text = "a\r\nb\n\nc"
+
+        # Act
+        result = LineIndex.build(text, "preserve")
+
+        # Assert
+        assert result.lines == ("a\r\n", "b\n", "\n", "c")
+        assert "".join(result.lines) == text
+
 
 class TestSrcText:
     """SrcTextクラスのテスト"""
 
+    def test_index_正常系_生成時に構築した行インデックスを保持する(self):
+        # Arrange
+        src = SrcText("first\nsecond")
+
+        # Act
+        result = src.index
+
+        # Assert
+        assert result == LineIndex(("first", "second"))
+        assert src == SrcText("first\nsecond")
+
     def test_numbered_lines_正常系_複数行テキストに行番号を付与(self):
         # Arrange
         src = SrcText("first\nsecond\nthird")
@@ -42,6 +132,26 @@ class TestSrcText:
         # Assert
         assert result == []
 
+    def test_numbered_lines_正常系_指定した番号から行番号を付与(self):
+        # Arrange
+        src = SrcText("first\nsecond")
+
+        # Act
+        result = src.numbered_lines(first_number=99)
+
+        # Assert
+        assert result == ["99: first", "100: second"]
+
+    def test_content_size_正常系_行区切り文字を除いたUTF_8のバイト数を返す(self):
+        # Arrange
+        src = SrcText("ab\r\n日本\n🚀")
+
+        # Act
+        result = src.content_size()
+
+        # Assert
+        assert result == 2 + 6 + 4
+
     def test_length_正常系_行数を返す(self):
         # Arrange
         src = SrcText("line1\nline2\nline3")
@@ -66,6 +176,17 @@ class TestDstText:
         # Assert
         assert result == 3
 
+    def test_length_正常系_line_count指定時はその値を返す(self):
+        # Arrange
+        dst = DstText("line1\nline2\nline3", line_count=3)
+
+        # Act
+        result = dst.length()
+
+        # Assert
+        assert result == 3
+        assert dst == DstText("line1\nline2\nline3")
+
     def test_str_正常系_内部テキストを文字列として返す(self):
         # Arrange
         dst = DstText("hello\nworld")
@@ -75,3 +196,151 @@ class TestDstText:
 
         # Assert
         assert result == "hello\nworld"
+
+
+class TestSrcBytes:
+    """SrcBytes・DstBytesクラスのテスト"""
+
+    def test_repr_正常系_内容を含めずにバイト数を返す(self):
+        # Arrange
+        src = SrcBytes(b"line1\n" * 1000)
+        dst = DstBytes(b"header\n1: line1", line_count=2)
+
+        # Act
+        result = (repr(src), repr(dst))
+
+        # Assert
+        assert result == ("SrcBytes(<6000 bytes>)", "DstBytes(<15 bytes>, line_count=2)")
+
+    def test_length_正常系_改行コードで区切った行数を返す(self):
+        # Arrange
+        cases = [
+            (b"", "utf-8"),
+            (b"a\r\nb\rc\n\n\xff\x0bd", "utf-8"),
+            (b"a\nb\n", "utf-8"),
+            ("first\r\n\u65e5\u672c\u8a9e\r".encode("utf-16"), "utf-16"),
+        ]
+
+        # Act
+        results = [SrcBytes(data).length(encoding) for data, encoding in cases]
+
+        # Assert
+        assert results == [0, 5, 2, 2]
+
+
+class TestSrcTextStream:
+    """SrcTextStreamクラスのテスト"""
+
+    def test_numbered_lines_正常系_物理行ごとに行番号を付与(self):
+        # Arrange
+        src = SrcTextStream(["first\n", "second\n", "third"])
+
+        # Act
+        result = list(src.numbered_lines())
+
+        # Assert
+        assert result == ["1: first", "2: second", "3: third"]
+        assert src.length() == 3
+
+    def test_numbered_lines_正常系_splitlinesと同じ規則で分割する(self):
+        # Arrange
+        text = "a\r\nb\rc\x0bd\n\ne"
+        src = SrcTextStream(io.StringIO(text, newline="\n"))
+
+        # Act
+        result = list(src.numbered_lines())
+
+        # Assert
+        assert result == SrcText(text).numbered_lines()
+        assert src.length() == SrcText(text).length()
+
+    def test_numbered_lines_正常系_lf_preserveはSrcTextと同じ規則で分割する(self):
+        # Arrange
+        text = "a\r\nb\rc\x0bd\n\ne\r"
+
+        for newline in ("lf", "preserve"):
+            src = SrcTextStream(io.StringIO(text, newline="\n"), newline)
+
+            # Act
+            result = list(src.numbered_lines())
+
+            # Assert
+            assert result == SrcText(text, newline).numbered_lines()
+            assert src.length() == SrcText(text, newline).length() == 4
+
+    def test_length_正常系_消費前は0を返す(self):
+        # Arrange
+        src = SrcTextStream(["line1\n"])
+
+        # Act
+        result = src.length()
+
+        # Assert
+        assert result == 0
+
+
+class TestDstTextStream:
+    """DstTextStreamクラスのテスト"""
+
+    def test_chunks_正常系_連結結果が改行区切りのテキストと一致する(self):
+        # Arrange
+        dst = DstTextStream(["header", "1: a", "2: b"])
+
+        # Act
+        result = "".join(dst.chunks())
+
+        # Assert
+        assert result == "header\n1: a\n2: b"
+        assert dst.length() == 3
+
+    def test_chunks_正常系_separatorを空にすると行をそのまま連結する(self):
+        # Arrange
+        dst = DstTextStream(["header\r\n", "1: a\r\n", "2: b"], separator="")
+
+        # Act
+        result = "".join(dst.chunks())
+
+        # Assert
+        assert result == "header\r\n1: a\r\n2: b"
+        assert dst.length() == 3
+
+
+class TestBatchTransformResult:
+    """BatchTransformResultクラスのテスト"""
+
+    def test_aggregate_正常系_ファイルごとの結果を集計する(self):
+        # Arrange
+        files = [
+            FileTransformResult.succeeded("a.txt", TransformResult(src_length=2, dst_length=3)),
+            FileTransformResult.failed("b.txt", "失敗"),
+        ]
+
+        # Act
+        result = BatchTransformResult.aggregate(files)
+
+        # Assert
+        data = json.loads(result.to_json())
+        assert data["src_length"] == 2
+        assert data["dst_length"] == 3
+        assert data["file_count"] == 2
+        assert data["error_count"] == 1
+        assert data["files"][1]["status"] == "error"
+
+    def test_to_json_正常系_ファイルごとの計測値を含めない(self):
+        # Arrange
+        file = FileTransformResult.succeeded(
+            "a.txt",
+            TransformResult(src_length=2, dst_length=3),
+            src_bytes=12,
+            duration_seconds=0.5,
+        )
+
+        # Act
+        data = json.loads(BatchTransformResult.aggregate([file]).to_json())
+
+        # Assert
+        assert data["files"] == [
+            {"path": "a.txt", "src_length": 2, "dst_length": 3, "status": "ok", "error": None}
+        ]
+        assert json.loads(file.to_json())["src_bytes"] == 12
+        assert json.loads(file.to_json())["duration_seconds"] == 0.5
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from example.transform.types import DstText
+from example.transform.types import DstText, DstTextStream
 from example.transform.writer import TextWriter
 from tests.unit.test_transform.fakes import InMemoryFsWriter
 
@@ -21,3 +21,17 @@ class TestTextWriter:
         # Assert
         assert fs_writer.written_text == str(text)
         assert fs_writer.written_path == path
+
+    def test_write_stream_正常系_チャンクを連結して書き込むこと(self):
+        # Arrange
+        text = DstTextStream(["line1", "line2", "line3"])
+        path = Path("output/result.txt")
+        fs_writer = InMemoryFsWriter()
+        writer = TextWriter(fs_writer)
+
+        # Act
+        writer.write_stream(text, path)
+
+        # Assert
+        assert fs_writer.written_text == "line1\nline2\nline3"
+        assert fs_writer.written_path == path